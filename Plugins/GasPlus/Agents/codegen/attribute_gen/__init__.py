@@ -1,8 +1,32 @@
 """Attribute set generator package."""
 
+from .cache import OutputCache
+from .gameplay_tags import GameplayTagsPlugin
 from .generator import AttributeSetGenerator, GeneratorConfig
+from .index import AttributeIndex
+from .journal import ManifestChanges, ManifestJournal
+from .metrics import RunMetrics
+from .plugins import GeneratorPlugin, PluginAsset, register_plugin
+from .storage import DiskStorage, MemoryStorage, OverlayStorage, Storage
+from .templates import Template
+from .validation import ValidationIssue
 
 __all__ = [
+    "AttributeIndex",
     "AttributeSetGenerator",
+    "DiskStorage",
+    "GameplayTagsPlugin",
     "GeneratorConfig",
+    "GeneratorPlugin",
+    "ManifestChanges",
+    "ManifestJournal",
+    "MemoryStorage",
+    "OutputCache",
+    "OverlayStorage",
+    "PluginAsset",
+    "RunMetrics",
+    "Storage",
+    "Template",
+    "ValidationIssue",
+    "register_plugin",
 ]
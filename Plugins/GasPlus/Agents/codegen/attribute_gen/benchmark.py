@@ -0,0 +1,598 @@
+"""Render throughput micro-benchmark.
+
+Run with ``python -m Plugins.GasPlus.Agents.codegen.attribute_gen.benchmark``.
+Only the renderers are timed; discovery, hashing and file I/O are excluded.
+
+The compiled templates are compared against ``BaselineGenerator``, a port of
+the f-string and ``textwrap.dedent`` renderers they replaced. Those renderers
+predate the static lookup tables, so both sides render the sets without
+them, and their output must be identical before anything is timed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import textwrap
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from . import generator
+from .generator import (
+    AttributeDefinition,
+    AttributeMetadata,
+    AttributeSetAsset,
+    AttributeSetGenerator,
+    GeneratorConfig,
+)
+from .templates import META_REGISTRY_HEADER, META_REGISTRY_SOURCE, Template
+
+# The baseline kept the registry files as indented literals and dedented them
+# on every call.
+_BASELINE_META_REGISTRY_HEADER = textwrap.indent(META_REGISTRY_HEADER.source, " " * 12) + " " * 12
+_BASELINE_META_REGISTRY_SOURCE = textwrap.indent(META_REGISTRY_SOURCE.source, " " * 12) + " " * 12
+
+
+def synthetic_assets(sets: int, attributes_per_set: int) -> List[AttributeSetAsset]:
+    """Sets that exercise every renderer branch (clamps, replication, hooks, tracing)."""
+    assets = []
+    for set_index in range(sets):
+        attributes = [
+            AttributeDefinition(
+                name=f"Attribute{index}",
+                category="Benchmark",
+                comment="Synthetic attribute" if index % 3 == 0 else None,
+                metadata=AttributeMetadata(
+                    replicate=index % 4 != 3,
+                    generate_hooks=index % 5 != 4,
+                    skip_on_rep=index % 4 == 2,
+                    clamp_min=0.0 if index % 2 == 0 else None,
+                    clamp_max=100.0 if index % 3 == 0 else None,
+                    meta_attribute="Damage" if index % 7 == 6 else None,
+                ),
+            )
+            for index in range(attributes_per_set)
+        ]
+        assets.append(
+            AttributeSetAsset(
+                name=f"Bench{set_index}",
+                class_name=f"UBench{set_index}AttributeSet",
+                attributes=attributes,
+                source_path=Path(f"Bench{set_index}.json"),
+                instrument=set_index % 2 == 1,
+            )
+        )
+    return assets
+
+
+def _cut(source: str, start: str, end: str) -> str:
+    """``source`` without the text from ``start`` up to (not including) ``end``."""
+    head, found, rest = source.partition(start)
+    _, found_end, tail = rest.partition(end)
+    if not found or not found_end:
+        raise ValueError(f"Template text between {start!r} and {end!r} not found")
+    return head + end + tail
+
+
+@contextmanager
+def without_lookup_tables() -> Iterator[None]:
+    """Render attribute sets without the static lookup tables, as the baseline did."""
+    header = generator.ATTRIBUTE_SET_HEADER
+    source = generator.ATTRIBUTE_SET_SOURCE
+    lookup = AttributeSetGenerator.__dict__["_render_lookup_source"]
+    header_text = _cut(header.source, "// Static description of one", "UCLASS()")
+    header_text = _cut(header_text, "    using FAttributeInfo", "    // GASPLUS-PRESERVE BEGIN")
+    if "{{Lookup}}\n\n" not in source.source:
+        raise ValueError("Template text around {{Lookup}} not found")
+    try:
+        generator.ATTRIBUTE_SET_HEADER = Template(header_text, header.name)
+        generator.ATTRIBUTE_SET_SOURCE = Template(
+            source.source.replace("{{Lookup}}\n\n", "{{Lookup}}"), source.name
+        )
+        AttributeSetGenerator._render_lookup_source = staticmethod(lambda asset: "")
+        yield
+    finally:
+        generator.ATTRIBUTE_SET_HEADER = header
+        generator.ATTRIBUTE_SET_SOURCE = source
+        AttributeSetGenerator._render_lookup_source = lookup
+
+
+class BaselineGenerator(AttributeSetGenerator):
+    """The renderers as they were before templates were compiled."""
+
+    def _render_header(self, asset: AttributeSetAsset) -> str:
+        plan = self._compute_include_plan(asset)
+        include_block = "\n".join(f'#include "{include}"' for include in plan.header)
+        forward_block = "\n".join(plan.forward_declarations)
+        if forward_block:
+            forward_block += "\n\n"
+
+        properties = []
+        onrep_decls = []
+        for attribute in asset.attributes:
+            metadata_comment_parts = [
+                f"Replicate={'true' if attribute.metadata.replicate else 'false'}",
+                f"GenerateHooks={'true' if attribute.metadata.generate_hooks else 'false'}",
+                f"SkipOnRep={'true' if attribute.metadata.skip_on_rep else 'false'}",
+            ]
+            if attribute.metadata.clamp_min is not None:
+                metadata_comment_parts.append(f"ClampMin={attribute.metadata.clamp_min}")
+            if attribute.metadata.clamp_max is not None:
+                metadata_comment_parts.append(f"ClampMax={attribute.metadata.clamp_max}")
+            if attribute.metadata.meta_attribute is not None:
+                metadata_comment_parts.append(
+                    f"MetaAttribute={attribute.metadata.meta_attribute}"
+                )
+            metadata_comment = ", ".join(metadata_comment_parts)
+
+            property_lines = [
+                f"    // Attribute: {attribute.name}",
+                f"    // Metadata: {metadata_comment}",
+            ]
+            if attribute.comment:
+                property_lines.append(f"    // {attribute.comment}")
+
+            specifiers = ["BlueprintReadOnly", f"Category=\"{attribute.category}\""]
+            meta_parts = []
+            if attribute.metadata.clamp_min is not None:
+                meta_parts.append(f"ClampMin=\"{attribute.metadata.clamp_min}\"")
+            if attribute.metadata.clamp_max is not None:
+                meta_parts.append(f"ClampMax=\"{attribute.metadata.clamp_max}\"")
+
+            if attribute.metadata.replicate:
+                if attribute.metadata.skip_on_rep:
+                    specifiers.append("Replicated")
+                else:
+                    specifiers.append(f"ReplicatedUsing=OnRep_{attribute.name}")
+                    onrep_decls.append(
+                        f"    UFUNCTION()\n    void OnRep_{attribute.name}(const FGameplayAttributeData& OldValue);"
+                    )
+            specifier_block = ", ".join(specifiers)
+            meta_block = f", meta=({', '.join(meta_parts)})" if meta_parts else ""
+            property_lines.append(
+                f"    UPROPERTY({specifier_block}{meta_block})\n    FGameplayAttributeData {attribute.name};"
+            )
+            property_lines.append(
+                f"    ATTRIBUTE_ACCESSORS({asset.class_name}, {attribute.name});"
+            )
+            properties.append("\n".join(property_lines))
+
+        properties_block = "\n\n".join(properties)
+        onrep_block = "\n\n".join(onrep_decls)
+        if onrep_block:
+            onrep_block = "\n\n" + onrep_block
+
+        preserve_block = (
+            f"    // GASPLUS-PRESERVE BEGIN {asset.class_name}.PublicMembers\n"
+            "    // Add additional member declarations here.\n"
+            f"    // GASPLUS-PRESERVE END {asset.class_name}.PublicMembers"
+        )
+
+        class_body_parts = [
+            "public:",
+            f"    {asset.class_name}();",
+            "",
+            "    virtual void GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const override;",
+            "    virtual void PreAttributeChange(const FGameplayAttribute& Attribute, float& NewValue) override;",
+            "    virtual void PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue) override;",
+            "",
+            f"    using FSnapshot = F{asset.file_basename}Snapshot;",
+            "    static constexpr int32 SnapshotFieldCount = FSnapshot::NumAttributes;",
+            "    static const TCHAR* const SnapshotFieldNames[SnapshotFieldCount];",
+            f"    static FGameplayAttributeData {asset.class_name}::* const SnapshotFields[SnapshotFieldCount];",
+            "",
+            "    void CaptureSnapshot(FSnapshot& OutSnapshot) const;",
+            "    void RestoreSnapshot(const FSnapshot& Snapshot);",
+            "",
+            preserve_block,
+        ]
+
+        if properties_block:
+            class_body_parts.extend(["", properties_block])
+        if onrep_block:
+            class_body_parts.extend(["", onrep_block.strip("\n")])
+
+        class_body = "\n".join(class_body_parts)
+
+        header = (
+            "#pragma once\n\n"
+            f"{include_block}\n"
+            "// <Codex::Preserve Begin: HeaderIncludes>\n"
+            "// <Codex::Preserve End: HeaderIncludes>\n\n"
+            f"#include \"{asset.name}AttributeSet.generated.h\"\n\n"
+            f"{forward_block}"
+            f"{self._render_snapshot_struct(asset)}\n"
+            "UCLASS()\n"
+            f"class {asset.module_api} {asset.class_name} : public UAttributeSet\n"
+            "{\n"
+            "    GENERATED_BODY()\n\n"
+            f"{class_body}\n"
+            "};\n"
+        )
+        return header
+
+    def _render_source(self, asset: AttributeSetAsset) -> str:
+        plan = self._compute_include_plan(asset)
+        own_include, *dependency_includes = plan.source
+        source_include_block = f"#include \"{own_include}\"\n\n"
+        if dependency_includes:
+            source_include_block += (
+                "\n".join(f"#include \"{include}\"" for include in dependency_includes)
+                + "\n\n"
+            )
+        source_include_block += (
+            "// <Codex::Preserve Begin: SourceIncludes>\n"
+            "// <Codex::Preserve End: SourceIncludes>\n"
+        )
+        replication_lines = []
+        pre_blocks = []
+        post_blocks = []
+        onrep_impls = []
+
+        for attribute in asset.attributes:
+            if attribute.metadata.replicate:
+                if attribute.metadata.skip_on_rep:
+                    replication_lines.append(
+                        f"    DOREPLIFETIME({asset.class_name}, {attribute.name});"
+                    )
+                else:
+                    replication_lines.append(
+                        f"    DOREPLIFETIME_CONDITION_NOTIFY({asset.class_name}, {attribute.name}, COND_None, REPNOTIFY_Always);"
+                    )
+                    onrep_impls.append(
+                        "\n".join(
+                            [
+                                f"void {asset.class_name}::OnRep_{attribute.name}(const FGameplayAttributeData& OldValue)",
+                                "{",
+                                *self._instrumentation_lines(asset, "    ", attribute.name, "OnRep"),
+                                f"    GAMEPLAYATTRIBUTE_REPNOTIFY({asset.class_name}, {attribute.name}, OldValue);",
+                                f"    // <Codex::Preserve Begin: OnRep_{attribute.name}>",
+                                f"    // <Codex::Preserve End: OnRep_{attribute.name}>",
+                                "}",
+                            ]
+                        )
+                    )
+
+            if attribute.metadata.generate_hooks:
+                metadata_comment_parts = [
+                    f"Replicate={'true' if attribute.metadata.replicate else 'false'}",
+                    f"GenerateHooks={'true' if attribute.metadata.generate_hooks else 'false'}",
+                    f"SkipOnRep={'true' if attribute.metadata.skip_on_rep else 'false'}",
+                ]
+                if attribute.metadata.clamp_min is not None:
+                    metadata_comment_parts.append(f"ClampMin={attribute.metadata.clamp_min}")
+                if attribute.metadata.clamp_max is not None:
+                    metadata_comment_parts.append(f"ClampMax={attribute.metadata.clamp_max}")
+                if attribute.metadata.meta_attribute is not None:
+                    metadata_comment_parts.append(
+                        f"MetaAttribute={attribute.metadata.meta_attribute}"
+                    )
+                metadata_comment = ", ".join(metadata_comment_parts)
+
+                clamp_expression = "NewValue"
+                clamp_lines = []
+                if attribute.metadata.clamp_min is not None or attribute.metadata.clamp_max is not None:
+                    clamp_min = (
+                        attribute.metadata.clamp_min
+                        if attribute.metadata.clamp_min is not None
+                        else "-FLT_MAX"
+                    )
+                    clamp_max = (
+                        attribute.metadata.clamp_max
+                        if attribute.metadata.clamp_max is not None
+                        else "FLT_MAX"
+                    )
+                    clamp_expression = f"FMath::Clamp(NewValue, {clamp_min}, {clamp_max})"
+                    clamp_lines.append(
+                        "        const float ClampedValue = " + clamp_expression + ";"
+                    )
+                    clamp_lines.append("        NewValue = ClampedValue;")
+
+                pre_block_lines = [
+                    f"    if (Attribute == Get{attribute.name}Attribute())",
+                    "    {",
+                    *self._instrumentation_lines(
+                        asset, "        ", attribute.name, "PreAttributeChange"
+                    ),
+                    f"        // Metadata: {metadata_comment}",
+                ]
+                pre_block_lines.extend(clamp_lines)
+                pre_block_lines.append(
+                    f"        // TODO: Add pre-clamp logic for {attribute.name} if additional validation is required."
+                )
+                pre_block_lines.append("    }")
+                pre_blocks.append("\n".join(pre_block_lines))
+
+                post_block_lines = [
+                    f"    if (Attribute == Get{attribute.name}Attribute())",
+                    "    {",
+                    *self._instrumentation_lines(
+                        asset, "        ", attribute.name, "PostAttributeChange"
+                    ),
+                    f"        // Metadata: {metadata_comment}",
+                    f"        // TODO: Add post-clamp logic for {attribute.name} (OldValue={{OldValue}}, NewValue={{NewValue}}).",
+                    "    }",
+                ]
+                post_blocks.append("\n".join(post_block_lines))
+
+        replication_block = "\n".join(replication_lines) if replication_lines else ""
+        if replication_block:
+            replication_block = "\n" + replication_block
+
+        pre_block = "\n".join(pre_blocks)
+        post_block = "\n".join(post_blocks)
+        if pre_block:
+            pre_block = "\n" + pre_block
+        if post_block:
+            post_block = "\n" + post_block
+        pre_block += (
+            "\n    // <Codex::Preserve Begin: PreAttributeChange_Custom>\n"
+            "    // <Codex::Preserve End: PreAttributeChange_Custom>"
+        )
+        post_block += (
+            "\n    // <Codex::Preserve Begin: PostAttributeChange_Custom>\n"
+            "    // <Codex::Preserve End: PostAttributeChange_Custom>"
+        )
+
+        onrep_block = "\n\n".join(onrep_impls)
+
+        constructor_preserve = (
+            f"// GASPLUS-PRESERVE BEGIN {asset.class_name}.Constructor\n"
+            "// Customize constructor defaults here.\n"
+            f"// GASPLUS-PRESERVE END {asset.class_name}.Constructor"
+        )
+        pre_preserve = (
+            f"    // GASPLUS-PRESERVE BEGIN {asset.class_name}.PreAttributeChange\n"
+            "    // Customize pre-attribute change logic here.\n"
+            f"    // GASPLUS-PRESERVE END {asset.class_name}.PreAttributeChange"
+        )
+        post_preserve = (
+            f"    // GASPLUS-PRESERVE BEGIN {asset.class_name}.PostAttributeChange\n"
+            "    // Customize post-attribute change logic here.\n"
+            f"    // GASPLUS-PRESERVE END {asset.class_name}.PostAttributeChange"
+        )
+        additional_preserve = (
+            f"// GASPLUS-PRESERVE BEGIN {asset.class_name}.AdditionalMethods\n"
+            "// Add additional method definitions here.\n"
+            f"// GASPLUS-PRESERVE END {asset.class_name}.AdditionalMethods"
+        )
+
+        source_lines: List[str] = [source_include_block]
+        if asset.instrument:
+            source_lines.extend(["", self._render_instrumentation(asset).rstrip("\n"), ""])
+        source_lines += [
+            "",
+            f"{asset.class_name}::{asset.class_name}() = default;",
+            constructor_preserve,
+            "",
+            f"void {asset.class_name}::GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const",
+            "{",
+            "    Super::GetLifetimeReplicatedProps(OutLifetimeProps);" + replication_block,
+            "}",
+            "",
+            f"void {asset.class_name}::PreAttributeChange(const FGameplayAttribute& Attribute, float& NewValue)",
+            "{",
+            *self._instrumentation_lines(asset, "    ", "PreAttributeChange"),
+            "    Super::PreAttributeChange(Attribute, NewValue);",
+            pre_preserve + pre_block,
+            "}",
+            "",
+            f"void {asset.class_name}::PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue)",
+            "{",
+            *self._instrumentation_lines(asset, "    ", "PostAttributeChange"),
+            "    Super::PostAttributeChange(Attribute, OldValue, NewValue);",
+            "    UE_UNUSED(OldValue);",
+            "    UE_UNUSED(NewValue);",
+            post_preserve + post_block,
+            "}",
+            "",
+            self._render_snapshot_source(asset),
+        ]
+
+        if onrep_block:
+            source_lines.extend(["", onrep_block, ""])
+        else:
+            source_lines.append("")
+
+        source_lines.append(additional_preserve)
+
+        source = "\n".join(source_lines) + "\n"
+        return source
+
+    @staticmethod
+    def _render_snapshot_struct(asset: AttributeSetAsset) -> str:
+        return (
+            f"// Base and current values of every {asset.class_name} attribute, indexed\n"
+            f"// like {asset.class_name}::SnapshotFields.\n"
+            f"struct F{asset.file_basename}Snapshot\n"
+            "{\n"
+            f"    static constexpr int32 NumAttributes = {len(asset.attributes)};\n"
+            "\n"
+            "    float BaseValues[NumAttributes];\n"
+            "    float CurrentValues[NumAttributes];\n"
+            "};\n"
+        )
+
+    @staticmethod
+    def _render_snapshot_source(asset: AttributeSetAsset) -> str:
+        owner = asset.class_name
+        names = [f'    TEXT("{attribute.name}"),' for attribute in asset.attributes]
+        fields = [f"    &{owner}::{attribute.name}," for attribute in asset.attributes]
+        capture = []
+        restore = []
+        for index, attribute in enumerate(asset.attributes):
+            capture.append(f"    OutSnapshot.BaseValues[{index}] = {attribute.name}.GetBaseValue();")
+            capture.append(f"    OutSnapshot.CurrentValues[{index}] = {attribute.name}.GetCurrentValue();")
+            restore.append(f"    {attribute.name}.SetBaseValue(Snapshot.BaseValues[{index}]);")
+            restore.append(f"    {attribute.name}.SetCurrentValue(Snapshot.CurrentValues[{index}]);")
+        return "\n".join(
+            [
+                f"const TCHAR* const {owner}::SnapshotFieldNames[{owner}::SnapshotFieldCount] = {{",
+                *names,
+                "};",
+                "",
+                f"FGameplayAttributeData {owner}::* const {owner}::SnapshotFields[{owner}::SnapshotFieldCount] = {{",
+                *fields,
+                "};",
+                "",
+                f"void {owner}::CaptureSnapshot(FSnapshot& OutSnapshot) const",
+                "{",
+                *capture,
+                "}",
+                "",
+                f"void {owner}::RestoreSnapshot(const FSnapshot& Snapshot)",
+                "{",
+                *restore,
+                "}",
+            ]
+        )
+
+    @staticmethod
+    def _instrumentation_lines(asset: AttributeSetAsset, indent: str, *scope: str) -> List[str]:
+        if not asset.instrument:
+            return []
+        name = "_".join((asset.class_name, *scope))
+        return [
+            f"{indent}GASPLUS_ATTRIBUTE_SCOPE({name});",
+            f"{indent}GASPLUS_ATTRIBUTE_COUNT(STAT_GasPlus_{name});",
+        ]
+
+    @staticmethod
+    def _render_instrumentation(asset: AttributeSetAsset) -> str:
+        group = f"STATGROUP_GasPlus_{asset.class_name}"
+        scopes: List[Tuple[str, ...]] = [("PreAttributeChange",), ("PostAttributeChange",)]
+        for attribute in asset.attributes:
+            if attribute.metadata.generate_hooks:
+                scopes.append((attribute.name, "PreAttributeChange"))
+                scopes.append((attribute.name, "PostAttributeChange"))
+            if attribute.metadata.replicate and not attribute.metadata.skip_on_rep:
+                scopes.append((attribute.name, "OnRep"))
+        declarations = "\n".join(
+            f'DECLARE_DWORD_COUNTER_STAT(TEXT("{".".join((asset.class_name, *scope))}"), '
+            f'STAT_GasPlus_{"_".join((asset.class_name, *scope))}, {group});'
+            for scope in scopes
+        )
+        return (
+            "// Unreal Insights trace scopes and stat counters. Define\n"
+            "// GASPLUS_ATTRIBUTE_INSTRUMENTATION=0 to compile them out.\n"
+            "#ifndef GASPLUS_ATTRIBUTE_INSTRUMENTATION\n"
+            "#define GASPLUS_ATTRIBUTE_INSTRUMENTATION !UE_BUILD_SHIPPING\n"
+            "#endif\n"
+            "\n"
+            "#if GASPLUS_ATTRIBUTE_INSTRUMENTATION\n"
+            '#include "ProfilingDebugging/CpuProfilerTrace.h"\n'
+            '#include "Stats/Stats.h"\n'
+            "\n"
+            f'DECLARE_STATS_GROUP(TEXT("GasPlus {asset.class_name}"), {group}, STATCAT_Advanced);\n'
+            f"{declarations}\n"
+            "\n"
+            "#define GASPLUS_ATTRIBUTE_SCOPE(Name) TRACE_CPUPROFILER_EVENT_SCOPE(Name)\n"
+            "#define GASPLUS_ATTRIBUTE_COUNT(Stat) INC_DWORD_STAT(Stat)\n"
+            "#else\n"
+            "#define GASPLUS_ATTRIBUTE_SCOPE(Name)\n"
+            "#define GASPLUS_ATTRIBUTE_COUNT(Stat)\n"
+            "#endif\n"
+        )
+
+    def _render_meta_registry_header(self) -> str:
+        return textwrap.dedent(_BASELINE_META_REGISTRY_HEADER).strip() + "\n"
+
+    def _render_meta_registry_source(self) -> str:
+        return textwrap.dedent(_BASELINE_META_REGISTRY_SOURCE).strip() + "\n"
+
+    def _render_generated_header(self, asset: AttributeSetAsset) -> str:
+        return textwrap.dedent(
+            f"""
+            #pragma once
+
+            // Stub generated header for {asset.class_name}. In Unreal builds this file will be replaced by UHT.
+            """
+        ).strip() + "\n"
+
+
+def measure_render_throughput(
+    assets: Sequence[AttributeSetAsset], repeat: int = 5
+) -> Dict[str, float]:
+    """Best-of-``repeat`` timings of the per-set renderers over ``assets`` and of
+    the once-per-run meta registry renderers, compiled and baseline.
+
+    ``seconds`` covers the full compiled output; the ``lookupFree*`` and
+    ``baseline*`` timings render the text the baseline could produce.
+    """
+    config = GeneratorConfig(dry_run=True)
+    generators = {
+        "compiled": AttributeSetGenerator(config),
+        "lookupFree": AttributeSetGenerator(config),
+        "baseline": BaselineGenerator(config),
+    }
+    attributes = sum(len(asset.attributes) for asset in assets)
+
+    def render_sets(mode: str) -> Callable[[], List[str]]:
+        renderers = list(generators[mode]._renderers().values())
+        return lambda: [renderer(asset) for asset in assets for renderer in renderers]
+
+    def render_registry(mode: str) -> Callable[[], List[str]]:
+        instance = generators[mode]
+        return lambda: [
+            instance._render_meta_registry_header(),
+            instance._render_meta_registry_source(),
+        ]
+
+    with without_lookup_tables():
+        if render_sets("lookupFree")() != render_sets("baseline")():
+            raise AssertionError("Compiled templates render differently from the baseline")
+    if render_registry("compiled")() != render_registry("baseline")():
+        raise AssertionError("Compiled meta registry differs from the baseline")
+
+    best = {mode: float("inf") for mode in generators}
+    registry_best = dict(best)
+    for _ in range(max(1, repeat)):
+        for mode in generators:
+            with without_lookup_tables() if mode == "lookupFree" else nullcontext():
+                sets, registry = render_sets(mode), render_registry(mode)
+                started = time.perf_counter()
+                sets()
+                best[mode] = min(best[mode], time.perf_counter() - started)
+                started = time.perf_counter()
+                registry()
+                registry_best[mode] = min(registry_best[mode], time.perf_counter() - started)
+    seconds = best["compiled"]
+    return {
+        "sets": float(len(assets)),
+        "attributes": float(attributes),
+        "seconds": seconds,
+        "attributesPerSecond": attributes / seconds if seconds else float("inf"),
+        "metaRegistrySeconds": registry_best["compiled"],
+        "lookupFreeSeconds": best["lookupFree"],
+        "baselineSeconds": best["baseline"],
+        "baselineMetaRegistrySeconds": registry_best["baseline"],
+        "speedup": best["baseline"] / best["lookupFree"] if best["lookupFree"] else float("inf"),
+    }
+
+
+def main(args: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sets", type=int, default=200)
+    parser.add_argument("--attributes", type=int, default=25, help="Attributes per set.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parsed = parser.parse_args(args=args)
+    result = measure_render_throughput(
+        synthetic_assets(parsed.sets, parsed.attributes), parsed.repeat
+    )
+    print(
+        f"Rendered {int(result['attributes'])} attributes in {int(result['sets'])} sets "
+        f"in {result['seconds']:.4f}s ({result['attributesPerSecond']:,.0f} attributes/s)."
+    )
+    print(
+        f"Without lookup tables: {result['lookupFreeSeconds']:.4f}s compiled, "
+        f"{result['baselineSeconds']:.4f}s baseline ({result['speedup']:.2f}x)."
+    )
+    print(
+        f"Rendered the meta registry in {result['metaRegistrySeconds'] * 1e6:.1f}us "
+        f"({result['baselineMetaRegistrySeconds'] * 1e6:.1f}us baseline)."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .hashing import hash_parts
+from .locking import FileLock, atomic_write_text
+
+CACHE_DIR_ENV = "GASPLUS_ATTRIBUTE_GEN_CACHE"
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_OBJECTS_DIR = "objects"
+_STATS_FILE = "stats.json"
+_STATS_LOCK_FILE = ".stats.lock"
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    def to_summary(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+        }
+
+
+class OutputCache:
+    """Machine-local, content-addressed store of rendered generator outputs.
+
+    Entries hold the rendered text *before* preserve regions are merged, so a
+    hit can be shared by every worktree or branch that renders the same
+    template/input combination. Keys only ever contain project-relative paths.
+    """
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        # Generation workers share one cache; guard the counters.
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(kind: str, output_hash: str, relative_path: str) -> str:
+        return hash_parts([kind, output_hash, Path(relative_path).as_posix()])
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / _OBJECTS_DIR / key[:2] / key
+
+    def get(self, key: str, touch: bool = True) -> Optional[str]:
+        """The cached text for ``key``; ``touch=False`` leaves the entry's mtime alone."""
+        entry_path = self._entry_path(key)
+        try:
+            text = entry_path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            with self._lock:
+                self.stats.misses += 1
+            return None
+        if touch:
+            try:
+                # Refresh the entry's mtime so eviction is least-recently-used.
+                os.utime(entry_path)
+            except OSError:
+                pass
+        with self._lock:
+            self.stats.hits += 1
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        entry_path = self._entry_path(key)
+        try:
+            atomic_write_text(entry_path, text)
+        except OSError:
+            # The cache is an accelerator only; never fail generation on it.
+            return
+        with self._lock:
+            self.stats.stores += 1
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        entries: List[Tuple[float, int, Path]] = []
+        objects_root = self.root / _OBJECTS_DIR
+        if not objects_root.exists():
+            return entries
+        for shard in objects_root.iterdir():
+            if not shard.is_dir():
+                continue
+            for entry in shard.iterdir():
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry))
+        return entries
+
+    def size_bytes(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> int:
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            total -= size
+            evicted += 1
+        self.stats.evictions += evicted
+        return evicted
+
+    def load_totals(self) -> Dict[str, int]:
+        try:
+            payload = json.loads((self.root / _STATS_FILE).read_text())
+        except (OSError, json.JSONDecodeError, ValueError):
+            return CacheStats().to_summary()
+        totals = CacheStats().to_summary()
+        for key in totals:
+            try:
+                totals[key] = int(payload.get(key, 0))
+            except (TypeError, ValueError):
+                continue
+        return totals
+
+    def finalize(self) -> Dict[str, object]:
+        """Evict down to the size bound and fold this run into the lifetime totals."""
+        # Worktrees share the cache directory, so concurrent runs take turns
+        # reading and rewriting the totals instead of overwriting each other.
+        try:
+            with FileLock(self.root / _STATS_LOCK_FILE):
+                self.evict()
+                totals = self.load_totals()
+                for key, value in self.stats.to_summary().items():
+                    totals[key] += value
+                atomic_write_text(self.root / _STATS_FILE, json.dumps(totals, indent=2) + "\n")
+        except OSError:
+            return self.summary()
+        return self.summary(totals)
+
+    def summary(self, totals: Optional[Dict[str, int]] = None) -> Dict[str, object]:
+        return {
+            "root": str(self.root),
+            "maxBytes": self.max_bytes,
+            "run": self.stats.to_summary(),
+            "lifetime": totals if totals is not None else self.load_totals(),
+        }
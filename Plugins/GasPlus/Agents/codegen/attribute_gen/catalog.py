@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import codecs
+import hashlib
+import io
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterator
+
+JSON_LINES_SUFFIXES = frozenset({".jsonl", ".ndjson"})
+_CHUNK_SIZE = 65536
+_WHITESPACE = " \t\r\n"
+
+Opener = Callable[[Path], BinaryIO]
+
+
+def open_binary(path: Path) -> BinaryIO:
+    return path.open("rb")
+
+
+@dataclass
+class CatalogRecord:
+    index: int
+    data: Dict[str, object]
+
+    @property
+    def content_hash(self) -> str:
+        # Canonical form so re-indenting or reordering keys in a bulk export
+        # does not invalidate records whose content is unchanged.
+        canonical = json.dumps(self.data, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def is_catalog(path: Path, opener: Opener = open_binary) -> bool:
+    """JSON Lines files, or ``.json`` files whose top-level value is an array."""
+    if path.suffix in JSON_LINES_SUFFIXES:
+        return True
+    with opener(path) as handle:
+        while True:
+            chunk = handle.read(256)
+            if not chunk:
+                return False
+            stripped = chunk.lstrip(b" \t\r\n\xef\xbb\xbf")
+            if stripped:
+                return stripped[:1] == b"["
+
+
+def iter_catalog(path: Path, opener: Opener = open_binary) -> Iterator[CatalogRecord]:
+    if path.suffix in JSON_LINES_SUFFIXES:
+        return _iter_json_lines(path, opener)
+    return _iter_json_array(path, opener)
+
+
+def _as_record(index: int, value: object, path: Path) -> CatalogRecord:
+    if not isinstance(value, dict):
+        raise ValueError(f"Catalog record {index} in {path} is not an object: {value!r}")
+    return CatalogRecord(index=index, data=value)
+
+
+def _iter_json_lines(path: Path, opener: Opener) -> Iterator[CatalogRecord]:
+    index = 0
+    with io.TextIOWrapper(opener(path), encoding="utf-8-sig") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                value = json.loads(line)
+            except json.JSONDecodeError as error:
+                raise ValueError(f"Invalid JSON on line {line_number} of {path}: {error}") from error
+            yield _as_record(index, value, path)
+            index += 1
+
+
+def _iter_json_array(path: Path, opener: Opener) -> Iterator[CatalogRecord]:
+    """Yield the elements of a top-level JSON array one at a time.
+
+    Only the unparsed tail of the file is buffered, so memory is bounded by the
+    largest single record rather than the catalog size.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    position = 0
+    exhausted = False
+    started = False
+    index = 0
+
+    with opener(path) as handle:
+
+        def _fill() -> bool:
+            nonlocal buffer, position, exhausted
+            if exhausted:
+                return False
+            chunk = handle.read(_CHUNK_SIZE)
+            if not chunk:
+                exhausted = True
+                buffer = buffer[position:] + text_decoder.decode(b"", final=True)
+                position = 0
+                return False
+            buffer = buffer[position:] + text_decoder.decode(chunk)
+            position = 0
+            return True
+
+        while True:
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            if position >= len(buffer):
+                if _fill():
+                    continue
+                raise ValueError(f"Unterminated JSON array in {path}")
+
+            token = buffer[position]
+            if not started:
+                if token != "[":
+                    raise ValueError(f"Catalog {path} does not start with a JSON array")
+                started = True
+                position += 1
+                continue
+            if token == "]":
+                return
+            if token == "," and index > 0:
+                position += 1
+                continue
+
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError as error:
+                if _fill():
+                    continue
+                raise ValueError(f"Invalid JSON record {index} in {path}: {error}") from error
+            yield _as_record(index, value, path)
+            index += 1
+            position = end
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from .locking import atomic_write_text
+
+DEFAULT_CHECKPOINT_INTERVAL = 100
+CHECKPOINT_VERSION = 1
+
+
+def checkpoint_path_for(manifest_path: Path) -> Path:
+    return manifest_path.with_name(f"{manifest_path.stem}.checkpoint{manifest_path.suffix}")
+
+
+class RunCheckpoint:
+    """Completed per-set results of an unfinished run, flushed periodically.
+
+    ``fingerprint`` identifies everything besides the inputs that shapes a
+    result (generator and template versions, output root, flags); results
+    from a checkpoint with a different fingerprint are never reused.
+    """
+
+    def __init__(self, path: Path, fingerprint: str, interval: int = DEFAULT_CHECKPOINT_INTERVAL):
+        self.path = Path(path)
+        self.fingerprint = fingerprint
+        self.interval = max(1, interval)
+        self._completed: Dict[str, Dict[str, object]] = {}
+        self._resumable: Dict[str, Dict[str, object]] = {}
+        self._unflushed = 0
+        self._lock = threading.Lock()
+
+    def load(self) -> int:
+        """Read a previous checkpoint for resuming; returns how many results it holds."""
+        try:
+            payload = json.loads(self.path.read_text())
+        except (OSError, json.JSONDecodeError, ValueError):
+            return 0
+        if (
+            not isinstance(payload, dict)
+            or payload.get("version") != CHECKPOINT_VERSION
+            or payload.get("fingerprint") != self.fingerprint
+        ):
+            return 0
+        self._resumable = dict(payload.get("results") or {})
+        return len(self._resumable)
+
+    def resumed(self, key: str, input_hash: Optional[str]) -> Optional[Dict[str, object]]:
+        """The checkpointed result for ``key`` if its input is unchanged."""
+        result = self._resumable.get(key)
+        if result is None or input_hash is None:
+            return None
+        if dict(result.get("manifest") or {}).get("inputHash") != input_hash:
+            return None
+        with self._lock:
+            self._completed[key] = result
+        return result
+
+    def record(self, key: str, result: Dict[str, object]) -> None:
+        with self._lock:
+            self._completed[key] = result
+            self._unflushed += 1
+            if self._unflushed >= self.interval:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        payload = {
+            "version": CHECKPOINT_VERSION,
+            "fingerprint": self.fingerprint,
+            "results": self._completed,
+        }
+        atomic_write_text(self.path, json.dumps(payload))
+        self._unflushed = 0
+
+    def discard(self) -> None:
+        self.path.unlink(missing_ok=True)
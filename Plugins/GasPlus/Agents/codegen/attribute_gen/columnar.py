@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import math
+import struct
+import sys
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, List, Sequence, Tuple
+
+from .locking import atomic_write_bytes
+
+if TYPE_CHECKING:
+    from .generator import AttributeSetAsset
+
+CATALOG_FILENAME = "attributes.catalog"
+CATALOG_MAGIC = b"GPAC"
+CATALOG_VERSION = 1
+
+FLAG_REPLICATE = 1 << 0
+FLAG_GENERATE_HOOKS = 1 << 1
+FLAG_SKIP_ON_REP = 1 << 2
+FLAG_CLAMP_MIN = 1 << 3
+FLAG_CLAMP_MAX = 1 << 4
+FLAG_META_ATTRIBUTE = 1 << 5
+
+# magic, version, set count, attribute count, meta string count
+_HEADER = struct.Struct("<4sHIII")
+_NO_META = -1
+
+
+@dataclass
+class AttributeColumns:
+    """Struct-of-arrays view of every attribute in a generation run.
+
+    Row ``i`` describes one attribute; ``set_ids[i]`` indexes ``set_names`` and
+    ``class_names``, ``meta_ids[i]`` indexes ``meta_names`` (``-1`` for none).
+    Absent clamps are stored as NaN with the matching flag bit cleared.
+    """
+
+    set_names: List[str] = field(default_factory=list)
+    class_names: List[str] = field(default_factory=list)
+    meta_names: List[str] = field(default_factory=list)
+    names: List[str] = field(default_factory=list)
+    set_ids: array = field(default_factory=lambda: array("I"))
+    flags: array = field(default_factory=lambda: array("B"))
+    clamp_min: array = field(default_factory=lambda: array("d"))
+    clamp_max: array = field(default_factory=lambda: array("d"))
+    meta_ids: array = field(default_factory=lambda: array("i"))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def from_assets(cls, assets: Iterable["AttributeSetAsset"]) -> "AttributeColumns":
+        columns = cls()
+        meta_lookup = {}
+        for set_id, asset in enumerate(assets):
+            columns.set_names.append(asset.name)
+            columns.class_names.append(asset.class_name)
+            for attribute in asset.attributes:
+                metadata = attribute.metadata
+                flags = 0
+                if metadata.replicate:
+                    flags |= FLAG_REPLICATE
+                if metadata.generate_hooks:
+                    flags |= FLAG_GENERATE_HOOKS
+                if metadata.skip_on_rep:
+                    flags |= FLAG_SKIP_ON_REP
+                if metadata.clamp_min is not None:
+                    flags |= FLAG_CLAMP_MIN
+                if metadata.clamp_max is not None:
+                    flags |= FLAG_CLAMP_MAX
+                meta_id = _NO_META
+                if metadata.meta_attribute is not None:
+                    flags |= FLAG_META_ATTRIBUTE
+                    meta_id = meta_lookup.setdefault(metadata.meta_attribute, len(meta_lookup))
+                columns.names.append(attribute.name)
+                columns.set_ids.append(set_id)
+                columns.flags.append(flags)
+                columns.clamp_min.append(
+                    math.nan if metadata.clamp_min is None else metadata.clamp_min
+                )
+                columns.clamp_max.append(
+                    math.nan if metadata.clamp_max is None else metadata.clamp_max
+                )
+                columns.meta_ids.append(meta_id)
+        columns.meta_names = list(meta_lookup)
+        return columns
+
+
+def merge_columns(
+    parts: Sequence[AttributeColumns], orders: Sequence[Sequence[Tuple[int, ...]]]
+) -> AttributeColumns:
+    """Combine partial catalogs, ordering sets by their discovery order keys."""
+    ranked = []
+    for part, order in zip(parts, orders):
+        if len(order) != len(part.set_names):
+            raise ValueError("Attribute catalog does not match its discovery order data")
+        rows: List[List[int]] = [[] for _ in part.set_names]
+        for row, set_id in enumerate(part.set_ids):
+            rows[set_id].append(row)
+        ranked.extend((tuple(key), part, set_id, rows[set_id]) for set_id, key in enumerate(order))
+    ranked.sort(key=lambda item: item[0])
+
+    merged = AttributeColumns()
+    meta_lookup = {}
+    for set_id, (_, part, source_set_id, rows) in enumerate(ranked):
+        merged.set_names.append(part.set_names[source_set_id])
+        merged.class_names.append(part.class_names[source_set_id])
+        for row in rows:
+            meta_id = part.meta_ids[row]
+            if meta_id != _NO_META:
+                meta_id = meta_lookup.setdefault(part.meta_names[meta_id], len(meta_lookup))
+            merged.names.append(part.names[row])
+            merged.set_ids.append(set_id)
+            merged.flags.append(part.flags[row])
+            merged.clamp_min.append(part.clamp_min[row])
+            merged.clamp_max.append(part.clamp_max[row])
+            merged.meta_ids.append(meta_id)
+    merged.meta_names = list(meta_lookup)
+    return merged
+
+
+def _pack_strings(values: List[str]) -> bytes:
+    blob = "\0".join(values).encode("utf-8")
+    return struct.pack("<I", len(blob)) + blob
+
+
+def _unpack_strings(buffer: memoryview, offset: int, count: int):
+    (length,) = struct.unpack_from("<I", buffer, offset)
+    offset += 4
+    blob = bytes(buffer[offset : offset + length]).decode("utf-8")
+    values = blob.split("\0") if count else []
+    if len(values) != count:
+        raise ValueError("Attribute catalog string table is corrupt")
+    return values, offset + length
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _read_array(typecode: str, buffer: memoryview, offset: int, count: int):
+    values = array(typecode)
+    size = values.itemsize * count
+    values.frombytes(buffer[offset : offset + size])
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values, offset + size
+
+
+def encode_catalog(columns: AttributeColumns) -> bytes:
+    """Header, string tables, then one block per column."""
+    parts = [
+        _HEADER.pack(
+            CATALOG_MAGIC,
+            CATALOG_VERSION,
+            len(columns.set_names),
+            len(columns.names),
+            len(columns.meta_names),
+        ),
+        _pack_strings(columns.set_names),
+        _pack_strings(columns.class_names),
+        _pack_strings(columns.meta_names),
+        _pack_strings(columns.names),
+        _little_endian(columns.set_ids),
+        _little_endian(columns.flags),
+        _little_endian(columns.clamp_min),
+        _little_endian(columns.clamp_max),
+        _little_endian(columns.meta_ids),
+    ]
+    return b"".join(parts)
+
+
+def write_catalog(path: Path, columns: AttributeColumns) -> None:
+    """Write ``columns`` atomically."""
+    atomic_write_bytes(path, encode_catalog(columns))
+
+
+def read_catalog(path: Path) -> AttributeColumns:
+    buffer = memoryview(path.read_bytes())
+    if len(buffer) < _HEADER.size:
+        raise ValueError(f"{path} is not an attribute catalog")
+    magic, version, set_count, attribute_count, meta_count = _HEADER.unpack_from(buffer, 0)
+    if magic != CATALOG_MAGIC:
+        raise ValueError(f"{path} is not an attribute catalog")
+    if version != CATALOG_VERSION:
+        raise ValueError(f"Unsupported attribute catalog version {version} in {path}")
+
+    offset = _HEADER.size
+    set_names, offset = _unpack_strings(buffer, offset, set_count)
+    class_names, offset = _unpack_strings(buffer, offset, set_count)
+    meta_names, offset = _unpack_strings(buffer, offset, meta_count)
+    names, offset = _unpack_strings(buffer, offset, attribute_count)
+    set_ids, offset = _read_array("I", buffer, offset, attribute_count)
+    flags, offset = _read_array("B", buffer, offset, attribute_count)
+    clamp_min, offset = _read_array("d", buffer, offset, attribute_count)
+    clamp_max, offset = _read_array("d", buffer, offset, attribute_count)
+    meta_ids, offset = _read_array("i", buffer, offset, attribute_count)
+    if offset != len(buffer):
+        raise ValueError(f"Attribute catalog {path} has trailing or missing data")
+    return AttributeColumns(
+        set_names=set_names,
+        class_names=class_names,
+        meta_names=meta_names,
+        names=names,
+        set_ids=set_ids,
+        flags=flags,
+        clamp_min=clamp_min,
+        clamp_max=clamp_max,
+        meta_ids=meta_ids,
+    )
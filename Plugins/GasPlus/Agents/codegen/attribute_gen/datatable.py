@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import csv
+import hashlib
+import io
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from .catalog import Opener, open_binary
+
+try:  # NumPy is optional; it only speeds up the numeric column pass.
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is absent
+    np = None
+
+DATATABLE_SUFFIXES = frozenset({".csv"})
+
+# Unreal DataTable exports name the row-name column "---".
+_ROW_NAME_COLUMN = "---"
+_COLUMN_ALIASES: Dict[str, Sequence[str]] = {
+    "set": ("Set", "AttributeSet", "AttributeSetName"),
+    "name": ("Attribute", "AttributeName", "Name"),
+    "class_name": ("ClassName",),
+    "module_api": ("ModuleAPI", "ModuleApi"),
+    "category": ("Category",),
+    "comment": ("Comment",),
+    "replicate": ("Replicate",),
+    "generate_hooks": ("GenerateHooks",),
+    "skip_on_rep": ("SkipOnRep",),
+    "clamp_min": ("ClampMin",),
+    "clamp_max": ("ClampMax",),
+    "meta_attribute": ("MetaAttribute",),
+}
+_BOOLEAN_VALUES = {
+    "true": True,
+    "1": True,
+    "yes": True,
+    "on": True,
+    "false": False,
+    "0": False,
+    "no": False,
+    "off": False,
+}
+
+
+@dataclass
+class DataTableSet:
+    """All rows of one AttributeSet, already coerced column by column."""
+
+    index: int
+    name: str
+    content_hash: str
+    class_name: Optional[str] = None
+    module_api: Optional[str] = None
+    names: List[str] = field(default_factory=list)
+    categories: List[Optional[str]] = field(default_factory=list)
+    comments: List[Optional[str]] = field(default_factory=list)
+    replicate: List[Optional[bool]] = field(default_factory=list)
+    generate_hooks: List[Optional[bool]] = field(default_factory=list)
+    skip_on_rep: List[Optional[bool]] = field(default_factory=list)
+    clamp_min: List[Optional[float]] = field(default_factory=list)
+    clamp_max: List[Optional[float]] = field(default_factory=list)
+    meta_attribute: List[Optional[str]] = field(default_factory=list)
+
+
+def _resolve_columns(header: Sequence[str]) -> Dict[str, int]:
+    positions = {name.strip(): index for index, name in enumerate(header)}
+    resolved: Dict[str, int] = {}
+    for key, aliases in _COLUMN_ALIASES.items():
+        for alias in aliases:
+            if alias in positions:
+                resolved[key] = positions[alias]
+                break
+    if "name" not in resolved and header and header[0].strip() == _ROW_NAME_COLUMN:
+        resolved["name"] = 0
+    return resolved
+
+
+def _text_column(values: Sequence[str]) -> List[Optional[str]]:
+    return [value.strip() or None for value in values]
+
+
+def _bool_column(
+    values: Sequence[str], column: str, path: Path, lines: Sequence[int]
+) -> List[Optional[bool]]:
+    lowered = [value.strip().lower() for value in values]
+    invalid = [
+        row for row, value in enumerate(lowered) if value and value not in _BOOLEAN_VALUES
+    ]
+    if invalid:
+        row = invalid[0]
+        raise ValueError(
+            f"{path}: row {lines[row]} column {column} is not a boolean: {values[row]!r}"
+        )
+    return [_BOOLEAN_VALUES[value] if value else None for value in lowered]
+
+
+def _float_column(
+    values: Sequence[str], column: str, path: Path, lines: Sequence[int]
+) -> List[Optional[float]]:
+    stripped = [value.strip() for value in values]
+    if np is not None:
+        # NumPy converts the strings in C; on a bad cell fall through to the
+        # per-cell pass, which names the offending row.
+        try:
+            parsed = np.array([value or "nan" for value in stripped], dtype=np.float64)
+        except ValueError:
+            parsed = None
+        if parsed is not None:
+            return [
+                number if value else None for value, number in zip(stripped, parsed.tolist())
+            ]
+    parsed_values: List[Optional[float]] = []
+    for row, value in enumerate(stripped):
+        if not value:
+            parsed_values.append(None)
+            continue
+        try:
+            parsed_values.append(float(value))
+        except ValueError:
+            raise ValueError(
+                f"{path}: row {lines[row]} column {column} is not a number: {values[row]!r}"
+            ) from None
+    return parsed_values
+
+
+def _first_present(values: Sequence[Optional[str]]) -> Optional[str]:
+    return next((value for value in values if value), None)
+
+
+def iter_datatable_sets(path: Path, opener: Opener = open_binary) -> Iterator[DataTableSet]:
+    """Parse a DataTable CSV export (one row per attribute) into per-set columns.
+
+    Every column is parsed and validated in a single pass over the whole
+    sheet before rows are grouped into sets in first-seen order. Errors name
+    the line each row starts on in the file, blank rows included.
+    """
+    rows: List[List[str]] = []
+    lines: List[int] = []
+    with io.TextIOWrapper(opener(path), encoding="utf-8-sig", newline="") as handle:
+        reader = csv.reader(handle)
+        header = next(reader, [])
+        line = reader.line_num + 1
+        for row in reader:
+            if any(cell.strip() for cell in row):
+                rows.append(row)
+                lines.append(line)
+            line = reader.line_num + 1
+
+    columns = _resolve_columns(header)
+    missing = [_COLUMN_ALIASES[key][0] for key in ("set", "name") if key not in columns]
+    if missing:
+        raise ValueError(f"{path}: header has no {' or '.join(missing)} column")
+    width = len(header)
+    for row in rows:
+        if len(row) < width:
+            row.extend([""] * (width - len(row)))
+    raw_columns = list(zip(*rows)) if rows else [()] * width
+
+    def raw(key: str) -> Sequence[str]:
+        index = columns.get(key)
+        return raw_columns[index] if index is not None else [""] * len(rows)
+
+    set_names = _text_column(raw("set"))
+    names = _text_column(raw("name"))
+    for row, (set_name, name) in enumerate(zip(set_names, names)):
+        if not set_name or not name:
+            raise ValueError(f"{path}: row {lines[row]} is missing a set or attribute name")
+
+    parsed = {
+        "class_name": _text_column(raw("class_name")),
+        "module_api": _text_column(raw("module_api")),
+        "categories": _text_column(raw("category")),
+        "comments": _text_column(raw("comment")),
+        "replicate": _bool_column(raw("replicate"), "Replicate", path, lines),
+        "generate_hooks": _bool_column(raw("generate_hooks"), "GenerateHooks", path, lines),
+        "skip_on_rep": _bool_column(raw("skip_on_rep"), "SkipOnRep", path, lines),
+        "clamp_min": _float_column(raw("clamp_min"), "ClampMin", path, lines),
+        "clamp_max": _float_column(raw("clamp_max"), "ClampMax", path, lines),
+        "meta_attribute": _text_column(raw("meta_attribute")),
+    }
+
+    groups: Dict[str, List[int]] = {}
+    for row, set_name in enumerate(set_names):
+        groups.setdefault(str(set_name), []).append(row)
+
+    for index, (set_name, group) in enumerate(groups.items()):
+        digest = hashlib.sha256()
+        digest.update(json.dumps([header] + [rows[row] for row in group]).encode("utf-8"))
+        yield DataTableSet(
+            index=index,
+            name=set_name,
+            content_hash=digest.hexdigest(),
+            class_name=_first_present([parsed["class_name"][row] for row in group]),
+            module_api=_first_present([parsed["module_api"][row] for row in group]),
+            names=[str(names[row]) for row in group],
+            categories=[parsed["categories"][row] for row in group],
+            comments=[parsed["comments"][row] for row in group],
+            replicate=[parsed["replicate"][row] for row in group],
+            generate_hooks=[parsed["generate_hooks"][row] for row in group],
+            skip_on_rep=[parsed["skip_on_rep"][row] for row in group],
+            clamp_min=[parsed["clamp_min"][row] for row in group],
+            clamp_max=[parsed["clamp_max"][row] for row in group],
+            meta_attribute=[parsed["meta_attribute"][row] for row in group],
+        )
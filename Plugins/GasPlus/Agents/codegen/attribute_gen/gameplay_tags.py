@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from .plugins import GeneratorPlugin, PluginAsset, register_plugin
+from .templates import (
+    GAMEPLAY_TAG_DECLARATION,
+    GAMEPLAY_TAG_DEFINITION,
+    GAMEPLAY_TAGS_HEADER,
+    GAMEPLAY_TAGS_SOURCE,
+)
+from .validation import is_cpp_identifier
+
+_TAG_PATTERN = re.compile(r"^[A-Za-z0-9_]+(\.[A-Za-z0-9_]+)*$")
+
+
+def _string_literal(text: str) -> str:
+    return text.replace("\\", "\\\\").replace('"', '\\"')
+
+
+@register_plugin
+class GameplayTagsPlugin(GeneratorPlugin):
+    """Native gameplay tags from DataAssets that list ``gameplayTags``.
+
+    Each asset renders ``<Name>GameplayTags.h``/``.cpp`` with one
+    ``UE_DECLARE_GAMEPLAY_TAG_EXTERN``/``UE_DEFINE_GAMEPLAY_TAG_COMMENT`` pair
+    per tag in a ``<Name>Tags`` namespace; ``Ability.Fire`` becomes
+    ``<Name>Tags::Ability_Fire``. Tags are strings or ``{"tag", "comment"}``
+    objects.
+    """
+
+    name = "gameplayTags"
+    templates = {"header": ("render",), "source": ("render",)}
+
+    def claims(self, data: Dict[str, object]) -> bool:
+        return "gameplayTags" in data
+
+    def parse(self, data: Dict[str, object], source_path: Path) -> PluginAsset:
+        asset = super().parse(data, source_path)
+        if not is_cpp_identifier(asset.name):
+            raise ValueError(f"{asset.name!r} in {source_path.name} is not a valid C++ identifier")
+        # Fail at discovery, like malformed attribute sets, not mid-render.
+        self.tags(asset)
+        return asset
+
+    @staticmethod
+    def tags(asset: PluginAsset) -> List[Tuple[str, str, str]]:
+        """``(identifier, tag, comment)`` for every tag of ``asset``, in order."""
+        rows: List[Tuple[str, str, str]] = []
+        seen: Dict[str, str] = {}
+        for item in asset.data.get("gameplayTags") or []:
+            if isinstance(item, dict):
+                tag = str(item.get("tag") or "").strip()
+                comment = str(item.get("comment") or "").strip()
+            else:
+                tag, comment = str(item).strip(), ""
+            if not _TAG_PATTERN.match(tag):
+                raise ValueError(f"{asset.source_label}: {tag!r} is not a valid gameplay tag")
+            identifier = tag.replace(".", "_")
+            if identifier in seen:
+                raise ValueError(
+                    f"{asset.source_label}: gameplay tags {seen[identifier]!r} and {tag!r} "
+                    f"both map to {identifier}"
+                )
+            seen[identifier] = tag
+            rows.append((identifier, tag, comment))
+        return rows
+
+    def output_paths(self, asset: PluginAsset, output_root: Path) -> Dict[str, Path]:
+        directory = output_root / "Tags"
+        return {
+            "header": directory / f"{asset.name}GameplayTags.h",
+            "source": directory / f"{asset.name}GameplayTags.cpp",
+        }
+
+    def render(self, label: str, asset: PluginAsset) -> str:
+        tags = self.tags(asset)
+        if label == "header":
+            module_api = str(asset.data.get("moduleApi") or "GASPLUSSAMPLE_API")
+            return GAMEPLAY_TAGS_HEADER.render(
+                Name=asset.name,
+                Source=asset.source_label,
+                Declarations="".join(
+                    GAMEPLAY_TAG_DECLARATION.render(ModuleApi=module_api, Identifier=identifier)
+                    for identifier, _, _ in tags
+                ),
+            )
+        return GAMEPLAY_TAGS_SOURCE.render(
+            Name=asset.name,
+            Definitions="".join(
+                GAMEPLAY_TAG_DEFINITION.render(
+                    Identifier=identifier, Tag=tag, Comment=_string_literal(comment)
+                )
+                for identifier, tag, comment in tags
+            ),
+        )
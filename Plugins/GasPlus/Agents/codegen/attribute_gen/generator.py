@@ -3,24 +3,107 @@ from __future__ import annotations
 import argparse
 import configparser
 import dataclasses
+import functools
 import hashlib
+import inspect
 import json
+import marshal
 import os
 import re
+import sys
 import textwrap
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+from .checkpoint import DEFAULT_CHECKPOINT_INTERVAL, RunCheckpoint, checkpoint_path_for
+from .catalog import JSON_LINES_SUFFIXES, is_catalog, iter_catalog
+from .columnar import CATALOG_FILENAME, AttributeColumns, encode_catalog
+from .datatable import DATATABLE_SUFFIXES, DataTableSet, iter_datatable_sets
+from .cache import CACHE_DIR_ENV, DEFAULT_CACHE_MAX_BYTES, OutputCache
+from .gitscope import GitScopeError, changed_paths, index_blob_ids, repository_root
+from .hashing import DEFAULT_ALGORITHM, available_algorithms, hash_files, hash_parts
+from .index import INDEX_FILENAME, AttributeIndex, query_main
+from .journal import ManifestJournal, journal_main
+from .locking import LockTimeoutError, RunCoordinator
+from .metrics import METRICS_JSON_FILENAME, METRICS_TEXT_FILENAME, MeteredStorage, RunMetrics
+from .output_index import OUTPUT_INDEX_FILENAME, entry_key, reconcile_outputs
+from .pipeline import DEFAULT_IO_CONCURRENCY, map_ordered
+from .plugins import GeneratorPlugin, PluginAsset, resolve_plugins
+from .sharding import merge_manifests_main, parse_shard_spec, shard_for, shard_output_path
+from .storage import DiskStorage, OverlayStorage, Storage
+from .templates import (
+    ATTRIBUTE_PROPERTY,
+    ATTRIBUTE_SET_HEADER,
+    ATTRIBUTE_SET_SOURCE,
+    CLAMP_LINES,
+    COUNTER_STAT,
+    GENERATED_HEADER,
+    INSTRUMENTATION,
+    INSTRUMENTATION_SCOPE,
+    LOOKUP_DEFINITIONS,
+    LOOKUP_INFO,
+    META_REGISTRY_HEADER,
+    META_REGISTRY_SOURCE,
+    ONREP_DECLARATION,
+    ONREP_DEFINITION,
+    POST_ATTRIBUTE_CHANGE_BLOCK,
+    PRE_ATTRIBUTE_CHANGE_BLOCK,
+    SNAPSHOT_CAPTURE,
+    SNAPSHOT_DEFINITIONS,
+    SNAPSHOT_FIELD_NAME,
+    SNAPSHOT_FIELD_POINTER,
+    SNAPSHOT_RESTORE,
+    Template,
+)
+from .validation import (
+    SEVERITY_ERROR,
+    ValidationIndex,
+    ValidationIssue,
+    summarize,
+    validate_assets,
+)
 
 DEFAULT_INPUT_ROOTS = ["Content/Attributes"]
+INPUT_SUFFIXES = frozenset({".json"}) | JSON_LINES_SUFFIXES | DATATABLE_SUFFIXES
 DEFAULT_OUTPUT_ROOT = "Source/GasPlusSample/Attributes"
 DEFAULT_CONFIG_PATH = "Config/GasPlus.AttributeGen.ini"
 DEFAULT_MANIFEST_PATH = "Plugins/GasPlus/Agents/codegen/manifest.json"
 DEFAULT_LOG_PATH = "Plugins/GasPlus/Agents/codegen/logs/attribute_gen.log"
 GENERATOR_VERSION = "1.0.0"
+EXIT_STALE = 3
+EXIT_INVALID = 4
+EXIT_FAILED = 5
+# Reported in manifests for compatibility only; cache invalidation is driven
+# by the template fingerprints derived from TEMPLATE_RENDERERS.
 TEMPLATE_VERSION = "1.0.0"
 
+# Entry points of the renderers behind each output kind. The template
+# fingerprint for a kind covers everything they reach (helper methods,
+# properties, compiled templates, module constants; see _renderer_closure),
+# so editing any of it invalidates exactly the outputs it produces.
+TEMPLATE_RENDERERS: Dict[str, Tuple[Union[str, Template], ...]] = {
+    "header": ("_render_header",),
+    "source": ("_render_source",),
+    "generatedHeader": ("_render_generated_header",),
+    "metaRegistry": ("_render_meta_registry_header", "_render_meta_registry_source"),
+}
+
+
+def _as_bool(value: object, default: bool) -> bool:
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        normalized = value.strip().lower()
+        if normalized in {"true", "1", "yes", "on"}:
+            return True
+        if normalized in {"false", "0", "no", "off"}:
+            return False
+    raise ValueError(f"Unable to coerce boolean from {value!r}")
+
 
 @dataclass
 class AttributeMetadata:
@@ -33,19 +116,6 @@ class AttributeMetadata:
 
     @classmethod
     def from_dict(cls, data: Dict[str, object]) -> "AttributeMetadata":
-        def _as_bool(value: object, default: bool) -> bool:
-            if value is None:
-                return default
-            if isinstance(value, bool):
-                return value
-            if isinstance(value, str):
-                normalized = value.strip().lower()
-                if normalized in {"true", "1", "yes", "on"}:
-                    return True
-                if normalized in {"false", "0", "no", "off"}:
-                    return False
-            raise ValueError(f"Unable to coerce boolean from {value!r}")
-
         def _as_float(value: object) -> Optional[float]:
             if value is None:
                 return None
@@ -108,11 +178,50 @@ class AttributeSetAsset:
     module_api: str = "GASPLUSSAMPLE_API"
     attributes: List[AttributeDefinition] = field(default_factory=list)
     source_path: Path = field(default_factory=Path)
+    discovery_order: Tuple[int, ...] = (0,)
+    record: Optional[int] = None
+    input_hash: Optional[str] = None
+    instrument: bool = False
 
     @property
     def file_basename(self) -> str:
         return f"{self.class_name[1:] if self.class_name.startswith('U') else self.class_name}"  # type: ignore[return-value]
 
+    @property
+    def source_label(self) -> str:
+        if self.record is None:
+            return self.source_path.name
+        return f"{self.source_path.name}#{self.record}"
+
+
+GeneratedAsset = Union[AttributeSetAsset, PluginAsset]
+
+
+@dataclass
+class IncludePlan:
+    header: List[str] = field(default_factory=list)
+    source: List[str] = field(default_factory=list)
+    forward_declarations: List[str] = field(default_factory=list)
+
+    def to_summary(self) -> Dict[str, Dict[str, object]]:
+        return {
+            "header": {
+                "count": len(self.header),
+                "paths": list(self.header),
+                "forwardDeclarations": list(self.forward_declarations),
+            },
+            "source": {
+                "count": len(self.source),
+                "paths": list(self.source),
+                "forwardDeclarations": [],
+            },
+            "generatedHeader": {
+                "count": 0,
+                "paths": [],
+                "forwardDeclarations": [],
+            },
+        }
+
 
 @dataclass
 class GeneratorConfig:
@@ -123,6 +232,24 @@ class GeneratorConfig:
     force: bool = False
     dry_run: bool = False
     no_preserve: bool = False
+    project_root: Optional[Path] = None
+    cache_dir: Optional[Path] = None
+    cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES
+    shard_index: Optional[int] = None
+    shard_count: int = 1
+    changed_since: Optional[str] = None
+    staged: bool = False
+    check: Optional[str] = None
+    hash_algorithm: str = DEFAULT_ALGORITHM
+    hash_workers: int = 0
+    io_concurrency: int = DEFAULT_IO_CONCURRENCY
+    keep_going: bool = False
+    resume: bool = False
+    checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL
+    lock_timeout: Optional[float] = None
+    prune: bool = False
+    instrument: bool = False
+    plugins: Sequence[Union[str, GeneratorPlugin]] = dataclasses.field(default_factory=list)
 
 
 _PRESERVE_PATTERN = re.compile(
@@ -166,11 +293,155 @@ def _merge_preserve_regions(existing_text: str, new_text: str) -> str:
     return _PRESERVE_PATTERN.sub(_replacer, new_text)
 
 
+def _callable_fingerprint(function: Callable[..., object]) -> bytes:
+    try:
+        return textwrap.dedent(inspect.getsource(function)).encode("utf-8")
+    except (OSError, TypeError):
+        # Source is unavailable (e.g. frozen builds); fall back to bytecode.
+        return marshal.dumps(function.__code__)
+
+
+_PACKAGE = __name__.rpartition(".")[0]
+# Names of str/dict/list/... methods are never looked up on package classes,
+# so ``", ".join`` or ``data.get`` does not pull in an unrelated ``get``.
+_BUILTIN_ATTRIBUTES = frozenset(
+    name for kind in (str, bytes, list, dict, set, tuple, int, float) for name in dir(kind)
+)
+
+
+def _code_names(code: object) -> Iterator[str]:
+    """Global and attribute names used by ``code`` and the functions nested in it."""
+    yield from code.co_names  # type: ignore[attr-defined]
+    for constant in code.co_consts:  # type: ignore[attr-defined]
+        if inspect.iscode(constant):
+            yield from _code_names(constant)
+
+
+def _class_attribute(owner: type, name: str) -> object:
+    for klass in owner.__mro__:
+        if klass is not object and name in vars(klass):
+            return vars(klass)[name]
+    return None
+
+
+def _as_function(value: object) -> Optional[Callable[..., object]]:
+    if isinstance(value, property):
+        value = value.fget
+    value = getattr(value, "__func__", value)
+    if callable(value):
+        value = inspect.unwrap(value)
+    if not inspect.isfunction(value) or getattr(value, "__isabstractmethod__", False):
+        return None
+    return value
+
+
+def _closure_label(module: str, name: str) -> str:
+    # Package-relative, so the fingerprint does not depend on how the
+    # package was imported.
+    if module.startswith(f"{_PACKAGE}."):
+        module = module[len(_PACKAGE) + 1 :]
+    return f"{module}.{name}"
+
+
+def _renderer_closure(
+    owner: type, roots: Sequence[Union[str, Template]]
+) -> Dict[str, bytes]:
+    """Source of every function, Template and constant the ``roots`` can reach.
+
+    Renderer methods are resolved on ``owner``. From there, every name a
+    function uses is followed when it is a module global Template, function
+    or constant, or a method or property of ``owner`` or of a class the
+    function's module defines or imports from this package. That catches
+    ``asset.file_basename`` or a plugin's module-level helpers without
+    listing them; extra matches only cost an extra regeneration.
+    """
+    closure: Dict[str, bytes] = {}
+    pending: List[Callable[..., object]] = []
+
+    def visit(value: object) -> None:
+        if isinstance(value, Template):
+            closure[f"template:{value.name}"] = value.source.encode("utf-8")
+            return
+        function = _as_function(value)
+        if function is None:
+            return
+        label = _closure_label(function.__module__, function.__qualname__)
+        if label not in closure:
+            closure[label] = _callable_fingerprint(function)
+            pending.append(function)
+
+    for root in roots:
+        if isinstance(root, Template):
+            visit(root)
+            continue
+        renderer = _class_attribute(owner, root)
+        if _as_function(renderer) is None:
+            raise AttributeError(f"{owner.__name__} has no renderer method {root!r}")
+        visit(renderer)
+
+    while pending:
+        function = pending.pop()
+        module = function.__module__
+        namespace = function.__globals__
+
+        def local(value: object) -> bool:
+            defined_in = getattr(value, "__module__", None) or ""
+            return defined_in == module or defined_in.startswith(f"{_PACKAGE}.")
+
+        classes = [owner] + [
+            value for value in namespace.values() if isinstance(value, type) and local(value)
+        ]
+        for name in _code_names(function.__code__):
+            if name in namespace:
+                value = namespace[name]
+                if isinstance(value, Template) or (inspect.isfunction(value) and local(value)):
+                    visit(value)
+                elif isinstance(value, re.Pattern):
+                    closure[_closure_label(module, name)] = value.pattern.encode("utf-8")
+                elif isinstance(value, (str, int, float)):
+                    closure[_closure_label(module, name)] = repr(value).encode("utf-8")
+            if name.startswith("__") or name in _BUILTIN_ATTRIBUTES:
+                continue
+            for klass in classes:
+                visit(_class_attribute(klass, name))
+    return closure
+
+
+@functools.lru_cache(maxsize=None)
+def _template_fingerprint(
+    owner: type, kind: str, parts: Optional[Tuple[Union[str, Template], ...]] = None
+) -> str:
+    digest = hashlib.sha256()
+    digest.update(kind.encode("utf-8"))
+    closure = _renderer_closure(owner, TEMPLATE_RENDERERS[kind] if parts is None else parts)
+    for label in sorted(closure):
+        digest.update(b"|")
+        digest.update(label.encode("utf-8"))
+        digest.update(b"=")
+        digest.update(closure[label])
+    return digest.hexdigest()
+
+
 class AttributeSetGenerator:
     """Main entry point for attribute set generation."""
 
-    def __init__(self, config: GeneratorConfig):
+    def __init__(self, config: GeneratorConfig, storage: Optional[Storage] = None):
         self.config = config
+        # Dry runs exercise every write against an in-memory overlay of the
+        # real tree; ``storage.changes`` then lists what a real run would write.
+        if storage is None:
+            storage = OverlayStorage(DiskStorage()) if config.dry_run else DiskStorage()
+        self.storage = storage
+        self.plugins: Dict[str, GeneratorPlugin] = resolve_plugins(config.plugins)
+        self.metrics = RunMetrics()
+        self._io: Storage = MeteredStorage(storage, self.metrics)
+        self.cache: Optional[OutputCache] = (
+            OutputCache(config.cache_dir, config.cache_max_bytes)
+            if config.cache_dir is not None
+            else None
+        )
+        self._changed_inputs: Optional[Set[Path]] = None
+        self._input_blobs: Dict[Path, str] = {}
 
     @staticmethod
     def from_args(args: Optional[Sequence[str]] = None) -> "AttributeSetGenerator":
@@ -211,7 +482,7 @@ class AttributeSetGenerator:
         parser.add_argument(
             "--force",
             action="store_true",
-            help="Force regeneration even when hashes are unchanged.",
+            help="Force regeneration even when hashes are unchanged (template edits are detected automatically).",
         )
         parser.add_argument(
             "--dry-run",
@@ -223,8 +494,136 @@ class AttributeSetGenerator:
             action="store_true",
             help="Disable preservation of // GASPLUS-PRESERVE blocks in existing outputs.",
         )
+        parser.add_argument(
+            "--project-root",
+            dest="project_root",
+            default=".",
+            help="Project root used to make cache keys and paths project-relative.",
+        )
+        parser.add_argument(
+            "--cache-dir",
+            dest="cache_dir",
+            default=os.environ.get(CACHE_DIR_ENV),
+            help=f"Shared local output cache directory (defaults to ${CACHE_DIR_ENV}; disabled when unset).",
+        )
+        parser.add_argument(
+            "--cache-max-mb",
+            dest="cache_max_mb",
+            type=int,
+            default=DEFAULT_CACHE_MAX_BYTES // (1024 * 1024),
+            help="Size bound for the shared output cache; least recently used entries are evicted.",
+        )
+
+        parser.add_argument(
+            "--shard",
+            dest="shard",
+            default=None,
+            help="Only process shard K of N (1-based, e.g. 2/4) and write a partial manifest; "
+            "combine partials with the merge-manifests subcommand.",
+        )
+        parser.add_argument(
+            "--changed-since",
+            dest="changed_since",
+            default=None,
+            metavar="REF",
+            help="Only process inputs git reports as changed since REF (plus untracked files).",
+        )
+        parser.add_argument(
+            "--staged",
+            action="store_true",
+            help="Only process inputs staged in the git index (for pre-commit hooks).",
+        )
+        parser.add_argument(
+            "--check",
+            nargs="?",
+            const="first",
+            choices=["first", "all"],
+            default=None,
+            help="Verify generated outputs are up to date without writing anything; stops at the "
+            f"first stale output unless --check=all. Exits with {EXIT_STALE} when stale.",
+        )
+
+        parser.add_argument(
+            "--hash-algorithm",
+            dest="hash_algorithm",
+            choices=available_algorithms(),
+            default=DEFAULT_ALGORITHM,
+            help="Digest for composite and per-output hashes; inputHash is always SHA-256.",
+        )
+        parser.add_argument(
+            "--hash-workers",
+            dest="hash_workers",
+            type=int,
+            default=0,
+            help="Threads used to hash input files (0 picks a default from the CPU count).",
+        )
+
+        parser.add_argument(
+            "--io-concurrency",
+            dest="io_concurrency",
+            type=int,
+            default=DEFAULT_IO_CONCURRENCY,
+            help="Maximum attribute sets read, rendered or written concurrently (1 runs serially).",
+        )
+
+        parser.add_argument(
+            "--keep-going",
+            action="store_true",
+            help="Record inputs that fail to parse, validate or generate as manifest error "
+            f"entries and continue; exits with {EXIT_FAILED} if any failed.",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Reuse results checkpointed by an interrupted or failed run and only process "
+            "the remaining attribute sets.",
+        )
+        parser.add_argument(
+            "--checkpoint-interval",
+            dest="checkpoint_interval",
+            type=int,
+            default=DEFAULT_CHECKPOINT_INTERVAL,
+            help="Flush the checkpoint after this many completed attribute sets.",
+        )
+
+        parser.add_argument(
+            "--lock-timeout",
+            dest="lock_timeout",
+            type=float,
+            default=None,
+            help="Seconds to wait for a concurrent run to finish before giving up (default: wait).",
+        )
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="Delete outputs and hash sidecars whose input was removed or renamed "
+            "(they are only reported otherwise). Sharded runs leave this to merge-manifests.",
+        )
+        parser.add_argument(
+            "--instrument",
+            action="store_true",
+            help="Emit Unreal Insights trace scopes and stat counters in the generated hooks of "
+            "every set, not only those whose DataAsset sets Instrument.",
+        )
+        parser.add_argument(
+            "--plugin",
+            dest="plugins",
+            action="append",
+            default=[],
+            metavar="NAME|MODULE:CLASS",
+            help="Enable an additional generator plugin (built in: gameplayTags); it shares "
+            "discovery, hashing and the manifest with the attribute set generator. Repeat for "
+            "several plugins.",
+        )
 
         parsed = parser.parse_args(args=args)
+        shard_index: Optional[int] = None
+        shard_count = 1
+        if parsed.shard:
+            try:
+                shard_index, shard_count = parse_shard_spec(parsed.shard)
+            except ValueError as error:
+                parser.error(str(error))
         input_roots = AttributeSetGenerator._resolve_input_roots(parsed.inputs, parsed.config_path)
         config = GeneratorConfig(
             input_roots=input_roots,
@@ -234,8 +633,29 @@ class AttributeSetGenerator:
             force=parsed.force,
             dry_run=parsed.dry_run,
             no_preserve=parsed.no_preserve,
+            project_root=Path(parsed.project_root),
+            cache_dir=Path(parsed.cache_dir) if parsed.cache_dir else None,
+            cache_max_bytes=parsed.cache_max_mb * 1024 * 1024,
+            shard_index=shard_index,
+            shard_count=shard_count,
+            changed_since=parsed.changed_since,
+            staged=parsed.staged,
+            check=parsed.check,
+            hash_algorithm=parsed.hash_algorithm,
+            hash_workers=parsed.hash_workers,
+            io_concurrency=parsed.io_concurrency,
+            keep_going=parsed.keep_going,
+            resume=parsed.resume,
+            checkpoint_interval=parsed.checkpoint_interval,
+            lock_timeout=parsed.lock_timeout,
+            prune=parsed.prune,
+            instrument=parsed.instrument,
+            plugins=parsed.plugins,
         )
-        return AttributeSetGenerator(config)
+        try:
+            return AttributeSetGenerator(config)
+        except ValueError as error:
+            parser.error(str(error))
 
     @staticmethod
     def _resolve_input_roots(cli_inputs: Optional[Sequence[str]], config_path: str) -> Sequence[Path]:
@@ -275,86 +695,798 @@ class AttributeSetGenerator:
                 discovered.append(path)
         return discovered
 
-    def run(self) -> None:
-        start_time = time.time()
-        assets = list(self._discover_assets())
-        log_lines: List[str] = []
-        manifest_entries: List[Dict[str, object]] = []
-        cli_lines: List[str] = []
+    def run(self) -> int:
+        if not self._io.persistent:
+            return self._generate()
+        # Editor, hooks and terminals may launch the generator at once; only
+        # one may touch the hash state at a time, and a waiter whose request
+        # was fully served by the run it waited on reuses that result.
+        manifest_path, _ = self._run_output_paths()
+        coordinator = RunCoordinator(
+            manifest_path.with_name(f".{manifest_path.stem}.lock"),
+            manifest_path.with_name(f".{manifest_path.stem}.state.json"),
+            self._request_key(),
+            self.config.lock_timeout,
+        )
+        exit_code, reused = coordinator.run(self._generate)
+        if reused is not None:
+            print(
+                f"Reused results of the identical run started by pid {reused.get('pid')} "
+                f"while waiting (exit code {exit_code})."
+            )
+        return exit_code
+
+    def _run_output_paths(self) -> Tuple[Path, Path]:
+        manifest_path = self.config.manifest_path
+        log_path = self.config.log_path
+        if self._is_sharded():
+            manifest_path = shard_output_path(
+                manifest_path, self.config.shard_index, self.config.shard_count
+            )
+            log_path = shard_output_path(log_path, self.config.shard_index, self.config.shard_count)
+        return manifest_path, log_path
+
+    def _request_key(self) -> str:
+        # Everything that decides what a run writes; tuning knobs such as
+        # concurrency or checkpoint cadence do not change the result.
+        request = {
+            "inputRoots": [str(Path(root).resolve()) for root in self.config.input_roots],
+            "outputRoot": str(self.config.output_root.resolve()),
+            "manifest": str(self.config.manifest_path.resolve()),
+            "log": str(self.config.log_path.resolve()),
+            "force": self.config.force,
+            "noPreserve": self.config.no_preserve,
+            "shard": [self.config.shard_index, self.config.shard_count],
+            "changedSince": self.config.changed_since,
+            "staged": self.config.staged,
+            "hashAlgorithm": self.config.hash_algorithm,
+            "keepGoing": self.config.keep_going,
+            "prune": self.config.prune,
+            "instrument": self.config.instrument,
+            "plugins": sorted(self.plugins),
+        }
+        return hashlib.sha256(json.dumps(request, sort_keys=True).encode("utf-8")).hexdigest()
 
+    def _generate(self) -> int:
+        start_time = time.time()
+        self.metrics = RunMetrics()
+        self._io = MeteredStorage(self.storage, self.metrics)
+        if self._is_git_scoped():
+            self._load_git_scope()
+        assets, failures = self._discover_all_assets()
+        # Class and output names must be unique across the whole project, so
+        # validation sees every set even when this run only renders a shard
+        # of them or the inputs git reports as changed.
+        attribute_sets = [asset for asset in assets if isinstance(asset, AttributeSetAsset)]
+        context = self._scope_context_assets() if self._is_git_scoped() else []
+        issues = validate_assets(attribute_sets, ValidationIndex.build(attribute_sets + context))
+        if self._is_sharded():
+            assets = [asset for asset in assets if self._owns_asset(asset.source_path, asset.record)]
+            failures = [
+                failure
+                for failure in failures
+                if self._owns_asset(
+                    Path(failure["manifest"]["input"]), failure["manifest"].get("record")
+                )
+            ]
+        self.metrics.increment("assets_discovered", len(assets))
         overrides = {
             "force": self.config.force,
             "dryRun": self.config.dry_run,
             "noPreserve": self.config.no_preserve,
         }
+        if self.config.hash_algorithm != DEFAULT_ALGORITHM:
+            overrides["hashAlgorithm"] = self.config.hash_algorithm
+        if self._is_git_scoped():
+            overrides["changedSince"] = self.config.changed_since
+            overrides["staged"] = self.config.staged
+
+        manifest_path, log_path = self._run_output_paths()
+        if any(issue.severity == SEVERITY_ERROR for issue in issues):
+            if not self.config.keep_going:
+                return self._skip_invalid_run(manifest_path, overrides, issues)
+            assets, invalid = self._isolate_invalid_assets(assets, issues)
+            failures.extend(invalid)
+
+        self._prefetch_input_hashes(assets)
+        log_lines: List[str] = []
+        manifest_entries: List[Dict[str, object]] = []
+        cli_lines: List[str] = []
 
         output_root = self.config.output_root.resolve()
-        if not self.config.dry_run:
-            output_root.mkdir(parents=True, exist_ok=True)
-            if self.config.manifest_path.parent:
-                self.config.manifest_path.parent.mkdir(parents=True, exist_ok=True)
-            if self.config.log_path.parent:
-                self.config.log_path.parent.mkdir(parents=True, exist_ok=True)
-
-        self._ensure_meta_registry(output_root)
+        self._io.mkdir(output_root)
+        if manifest_path.parent:
+            self._io.mkdir(manifest_path.parent)
+        if log_path.parent:
+            self._io.mkdir(log_path.parent)
+
+        # The registry is shared by every set; only one shard owns writing it.
+        if not self._is_sharded() or self.config.shard_index == 1:
+            self._ensure_meta_registry(output_root)
+
+        checkpoint: Optional[RunCheckpoint] = None
+        if self._io.persistent and assets:
+            checkpoint = RunCheckpoint(
+                checkpoint_path_for(manifest_path),
+                self._run_fingerprint(output_root, overrides),
+                self.config.checkpoint_interval,
+            )
+            if self.config.resume:
+                print(f"Resuming from {checkpoint.load()} checkpointed attribute set(s).")
+
+        # Failures sort in among the processed sets by discovery order so the
+        # manifest and log stay deterministic.
+        outcomes: List[Tuple[Tuple[int, ...], Optional[GeneratedAsset], Dict[str, object]]] = [
+            (asset.discovery_order, asset, result)
+            for asset, result in zip(assets, self._process_assets(assets, checkpoint))
+        ]
+        outcomes.extend((failure["order"], None, failure) for failure in failures)
+        outcomes.sort(key=lambda outcome: outcome[0])
 
-        for asset in assets:
-            result = self._process_asset(asset)
+        generated: List[Tuple[AttributeSetAsset, Dict[str, object]]] = []
+        failed_inputs: Set[str] = set()
+        for _, asset, result in outcomes:
             manifest_entries.append(result["manifest"])
             if result["log_line"]:
                 log_lines.append(result["log_line"])
             cli_lines.append(result["cli_line"])
+            if result.get("failed"):
+                failed_inputs.add(str(result["manifest"]["input"]))
+            elif isinstance(asset, AttributeSetAsset):
+                # Only attribute sets feed the SQLite index and the catalog.
+                generated.append((asset, result["manifest"]))
+
+        index_summary: Optional[Dict[str, object]] = None
+        if self._io.persistent:
+            index_summary = self._update_index(generated, failed_inputs)
+
+        if self._is_git_scoped():
+            manifest_entries = self._merge_scoped_entries(manifest_path, manifest_entries)
+
+        # Shards only see part of the tree, so they cannot tell which outputs
+        # lost their input; merge-manifests reconciles the merged tree instead.
+        orphan_summary: Optional[Dict[str, object]] = None
+        if not self._is_sharded():
+            orphaned = reconcile_outputs(
+                self._io, self.config.manifest_path, manifest_entries, self.config.prune
+            )
+            orphan_summary = {
+                "path": OUTPUT_INDEX_FILENAME,
+                "files": [str(path) for path in orphaned],
+                "pruned": self.config.prune,
+            }
+            for path in orphaned:
+                label = self._project_relative(path)
+                if self.config.prune:
+                    prefix = "DRY-PRUNED" if self.config.dry_run else "PRUNED"
+                    log_lines.append(f"{prefix} {label}")
+                    cli_lines.append(f"[{prefix}] {label}")
+                else:
+                    cli_lines.append(f"[ORPHAN] {label} (no input left; run with --prune to delete)")
+
+        cache_summary: Optional[Dict[str, object]] = None
+        if self.cache is not None:
+            cache_summary = (
+                self.cache.summary() if self.config.dry_run else self.cache.finalize()
+            )
+
+        # The columnar catalog describes the whole project, so git-scoped runs
+        # leave the previous one in place; shards write partials that
+        # merge-manifests combines.
+        columns: Optional[AttributeColumns] = None
+        catalog_path = manifest_path.parent / CATALOG_FILENAME
+        if not self._is_git_scoped():
+            columns = AttributeColumns.from_assets(asset for asset, _ in generated)
+            if self._is_sharded():
+                catalog_path = shard_output_path(
+                    catalog_path, self.config.shard_index, self.config.shard_count
+                )
 
         elapsed = round(time.time() - start_time, 4)
         manifest = {
             "generatorVersion": GENERATOR_VERSION,
             "templateVersion": TEMPLATE_VERSION,
+            "templateFingerprints": self._template_fingerprints(),
             "elapsedSeconds": elapsed,
             "flags": overrides,
             "entries": manifest_entries,
+            "validation": summarize(issues),
         }
+        if cache_summary is not None:
+            manifest["cache"] = cache_summary
+        if index_summary is not None:
+            manifest["index"] = index_summary
+        if orphan_summary is not None:
+            manifest["orphans"] = orphan_summary
+        if columns is not None:
+            manifest["catalog"] = {
+                "path": catalog_path.name,
+                "sets": len(columns.set_names),
+                "attributes": len(columns),
+            }
+        if self._is_sharded():
+            manifest["shard"] = {
+                "index": self.config.shard_index,
+                "count": self.config.shard_count,
+                "order": [list(order) for order, _, _ in outcomes],
+                "logLines": log_lines,
+            }
 
-        if not self.config.dry_run:
-            self.config.manifest_path.write_text(json.dumps(manifest, indent=2) + "\n")
-            log_output = "\n".join(log_lines)
-            if log_output:
-                log_output += "\n"
-            self.config.log_path.write_text(log_output)
+        # Shard manifests are partial; merge-manifests journals the merged one.
+        journal: Optional[ManifestJournal] = None
+        if self._io.persistent and not self._is_sharded():
+            journal = ManifestJournal.for_manifest(manifest_path)
+            manifest["journal"] = {"path": journal.path.name, "run": journal.next_run}
+
+        failure_count = sum(1 for _, _, result in outcomes if result.get("failed"))
+        if columns is not None:
+            self._io.write_bytes(catalog_path, encode_catalog(columns))
+        self._io.replace_text(manifest_path, json.dumps(manifest, indent=2) + "\n")
+        if journal is not None:
+            journal.append(manifest)
+        log_output = "\n".join(log_lines)
+        if log_output:
+            log_output += "\n"
+        self._io.replace_text(log_path, log_output)
+        # Written last and unmetered so the export covers the whole run.
+        for filename, payload in (
+            (METRICS_TEXT_FILENAME, self.metrics.to_openmetrics()),
+            (METRICS_JSON_FILENAME, self.metrics.to_json()),
+        ):
+            metrics_path = manifest_path.parent / filename
+            if self._is_sharded():
+                metrics_path = shard_output_path(
+                    metrics_path, self.config.shard_index, self.config.shard_count
+                )
+            self.storage.replace_text(metrics_path, payload)
+        if checkpoint is not None:
+            # Keep the checkpoint while anything failed so --resume only
+            # retries the failures.
+            if failure_count:
+                checkpoint.flush()
+            else:
+                checkpoint.discard()
 
         for line in cli_lines:
             print(line)
         if not cli_lines:
             print("No attribute sets processed.")
-        print("Validation issues: none detected.")
+        if self.cache is not None:
+            stats = self.cache.stats
+            print(f"Output cache: {stats.hits} hits, {stats.misses} misses ({self.cache.root}).")
+        for issue in issues:
+            print(issue.format())
+        if not issues:
+            print("Validation issues: none detected.")
+        if failure_count:
+            print(f"Generation finished with {failure_count} failed input(s).")
+            return EXIT_FAILED
         print(
             f"Completed attribute generation in {elapsed:.4f}s (dryRun={self.config.dry_run})."
         )
+        return 0
+
+    def _skip_invalid_run(
+        self,
+        manifest_path: Path,
+        overrides: Dict[str, object],
+        issues: Sequence[ValidationIssue],
+    ) -> int:
+        # Rendering invalid sets would clobber outputs or emit code that does
+        # not compile. Entries, log and journal stay as the last good run left
+        # them so the run after the fix is still incremental; only the
+        # validation block records why this one was skipped.
+        manifest = None if self._is_sharded() else self._previous_manifest(manifest_path)
+        if manifest is None:
+            manifest = {
+                "generatorVersion": GENERATOR_VERSION,
+                "templateVersion": TEMPLATE_VERSION,
+                "templateFingerprints": self._template_fingerprints(),
+                "flags": overrides,
+                "entries": [],
+            }
+            if self._is_sharded():
+                manifest["shard"] = {
+                    "index": self.config.shard_index,
+                    "count": self.config.shard_count,
+                    "order": [],
+                    "logLines": [],
+                }
+        manifest["validation"] = summarize(issues)
+        self._io.mkdir(manifest_path.parent)
+        self._io.replace_text(manifest_path, json.dumps(manifest, indent=2) + "\n")
+
+        for issue in issues:
+            print(issue.format())
+        errors = sum(1 for issue in issues if issue.severity == SEVERITY_ERROR)
+        print(f"Generation skipped: {errors} validation error(s).")
+        return EXIT_INVALID
+
+    def _isolate_invalid_assets(
+        self, assets: List[GeneratedAsset], issues: Sequence[ValidationIssue]
+    ) -> Tuple[List[GeneratedAsset], List[Dict[str, object]]]:
+        # In keep-going mode only the sets an error names are held back, as
+        # failed entries; every other set still renders.
+        messages: Dict[str, List[str]] = {}
+        for issue in issues:
+            if issue.severity == SEVERITY_ERROR:
+                for source in issue.sources:
+                    messages.setdefault(source, []).append(issue.message)
+        valid: List[GeneratedAsset] = []
+        invalid: List[Dict[str, object]] = []
+        for asset in assets:
+            errors = messages.get(asset.source_label)
+            if not isinstance(asset, AttributeSetAsset) or errors is None:
+                valid.append(asset)
+                continue
+            invalid.append(
+                self._failure_result(
+                    asset.discovery_order,
+                    asset.source_path,
+                    asset.record,
+                    "validate",
+                    ValueError("; ".join(errors)),
+                )
+            )
+        return valid, invalid
+
+    def _previous_manifest(self, manifest_path: Path) -> Optional[Dict[str, object]]:
+        if not self._io.exists(manifest_path):
+            return None
+        try:
+            manifest = json.loads(self._io.read_text(manifest_path))
+        except (OSError, json.JSONDecodeError, ValueError):
+            return None
+        return manifest if isinstance(manifest, dict) else None
+
+    def _run_fingerprint(self, output_root: Path, overrides: Dict[str, object]) -> str:
+        digest = hashlib.sha256()
+        digest.update(GENERATOR_VERSION.encode("utf-8"))
+        digest.update(json.dumps(self._template_fingerprints(), sort_keys=True).encode("utf-8"))
+        digest.update(json.dumps(overrides, sort_keys=True).encode("utf-8"))
+        digest.update(str(output_root).encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _asset_key(asset: GeneratedAsset) -> str:
+        if asset.record is None:
+            return str(asset.source_path)
+        return f"{asset.source_path}#{asset.record}"
+
+    def _failure_result(
+        self,
+        order: Tuple[int, ...],
+        source_path: Path,
+        record: Optional[int],
+        stage: str,
+        error: Exception,
+    ) -> Dict[str, object]:
+        label = source_path.name if record is None else f"{source_path.name}#{record}"
+        entry: Dict[str, object] = {
+            "input": str(source_path.resolve()),
+            "error": {"stage": stage, "type": type(error).__name__, "message": str(error)},
+            "status": {"write": "error", "dryRun": self.config.dry_run},
+        }
+        if record is not None:
+            entry["record"] = record
+        return {
+            "manifest": entry,
+            "log_line": f"FAILED {label} ({stage}): {error}",
+            "cli_line": f"[ERROR] {label} ({stage}): {error}",
+            "order": order,
+            "failed": True,
+        }
 
-    def _discover_assets(self) -> Iterable[AttributeSetAsset]:
+    def _process_assets(
+        self, assets: List[GeneratedAsset], checkpoint: Optional[RunCheckpoint]
+    ) -> List[Dict[str, object]]:
+        def process(asset: GeneratedAsset) -> Dict[str, object]:
+            key = self._asset_key(asset)
+            if checkpoint is not None and self.config.resume:
+                resumed = checkpoint.resumed(key, asset.input_hash)
+                if resumed is not None:
+                    return dict(resumed, cli_line=f"RESUMED {resumed['cli_line']}")
+            try:
+                result = self._process_asset(asset)
+            except Exception as error:  # isolate any per-set failure in keep-going mode
+                if not self.config.keep_going:
+                    raise
+                return self._failure_result(
+                    asset.discovery_order, asset.source_path, asset.record, "generate", error
+                )
+            if checkpoint is not None:
+                checkpoint.record(key, result)
+            return result
+
+        # Each set's reads, render and writes run on a bounded worker pool so
+        # one set's file round-trips overlap another's.
+        try:
+            return map_ordered(process, assets, self.config.io_concurrency)
+        except BaseException:
+            # Persist whatever completed so --resume can pick up from here.
+            if checkpoint is not None:
+                checkpoint.flush()
+            raise
+
+    def _prefetch_input_hashes(self, assets: Sequence[GeneratedAsset]) -> None:
+        # Hash every plain input up front on a thread pool instead of one file
+        # at a time inside _process_asset. Inputs git already fingerprinted are
+        # left to the sidecar blob check.
+        pending = [
+            asset
+            for asset in assets
+            if asset.input_hash is None and asset.source_path not in self._input_blobs
+        ]
+        try:
+            digests = hash_files(
+                [asset.source_path for asset in pending],
+                max_workers=self.config.hash_workers,
+                hasher=self._io.hash_file,
+            )
+        except OSError:
+            if not self.config.keep_going:
+                raise
+            # Leave hashing to _process_asset so the failure is isolated per set.
+            return
+        for asset in pending:
+            asset.input_hash = digests[asset.source_path]
+
+    def _update_index(
+        self,
+        generated: List[Tuple[AttributeSetAsset, Dict[str, object]]],
+        failed_inputs: Set[str],
+    ) -> Dict[str, object]:
+        # Full runs drop sets whose input disappeared; git-scoped runs may only
+        # drop sets of inputs they were told changed; shards never prune, as
+        # merge-manifests prunes against the merged entries instead.
+        # Inputs that failed this run keep their previous rows.
+        prune: Optional[Callable[[str], bool]] = None
+        if self._is_git_scoped():
+            changed = {str(path) for path in self._changed_inputs or ()}
+            prune = lambda input_path: input_path in changed and input_path not in failed_inputs
+        elif not self._is_sharded():
+            prune = lambda input_path: input_path not in failed_inputs
+
+        rows = []
+        for asset, entry in generated:
+            outputs = self._output_paths(asset)
+            revision = hash_parts(
+                [str(entry["inputHash"])] + [str(outputs[label]) for label in sorted(outputs)]
+            )
+            rows.append((self._entry_key(entry), revision, asset, outputs))
+
+        index_path = self.config.manifest_path.parent / INDEX_FILENAME
+        with AttributeIndex(index_path) as index:
+            update = index.update(rows, prune=prune)
+        return {"path": INDEX_FILENAME, **update.to_summary()}
+
+    def _is_sharded(self) -> bool:
+        return self.config.shard_index is not None and self.config.shard_count > 1
+
+    def _input_key(self, path: Path) -> str:
+        return self._project_relative(path)
+
+    def _owns_input(self, key: str) -> bool:
+        if not self._is_sharded():
+            return True
+        return shard_for(key, self.config.shard_count) == self.config.shard_index
+
+    def _owns_asset(self, source_path: Path, record: Optional[int]) -> bool:
+        key = self._input_key(source_path)
+        return self._owns_input(key if record is None else f"{key}#{record}")
+
+    def _is_git_scoped(self) -> bool:
+        return self.config.changed_since is not None or self.config.staged
+
+    def _load_git_scope(self) -> None:
+        repo_root = repository_root((self.config.project_root or Path.cwd()).resolve())
+        self._changed_inputs = changed_paths(
+            repo_root, since=self.config.changed_since, staged=self.config.staged
+        )
+        candidates = [
+            path
+            for path in self._changed_inputs
+            if path.suffix in INPUT_SUFFIXES
+            and self._io.exists(path)
+            and self._input_root_index(path) is not None
+        ]
+        self._input_blobs = index_blob_ids(repo_root, candidates)
+
+    def _input_root_index(self, path: Path) -> Optional[int]:
+        for index, root in enumerate(self.config.input_roots):
+            try:
+                path.relative_to(root.resolve())
+            except ValueError:
+                continue
+            return index
+        return None
+
+    def _iter_input_files(self) -> Iterable[Tuple[int, Path]]:
+        ordinal = 0
         for root in self.config.input_roots:
-            if not root.exists():
+            if not self._io.exists(root):
+                continue
+            if self._changed_inputs is not None:
+                # Git already told us what changed; never walk the tree.
+                resolved_root = root.resolve()
+                candidates = sorted(
+                    path
+                    for path in self._changed_inputs
+                    if path.suffix in INPUT_SUFFIXES
+                    and self._io.exists(path)
+                    and path.is_relative_to(resolved_root)
+                )
+            else:
+                candidates = sorted(
+                    path for path in self._io.iter_files(root) if path.suffix in INPUT_SUFFIXES
+                )
+            for file_path in candidates:
+                yield ordinal, file_path
+                ordinal += 1
+
+    @staticmethod
+    def _entry_key(entry: Dict[str, object]) -> str:
+        return entry_key(entry)
+
+    def _entry_sort_key(self, entry: Dict[str, object]) -> Tuple[object, ...]:
+        path = Path(str(entry.get("input")))
+        root_index = self._input_root_index(path)
+        return (
+            len(self.config.input_roots) if root_index is None else root_index,
+            path.parts,
+            int(entry.get("record") or 0),
+        )
+
+    def _scope_context_assets(self) -> List[AttributeSetAsset]:
+        # Sets outside the git scope are not parsed again; the previous
+        # manifest records enough of them for the cross-set checks.
+        changed = {str(path) for path in self._changed_inputs or ()}
+        assets: List[AttributeSetAsset] = []
+        for entry in (self._previous_manifest(self.config.manifest_path) or {}).get("entries") or []:
+            if (
+                not isinstance(entry, dict)
+                or "className" not in entry
+                or entry.get("generator")
+                or str(entry.get("input")) in changed
+            ):
                 continue
-            for file_path in sorted(root.rglob("*.json")):
-                data = json.loads(file_path.read_text())
-                asset = self._parse_asset(data, file_path)
+            stem = Path(str(dict(entry.get("outputs") or {}).get("header", ""))).stem
+            assets.append(
+                AttributeSetAsset(
+                    name=stem[: -len("AttributeSet")] if stem.endswith("AttributeSet") else stem,
+                    class_name=str(entry["className"]),
+                    attributes=[
+                        AttributeDefinition(
+                            name=str(attribute["name"]),
+                            metadata=AttributeMetadata.from_dict(
+                                dict(attribute.get("metadata") or {})
+                            ),
+                        )
+                        for attribute in entry.get("attributes") or []
+                    ],
+                    source_path=Path(str(entry["input"])),
+                    record=entry.get("record"),
+                )
+            )
+        return assets
+
+    def _merge_scoped_entries(
+        self, manifest_path: Path, processed: List[Dict[str, object]]
+    ) -> List[Dict[str, object]]:
+        # A git-scoped run only touched changed inputs; carry every other
+        # entry over from the previous manifest so it still describes the tree.
+        previous_entries = list((self._previous_manifest(manifest_path) or {}).get("entries") or [])
+        changed = {str(path) for path in self._changed_inputs or ()}
+        merged: Dict[str, Dict[str, object]] = {}
+        for entry in previous_entries:
+            if isinstance(entry, dict) and str(entry.get("input")) not in changed:
+                merged[self._entry_key(entry)] = entry
+        for entry in processed:
+            merged[self._entry_key(entry)] = entry
+        return sorted(merged.values(), key=self._entry_sort_key)
+
+    def check(self) -> int:
+        """Compare fingerprints against the hash store without rendering or writing."""
+        start_time = time.time()
+        if self._is_git_scoped():
+            self._load_git_scope()
+        stop_at_first = self.config.check != "all"
+        stale: List[str] = []
+
+        recorded_entries: Dict[str, Dict[str, object]] = {}
+        recorded_fingerprints: Dict[str, str] = {}
+        if self._io.exists(self.config.manifest_path):
+            try:
+                recorded_manifest = json.loads(self._io.read_text(self.config.manifest_path))
+                recorded_fingerprints = dict(recorded_manifest.get("templateFingerprints") or {})
+                for entry in recorded_manifest.get("entries") or []:
+                    recorded_entries[self._entry_name(entry)] = entry
+            except (OSError, json.JSONDecodeError, ValueError, AttributeError, TypeError):
+                recorded_entries = {}
+
+        meta_root = self.config.output_root.resolve() / "Meta"
+        if recorded_fingerprints.get("metaRegistry") != self._template_fingerprints()["metaRegistry"]:
+            stale.append("[STALE] Meta registry template changed since the last generation")
+        elif not all(
+            self._io.exists(meta_root / name) for name in ("MetaAttributes.h", "MetaAttributes.cpp")
+        ):
+            stale.append("[STALE] Meta registry output missing")
+
+        checked = 0
+        for asset in self._discover_assets():
+            if stale and stop_at_first:
+                break
+            checked += 1
+            stale.extend(self._check_asset(asset, recorded_entries.get(self._display_name(asset))))
+
+        elapsed = time.time() - start_time
+        for line in stale:
+            print(line)
+        if stale:
+            print(f"Check failed: {len(stale)} stale output(s) after {checked} attribute set(s) in {elapsed:.4f}s.")
+            return EXIT_STALE
+        print(f"Check passed: {checked} attribute set(s) up to date in {elapsed:.4f}s.")
+        return 0
+
+    def _check_asset(
+        self, asset: GeneratedAsset, recorded_entry: Optional[Dict[str, object]]
+    ) -> List[str]:
+        recorded_hashes: Dict[str, str] = {}
+        sidecar_path = self._sidecar_path(asset)
+        if self._io.exists(sidecar_path):
+            try:
+                recorded_hashes = dict(
+                    json.loads(self._io.read_text(sidecar_path)).get("outputHashes") or {}
+                )
+            except (OSError, json.JSONDecodeError, ValueError, AttributeError, TypeError):
+                recorded_hashes = {}
+        if not recorded_hashes and recorded_entry is not None:
+            # Sidecars are machine-local; CI falls back to the committed manifest.
+            recorded_hashes = dict(dict(recorded_entry.get("hashes") or {}).get("outputs") or {})
+        name = self._display_name(asset)
+        if not recorded_hashes:
+            return [f"[STALE] {name} has no recorded hashes ({asset.source_label})"]
+
+        issues: List[str] = []
+        output_hashes = self._compute_output_hashes(asset)
+        for label, path in self._output_paths(asset).items():
+            if not self._io.exists(path):
+                issues.append(f"[STALE] {name} {label} missing ({path.name})")
+            elif recorded_hashes.get(label) != output_hashes[label]:
+                issues.append(f"[STALE] {name} {label} out of date ({path.name})")
+        return issues
+
+    def _discover_assets(self) -> Iterable[GeneratedAsset]:
+        for item in self._iter_input_files():
+            for asset in self._discover_input(item):
+                if self._owns_asset(asset.source_path, asset.record):
+                    yield asset
+
+    def _discover_all_assets(
+        self,
+    ) -> Tuple[List[GeneratedAsset], List[Dict[str, object]]]:
+        """Read and parse inputs concurrently, keeping discovery order.
+
+        Returns the parsed assets plus, in keep-going mode, failure results for
+        inputs or catalog records that could not be parsed.
+        """
+        loaded = map_ordered(
+            self._discover_input_isolated, self._iter_input_files(), self.config.io_concurrency
+        )
+        assets = [asset for batch, _ in loaded for asset in batch]
+        failures = [failure for _, batch in loaded for failure in batch]
+        return assets, failures
+
+    def _discover_input_isolated(
+        self, item: Tuple[int, Path]
+    ) -> Tuple[List[GeneratedAsset], List[Dict[str, object]]]:
+        assets: List[GeneratedAsset] = []
+        failures: List[Dict[str, object]] = []
+        try:
+            for asset in self._discover_input(item, failures if self.config.keep_going else None):
+                assets.append(asset)
+        except (OSError, ValueError) as error:
+            if not self.config.keep_going:
+                raise
+            failures.append(self._failure_result((item[0],), item[1], None, "parse", error))
+        return assets, failures
+
+    def _discover_input(
+        self, item: Tuple[int, Path], failures: Optional[List[Dict[str, object]]] = None
+    ) -> Iterator[GeneratedAsset]:
+        ordinal, file_path = item
+        if file_path.suffix in DATATABLE_SUFFIXES:
+            for table_set in iter_datatable_sets(file_path, self._io.open_binary):
+                asset = self._datatable_asset(table_set, file_path)
+                asset.discovery_order = (ordinal, table_set.index)
                 yield asset
+            return
+        if not is_catalog(file_path, self._io.open_binary):
+            data = json.loads(self._io.read_text(file_path))
+            asset = self._claim(data, file_path) or self._parse_asset(data, file_path)
+            asset.discovery_order = (ordinal,)
+            yield asset
+            return
+
+        # Catalogs hold many sets; each record is sharded, hashed and
+        # cached on its own so one edited row only regenerates one set.
+        for record in iter_catalog(file_path, self._io.open_binary):
+            try:
+                asset = self._claim(record.data, file_path) or self._parse_asset(
+                    record.data, file_path
+                )
+            except ValueError as error:
+                # One bad record should not hide the rest of the catalog.
+                if failures is None:
+                    raise
+                failures.append(
+                    self._failure_result(
+                        (ordinal, record.index), file_path, record.index, "parse", error
+                    )
+                )
+                continue
+            asset.discovery_order = (ordinal, record.index)
+            asset.record = record.index
+            asset.input_hash = record.content_hash
+            yield asset
+
+    def _claim(self, data: object, source_path: Path) -> Optional[PluginAsset]:
+        # Plugins see every parsed input first; whatever none of them claims
+        # is an attribute set.
+        if isinstance(data, dict):
+            for plugin in self.plugins.values():
+                if plugin.claims(data):
+                    return plugin.parse(data, source_path)
+        return None
+
+    @staticmethod
+    def _display_name(asset: GeneratedAsset) -> str:
+        if isinstance(asset, PluginAsset):
+            return asset.qualified_name
+        return asset.class_name
+
+    @staticmethod
+    def _entry_name(entry: Dict[str, object]) -> str:
+        if entry.get("generator"):
+            return f"{entry['generator']}:{entry.get('name')}"
+        return str(entry.get("className"))
+
+    def _template_fingerprints(self) -> Dict[str, str]:
+        fingerprints = {
+            kind: _template_fingerprint(type(self), kind) for kind in TEMPLATE_RENDERERS
+        }
+        for plugin in self.plugins.values():
+            for label, names in plugin.templates.items():
+                kind = f"{plugin.name}.{label}"
+                fingerprints[kind] = _template_fingerprint(type(plugin), kind, tuple(names))
+        return fingerprints
+
+    def _asset_fingerprints(self, asset: GeneratedAsset) -> Dict[str, str]:
+        fingerprints = self._template_fingerprints()
+        if isinstance(asset, PluginAsset):
+            plugin = self.plugins[asset.generator]
+            return {label: fingerprints[f"{plugin.name}.{label}"] for label in plugin.templates}
+        return {label: fingerprints[label] for label in self._renderers()}
 
     def _compute_composite_hash(
-        self, input_hash: str, asset: AttributeSetAsset
+        self, input_hash: str, asset: GeneratedAsset
     ) -> str:
-        digest = hashlib.sha256()
-        digest.update(GENERATOR_VERSION.encode("utf-8"))
-        digest.update(b"|")
-        digest.update(TEMPLATE_VERSION.encode("utf-8"))
-        digest.update(b"|")
-        digest.update(asset.class_name.encode("utf-8"))
-        digest.update(b"|")
-        digest.update(input_hash.encode("utf-8"))
-        return digest.hexdigest()
+        return hash_parts(
+            [
+                GENERATOR_VERSION,
+                *self._asset_fingerprints(asset).values(),
+                self._display_name(asset),
+                input_hash,
+            ],
+            self.config.hash_algorithm,
+        )
 
-    def _sidecar_path(self, asset: AttributeSetAsset) -> Path:
+    def _sidecar_path(self, asset: GeneratedAsset) -> Path:
         sidecar_root = self.config.manifest_path.parent
-        filename = f"{asset.name}AttributeSet.generated.hash"
+        if isinstance(asset, PluginAsset):
+            filename = f"{asset.name}.{asset.generator}.generated.hash"
+        else:
+            filename = f"{asset.name}AttributeSet.generated.hash"
         return sidecar_root / filename if sidecar_root else Path(filename)
 
     def _apply_preserve_regions(
@@ -368,9 +1500,9 @@ class AttributeSetGenerator:
         )
 
         existing_regions: Dict[str, str] = {}
-        if not self.config.no_preserve and path.exists():
+        if not self.config.no_preserve and self._io.exists(path):
             try:
-                existing_regions = self._extract_preserve_regions(path.read_text())
+                existing_regions = self._extract_preserve_regions(self._io.read_text(path))
             except OSError:
                 existing_regions = {}
 
@@ -382,7 +1514,7 @@ class AttributeSetGenerator:
             preserved = body
             status = "generated"
 
-            if self.config.no_preserve and path.exists():
+            if self.config.no_preserve and self._io.exists(path):
                 status = "ignored"
             elif key in existing_regions:
                 preserved = existing_regions[key]
@@ -397,31 +1529,21 @@ class AttributeSetGenerator:
         updated_content = pattern.sub(replace, content)
         return updated_content, reports
 
-    def _collect_existing_preserve_reports(
-        self, header_path: Path, source_path: Path, generated_header_path: Path
-    ) -> Dict[str, Dict[str, Dict[str, object]]]:
-        reports: Dict[str, Dict[str, Dict[str, object]]] = {}
-        for label, path in (
-            ("header", header_path),
-            ("source", source_path),
-            ("generatedHeader", generated_header_path),
-        ):
-            if path.exists():
-                try:
-                    regions = self._extract_preserve_regions(path.read_text())
-                except OSError:
-                    regions = {}
-                reports[label] = {
-                    key: {"status": "unchanged", "lines": self._count_lines(value)}
-                    for key, value in regions.items()
-                }
-            else:
-                reports[label] = {}
-        return reports
+    def _collect_existing_preserve_report(self, path: Path) -> Dict[str, Dict[str, object]]:
+        if not self._io.exists(path):
+            return {}
+        try:
+            regions = self._extract_preserve_regions(self._io.read_text(path))
+        except OSError:
+            regions = {}
+        return {
+            key: {"status": "unchanged", "lines": self._count_lines(value)}
+            for key, value in regions.items()
+        }
 
     def _format_log_line(
         self,
-        asset: AttributeSetAsset,
+        asset: GeneratedAsset,
         write_decision: str,
         composite_hash: str,
         hash_changed: bool,
@@ -432,13 +1554,13 @@ class AttributeSetGenerator:
             "skip": "CACHED",
         }.get(write_decision, write_decision.upper())
         return (
-            f"{prefix} {asset.class_name} ({asset.source_path.name}) "
+            f"{prefix} {self._display_name(asset)} ({asset.source_label}) "
             f"hash={composite_hash[:12]} changed={hash_changed}"
         )
 
     def _format_cli_line(
         self,
-        asset: AttributeSetAsset,
+        asset: GeneratedAsset,
         write_decision: str,
         composite_hash: str,
         hash_changed: bool,
@@ -463,7 +1585,7 @@ class AttributeSetGenerator:
 
         preserve_summary = f" preserve={' | '.join(preserve_bits)}" if preserve_bits else ""
         return (
-            f"[{prefix}] {asset.class_name} hash={composite_hash[:12]} "
+            f"[{prefix}] {self._display_name(asset)} hash={composite_hash[:12]} "
             f"changed={hash_changed}{preserve_summary}"
         )
 
@@ -485,86 +1607,211 @@ class AttributeSetGenerator:
             return 0
         return len(block.rstrip("\n").splitlines())
 
-    def _process_asset(self, asset: AttributeSetAsset) -> Dict[str, object]:
+    def _output_paths(self, asset: GeneratedAsset) -> Dict[str, Path]:
         output_root = self.config.output_root.resolve()
-        header_path = output_root / f"{asset.name}AttributeSet.h"
-        source_path = output_root / f"{asset.name}AttributeSet.cpp"
-        generated_header_path = output_root / f"{asset.name}AttributeSet.generated.h"
+        if isinstance(asset, PluginAsset):
+            return self.plugins[asset.generator].output_paths(asset, output_root)
+        return {
+            "header": output_root / f"{asset.name}AttributeSet.h",
+            "source": output_root / f"{asset.name}AttributeSet.cpp",
+            "generatedHeader": output_root / f"{asset.name}AttributeSet.generated.h",
+        }
 
-        header_template = self._render_header(asset)
-        source_template = self._render_source(asset)
-        generated_header_template = self._render_generated_header(asset)
+    @staticmethod
+    def _output_projections(asset: AttributeSetAsset) -> Dict[str, Dict[str, object]]:
+        # Each projection lists exactly the asset fields its renderer reads, so
+        # an edit only invalidates the outputs that actually render it.
+        return {
+            "header": {
+                "name": asset.name,
+                "className": asset.class_name,
+                "moduleApi": asset.module_api,
+                "attributes": [
+                    {
+                        "name": attribute.name,
+                        "category": attribute.category,
+                        "comment": attribute.comment,
+                        "metadata": attribute.metadata.to_summary(),
+                    }
+                    for attribute in asset.attributes
+                ],
+            },
+            "source": {
+                "name": asset.name,
+                "className": asset.class_name,
+                "instrument": asset.instrument,
+                "attributes": [
+                    {
+                        "name": attribute.name,
+                        "metadata": attribute.metadata.to_summary(),
+                    }
+                    for attribute in asset.attributes
+                ],
+            },
+            "generatedHeader": {
+                "className": asset.class_name,
+            },
+        }
 
-        input_hash = self._hash_file(asset.source_path)
-        composite_hash = self._compute_composite_hash(input_hash, asset)
+    def _compute_output_hashes(self, asset: GeneratedAsset) -> Dict[str, str]:
+        fingerprints = self._asset_fingerprints(asset)
+        if isinstance(asset, PluginAsset):
+            plugin = self.plugins[asset.generator]
+            projections = {label: plugin.projection(label, asset) for label in plugin.templates}
+        else:
+            projections = self._output_projections(asset)
+        hashes: Dict[str, str] = {}
+        for label, projection in projections.items():
+            hashes[label] = hash_parts(
+                [
+                    GENERATOR_VERSION,
+                    fingerprints[label],
+                    label,
+                    json.dumps(projection, sort_keys=True, separators=(",", ":")),
+                ],
+                self.config.hash_algorithm,
+            )
+        return hashes
+
+    def _renderers(self) -> Dict[str, Callable[[AttributeSetAsset], str]]:
+        return {
+            "header": self._render_header,
+            "source": self._render_source,
+            "generatedHeader": self._render_generated_header,
+        }
+
+    def _project_relative(self, path: Path) -> str:
+        project_root = (self.config.project_root or Path.cwd()).resolve()
+        try:
+            return path.resolve().relative_to(project_root).as_posix()
+        except ValueError:
+            return path.name
+
+    def _render_cached(
+        self, label: str, asset: GeneratedAsset, output_hash: str, path: Path
+    ) -> str:
+        if isinstance(asset, PluginAsset):
+            renderer = functools.partial(self.plugins[asset.generator].render, label)
+        else:
+            renderer = self._renderers()[label]
+        if self.cache is None:
+            self.metrics.increment("renders_performed")
+            return renderer(asset)
+        key = OutputCache.make_key(label, output_hash, self._project_relative(path))
+        if not self.config.force:
+            cached = self.cache.get(key, touch=not self.config.dry_run)
+            if cached is not None:
+                self.metrics.increment("renders_avoided")
+                return cached
+        self.metrics.increment("renders_performed")
+        rendered = renderer(asset)
+        if not self.config.dry_run:
+            self.cache.put(key, rendered)
+        return rendered
 
+    def _process_asset(self, asset: GeneratedAsset) -> Dict[str, object]:
+        output_paths = self._output_paths(asset)
         sidecar_path = self._sidecar_path(asset)
+        previous_payload: Dict[str, object] = {}
         previous_hash: Optional[str] = None
-        if sidecar_path.exists():
+        previous_output_hashes: Dict[str, str] = {}
+        if self._io.exists(sidecar_path):
             try:
-                previous_payload = json.loads(sidecar_path.read_text())
+                previous_payload = dict(json.loads(self._io.read_text(sidecar_path)))
                 previous_hash = str(previous_payload.get("compositeHash"))
-            except (OSError, json.JSONDecodeError, ValueError):
+                previous_output_hashes = dict(previous_payload.get("outputHashes") or {})
+            except (OSError, json.JSONDecodeError, ValueError, TypeError):
+                previous_payload = {}
                 previous_hash = None
+                previous_output_hashes = {}
+
+        input_blob = self._input_blobs.get(asset.source_path) if asset.record is None else None
+        if asset.input_hash is not None:
+            input_hash = asset.input_hash
+        elif (
+            input_blob is not None
+            and previous_payload.get("inputBlob") == input_blob
+            and previous_payload.get("inputHash")
+        ):
+            # Git already fingerprinted this exact content; skip re-hashing.
+            input_hash = str(previous_payload["inputHash"])
+        else:
+            input_hash = self._hash_file(asset.source_path)
+        composite_hash = self._compute_composite_hash(input_hash, asset)
+        output_hashes = self._compute_output_hashes(asset)
 
-        files_missing = any(
-            not path.exists()
-            for path in (header_path, source_path, generated_header_path)
-        )
+        files_missing = any(not self._io.exists(path) for path in output_paths.values())
         hash_changed = previous_hash != composite_hash or files_missing
-        write_decision = "update" if hash_changed else "skip"
+        self.metrics.increment("hash_misses" if hash_changed else "hash_hits")
+
+        output_decisions: Dict[str, str] = {}
+        for label, path in output_paths.items():
+            if self.config.force:
+                output_decisions[label] = "force"
+            elif previous_output_hashes.get(label) != output_hashes[label] or not self._io.exists(path):
+                output_decisions[label] = "update"
+            else:
+                output_decisions[label] = "skip"
+
         if self.config.force:
             write_decision = "force"
+        elif any(decision == "update" for decision in output_decisions.values()):
+            write_decision = "update"
+        else:
+            write_decision = "skip"
+
+        preserve_reports: Dict[str, Dict[str, Dict[str, object]]] = {}
+        writes_performed = False
+        for label, path in output_paths.items():
+            if output_decisions[label] == "skip":
+                preserve_reports[label] = self._collect_existing_preserve_report(path)
+                self.metrics.increment("renders_avoided")
+                self.metrics.increment("files_unchanged")
+                continue
 
-        header_final = header_template
-        source_final = source_template
-        generated_header_final = generated_header_template
-        preserve_reports: Dict[str, Dict[str, Dict[str, object]]] = {
-            "header": {},
-            "source": {},
-            "generatedHeader": {},
-        }
-
-        if write_decision in {"update", "force"}:
-            header_final, preserve_reports["header"] = self._apply_preserve_regions(
-                header_path, header_template
-            )
-            source_final, preserve_reports["source"] = self._apply_preserve_regions(
-                source_path, source_template
-            )
-            (
-                generated_header_final,
-                preserve_reports["generatedHeader"],
-            ) = self._apply_preserve_regions(
-                generated_header_path, generated_header_template
+            rendered = self._render_cached(label, asset, output_hashes[label], path)
+            final_text, preserve_reports[label] = self._apply_preserve_regions(path, rendered)
+            self.metrics.increment(
+                "preserve_regions_merged",
+                sum(1 for report in preserve_reports[label].values() if report["status"] == "preserved"),
             )
+            if output_decisions[label] == "force":
+                self._io.write_text(path, final_text)
+                self.metrics.increment("files_rewritten")
+                writes_performed = True
+            elif self._write_if_changed(path, final_text):
+                writes_performed = True
+            else:
+                # Hash moved but the rendered bytes did not; leave mtime alone.
+                output_decisions[label] = "unchanged"
 
-            if not self.config.dry_run:
-                header_path.write_text(header_final)
-                source_path.write_text(source_final)
-                generated_header_path.write_text(generated_header_final)
-
-                sidecar_payload = {
-                    "asset": asset.name,
-                    "className": asset.class_name,
-                    "input": str(asset.source_path),
-                    "inputHash": input_hash,
-                    "compositeHash": composite_hash,
-                    "generatorVersion": GENERATOR_VERSION,
-                    "templateVersion": TEMPLATE_VERSION,
-                    "outputs": {
-                        "header": str(header_path),
-                        "source": str(source_path),
-                        "generatedHeader": str(generated_header_path),
-                    },
-                }
-                if sidecar_path.parent:
-                    sidecar_path.parent.mkdir(parents=True, exist_ok=True)
-                sidecar_path.write_text(json.dumps(sidecar_payload, indent=2) + "\n")
-        else:
-            preserve_reports = self._collect_existing_preserve_reports(
-                header_path, source_path, generated_header_path
+        sidecar_stale = (
+            previous_hash != composite_hash
+            or previous_output_hashes != output_hashes
+            or previous_payload.get("inputBlob") != input_blob
+        )
+        if write_decision != "skip" or sidecar_stale:
+            identity = (
+                {"generator": asset.generator}
+                if isinstance(asset, PluginAsset)
+                else {"className": asset.class_name}
             )
+            sidecar_payload: Dict[str, object] = {
+                "asset": asset.name,
+                **identity,
+                "input": str(asset.source_path),
+                "inputHash": input_hash,
+                "inputBlob": input_blob,
+                "compositeHash": composite_hash,
+                "outputHashes": output_hashes,
+                "generatorVersion": GENERATOR_VERSION,
+                "templateVersion": TEMPLATE_VERSION,
+                "templateFingerprints": self._asset_fingerprints(asset),
+                "outputs": {label: str(path) for label, path in output_paths.items()},
+            }
+            if asset.record is not None:
+                sidecar_payload["record"] = asset.record
+            self._io.replace_text(sidecar_path, json.dumps(sidecar_payload, indent=2) + "\n")
 
         log_line = self._format_log_line(
             asset, write_decision, composite_hash, hash_changed
@@ -573,39 +1820,30 @@ class AttributeSetGenerator:
             asset, write_decision, composite_hash, hash_changed, preserve_reports
         )
 
-        manifest_entry = {
+        manifest_entry: Dict[str, object] = {
             "input": str(asset.source_path),
             "inputHash": input_hash,
-            "outputs": {
-                "header": str(header_path),
-                "source": str(source_path),
-                "generatedHeader": str(generated_header_path),
-            },
-            "attributes": [
-                {
-                    "name": attribute.name,
-                    "metadata": attribute.metadata.to_summary(),
-                    "category": attribute.category,
-                }
-                for attribute in asset.attributes
-            ],
-            "className": asset.class_name,
-            "moduleAPI": asset.module_api,
+            "outputs": {label: str(path) for label, path in output_paths.items()},
+            **self._describe_asset(asset),
             "hashes": {
                 "input": input_hash,
                 "composite": composite_hash,
                 "previous": previous_hash,
+                "outputs": output_hashes,
+                "previousOutputs": previous_output_hashes or None,
             },
             "status": {
                 "write": write_decision,
                 "dryRun": self.config.dry_run,
                 "hashChanged": hash_changed,
-                "writesPerformed": not self.config.dry_run
-                and write_decision in {"update", "force"},
+                "writesPerformed": writes_performed,
+                "outputs": output_decisions,
             },
             "sidecar": str(sidecar_path),
             "preserveRegions": preserve_reports,
         }
+        if asset.record is not None:
+            manifest_entry["record"] = asset.record
 
         return {
             "manifest": manifest_entry,
@@ -613,6 +1851,23 @@ class AttributeSetGenerator:
             "cli_line": cli_line,
         }
 
+    def _describe_asset(self, asset: GeneratedAsset) -> Dict[str, object]:
+        if isinstance(asset, PluginAsset):
+            return {"generator": asset.generator, "name": asset.name}
+        return {
+            "attributes": [
+                {
+                    "name": attribute.name,
+                    "metadata": attribute.metadata.to_summary(),
+                    "category": attribute.category,
+                }
+                for attribute in asset.attributes
+            ],
+            "className": asset.class_name,
+            "moduleAPI": asset.module_api,
+            "includes": self._compute_include_plan(asset).to_summary(),
+        }
+
     def _parse_asset(self, data: Dict[str, object], source_path: Path) -> AttributeSetAsset:
         name = str(data.get("name") or data.get("AttributeSetName") or source_path.stem)
         class_name = str(
@@ -647,294 +1902,386 @@ class AttributeSetGenerator:
                 )
             )
 
+        instrument = _as_bool(data.get("instrument", data.get("Instrument")), False)
         return AttributeSetAsset(
             name=name,
             class_name=class_name,
             module_api=module_api,
             attributes=attributes,
             source_path=source_path.resolve(),
+            instrument=instrument or self.config.instrument,
         )
 
-    def _render_header(self, asset: AttributeSetAsset) -> str:
-        requires_meta_registry = any(
-            attribute.metadata.meta_attribute is not None for attribute in asset.attributes
-        )
-        include_lines = [
-            '#include "CoreMinimal.h"',
-            '#include "AttributeSet.h"',
-            '#include "AbilitySystemComponent.h"',
-            '#include "Meta/MetaAttributes.h"',
-        ]
-        if requires_meta_registry:
-            include_lines.append('#include "GasPlusMetaAttributeRegistry.h"')
-        include_block = "\n".join(include_lines)
-
-        properties = []
-        onrep_decls = []
-        for attribute in asset.attributes:
-            metadata_comment_parts = [
-                f"Replicate={'true' if attribute.metadata.replicate else 'false'}",
-                f"GenerateHooks={'true' if attribute.metadata.generate_hooks else 'false'}",
-                f"SkipOnRep={'true' if attribute.metadata.skip_on_rep else 'false'}",
-            ]
-            if attribute.metadata.clamp_min is not None:
-                metadata_comment_parts.append(f"ClampMin={attribute.metadata.clamp_min}")
-            if attribute.metadata.clamp_max is not None:
-                metadata_comment_parts.append(f"ClampMax={attribute.metadata.clamp_max}")
-            if attribute.metadata.meta_attribute is not None:
-                metadata_comment_parts.append(
-                    f"MetaAttribute={attribute.metadata.meta_attribute}"
-                )
-            metadata_comment = ", ".join(metadata_comment_parts)
-
-            property_lines = [
-                f"    // Attribute: {attribute.name}",
-                f"    // Metadata: {metadata_comment}",
-            ]
-            if attribute.comment:
-                property_lines.append(f"    // {attribute.comment}")
-
-            specifiers = ["BlueprintReadOnly", f"Category=\"{attribute.category}\""]
-            meta_parts = []
-            if attribute.metadata.clamp_min is not None:
-                meta_parts.append(f"ClampMin=\"{attribute.metadata.clamp_min}\"")
-            if attribute.metadata.clamp_max is not None:
-                meta_parts.append(f"ClampMax=\"{attribute.metadata.clamp_max}\"")
-
-            if attribute.metadata.replicate:
-                if attribute.metadata.skip_on_rep:
-                    specifiers.append("Replicated")
-                else:
-                    specifiers.append(f"ReplicatedUsing=OnRep_{attribute.name}")
-                    onrep_decls.append(
-                        f"    UFUNCTION()\n    void OnRep_{attribute.name}(const FGameplayAttributeData& OldValue);"
-                    )
-            specifier_block = ", ".join(specifiers)
-            meta_block = f", meta=({', '.join(meta_parts)})" if meta_parts else ""
-            property_lines.append(
-                f"    UPROPERTY({specifier_block}{meta_block})\n    FGameplayAttributeData {attribute.name};"
+    def _datatable_asset(self, table_set: DataTableSet, source_path: Path) -> AttributeSetAsset:
+        attributes = [
+            AttributeDefinition(
+                name=name,
+                category=category or "Attributes",
+                comment=comment,
+                metadata=AttributeMetadata(
+                    replicate=True if replicate is None else replicate,
+                    generate_hooks=True if generate_hooks is None else generate_hooks,
+                    skip_on_rep=False if skip_on_rep is None else skip_on_rep,
+                    clamp_min=clamp_min,
+                    clamp_max=clamp_max,
+                    meta_attribute=meta_attribute,
+                ),
             )
-            property_lines.append(
-                f"    ATTRIBUTE_ACCESSORS({asset.class_name}, {attribute.name});"
+            for name, category, comment, replicate, generate_hooks, skip_on_rep, clamp_min, clamp_max, meta_attribute in zip(
+                table_set.names,
+                table_set.categories,
+                table_set.comments,
+                table_set.replicate,
+                table_set.generate_hooks,
+                table_set.skip_on_rep,
+                table_set.clamp_min,
+                table_set.clamp_max,
+                table_set.meta_attribute,
             )
-            properties.append("\n".join(property_lines))
+        ]
+        return AttributeSetAsset(
+            name=table_set.name,
+            class_name=table_set.class_name or f"U{table_set.name}AttributeSet",
+            module_api=table_set.module_api or "GASPLUSSAMPLE_API",
+            attributes=attributes,
+            source_path=source_path.resolve(),
+            record=table_set.index,
+            input_hash=table_set.content_hash,
+            instrument=self.config.instrument,
+        )
 
-        properties_block = "\n\n".join(properties)
-        onrep_block = "\n\n".join(onrep_decls)
-        if onrep_block:
-            onrep_block = "\n\n" + onrep_block
+    @staticmethod
+    def _compute_include_plan(asset: AttributeSetAsset) -> IncludePlan:
+        # Headers only pull in what the class body needs; everything the
+        # hook/replication implementations need lives in the .cpp so touching
+        # the ASC does not recompile every includer. No generated declaration
+        # names the ASC, so it is not forward-declared either. MetaAttribute
+        # links only show up in comments and the registry files, which include
+        # what they use themselves, so they add no includes here.
+        requires_replication = any(
+            attribute.metadata.replicate for attribute in asset.attributes
+        )
+        requires_rep_notify = any(
+            attribute.metadata.replicate and not attribute.metadata.skip_on_rep
+            for attribute in asset.attributes
+        )
 
-        preserve_block = (
-            f"    // GASPLUS-PRESERVE BEGIN {asset.class_name}.PublicMembers\n"
-            "    // Add additional member declarations here.\n"
-            f"    // GASPLUS-PRESERVE END {asset.class_name}.PublicMembers"
+        plan = IncludePlan(
+            header=["CoreMinimal.h", "AttributeSet.h"],
+            source=[f"{asset.name}AttributeSet.h"],
         )
+        if requires_rep_notify:
+            plan.source.append("AbilitySystemComponent.h")
+        if requires_replication:
+            plan.source.append("Net/UnrealNetwork.h")
+        return plan
 
-        class_body_parts = [
-            "public:",
-            f"    {asset.class_name}();",
-            "",
-            "    virtual void GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const override;",
-            "    virtual void PreAttributeChange(const FGameplayAttribute& Attribute, float& NewValue) override;",
-            "    virtual void PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue) override;",
-            "",
-            preserve_block,
+    @staticmethod
+    def _metadata_comment(metadata: AttributeMetadata) -> str:
+        parts = [
+            f"Replicate={'true' if metadata.replicate else 'false'}",
+            f"GenerateHooks={'true' if metadata.generate_hooks else 'false'}",
+            f"SkipOnRep={'true' if metadata.skip_on_rep else 'false'}",
         ]
+        if metadata.clamp_min is not None:
+            parts.append(f"ClampMin={metadata.clamp_min}")
+        if metadata.clamp_max is not None:
+            parts.append(f"ClampMax={metadata.clamp_max}")
+        if metadata.meta_attribute is not None:
+            parts.append(f"MetaAttribute={metadata.meta_attribute}")
+        return ", ".join(parts)
 
-        if properties_block:
-            class_body_parts.extend(["", properties_block])
-        if onrep_block:
-            class_body_parts.extend(["", onrep_block.strip("\n")])
-
-        class_body = "\n".join(class_body_parts)
-
-        header = (
-            "#pragma once\n\n"
-            f"{include_block}\n"
-            "// <Codex::Preserve Begin: HeaderIncludes>\n"
-            "// <Codex::Preserve End: HeaderIncludes>\n\n"
-            f"#include \"{asset.name}AttributeSet.generated.h\"\n\n"
-            "UCLASS()\n"
-            f"class {asset.module_api} {asset.class_name} : public UAttributeSet\n"
-            "{\n"
-            "    GENERATED_BODY()\n\n"
-            f"{class_body}\n"
-            "};\n"
+    def _render_header(self, asset: AttributeSetAsset) -> str:
+        plan = self._compute_include_plan(asset)
+        forward_block = "\n".join(plan.forward_declarations)
+
+        members: List[str] = []
+        onrep_decls: List[str] = []
+        for attribute in asset.attributes:
+            metadata = attribute.metadata
+            specifiers = f'BlueprintReadOnly, Category="{attribute.category}"'
+            if metadata.replicate:
+                if metadata.skip_on_rep:
+                    specifiers += ", Replicated"
+                else:
+                    specifiers += f", ReplicatedUsing=OnRep_{attribute.name}"
+                    onrep_decls.append("\n\n")
+                    onrep_decls.append(ONREP_DECLARATION.render(Name=attribute.name))
+            meta_parts = []
+            if metadata.clamp_min is not None:
+                meta_parts.append(f'ClampMin="{metadata.clamp_min}"')
+            if metadata.clamp_max is not None:
+                meta_parts.append(f'ClampMax="{metadata.clamp_max}"')
+            if meta_parts:
+                specifiers += f", meta=({', '.join(meta_parts)})"
+
+            members.append("\n\n")
+            members.append(
+                ATTRIBUTE_PROPERTY.render(
+                    Name=attribute.name,
+                    Metadata=self._metadata_comment(metadata),
+                    Comment=f"\n    // {attribute.comment}" if attribute.comment else "",
+                    Specifiers=specifiers,
+                    ClassName=asset.class_name,
+                )
+            )
+        members.extend(onrep_decls)
+
+        return ATTRIBUTE_SET_HEADER.render(
+            Includes="\n".join(f'#include "{include}"' for include in plan.header),
+            Name=asset.name,
+            ForwardDeclarations=f"{forward_block}\n\n" if forward_block else "",
+            ClassName=asset.class_name,
+            FileBasename=asset.file_basename,
+            NumAttributes=str(len(asset.attributes)),
+            ModuleApi=asset.module_api,
+            Members="".join(members),
         )
-        return header
 
     def _render_source(self, asset: AttributeSetAsset) -> str:
-        source_include_block = (
-            f"#include \"{asset.name}AttributeSet.h\"\n\n"
-            "#include \"Net/UnrealNetwork.h\"\n\n"
+        plan = self._compute_include_plan(asset)
+        own_include, *dependency_includes = plan.source
+        includes = f'#include "{own_include}"\n\n'
+        if dependency_includes:
+            includes += "\n".join(f'#include "{include}"' for include in dependency_includes) + "\n\n"
+        includes += (
             "// <Codex::Preserve Begin: SourceIncludes>\n"
             "// <Codex::Preserve End: SourceIncludes>\n"
         )
-        replication_lines = []
-        pre_blocks = []
-        post_blocks = []
-        onrep_impls = []
 
+        class_name = asset.class_name
+        replication: List[str] = []
+        pre_blocks: List[str] = []
+        post_blocks: List[str] = []
+        onrep_impls: List[str] = []
         for attribute in asset.attributes:
-            if attribute.metadata.replicate:
-                if attribute.metadata.skip_on_rep:
-                    replication_lines.append(
-                        f"    DOREPLIFETIME({asset.class_name}, {attribute.name});"
-                    )
+            metadata = attribute.metadata
+            name = attribute.name
+            if metadata.replicate:
+                if metadata.skip_on_rep:
+                    replication.append(f"\n    DOREPLIFETIME({class_name}, {name});")
                 else:
-                    replication_lines.append(
-                        f"    DOREPLIFETIME_CONDITION_NOTIFY({asset.class_name}, {attribute.name}, COND_None, REPNOTIFY_Always);"
+                    replication.append(
+                        f"\n    DOREPLIFETIME_CONDITION_NOTIFY({class_name}, {name}, COND_None, REPNOTIFY_Always);"
                     )
                     onrep_impls.append(
-                        textwrap.dedent(
-                            f"""
-                            void {asset.class_name}::OnRep_{attribute.name}(const FGameplayAttributeData& OldValue)
-                            {{
-                                GAMEPLAYATTRIBUTE_REPNOTIFY({asset.class_name}, {attribute.name}, OldValue);
-                                // <Codex::Preserve Begin: OnRep_{attribute.name}>
-                                // <Codex::Preserve End: OnRep_{attribute.name}>
-                            }}
-                            """
-                        ).strip()
-                    )
-
-            if attribute.metadata.generate_hooks:
-                metadata_comment_parts = [
-                    f"Replicate={'true' if attribute.metadata.replicate else 'false'}",
-                    f"GenerateHooks={'true' if attribute.metadata.generate_hooks else 'false'}",
-                    f"SkipOnRep={'true' if attribute.metadata.skip_on_rep else 'false'}",
-                ]
-                if attribute.metadata.clamp_min is not None:
-                    metadata_comment_parts.append(f"ClampMin={attribute.metadata.clamp_min}")
-                if attribute.metadata.clamp_max is not None:
-                    metadata_comment_parts.append(f"ClampMax={attribute.metadata.clamp_max}")
-                if attribute.metadata.meta_attribute is not None:
-                    metadata_comment_parts.append(
-                        f"MetaAttribute={attribute.metadata.meta_attribute}"
+                        ONREP_DEFINITION.render(
+                            ClassName=class_name,
+                            Name=name,
+                            Scope=self._instrumentation_scope(asset, "    ", name, "OnRep"),
+                        )
                     )
-                metadata_comment = ", ".join(metadata_comment_parts)
-
-                clamp_expression = "NewValue"
-                clamp_lines = []
-                if attribute.metadata.clamp_min is not None or attribute.metadata.clamp_max is not None:
-                    clamp_min = (
-                        attribute.metadata.clamp_min
-                        if attribute.metadata.clamp_min is not None
-                        else "-FLT_MAX"
+                    onrep_impls.append("\n\n")
+
+            if metadata.generate_hooks:
+                metadata_comment = self._metadata_comment(metadata)
+                clamp = ""
+                if metadata.clamp_min is not None or metadata.clamp_max is not None:
+                    clamp = CLAMP_LINES.render(
+                        Min="-FLT_MAX" if metadata.clamp_min is None else str(metadata.clamp_min),
+                        Max="FLT_MAX" if metadata.clamp_max is None else str(metadata.clamp_max),
                     )
-                    clamp_max = (
-                        attribute.metadata.clamp_max
-                        if attribute.metadata.clamp_max is not None
-                        else "FLT_MAX"
+                pre_blocks.append("\n")
+                pre_blocks.append(
+                    PRE_ATTRIBUTE_CHANGE_BLOCK.render(
+                        Name=name,
+                        Scope=self._instrumentation_scope(asset, "        ", name, "PreAttributeChange"),
+                        Metadata=metadata_comment,
+                        Clamp=clamp,
                     )
-                    clamp_expression = f"FMath::Clamp(NewValue, {clamp_min}, {clamp_max})"
-                    clamp_lines.append(
-                        "        const float ClampedValue = " + clamp_expression + ";"
+                )
+                post_blocks.append("\n")
+                post_blocks.append(
+                    POST_ATTRIBUTE_CHANGE_BLOCK.render(
+                        Name=name,
+                        Scope=self._instrumentation_scope(asset, "        ", name, "PostAttributeChange"),
+                        Metadata=metadata_comment,
                     )
-                    clamp_lines.append("        NewValue = ClampedValue;")
-
-                pre_block_lines = [
-                    f"    if (Attribute == Get{attribute.name}Attribute())",
-                    "    {",
-                    f"        // Metadata: {metadata_comment}",
-                ]
-                pre_block_lines.extend(clamp_lines)
-                pre_block_lines.append(
-                    f"        // TODO: Add pre-clamp logic for {attribute.name} if additional validation is required."
                 )
-                pre_block_lines.append("    }")
-                pre_blocks.append("\n".join(pre_block_lines))
-
-                post_block_lines = [
-                    f"    if (Attribute == Get{attribute.name}Attribute())",
-                    "    {",
-                    f"        // Metadata: {metadata_comment}",
-                    f"        // TODO: Add post-clamp logic for {attribute.name} (OldValue={{OldValue}}, NewValue={{NewValue}}).",
-                    "    }",
-                ]
-                post_blocks.append("\n".join(post_block_lines))
-
-        replication_block = "\n".join(replication_lines) if replication_lines else ""
-        if replication_block:
-            replication_block = "\n" + replication_block
-
-        pre_block = "\n".join(pre_blocks)
-        post_block = "\n".join(post_blocks)
-        if pre_block:
-            pre_block = "\n" + pre_block
-        if post_block:
-            post_block = "\n" + post_block
-        pre_block += (
-            "\n    // <Codex::Preserve Begin: PreAttributeChange_Custom>\n"
-            "    // <Codex::Preserve End: PreAttributeChange_Custom>"
+
+        return ATTRIBUTE_SET_SOURCE.render(
+            Includes=includes,
+            Instrumentation=f"\n{self._render_instrumentation(asset)}\n" if asset.instrument else "",
+            ClassName=class_name,
+            Replication="".join(replication),
+            PreScope=self._instrumentation_scope(asset, "    ", "PreAttributeChange"),
+            PreBlocks="".join(pre_blocks),
+            PostScope=self._instrumentation_scope(asset, "    ", "PostAttributeChange"),
+            PostBlocks="".join(post_blocks),
+            Snapshot=self._render_snapshot_source(asset),
+            Lookup=self._render_lookup_source(asset),
+            OnRep="".join(onrep_impls),
         )
-        post_block += (
-            "\n    // <Codex::Preserve Begin: PostAttributeChange_Custom>\n"
-            "    // <Codex::Preserve End: PostAttributeChange_Custom>"
+
+    @staticmethod
+    def _render_snapshot_source(asset: AttributeSetAsset) -> str:
+        # Capture and restore copy each attribute directly; restoring bypasses
+        # PreAttributeChange so rolled-back values are not clamped twice.
+        names: List[str] = []
+        pointers: List[str] = []
+        capture: List[str] = []
+        restore: List[str] = []
+        for index, attribute in enumerate(asset.attributes):
+            position = str(index)
+            names.append(SNAPSHOT_FIELD_NAME.render(Name=attribute.name))
+            pointers.append(SNAPSHOT_FIELD_POINTER.render(ClassName=asset.class_name, Name=attribute.name))
+            capture.append(SNAPSHOT_CAPTURE.render(Index=position, Name=attribute.name))
+            restore.append(SNAPSHOT_RESTORE.render(Index=position, Name=attribute.name))
+        return SNAPSHOT_DEFINITIONS.render(
+            ClassName=asset.class_name,
+            FieldNames="".join(names),
+            FieldPointers="".join(pointers),
+            Capture="".join(capture),
+            Restore="".join(restore),
         )
 
-        onrep_block = "\n\n".join(onrep_impls)
+    @staticmethod
+    def _render_lookup_source(asset: AttributeSetAsset) -> str:
+        def rows(values: Sequence[str]) -> str:
+            return "".join(
+                f"    {', '.join(values[start : start + 8])},\n" for start in range(0, len(values), 8)
+            )
 
-        constructor_preserve = (
-            f"// GASPLUS-PRESERVE BEGIN {asset.class_name}.Constructor\n"
-            "// Customize constructor defaults here.\n"
-            f"// GASPLUS-PRESERVE END {asset.class_name}.Constructor"
-        )
-        pre_preserve = (
-            f"    // GASPLUS-PRESERVE BEGIN {asset.class_name}.PreAttributeChange\n"
-            "    // Customize pre-attribute change logic here.\n"
-            f"    // GASPLUS-PRESERVE END {asset.class_name}.PreAttributeChange"
-        )
-        post_preserve = (
-            f"    // GASPLUS-PRESERVE BEGIN {asset.class_name}.PostAttributeChange\n"
-            "    // Customize post-attribute change logic here.\n"
-            f"    // GASPLUS-PRESERVE END {asset.class_name}.PostAttributeChange"
+        infos: List[str] = []
+        for index, attribute in enumerate(asset.attributes):
+            metadata = attribute.metadata
+            clamp_min = metadata.clamp_min
+            clamp_max = metadata.clamp_max
+            infos.append(
+                LOOKUP_INFO.render(
+                    Name=attribute.name,
+                    Index=index,
+                    ClampMin="-FLT_MAX" if clamp_min is None else f"{float(clamp_min)!r}f",
+                    ClampMax="FLT_MAX" if clamp_max is None else f"{float(clamp_max)!r}f",
+                    HasClampMin="false" if clamp_min is None else "true",
+                    HasClampMax="false" if clamp_max is None else "true",
+                    Replicated="true" if metadata.replicate else "false",
+                    RepNotify="true" if metadata.replicate and not metadata.skip_on_rep else "false",
+                )
+            )
+        seeds, slots = AttributeSetGenerator._build_name_lookup(
+            [attribute.name for attribute in asset.attributes]
         )
-        additional_preserve = (
-            f"// GASPLUS-PRESERVE BEGIN {asset.class_name}.AdditionalMethods\n"
-            "// Add additional method definitions here.\n"
-            f"// GASPLUS-PRESERVE END {asset.class_name}.AdditionalMethods"
+        return LOOKUP_DEFINITIONS.render(
+            ClassName=asset.class_name,
+            Infos="".join(infos),
+            Mask=str(len(slots) - 1),
+            Seeds=rows([f"{seed}u" for seed in seeds]),
+            Slots=rows(["INDEX_NONE" if slot < 0 else str(slot) for slot in slots]),
         )
 
-        source_lines: List[str] = [
-            source_include_block,
-            "",
-            f"{asset.class_name}::{asset.class_name}() = default;",
-            constructor_preserve,
-            "",
-            f"void {asset.class_name}::GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const",
-            "{",
-            "    Super::GetLifetimeReplicatedProps(OutLifetimeProps);" + replication_block,
-            "}",
-            "",
-            f"void {asset.class_name}::PreAttributeChange(const FGameplayAttribute& Attribute, float& NewValue)",
-            "{",
-            "    Super::PreAttributeChange(Attribute, NewValue);",
-            pre_preserve + pre_block,
-            "}",
-            "",
-            f"void {asset.class_name}::PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue)",
-            "{",
-            "    Super::PostAttributeChange(Attribute, OldValue, NewValue);",
-            "    UE_UNUSED(OldValue);",
-            "    UE_UNUSED(NewValue);",
-            post_preserve + post_block,
-            "}",
-        ]
-
-        if onrep_block:
-            source_lines.extend(["", onrep_block, ""])
+    @staticmethod
+    def _attribute_name_hash(name: str) -> int:
+        # FNV-1a over the ASCII-lowercased name; mirrors HashAttributeName.
+        if name.isascii():
+            codes: Iterable[int] = name.encode("ascii").lower()
         else:
-            source_lines.append("")
+            codes = (
+                ord(character) + 32 if "A" <= character <= "Z" else ord(character)
+                for character in name
+            )
+        value = 0x811C9DC5
+        for code in codes:
+            value = ((value ^ code) * 0x01000193) & 0xFFFFFFFF
+        return value
 
-        source_lines.append(additional_preserve)
+    @staticmethod
+    def _attribute_name_slot(name_hash: int, seed: int, mask: int) -> int:
+        # Murmur3 finalizer over the seeded hash; mirrors AttributeNameSlot.
+        value = name_hash ^ seed
+        value = ((value ^ (value >> 16)) * 0x85EBCA6B) & 0xFFFFFFFF
+        value = ((value ^ (value >> 13)) * 0xC2B2AE35) & 0xFFFFFFFF
+        return (value ^ (value >> 16)) & mask
 
-        source = "\n".join(source_lines) + "\n"
-        return source
+    @staticmethod
+    def _build_name_lookup(names: Sequence[str]) -> Tuple[List[int], List[int]]:
+        """Hash-and-displace perfect hash over ``names`` (a power-of-two table).
+
+        Returns the per-bucket seeds and the slot -> name index table, with -1
+        marking empty slots. Names equal up to case keep the first index.
+        """
+        slot_of = AttributeSetGenerator._attribute_name_slot
+        name_hash = AttributeSetGenerator._attribute_name_hash
+        hashes: Dict[str, Tuple[int, int]] = {}
+        for index, name in enumerate(names):
+            key = name.lower()
+            if key not in hashes:
+                hashes[key] = (index, name_hash(name))
+        # Keeping the load factor at or below 1/2 makes most seed searches
+        # succeed on the first try.
+        size = 1
+        while size < 2 * len(hashes):
+            size *= 2
+        while True:
+            mask = size - 1
+            buckets: Dict[int, List[Tuple[int, int]]] = {}
+            for member in hashes.values():
+                buckets.setdefault(member[1] & mask, []).append(member)
+            seeds = [0] * size
+            slots = [-1] * size
+            # Largest buckets first, while most slots are still free.
+            for bucket, members in sorted(buckets.items(), key=lambda item: -len(item[1])):
+                if len(members) == 1:
+                    index, member_hash = members[0]
+                    for seed in range(1 << 16):
+                        position = slot_of(member_hash, seed, mask)
+                        if slots[position] < 0:
+                            break
+                    else:
+                        break
+                    seeds[bucket] = seed
+                    slots[position] = index
+                    continue
+                for seed in range(1 << 16):
+                    positions = [slot_of(member_hash, seed, mask) for _, member_hash in members]
+                    if all(slots[position] < 0 for position in positions) and len(
+                        set(positions)
+                    ) == len(positions):
+                        break
+                else:
+                    break
+                seeds[bucket] = seed
+                for (index, _), position in zip(members, positions):
+                    slots[position] = index
+            else:
+                return seeds, slots
+            size *= 2
+
+    @staticmethod
+    def _instrumentation_scope(asset: AttributeSetAsset, indent: str, *scope: str) -> str:
+        # Trace scope and stat names are derived from the class and attribute
+        # names only, so they stay stable across regenerations.
+        if not asset.instrument:
+            return ""
+        return INSTRUMENTATION_SCOPE.render(
+            Indent=indent, Scope="_".join((asset.class_name, *scope))
+        )
+
+    @staticmethod
+    def _render_instrumentation(asset: AttributeSetAsset) -> str:
+        group = f"STATGROUP_GasPlus_{asset.class_name}"
+        scopes: List[Tuple[str, ...]] = [("PreAttributeChange",), ("PostAttributeChange",)]
+        for attribute in asset.attributes:
+            if attribute.metadata.generate_hooks:
+                scopes.append((attribute.name, "PreAttributeChange"))
+                scopes.append((attribute.name, "PostAttributeChange"))
+            if attribute.metadata.replicate and not attribute.metadata.skip_on_rep:
+                scopes.append((attribute.name, "OnRep"))
+        declarations = "".join(
+            COUNTER_STAT.render(
+                Label=".".join((asset.class_name, *scope)),
+                Scope="_".join((asset.class_name, *scope)),
+                Group=group,
+            )
+            for scope in scopes
+        )
+        return INSTRUMENTATION.render(
+            ClassName=asset.class_name, Group=group, Declarations=declarations
+        )
 
     def _ensure_meta_registry(self, output_root: Path) -> None:
         meta_root = output_root / "Meta"
-        meta_root.mkdir(parents=True, exist_ok=True)
+        self._io.mkdir(meta_root)
 
         header_path = meta_root / "MetaAttributes.h"
         source_path = meta_root / "MetaAttributes.cpp"
@@ -946,331 +2293,51 @@ class AttributeSetGenerator:
         self._write_if_changed(source_path, source_contents)
 
     def _render_meta_registry_header(self) -> str:
-        return textwrap.dedent(
-            """\
-            #pragma once
-
-            #include "CoreMinimal.h"
-
-            #if __has_include("UObject/NameTypes.h")
-            #include "UObject/NameTypes.h"
-            #include "Containers/UnrealString.h"
-            #endif
-
-            #if __has_include("Containers/Map.h")
-            #include "Containers/Map.h"
-            #endif
-
-            #if !__has_include("UObject/NameTypes.h")
-            #include <string>
-            #endif
-
-            #if !__has_include("Containers/Map.h")
-            #include <map>
-            #include <stdexcept>
-            #endif
-
-            #ifndef TEXT
-            #define TEXT(x) x
-            #endif
-
-            namespace GasPlusSample::Attributes::Meta
-            {
-            #if __has_include("UObject/NameTypes.h")
-                using FMetaRegistryName = FName;
-                using FMetaRegistryString = FString;
-            #else
-                struct FMetaRegistryName
-                {
-                    FMetaRegistryName() = default;
-
-                    explicit FMetaRegistryName(const char* InName)
-                        : Value(InName ? InName : "")
-                    {
-                    }
-
-                    bool IsNone() const
-                    {
-                        return Value.empty();
-                    }
-
-                    bool operator==(const FMetaRegistryName& Other) const
-                    {
-                        return Value == Other.Value;
-                    }
-
-                    bool operator!=(const FMetaRegistryName& Other) const
-                    {
-                        return !(*this == Other);
-                    }
-
-                    std::string Value;
-                };
-
-                inline bool operator<(const FMetaRegistryName& Lhs, const FMetaRegistryName& Rhs)
-                {
-                    return Lhs.Value < Rhs.Value;
-                }
-
-                using FMetaRegistryString = std::string;
-            #endif
-
-            #if __has_include("Containers/Map.h")
-                template <typename KeyType, typename ValueType>
-                using TMetaRegistryMap = TMap<KeyType, ValueType>;
-            #else
-                template <typename KeyType, typename ValueType>
-                class TMetaRegistryMap
-                {
-                public:
-                    bool Contains(const KeyType& Key) const
-                    {
-                        return Storage.find(Key) != Storage.end();
-                    }
-
-                    void Add(const KeyType& Key, const ValueType& Value)
-                    {
-                        Storage[Key] = Value;
-                    }
-
-                    const ValueType* Find(const KeyType& Key) const
-                    {
-                        auto It = Storage.find(Key);
-                        if (It == Storage.end())
-                        {
-                            return nullptr;
-                        }
-                        return &It->second;
-                    }
-
-                    ValueType* Find(const KeyType& Key)
-                    {
-                        auto It = Storage.find(Key);
-                        if (It == Storage.end())
-                        {
-                            return nullptr;
-                        }
-                        return &It->second;
-                    }
-
-                    const ValueType& FindChecked(const KeyType& Key) const
-                    {
-                        auto It = Storage.find(Key);
-                        if (It == Storage.end())
-                        {
-                            throw std::out_of_range("Key not found in TMetaRegistryMap");
-                        }
-                        return It->second;
-                    }
-
-                private:
-                    std::map<KeyType, ValueType> Storage;
-                };
-            #endif
-
-                struct GASPLUSSAMPLE_API FMetaAttributeDefinition
-                {
-                    FMetaAttributeDefinition() = default;
-
-                    FMetaAttributeDefinition(
-                        const FMetaRegistryName& InRegistryName,
-                        const FMetaRegistryName& InBackingAttributeName,
-                        const FMetaRegistryString& InDescription);
-
-                    FMetaRegistryName RegistryName;
-                    FMetaRegistryName BackingAttributeName;
-                    FMetaRegistryString Description;
-                };
-
-                class GASPLUSSAMPLE_API FMetaAttributesRegistry
-                {
-                public:
-                    static const FMetaAttributesRegistry& Get();
-                    static void RegisterEditorExtension(const FMetaAttributeDefinition& Definition);
-
-                    const FMetaAttributeDefinition& GetDamage() const;
-                    const FMetaAttributeDefinition& GetHeal() const;
-                    const FMetaAttributeDefinition& GetShieldDelta() const;
-
-                    const TMetaRegistryMap<FMetaRegistryName, FMetaAttributeDefinition>& GetDefinitions() const;
-                    const FMetaAttributeDefinition* FindDefinition(const FMetaRegistryName& RegistryName) const;
-
-                private:
-                    FMetaAttributesRegistry();
-                    void Register(const FMetaAttributeDefinition& Definition);
-
-                    static const FMetaRegistryName DamageKey;
-                    static const FMetaRegistryName HealKey;
-                    static const FMetaRegistryName ShieldDeltaKey;
-
-                    TMetaRegistryMap<FMetaRegistryName, FMetaAttributeDefinition> Definitions;
-                };
-            }
-            """
-        ).strip() + "\n"
+        return META_REGISTRY_HEADER.render()
 
     def _render_meta_registry_source(self) -> str:
-        return textwrap.dedent(
-            """\
-            #include "Meta/MetaAttributes.h"
-
-            #if __has_include("HAL/CriticalSection.h")
-            #include "HAL/CriticalSection.h"
-            #include "Misc/ScopeLock.h"
-            #else
-            #include <mutex>
-            #endif
-
-            namespace GasPlusSample::Attributes::Meta
-            {
-            #if !__has_include("HAL/CriticalSection.h")
-                class FCriticalSection
-                {
-                public:
-                    void Lock()
-                    {
-                        Mutex.lock();
-                    }
-
-                    void Unlock()
-                    {
-                        Mutex.unlock();
-                    }
-
-                private:
-                    std::mutex Mutex;
-                };
-
-                class FScopeLock
-                {
-                public:
-                    explicit FScopeLock(FCriticalSection* InCriticalSection)
-                        : CriticalSection(InCriticalSection)
-                    {
-                        if (CriticalSection)
-                        {
-                            CriticalSection->Lock();
-                        }
-                    }
-
-                    ~FScopeLock()
-                    {
-                        if (CriticalSection)
-                        {
-                            CriticalSection->Unlock();
-                        }
-                    }
-
-                private:
-                    FCriticalSection* CriticalSection;
-                };
-            #endif
-
-                namespace
-                {
-                    FCriticalSection GMetaAttributesRegistryMutex;
-                }
-
-                const FMetaRegistryName FMetaAttributesRegistry::DamageKey(TEXT("Damage"));
-                const FMetaRegistryName FMetaAttributesRegistry::HealKey(TEXT("Heal"));
-                const FMetaRegistryName FMetaAttributesRegistry::ShieldDeltaKey(TEXT("ShieldDelta"));
-
-                FMetaAttributeDefinition::FMetaAttributeDefinition(
-                    const FMetaRegistryName& InRegistryName,
-                    const FMetaRegistryName& InBackingAttributeName,
-                    const FMetaRegistryString& InDescription)
-                    : RegistryName(InRegistryName)
-                    , BackingAttributeName(InBackingAttributeName)
-                    , Description(InDescription)
-                {
-                }
-
-                const FMetaAttributesRegistry& FMetaAttributesRegistry::Get()
-                {
-                    static FMetaAttributesRegistry Instance;
-                    return Instance;
-                }
-
-                void FMetaAttributesRegistry::RegisterEditorExtension(const FMetaAttributeDefinition& Definition)
-                {
-                    FScopeLock Lock(&GMetaAttributesRegistryMutex);
-                    FMetaAttributesRegistry& Registry = const_cast<FMetaAttributesRegistry&>(Get());
-                    Registry.Register(Definition);
-                }
-
-                FMetaAttributesRegistry::FMetaAttributesRegistry()
-                {
-                    Register(FMetaAttributeDefinition(DamageKey, DamageKey, TEXT("Aggregates outgoing damage modifications before final application.")));
-                    Register(FMetaAttributeDefinition(HealKey, HealKey, TEXT("Aggregates incoming healing before it is applied to core attributes.")));
-                    Register(FMetaAttributeDefinition(ShieldDeltaKey, ShieldDeltaKey, TEXT("Captures shield-specific adjustments that may bypass health values.")));
-                }
-
-                void FMetaAttributesRegistry::Register(const FMetaAttributeDefinition& Definition)
-                {
-                    if (Definition.RegistryName.IsNone() || Definitions.Contains(Definition.RegistryName))
-                    {
-                        return;
-                    }
-
-                    Definitions.Add(Definition.RegistryName, Definition);
-                }
-
-                const TMetaRegistryMap<FMetaRegistryName, FMetaAttributeDefinition>& FMetaAttributesRegistry::GetDefinitions() const
-                {
-                    return Definitions;
-                }
+        return META_REGISTRY_SOURCE.render()
 
-                const FMetaAttributeDefinition* FMetaAttributesRegistry::FindDefinition(const FMetaRegistryName& RegistryName) const
-                {
-                    return Definitions.Find(RegistryName);
-                }
-
-                const FMetaAttributeDefinition& FMetaAttributesRegistry::GetDamage() const
-                {
-                    return Definitions.FindChecked(DamageKey);
-                }
-
-                const FMetaAttributeDefinition& FMetaAttributesRegistry::GetHeal() const
-                {
-                    return Definitions.FindChecked(HealKey);
-                }
-
-                const FMetaAttributeDefinition& FMetaAttributesRegistry::GetShieldDelta() const
-                {
-                    return Definitions.FindChecked(ShieldDeltaKey);
-                }
-            }
-            """
-        ).strip() + "\n"
-
-    @staticmethod
-    def _write_if_changed(path: Path, contents: str) -> None:
+    def _write_if_changed(self, path: Path, contents: str) -> bool:
         normalized = contents if contents.endswith("\n") else contents + "\n"
-        if path.exists() and path.read_text() == normalized:
-            return
-        path.write_text(normalized)
+        if self._io.exists(path) and self._io.read_text(path) == normalized:
+            self.metrics.increment("files_unchanged")
+            return False
+        self._io.write_text(path, normalized)
+        self.metrics.increment("files_rewritten")
+        return True
 
     def _render_generated_header(self, asset: AttributeSetAsset) -> str:
-        return textwrap.dedent(
-            f"""
-            #pragma once
-
-            // Stub generated header for {asset.class_name}. In Unreal builds this file will be replaced by UHT.
-            """
-        ).strip() + "\n"
+        return GENERATED_HEADER.render(ClassName=asset.class_name)
 
-    @staticmethod
-    def _hash_file(path: Path) -> str:
-        digest = hashlib.sha256()
-        with path.open("rb") as handle:
-            for chunk in iter(lambda: handle.read(65536), b""):
-                digest.update(chunk)
-        return digest.hexdigest()
+    def _hash_file(self, path: Path) -> str:
+        return self._io.hash_file(path)
 
 
 def main(args: Optional[Sequence[str]] = None) -> None:
-    generator = AttributeSetGenerator.from_args(args)
-    generator.run()
+    argv = list(sys.argv[1:] if args is None else args)
+    if argv and argv[0] == "merge-manifests":
+        merge_manifests_main(argv[1:], DEFAULT_MANIFEST_PATH, DEFAULT_LOG_PATH)
+        return
+    if argv and argv[0] == "journal":
+        journal_main(argv[1:], DEFAULT_MANIFEST_PATH)
+        return
+    if argv and argv[0] == "query":
+        query_main(argv[1:], str(Path(DEFAULT_MANIFEST_PATH).parent / INDEX_FILENAME))
+        return
+    generator = AttributeSetGenerator.from_args(argv)
+    try:
+        if generator.config.check:
+            exit_code = generator.check()
+            if exit_code:
+                raise SystemExit(exit_code)
+            return
+        exit_code = generator.run()
+        if exit_code:
+            raise SystemExit(exit_code)
+    except (GitScopeError, LockTimeoutError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        raise SystemExit(2) from error
 
 
 if __name__ == "__main__":
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+
+class GitScopeError(RuntimeError):
+    """Raised when git cannot answer a change-detection query."""
+
+
+def _git(repo_root: Path, *args: str) -> str:
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=str(repo_root),
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError as error:
+        raise GitScopeError(f"Unable to run git: {error}") from error
+    if result.returncode != 0:
+        raise GitScopeError(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+    return result.stdout
+
+
+def _split_nul(output: str) -> List[str]:
+    return [item for item in output.split("\0") if item]
+
+
+def repository_root(start: Path) -> Path:
+    return Path(_git(start, "rev-parse", "--show-toplevel").strip()).resolve()
+
+
+def changed_paths(
+    repo_root: Path, *, since: Optional[str] = None, staged: bool = False
+) -> Set[Path]:
+    """Absolute paths git reports as changed, including deletions.
+
+    ``staged`` compares the index against HEAD; ``since`` compares the working
+    tree against ``since`` and also includes untracked files.
+    """
+    paths: Set[str] = set()
+    if staged:
+        paths.update(_split_nul(_git(repo_root, "diff", "--cached", "--name-only", "-z")))
+    if since is not None:
+        paths.update(_split_nul(_git(repo_root, "diff", "--name-only", "-z", since, "--")))
+        paths.update(
+            _split_nul(_git(repo_root, "ls-files", "--others", "--exclude-standard", "-z"))
+        )
+    return {(repo_root / path).resolve() for path in paths}
+
+
+def index_blob_ids(repo_root: Path, paths: Iterable[Path]) -> Dict[Path, str]:
+    """Blob ids recorded in the index for ``paths`` whose working copy is unmodified."""
+    relative = [str(path.relative_to(repo_root)) for path in paths]
+    if not relative:
+        return {}
+    dirty = {
+        (repo_root / path).resolve()
+        for path in _split_nul(_git(repo_root, "diff", "--name-only", "-z", "--", *relative))
+    }
+    blobs: Dict[Path, str] = {}
+    for record in _split_nul(_git(repo_root, "ls-files", "-s", "-z", "--", *relative)):
+        info, _, name = record.partition("\t")
+        fields = info.split()
+        if len(fields) != 3 or fields[2] != "0":
+            # Unmerged entries have no single blob to trust.
+            continue
+        path = (repo_root / name).resolve()
+        if path not in dirty:
+            blobs[path] = fields[1]
+    return blobs
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Sequence
+
+try:  # xxhash is optional; fall back to hashlib digests when it is missing.
+    import xxhash
+except ImportError:  # pragma: no cover - exercised when xxhash is absent
+    xxhash = None
+
+DEFAULT_ALGORITHM = "sha256"
+# Files smaller than this are read directly; mapping them costs more than it saves.
+MMAP_THRESHOLD = 1024 * 1024
+_CHUNK_SIZE = 65536
+
+
+def available_algorithms() -> List[str]:
+    algorithms = ["sha256", "blake2b"]
+    if xxhash is not None:
+        algorithms.append("xxh3_128")
+    return algorithms
+
+
+def new_digest(algorithm: str = DEFAULT_ALGORITHM):
+    """Return a hashlib-style object exposing ``update`` and ``hexdigest``."""
+    if algorithm == "sha256":
+        return hashlib.sha256()
+    if algorithm == "blake2b":
+        # 32-byte output keeps digests the same length as SHA-256 hex strings.
+        return hashlib.blake2b(digest_size=32)
+    if algorithm == "xxh3_128":
+        if xxhash is None:
+            raise ValueError("The xxh3_128 digest requires the xxhash package")
+        return xxhash.xxh3_128()
+    raise ValueError(f"Unknown hash algorithm {algorithm!r}")
+
+
+def hash_parts(parts: Iterable[str], algorithm: str = DEFAULT_ALGORITHM) -> str:
+    """Digest ``parts`` joined by ``|`` without building the joined string."""
+    digest = new_digest(algorithm)
+    for index, part in enumerate(parts):
+        if index:
+            digest.update(b"|")
+        digest.update(part.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def hash_file(path: Path, algorithm: str = DEFAULT_ALGORITHM) -> str:
+    digest = new_digest(algorithm)
+    with open(path, "rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            # Hash straight out of the page cache; hashlib releases the GIL for
+            # large buffers, so pooled workers hash in parallel.
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+        else:
+            for chunk in iter(lambda: handle.read(_CHUNK_SIZE), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_files(
+    paths: Sequence[Path],
+    algorithm: str = DEFAULT_ALGORITHM,
+    max_workers: int = 0,
+    hasher: Callable[[Path, str], str] = hash_file,
+) -> Dict[Path, str]:
+    """Hash ``paths`` on a thread pool; ``max_workers`` of 0 picks a default."""
+    unique = list(dict.fromkeys(paths))
+    if not unique:
+        return {}
+    workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    if workers == 1 or len(unique) == 1:
+        return {path: hasher(path, algorithm) for path in unique}
+    with ThreadPoolExecutor(max_workers=min(workers, len(unique))) as pool:
+        digests = pool.map(lambda path: hasher(path, algorithm), unique)
+        return dict(zip(unique, digests))
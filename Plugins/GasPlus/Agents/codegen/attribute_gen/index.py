@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from .generator import AttributeSetAsset
+
+INDEX_FILENAME = "attributes.sqlite"
+INDEX_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS info (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sets (
+    id INTEGER PRIMARY KEY,
+    entry_key TEXT NOT NULL UNIQUE,
+    input TEXT NOT NULL,
+    record INTEGER,
+    name TEXT NOT NULL,
+    class_name TEXT NOT NULL,
+    module_api TEXT NOT NULL,
+    revision TEXT NOT NULL,
+    header_path TEXT NOT NULL,
+    source_path TEXT NOT NULL,
+    generated_header_path TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS attributes (
+    set_id INTEGER NOT NULL REFERENCES sets(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    category TEXT NOT NULL,
+    comment TEXT,
+    replicate INTEGER NOT NULL,
+    generate_hooks INTEGER NOT NULL,
+    skip_on_rep INTEGER NOT NULL,
+    clamp_min REAL,
+    clamp_max REAL,
+    meta_attribute TEXT,
+    PRIMARY KEY (set_id, position)
+);
+CREATE INDEX IF NOT EXISTS sets_by_name ON sets(name);
+CREATE INDEX IF NOT EXISTS sets_by_class ON sets(class_name);
+CREATE INDEX IF NOT EXISTS attributes_by_name ON attributes(name);
+CREATE INDEX IF NOT EXISTS attributes_by_meta ON attributes(meta_attribute);
+"""
+
+_ATTRIBUTE_COLUMNS = (
+    "sets.name AS set_name, sets.class_name, attributes.name, attributes.category, "
+    "attributes.comment, attributes.replicate, attributes.generate_hooks, "
+    "attributes.skip_on_rep, attributes.clamp_min, attributes.clamp_max, "
+    "attributes.meta_attribute"
+)
+
+
+@dataclass
+class IndexUpdate:
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    removed: int = 0
+
+    def to_summary(self) -> Dict[str, int]:
+        return {
+            "inserted": self.inserted,
+            "updated": self.updated,
+            "unchanged": self.unchanged,
+            "removed": self.removed,
+        }
+
+
+class AttributeIndex:
+    """SQLite index of generated sets, attributes, metadata and output paths.
+
+    Rows are keyed by the manifest entry key (input path plus catalog record),
+    and a set is only rewritten when its revision (input hash plus output
+    paths) changes. A ``read_only`` index never creates, migrates or writes
+    the database and raises ``ValueError`` when its schema does not match.
+    """
+
+    def __init__(self, path: Path, read_only: bool = False):
+        self.path = Path(path)
+        if read_only:
+            self.connection = sqlite3.connect(
+                f"{self.path.resolve().as_uri()}?mode=ro", uri=True, timeout=30.0
+            )
+            self.connection.row_factory = sqlite3.Row
+            version = self._schema_version()
+            if version != INDEX_SCHEMA_VERSION:
+                self.connection.close()
+                raise ValueError(
+                    f"{self.path} has index schema {version}, expected {INDEX_SCHEMA_VERSION};"
+                    " rerun the generator to rebuild it"
+                )
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Shards may update the index concurrently; let SQLite serialize them.
+        self.connection = sqlite3.connect(str(self.path), timeout=30.0)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        version = self._schema_version()
+        if version not in (None, INDEX_SCHEMA_VERSION):
+            self.connection.executescript(
+                "DROP TABLE IF EXISTS attributes; DROP TABLE IF EXISTS sets; DROP TABLE IF EXISTS info;"
+            )
+        self.connection.executescript(_SCHEMA)
+        self.connection.execute(
+            "INSERT OR REPLACE INTO info (key, value) VALUES ('schemaVersion', ?)",
+            (str(INDEX_SCHEMA_VERSION),),
+        )
+        self.connection.commit()
+
+    def __enter__(self) -> "AttributeIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def _schema_version(self) -> Optional[int]:
+        try:
+            row = self.connection.execute(
+                "SELECT value FROM info WHERE key = 'schemaVersion'"
+            ).fetchone()
+        except sqlite3.OperationalError:
+            return None
+        return int(row[0]) if row else None
+
+    def update(
+        self,
+        sets: Iterable[Tuple[str, str, "AttributeSetAsset", Dict[str, Path]]],
+        prune: Optional[Callable[[str], bool]] = None,
+    ) -> IndexUpdate:
+        """Upsert ``(entry_key, revision, asset, output_paths)`` rows in one transaction.
+
+        Existing sets not listed are removed when ``prune(input)`` is true.
+        """
+        result = IndexUpdate()
+        with self.connection:
+            existing = {
+                row["entry_key"]: (row["id"], row["revision"], row["input"])
+                for row in self.connection.execute("SELECT id, entry_key, revision, input FROM sets")
+            }
+            seen = set()
+            for entry_key, revision, asset, outputs in sets:
+                seen.add(entry_key)
+                current = existing.get(entry_key)
+                if current is not None and current[1] == revision:
+                    result.unchanged += 1
+                    continue
+                if current is not None:
+                    self.connection.execute("DELETE FROM sets WHERE id = ?", (current[0],))
+                    result.updated += 1
+                else:
+                    result.inserted += 1
+                self._insert(entry_key, revision, asset, outputs)
+            if prune is not None:
+                for entry_key, (set_id, _, input_path) in existing.items():
+                    if entry_key not in seen and prune(input_path):
+                        self.connection.execute("DELETE FROM sets WHERE id = ?", (set_id,))
+                        result.removed += 1
+        return result
+
+    def retain(self, entry_keys: Iterable[str]) -> int:
+        """Remove every set whose entry key is not in ``entry_keys``; returns how many."""
+        keep = set(entry_keys)
+        with self.connection:
+            stale = [
+                (row["id"],)
+                for row in self.connection.execute("SELECT id, entry_key FROM sets")
+                if row["entry_key"] not in keep
+            ]
+            self.connection.executemany("DELETE FROM sets WHERE id = ?", stale)
+        return len(stale)
+
+    def _insert(
+        self, entry_key: str, revision: str, asset: "AttributeSetAsset", outputs: Dict[str, Path]
+    ) -> None:
+        cursor = self.connection.execute(
+            "INSERT INTO sets (entry_key, input, record, name, class_name, module_api, revision,"
+            " header_path, source_path, generated_header_path)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                entry_key,
+                str(asset.source_path),
+                asset.record,
+                asset.name,
+                asset.class_name,
+                asset.module_api,
+                revision,
+                str(outputs["header"]),
+                str(outputs["source"]),
+                str(outputs["generatedHeader"]),
+            ),
+        )
+        self.connection.executemany(
+            "INSERT INTO attributes (set_id, position, name, category, comment, replicate,"
+            " generate_hooks, skip_on_rep, clamp_min, clamp_max, meta_attribute)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    cursor.lastrowid,
+                    position,
+                    attribute.name,
+                    attribute.category,
+                    attribute.comment,
+                    int(attribute.metadata.replicate),
+                    int(attribute.metadata.generate_hooks),
+                    int(attribute.metadata.skip_on_rep),
+                    attribute.metadata.clamp_min,
+                    attribute.metadata.clamp_max,
+                    attribute.metadata.meta_attribute,
+                )
+                for position, attribute in enumerate(asset.attributes)
+            ],
+        )
+
+    def sets_defining(self, attribute_name: str) -> List[Dict[str, object]]:
+        """Sets declaring ``attribute_name``, with their output paths."""
+        rows = self.connection.execute(
+            "SELECT DISTINCT sets.name, sets.class_name, sets.input, sets.record, sets.header_path,"
+            " sets.source_path, sets.generated_header_path FROM sets"
+            " JOIN attributes ON attributes.set_id = sets.id"
+            " WHERE attributes.name = ? ORDER BY sets.name",
+            (attribute_name,),
+        )
+        return [dict(row) for row in rows]
+
+    def attributes_with_meta(self, meta_attribute: str) -> List[Dict[str, object]]:
+        rows = self.connection.execute(
+            f"SELECT {_ATTRIBUTE_COLUMNS} FROM attributes JOIN sets ON attributes.set_id = sets.id"
+            " WHERE attributes.meta_attribute = ? ORDER BY sets.name, attributes.position",
+            (meta_attribute,),
+        )
+        return [dict(row) for row in rows]
+
+    def set_attributes(self, set_name: str) -> List[Dict[str, object]]:
+        """Attributes of the set named ``set_name`` (or with that class name), in order."""
+        rows = self.connection.execute(
+            f"SELECT {_ATTRIBUTE_COLUMNS} FROM attributes JOIN sets ON attributes.set_id = sets.id"
+            " WHERE sets.name = ? OR sets.class_name = ? ORDER BY sets.name, attributes.position",
+            (set_name, set_name),
+        )
+        return [dict(row) for row in rows]
+
+
+def query_main(args: Optional[Sequence[str]], default_index: str) -> None:
+    parser = argparse.ArgumentParser(
+        prog="attribute_gen query",
+        description="Look up attributes in the index maintained by the generator.",
+    )
+    parser.add_argument("--index", dest="index", default=default_index)
+    parser.add_argument("--json", dest="as_json", action="store_true", help="Print rows as JSON.")
+    subparsers = parser.add_subparsers(dest="kind", required=True)
+    subparsers.add_parser("attribute", help="Sets that define an attribute.").add_argument("name")
+    subparsers.add_parser("meta", help="Attributes bound to a MetaAttribute.").add_argument("name")
+    subparsers.add_parser("set", help="Attributes of a set (name or class name).").add_argument("name")
+    parsed = parser.parse_args(args=args)
+
+    index_path = Path(parsed.index)
+    if not index_path.exists():
+        parser.error(f"No attribute index at {index_path}; run the generator first.")
+    try:
+        index = AttributeIndex(index_path, read_only=True)
+    except (ValueError, sqlite3.DatabaseError) as error:
+        parser.error(str(error))
+    with index:
+        if parsed.kind == "attribute":
+            rows = index.sets_defining(parsed.name)
+        elif parsed.kind == "meta":
+            rows = index.attributes_with_meta(parsed.name)
+        else:
+            rows = index.set_attributes(parsed.name)
+
+    if parsed.as_json:
+        print(json.dumps(rows, indent=2))
+        return
+    if not rows:
+        print(f"No matches for {parsed.kind} {parsed.name!r}.")
+        return
+    for row in rows:
+        if parsed.kind == "attribute":
+            print(f"{row['class_name']} ({row['header_path']})")
+        else:
+            print(f"{row['class_name']}.{row['name']} [{row['category']}]")
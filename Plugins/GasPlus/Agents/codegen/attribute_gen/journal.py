@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+from .output_index import entry_key
+
+JOURNAL_VERSION = 1
+DEFAULT_SNAPSHOT_INTERVAL = 32
+
+# One fixed-size record per run: byte offset and length of the run's journal
+# line, and the run whose full snapshot its replay starts from.
+_LOCATOR = struct.Struct("<QQQ")
+
+
+def journal_path_for(manifest_path: Path) -> Path:
+    return manifest_path.with_name(f"{manifest_path.stem}.journal.jsonl")
+
+
+class _Locator(NamedTuple):
+    offset: int
+    length: int
+    base: int
+
+
+@dataclass
+class ManifestChanges:
+    """Net manifest changes between two journal runs.
+
+    ``changed`` maps entry keys to the latest version of every entry that was
+    added or modified after ``since``; ``removed`` lists entry keys dropped in
+    that span and not re-added. Top-level manifest fields are tracked the same
+    way in ``fields`` and ``removed_fields``.
+    """
+
+    since: int
+    until: int
+    changed: Dict[str, Dict[str, object]] = field(default_factory=dict)
+    removed: List[str] = field(default_factory=list)
+    fields: Dict[str, object] = field(default_factory=dict)
+    removed_fields: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "since": self.since,
+            "until": self.until,
+            "changed": list(self.changed.values()),
+            "removed": self.removed,
+            "fields": self.fields,
+            "removedFields": self.removed_fields,
+        }
+
+
+def manifest_delta(
+    previous: Optional[Dict[str, object]], current: Dict[str, object]
+) -> Dict[str, object]:
+    """The entries and top-level fields of ``current`` that differ from ``previous``."""
+    previous = previous or {}
+    before = {entry_key(entry): entry for entry in previous.get("entries") or []}
+    entries = list(current.get("entries") or [])
+    keys = [entry_key(entry) for entry in entries]
+    remaining = set(keys)
+    delta: Dict[str, object] = {
+        "fields": {
+            key: value
+            for key, value in current.items()
+            if key != "entries" and previous.get(key) != value
+        },
+        "changed": [entry for key, entry in zip(keys, entries) if before.get(key) != entry],
+        "removed": [key for key in before if key not in remaining],
+    }
+    removed_fields = [key for key in previous if key != "entries" and key not in current]
+    if removed_fields:
+        delta["removedFields"] = removed_fields
+    # Replay keeps surviving entries in place and appends new ones; only
+    # record the order when that would not reproduce it.
+    replayed = [key for key in before if key in remaining]
+    replayed.extend(key for key in keys if key not in before)
+    if replayed != keys:
+        delta["order"] = keys
+    return delta
+
+
+def apply_delta(manifest: Dict[str, object], delta: Dict[str, object]) -> Dict[str, object]:
+    entries = {entry_key(entry): entry for entry in manifest.get("entries") or []}
+    for key in delta.get("removed") or []:
+        entries.pop(key, None)
+    for entry in delta.get("changed") or []:
+        entries[entry_key(entry)] = entry
+    order = delta.get("order")
+    result = {key: value for key, value in manifest.items() if key != "entries"}
+    for key in delta.get("removedFields") or []:
+        result.pop(key, None)
+    result.update(delta.get("fields") or {})
+    result["entries"] = (
+        [entries[key] for key in order] if order is not None else list(entries.values())
+    )
+    return result
+
+
+class ManifestJournal:
+    """Append-only history of manifest deltas, one JSON line per run.
+
+    Each line holds only the entries and top-level fields that changed since
+    the previous run. Every ``snapshot_interval`` runs the line also carries
+    the full manifest, so rebuilding any run replays a bounded number of
+    deltas. A fixed-width side index maps run numbers to byte offsets, so
+    readers seek straight to the lines they need instead of parsing the
+    whole history.
+    """
+
+    def __init__(self, path: Path, snapshot_interval: int = DEFAULT_SNAPSHOT_INTERVAL):
+        self.path = Path(path)
+        self.index_path = self.path.with_suffix(".idx")
+        self.snapshot_interval = max(1, snapshot_interval)
+
+    @classmethod
+    def for_manifest(cls, manifest_path: Path, **kwargs) -> "ManifestJournal":
+        return cls(journal_path_for(Path(manifest_path)), **kwargs)
+
+    @property
+    def latest_run(self) -> int:
+        return len(self._locators())
+
+    @property
+    def next_run(self) -> int:
+        return self.latest_run + 1
+
+    def append(self, manifest: Dict[str, object]) -> int:
+        """Record ``manifest`` as the next run; returns its run number."""
+        locators = self._locators()
+        self._truncate_torn_tail(locators)
+        run = len(locators) + 1
+        previous = self._rebuild(locators, run - 1) if locators else None
+        record: Dict[str, object] = {"version": JOURNAL_VERSION, "run": run}
+        record.update(manifest_delta(previous, manifest))
+        keys = [entry_key(entry) for entry in manifest.get("entries") or []]
+        base = locators[-1].base if locators else run
+        # Entries that share a key cannot be replayed from deltas, so such
+        # manifests are always stored in full.
+        if previous is None or run - base >= self.snapshot_interval or len(set(keys)) != len(keys):
+            record["snapshot"] = manifest
+            base = run
+        line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("ab") as stream:
+            offset = stream.seek(0, os.SEEK_END)
+            stream.write(line)
+            stream.flush()
+            os.fsync(stream.fileno())
+        # The locator goes in last: a line without one is a torn append that
+        # readers ignore and the next writer truncates.
+        with self.index_path.open("ab") as stream:
+            stream.write(_LOCATOR.pack(offset, len(line), base))
+            stream.flush()
+            os.fsync(stream.fileno())
+        return run
+
+    def manifest_at(self, run: Optional[int] = None) -> Dict[str, object]:
+        """The manifest as written by ``run`` (the latest run by default)."""
+        locators = self._locators()
+        run = len(locators) if run is None else run
+        if not 1 <= run <= len(locators):
+            raise ValueError(f"Run {run} is not in {self.path} ({len(locators)} runs recorded)")
+        return self._rebuild(locators, run)
+
+    def changes_since(self, run: int) -> ManifestChanges:
+        """What changed between ``run`` (0 for an empty tree) and the latest run."""
+        locators = self._locators()
+        if not 0 <= run <= len(locators):
+            raise ValueError(f"Run {run} is not in {self.path} ({len(locators)} runs recorded)")
+        changes = ManifestChanges(since=run, until=len(locators))
+        removed: Dict[str, None] = {}
+        removed_fields: Dict[str, None] = {}
+        if run < len(locators):
+            for record in self._read(locators, run + 1, len(locators)):
+                for key in record.get("removed") or []:
+                    changes.changed.pop(key, None)
+                    removed[key] = None
+                for entry in record.get("changed") or []:
+                    key = entry_key(entry)
+                    removed.pop(key, None)
+                    changes.changed[key] = entry
+                for key in record.get("removedFields") or []:
+                    changes.fields.pop(key, None)
+                    removed_fields[key] = None
+                for key, value in dict(record.get("fields") or {}).items():
+                    removed_fields.pop(key, None)
+                    changes.fields[key] = value
+        changes.removed = list(removed)
+        changes.removed_fields = list(removed_fields)
+        return changes
+
+    def _rebuild(self, locators: Sequence[_Locator], run: int) -> Dict[str, object]:
+        records = self._read(locators, locators[run - 1].base, run)
+        manifest = dict(next(records)["snapshot"])
+        for record in records:
+            manifest = (
+                dict(record["snapshot"]) if "snapshot" in record else apply_delta(manifest, record)
+            )
+        return manifest
+
+    def _read(
+        self, locators: Sequence[_Locator], first: int, last: int
+    ) -> Iterator[Dict[str, object]]:
+        start = locators[first - 1].offset
+        end = locators[last - 1].offset + locators[last - 1].length
+        with self.path.open("rb") as stream:
+            stream.seek(start)
+            payload = stream.read(end - start)
+        for line in payload.splitlines():
+            yield json.loads(line)
+
+    def _locators(self) -> List[_Locator]:
+        try:
+            payload = self.index_path.read_bytes()
+            size = self.path.stat().st_size
+        except OSError:
+            return []
+        locators = []
+        for offset, length, base in _LOCATOR.iter_unpack(
+            payload[: len(payload) - len(payload) % _LOCATOR.size]
+        ):
+            if offset + length > size or base > len(locators) + 1:
+                break
+            locators.append(_Locator(offset, length, base))
+        return locators
+
+    def _truncate_torn_tail(self, locators: Sequence[_Locator]) -> None:
+        end = locators[-1].offset + locators[-1].length if locators else 0
+        if self.path.exists() and self.path.stat().st_size != end:
+            with self.path.open("r+b") as stream:
+                stream.truncate(end)
+        if self.index_path.exists() and self.index_path.stat().st_size != len(locators) * _LOCATOR.size:
+            with self.index_path.open("r+b") as stream:
+                stream.truncate(len(locators) * _LOCATOR.size)
+
+
+def journal_main(args: Optional[Sequence[str]], default_manifest: str) -> None:
+    parser = argparse.ArgumentParser(
+        prog="attribute_gen journal",
+        description="Read the generation journal kept next to the manifest.",
+    )
+    parser.add_argument("--manifest", dest="manifest", default=default_manifest)
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument(
+        "--since", type=int, metavar="RUN", help="Print entries changed or removed after RUN as JSON."
+    )
+    group.add_argument("--at", type=int, metavar="RUN", help="Print the manifest written by RUN.")
+    parsed = parser.parse_args(args=args)
+
+    journal = ManifestJournal.for_manifest(Path(parsed.manifest))
+    latest = journal.latest_run
+    if not latest:
+        parser.error(f"No generation journal at {journal.path}; run the generator first.")
+    try:
+        if parsed.since is not None:
+            print(json.dumps(journal.changes_since(parsed.since).to_dict(), indent=2))
+        elif parsed.at is not None:
+            print(json.dumps(journal.manifest_at(parsed.at), indent=2))
+        else:
+            print(f"{latest} runs recorded in {journal.path}.")
+    except ValueError as error:
+        parser.error(str(error))
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import json
+import os
+import stat
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+_POLL_INTERVAL = 0.05
+
+
+class LockTimeoutError(RuntimeError):
+    """Raised when another generator run holds the lock for too long."""
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Replace ``path`` in one step so readers never see a partial file.
+
+    A replaced file keeps its mode; a new one gets the default mode under the
+    process umask, like a plain write.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode: Optional[int] = stat.S_IMODE(path.stat().st_mode)
+    except OSError:
+        mode = None
+    temp_path = path.with_name(f".tmp-{uuid.uuid4().hex}")
+    try:
+        with open(temp_path, "xb") as stream:
+            stream.write(data)
+        if mode is not None:
+            os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    atomic_write_bytes(path, text.encode("utf-8"))
+
+
+class FileLock:
+    """Exclusive advisory lock on ``path`` shared by every process on the host."""
+
+    def __init__(self, path: Path, timeout: Optional[float] = None):
+        self.path = Path(path)
+        self.timeout = timeout
+        self._fd: Optional[int] = None
+
+    def _try_lock(self, fd: int) -> bool:
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:  # pragma: no cover - Windows
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+
+    def acquire(self) -> bool:
+        """Block until the lock is held; returns whether another holder made us wait."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(str(self.path), os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        waited = False
+        while not self._try_lock(fd):
+            waited = True
+            if deadline is not None and time.monotonic() >= deadline:
+                os.close(fd)
+                raise LockTimeoutError(
+                    f"Timed out after {self.timeout}s waiting for {self.path}; "
+                    "another attribute_gen run is still in progress."
+                )
+            time.sleep(_POLL_INTERVAL)
+        self._fd = fd
+        return waited
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:  # pragma: no cover - Windows
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+
+class RunCoordinator:
+    """Serializes generator runs and coalesces identical requests.
+
+    The state file records the request key and start/finish times of the
+    last run. A caller that had to wait reuses that run's exit code when it
+    had the same key and *started after the caller arrived*, since it then
+    saw every input change the caller could have. Otherwise the caller runs
+    itself, so a burst of waiters queues exactly one follow-up run: the first
+    to get the lock runs, and the rest reuse its result.
+    """
+
+    def __init__(
+        self,
+        lock_path: Path,
+        state_path: Path,
+        request_key: str,
+        timeout: Optional[float] = None,
+    ):
+        self.lock = FileLock(lock_path, timeout)
+        self.state_path = Path(state_path)
+        self.request_key = request_key
+
+    def read_state(self) -> Dict[str, object]:
+        try:
+            state = json.loads(self.state_path.read_text())
+        except (OSError, json.JSONDecodeError, ValueError):
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def _write_state(self, state: Dict[str, object]) -> None:
+        atomic_write_text(self.state_path, json.dumps(state, indent=2) + "\n")
+
+    def run(self, work: Callable[[], int]) -> Tuple[int, Optional[Dict[str, object]]]:
+        """Run ``work`` under the lock; returns its exit code and the reused state, if any."""
+        arrived_at = time.time()
+        with self.lock:
+            state = self.read_state()
+            if (
+                state.get("requestKey") == self.request_key
+                and state.get("exitCode") is not None
+                and float(state.get("startedAt") or 0.0) > arrived_at
+                and state.get("finishedAt") is not None
+            ):
+                return int(state["exitCode"]), state
+
+            started = {
+                "requestKey": self.request_key,
+                "pid": os.getpid(),
+                "startedAt": time.time(),
+                "finishedAt": None,
+                "exitCode": None,
+            }
+            self._write_state(started)
+            exit_code: Optional[int] = None
+            try:
+                exit_code = work()
+                return exit_code, None
+            finally:
+                # A crashed run records no exit code, so nobody reuses it.
+                self._write_state(dict(started, finishedAt=time.time(), exitCode=exit_code))
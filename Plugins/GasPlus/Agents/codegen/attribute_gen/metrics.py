@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import io
+import json
+import threading
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, Optional, Tuple
+
+from .hashing import DEFAULT_ALGORITHM
+from .storage import Storage
+
+METRICS_PREFIX = "attribute_gen"
+METRICS_TEXT_FILENAME = "metrics.prom"
+METRICS_JSON_FILENAME = "metrics.json"
+METRICS_VERSION = 1
+
+# name -> (OpenMetrics unit, help text). Names with a unit end in it, as the
+# OpenMetrics spec requires.
+COUNTERS: Dict[str, Tuple[str, str]] = {
+    "assets_discovered": ("", "Attribute sets discovered in the inputs."),
+    "hash_hits": ("", "Attribute sets whose composite hash matched the recorded one."),
+    "hash_misses": ("", "Attribute sets whose composite hash changed or was never recorded."),
+    "renders_performed": ("", "Outputs rendered from their templates."),
+    "renders_avoided": ("", "Outputs skipped by hash or served from the output cache."),
+    "read_bytes": ("bytes", "Bytes read through the storage backend."),
+    "written_bytes": ("bytes", "Bytes written through the storage backend."),
+    "files_rewritten": ("", "Generated files whose contents were written."),
+    "files_unchanged": ("", "Generated files left untouched."),
+    "preserve_regions_merged": ("", "Preserve regions carried over from existing outputs."),
+}
+
+
+class RunMetrics:
+    """Counters describing how much work one generator run did or avoided."""
+
+    def __init__(self, counters: Optional[Dict[str, int]] = None):
+        self._counters: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self._lock = threading.Lock()
+        for name, value in (counters or {}).items():
+            self.increment(name, value)
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        if name not in COUNTERS:
+            raise KeyError(f"Unknown metric {name!r}")
+        with self._lock:
+            self._counters[name] += amount
+
+    def __getitem__(self, name: str) -> int:
+        with self._lock:
+            return self._counters[name]
+
+    def to_summary(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
+
+    def to_json(self) -> str:
+        payload = {"version": METRICS_VERSION, "counters": self.to_summary()}
+        return json.dumps(payload, indent=2) + "\n"
+
+    def to_openmetrics(self, prefix: str = METRICS_PREFIX) -> str:
+        lines = []
+        for name, value in self.to_summary().items():
+            unit, help_text = COUNTERS[name]
+            family = f"{prefix}_{name}"
+            lines.append(f"# TYPE {family} counter")
+            if unit:
+                lines.append(f"# UNIT {family} {unit}")
+            lines.append(f"# HELP {family} {help_text}")
+            lines.append(f"{family}_total {value}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def merged(cls, parts: Iterable["RunMetrics"]) -> "RunMetrics":
+        total = cls()
+        for part in parts:
+            for name, value in part.to_summary().items():
+                total.increment(name, value)
+        return total
+
+    @classmethod
+    def from_json(cls, text: str) -> "RunMetrics":
+        payload = json.loads(text)
+        if not isinstance(payload, dict) or payload.get("version") != METRICS_VERSION:
+            raise ValueError("Unsupported metrics file")
+        return cls({str(name): int(value) for name, value in dict(payload["counters"]).items()})
+
+
+class _CountingReader(io.RawIOBase):
+    def __init__(self, stream: BinaryIO, metrics: RunMetrics):
+        self._stream = stream
+        self._metrics = metrics
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._stream.read(len(buffer))
+        buffer[: len(data)] = data
+        self._metrics.increment("read_bytes", len(data))
+        return len(data)
+
+    def close(self) -> None:
+        self._stream.close()
+        super().close()
+
+
+class MeteredStorage(Storage):
+    """Counts the bytes moved through ``inner`` into ``metrics``."""
+
+    def __init__(self, inner: Storage, metrics: RunMetrics):
+        self.inner = inner
+        self.metrics = metrics
+
+    @property
+    def persistent(self) -> bool:
+        return self.inner.persistent
+
+    def read_bytes(self, path: Path) -> bytes:
+        data = self.inner.read_bytes(path)
+        self.metrics.increment("read_bytes", len(data))
+        return data
+
+    def read_text(self, path: Path) -> str:
+        text = self.inner.read_text(path)
+        self.metrics.increment("read_bytes", len(text.encode("utf-8")))
+        return text
+
+    def write_bytes(self, path: Path, data: bytes) -> None:
+        self.inner.write_bytes(path, data)
+        self.metrics.increment("written_bytes", len(data))
+
+    def write_text(self, path: Path, text: str) -> None:
+        self.inner.write_text(path, text)
+        self.metrics.increment("written_bytes", len(text.encode("utf-8")))
+
+    def replace_text(self, path: Path, text: str) -> None:
+        self.inner.replace_text(path, text)
+        self.metrics.increment("written_bytes", len(text.encode("utf-8")))
+
+    def exists(self, path: Path) -> bool:
+        return self.inner.exists(path)
+
+    def size(self, path: Path) -> int:
+        return self.inner.size(path)
+
+    def iter_files(self, root: Path) -> Iterator[Path]:
+        return self.inner.iter_files(root)
+
+    def mkdir(self, path: Path) -> None:
+        self.inner.mkdir(path)
+
+    def unlink(self, path: Path) -> None:
+        self.inner.unlink(path)
+
+    def open_binary(self, path: Path) -> BinaryIO:
+        return io.BufferedReader(_CountingReader(self.inner.open_binary(path), self.metrics))
+
+    def hash_file(self, path: Path, algorithm: str = DEFAULT_ALGORITHM) -> str:
+        digest = self.inner.hash_file(path, algorithm)
+        self.metrics.increment("read_bytes", self.inner.size(path))
+        return digest
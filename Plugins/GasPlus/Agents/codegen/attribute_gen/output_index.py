@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Set
+
+from .storage import Storage
+
+OUTPUT_INDEX_FILENAME = "outputs.index.json"
+OUTPUT_INDEX_VERSION = 1
+
+
+def entry_key(entry: Dict[str, object]) -> str:
+    record = entry.get("record")
+    if record is None:
+        return str(entry.get("input"))
+    return f"{entry.get('input')}#{record}"
+
+
+@dataclass
+class OutputIndex:
+    """Every file the generator owns, keyed by the manifest entry that wrote it.
+
+    ``orphans`` holds files whose entry is gone but which were reported
+    rather than pruned, so later runs keep reporting them until removed.
+    """
+
+    entries: Dict[str, List[str]] = field(default_factory=dict)
+    orphans: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[Dict[str, object]]) -> "OutputIndex":
+        index = cls()
+        for entry in entries:
+            files = [str(path) for path in dict(entry.get("outputs") or {}).values()]
+            if entry.get("sidecar"):
+                files.append(str(entry["sidecar"]))
+            if files:
+                index.entries[entry_key(entry)] = files
+        return index
+
+    @classmethod
+    def load(cls, storage: Storage, path: Path, fallback_manifest: Path) -> "OutputIndex":
+        """Read the index, bootstrapping from the previous manifest when it is missing."""
+        try:
+            if storage.exists(path):
+                payload = json.loads(storage.read_text(path))
+                if isinstance(payload, dict) and payload.get("version") == OUTPUT_INDEX_VERSION:
+                    return cls(
+                        entries={
+                            str(key): [str(file) for file in files]
+                            for key, files in dict(payload.get("entries") or {}).items()
+                        },
+                        orphans=[str(file) for file in payload.get("orphans") or []],
+                    )
+            if storage.exists(fallback_manifest):
+                manifest = json.loads(storage.read_text(fallback_manifest))
+                return cls.from_entries(
+                    entry for entry in manifest.get("entries") or [] if isinstance(entry, dict)
+                )
+        except (OSError, json.JSONDecodeError, ValueError, AttributeError, TypeError):
+            pass
+        return cls()
+
+    def files(self) -> Set[str]:
+        owned = {file for files in self.entries.values() for file in files}
+        owned.update(self.orphans)
+        return owned
+
+    def orphaned_by(self, current: "OutputIndex") -> List[str]:
+        """Files owned here that ``current`` no longer produces."""
+        return sorted(self.files() - current.files())
+
+    def dump(self) -> str:
+        payload = {
+            "version": OUTPUT_INDEX_VERSION,
+            "entries": dict(sorted(self.entries.items())),
+            "orphans": sorted(self.orphans),
+        }
+        return json.dumps(payload, indent=2) + "\n"
+
+
+def reconcile_outputs(
+    storage: Storage,
+    manifest_path: Path,
+    entries: List[Dict[str, object]],
+    prune: bool = False,
+) -> List[Path]:
+    """Record the outputs of ``entries`` and return owned files no entry produces any more.
+
+    Only files the previous index owned are candidates, so the output tree
+    is never walked. Inputs that failed this run keep their previous outputs.
+    Orphans are deleted when ``prune`` is set and otherwise kept in the index
+    so they are reported again.
+    """
+    index_path = manifest_path.parent / OUTPUT_INDEX_FILENAME
+    previous = OutputIndex.load(storage, index_path, manifest_path)
+    current = OutputIndex.from_entries(entries)
+    failed = {
+        str(entry.get("input"))
+        for entry in entries
+        if dict(entry.get("status") or {}).get("write") == "error"
+    }
+    for key, files in previous.entries.items():
+        if any(key == input_path or key.startswith(f"{input_path}#") for input_path in failed):
+            current.entries.setdefault(key, files)
+
+    orphaned = [Path(file) for file in previous.orphaned_by(current) if storage.exists(Path(file))]
+    if prune:
+        for path in orphaned:
+            storage.unlink(path)
+    else:
+        current.orphans = [str(path) for path in orphaned]
+    storage.replace_text(index_path, current.dump())
+    return orphaned
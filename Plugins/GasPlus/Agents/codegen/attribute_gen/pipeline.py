@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Callable, Iterable, List, TypeVar
+
+DEFAULT_IO_CONCURRENCY = 8
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def map_bounded(function: Callable[[T], R], items: Iterable[T], limit: int) -> List[R]:
+    """Run blocking ``function`` over ``items`` on worker threads.
+
+    At most ``limit`` calls are in flight at once, so slow file systems see a
+    bounded number of outstanding requests. Results come back in input order
+    regardless of completion order.
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def _run(item: T) -> R:
+        async with semaphore:
+            return await asyncio.to_thread(function, item)
+
+    return list(await asyncio.gather(*(_run(item) for item in items)))
+
+
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def map_ordered(function: Callable[[T], R], items: Iterable[T], limit: int) -> List[R]:
+    """Synchronous entry point for :func:`map_bounded`.
+
+    Runs serially when ``limit`` is 1, for a single item, or when called
+    from inside a running event loop (which cannot be nested).
+    """
+    pending = list(items)
+    if limit <= 1 or len(pending) <= 1 or _in_event_loop():
+        return [function(item) for item in pending]
+    return asyncio.run(map_bounded(function, pending, limit))
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import importlib
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Type, Union
+
+from .templates import Template
+
+# Reserved for the built-in attribute set generator.
+ATTRIBUTE_SET_GENERATOR = "attributeSet"
+
+_NAME_PATTERN = re.compile(r"^[A-Za-z][A-Za-z0-9_-]*$")
+_REGISTRY: Dict[str, Type["GeneratorPlugin"]] = {}
+
+
+@dataclass
+class PluginAsset:
+    """One DataAsset or catalog record claimed by a generator plugin."""
+
+    generator: str
+    name: str
+    data: Dict[str, object] = field(default_factory=dict)
+    source_path: Path = field(default_factory=Path)
+    discovery_order: Tuple[int, ...] = (0,)
+    record: Optional[int] = None
+    input_hash: Optional[str] = None
+
+    @property
+    def qualified_name(self) -> str:
+        return f"{self.generator}:{self.name}"
+
+    @property
+    def source_label(self) -> str:
+        if self.record is None:
+            return self.source_path.name
+        return f"{self.source_path.name}#{self.record}"
+
+
+class GeneratorPlugin(ABC):
+    """An additional output kind rendered from the generator's input roots.
+
+    Plugins only describe their schema and templates. Discovery, input
+    hashing, hash sidecars, preserve-region merging, the output cache and
+    the manifest are shared with the attribute set generator, so each
+    input file is walked and hashed once no matter how many plugins run.
+    """
+
+    name: str = ""
+    # Output label -> renderer entry points. They are fingerprinted the same
+    # way as TEMPLATE_RENDERERS, together with every helper and template they
+    # reach, so editing any of it only invalidates the outputs it produces.
+    templates: Dict[str, Tuple[Union[str, Template], ...]] = {}
+
+    @abstractmethod
+    def claims(self, data: Dict[str, object]) -> bool:
+        """Whether a parsed DataAsset (or catalog record) belongs to this plugin."""
+
+    def parse(self, data: Dict[str, object], source_path: Path) -> PluginAsset:
+        name = str(data.get("name") or data.get("Name") or source_path.stem)
+        return PluginAsset(
+            generator=self.name, name=name, data=dict(data), source_path=source_path.resolve()
+        )
+
+    @abstractmethod
+    def output_paths(self, asset: PluginAsset, output_root: Path) -> Dict[str, Path]:
+        """Where each output label of ``asset`` is written below ``output_root``."""
+
+    def projection(self, label: str, asset: PluginAsset) -> Dict[str, object]:
+        """The asset fields the ``label`` renderer reads; defaults to all of them."""
+        return {"name": asset.name, "data": asset.data}
+
+    @abstractmethod
+    def render(self, label: str, asset: PluginAsset) -> str:
+        """The full text of the ``label`` output, before preserve regions are merged."""
+
+
+def register_plugin(plugin_class: Type[GeneratorPlugin]) -> Type[GeneratorPlugin]:
+    """Class decorator making a plugin selectable by name via ``--plugin``."""
+    _validate_name(plugin_class.name)
+    existing = _REGISTRY.get(plugin_class.name)
+    if existing is not None and existing is not plugin_class:
+        raise ValueError(f"Generator plugin {plugin_class.name!r} is already registered")
+    _REGISTRY[plugin_class.name] = plugin_class
+    return plugin_class
+
+
+def registered_plugins() -> List[str]:
+    return sorted(_REGISTRY)
+
+
+def resolve_plugins(
+    specs: Sequence[Union[str, GeneratorPlugin]],
+) -> Dict[str, GeneratorPlugin]:
+    """Instantiate plugins from instances, registered names or ``module:Class`` specs."""
+    plugins: Dict[str, GeneratorPlugin] = {}
+    for spec in specs:
+        plugin = spec if isinstance(spec, GeneratorPlugin) else _load_plugin(spec)
+        _validate_name(plugin.name)
+        if plugin.name in plugins:
+            raise ValueError(f"Generator plugin {plugin.name!r} was selected twice")
+        if not plugin.templates:
+            raise ValueError(f"Generator plugin {plugin.name!r} declares no templates")
+        plugins[plugin.name] = plugin
+    return plugins
+
+
+def _load_plugin(spec: str) -> GeneratorPlugin:
+    if ":" not in spec:
+        if spec not in _REGISTRY:
+            known = ", ".join(registered_plugins()) or "none"
+            raise ValueError(f"Unknown generator plugin {spec!r} (registered: {known})")
+        return _REGISTRY[spec]()
+    module_name, _, attribute = spec.partition(":")
+    try:
+        plugin_class = getattr(importlib.import_module(module_name), attribute)
+    except (ImportError, AttributeError) as error:
+        raise ValueError(f"Unable to load generator plugin {spec!r}: {error}") from error
+    if not (isinstance(plugin_class, type) and issubclass(plugin_class, GeneratorPlugin)):
+        raise ValueError(f"{spec!r} is not a GeneratorPlugin subclass")
+    return plugin_class()
+
+
+def _validate_name(name: str) -> None:
+    if not _NAME_PATTERN.match(name or ""):
+        raise ValueError(f"Invalid generator plugin name {name!r}")
+    if name == ATTRIBUTE_SET_GENERATOR:
+        raise ValueError(f"Generator plugin name {name!r} is reserved")
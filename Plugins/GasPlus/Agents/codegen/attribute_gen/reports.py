@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+from .columnar import (
+    FLAG_CLAMP_MAX,
+    FLAG_CLAMP_MIN,
+    FLAG_GENERATE_HOOKS,
+    FLAG_REPLICATE,
+    AttributeColumns,
+)
+
+try:  # NumPy is optional; every report has a pure-Python fallback.
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is absent
+    np = None
+
+
+def replicated_per_set(columns: AttributeColumns) -> Dict[str, int]:
+    """Number of replicated attributes in each set, in catalog order."""
+    if np is not None:
+        set_ids = np.frombuffer(columns.set_ids, dtype=np.uint32)
+        replicated = (np.frombuffer(columns.flags, dtype=np.uint8) & FLAG_REPLICATE) != 0
+        counts = np.bincount(set_ids[replicated], minlength=len(columns.set_names))
+        return {name: int(count) for name, count in zip(columns.set_names, counts)}
+    totals = [0] * len(columns.set_names)
+    for set_id, flags in zip(columns.set_ids, columns.flags):
+        if flags & FLAG_REPLICATE:
+            totals[set_id] += 1
+    return dict(zip(columns.set_names, totals))
+
+
+def attributes_without_hooks(columns: AttributeColumns) -> List[Tuple[str, str]]:
+    """``(set, attribute)`` pairs whose GenerateHooks flag is off."""
+    if np is not None:
+        flags = np.frombuffer(columns.flags, dtype=np.uint8)
+        rows = np.flatnonzero((flags & FLAG_GENERATE_HOOKS) == 0).tolist()
+    else:
+        rows = [row for row, flags in enumerate(columns.flags) if not flags & FLAG_GENERATE_HOOKS]
+    return [(columns.set_names[columns.set_ids[row]], columns.names[row]) for row in rows]
+
+
+def meta_attribute_counts(columns: AttributeColumns) -> Dict[str, int]:
+    totals = [0] * len(columns.meta_names)
+    if np is not None:
+        meta_ids = np.frombuffer(columns.meta_ids, dtype=np.int32)
+        totals = np.bincount(meta_ids[meta_ids >= 0], minlength=len(columns.meta_names)).tolist()
+    else:
+        for meta_id in columns.meta_ids:
+            if meta_id >= 0:
+                totals[meta_id] += 1
+    return dict(zip(columns.meta_names, totals))
+
+
+def clamp_range_distribution(columns: AttributeColumns, bins: int = 10) -> Dict[str, object]:
+    """Histogram of ``ClampMax - ClampMin`` over attributes that declare both.
+
+    Bins are equal width; the last bin includes its upper edge.
+    """
+    both = FLAG_CLAMP_MIN | FLAG_CLAMP_MAX
+    if np is not None:
+        flags = np.frombuffer(columns.flags, dtype=np.uint8)
+        mask = (flags & both) == both
+        spans = (
+            np.frombuffer(columns.clamp_max, dtype=np.float64)[mask]
+            - np.frombuffer(columns.clamp_min, dtype=np.float64)[mask]
+        )
+        if not spans.size:
+            return {"count": 0, "min": None, "max": None, "mean": None, "edges": [], "counts": []}
+        counts, edges = np.histogram(spans, bins=bins)
+        return {
+            "count": int(spans.size),
+            "min": float(spans.min()),
+            "max": float(spans.max()),
+            "mean": float(spans.mean()),
+            "edges": edges.tolist(),
+            "counts": counts.tolist(),
+        }
+
+    spans_list = [
+        high - low
+        for flags, low, high in zip(columns.flags, columns.clamp_min, columns.clamp_max)
+        if flags & both == both
+    ]
+    if not spans_list:
+        return {"count": 0, "min": None, "max": None, "mean": None, "edges": [], "counts": []}
+    low, high = min(spans_list), max(spans_list)
+    if low == high:
+        # Match numpy.histogram, which widens a zero-width range by 0.5 each side.
+        low, high = low - 0.5, high + 0.5
+    width = (high - low) / bins
+    edges = [low + width * index for index in range(bins)] + [high]
+    counts = [0] * bins
+    for span in spans_list:
+        counts[min(int((span - low) / width), bins - 1)] += 1
+    return {
+        "count": len(spans_list),
+        "min": min(spans_list),
+        "max": max(spans_list),
+        "mean": sum(spans_list) / len(spans_list),
+        "edges": edges,
+        "counts": counts,
+    }
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .columnar import CATALOG_FILENAME, merge_columns, read_catalog, write_catalog
+from .index import AttributeIndex
+from .journal import ManifestJournal
+from .locking import FileLock, LockTimeoutError, atomic_write_text
+from .metrics import METRICS_JSON_FILENAME, METRICS_TEXT_FILENAME, RunMetrics
+from .output_index import OUTPUT_INDEX_FILENAME, entry_key, reconcile_outputs
+from .storage import DiskStorage
+
+_SHARD_SPEC_PATTERN = re.compile(r"^\s*(?P<index>\d+)\s*/\s*(?P<count>\d+)\s*$")
+
+
+def parse_shard_spec(spec: str) -> Tuple[int, int]:
+    """Parse a 1-based ``K/N`` shard spec into ``(K, N)``."""
+    match = _SHARD_SPEC_PATTERN.match(spec)
+    if not match:
+        raise ValueError(f"Shard spec must look like K/N, got {spec!r}")
+    index = int(match.group("index"))
+    count = int(match.group("count"))
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Shard index must satisfy 1 <= K <= N, got {spec!r}")
+    return index, count
+
+
+def shard_for(key: str, count: int) -> int:
+    """Return the 1-based shard owning ``key`` (a project-relative input key)."""
+    digest = hashlib.sha256(key.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count + 1
+
+
+def shard_output_path(path: Path, index: int, count: int) -> Path:
+    return path.with_name(f"{path.stem}.shard-{index}-of-{count}{path.suffix}")
+
+
+def discover_shard_manifests(manifest_path: Path) -> List[Path]:
+    pattern = f"{manifest_path.stem}.shard-*-of-*{manifest_path.suffix}"
+    return sorted(manifest_path.parent.glob(pattern))
+
+
+def _merge_cache_summaries(summaries: Sequence[Dict[str, object]]) -> Dict[str, object]:
+    merged_run: Dict[str, int] = {}
+    merged_lifetime: Dict[str, int] = {}
+    for summary in summaries:
+        for key, value in dict(summary.get("run") or {}).items():
+            merged_run[key] = merged_run.get(key, 0) + int(value)
+        for key, value in dict(summary.get("lifetime") or {}).items():
+            merged_lifetime[key] = max(merged_lifetime.get(key, 0), int(value))
+    first = summaries[0]
+    return {
+        "root": first.get("root"),
+        "maxBytes": first.get("maxBytes"),
+        "run": merged_run,
+        "lifetime": merged_lifetime,
+    }
+
+
+def _merge_validation(summaries: Sequence[Dict[str, object]]) -> Dict[str, object]:
+    # Every shard validates the whole project, so each one reports the same
+    # issues; keep one copy of each.
+    issues: Dict[str, Dict[str, object]] = {}
+    for summary in summaries:
+        for issue in summary.get("issues") or []:
+            issues.setdefault(json.dumps(issue, sort_keys=True), issue)
+    severities = [issue.get("severity") for issue in issues.values()]
+    return {
+        "errors": severities.count("error"),
+        "warnings": severities.count("warning"),
+        "issues": list(issues.values()),
+    }
+
+
+def merge_shard_manifests(
+    partials: Sequence[Dict[str, object]]
+) -> Tuple[Dict[str, object], List[str]]:
+    """Combine partial shard manifests into the manifest a single-node run writes.
+
+    Returns the merged manifest and the merged log lines, both in discovery
+    order.
+    """
+    if not partials:
+        raise ValueError("No shard manifests to merge.")
+
+    counts = {int(partial["shard"]["count"]) for partial in partials}
+    if len(counts) != 1:
+        raise ValueError(f"Shard manifests disagree on shard count: {sorted(counts)}")
+    count = counts.pop()
+    indices = sorted(int(partial["shard"]["index"]) for partial in partials)
+    if indices != list(range(1, count + 1)):
+        raise ValueError(f"Expected shards 1..{count}, found {indices}")
+
+    reference = partials[0]
+    for key in ("generatorVersion", "templateVersion", "templateFingerprints", "flags"):
+        for partial in partials[1:]:
+            if partial.get(key) != reference.get(key):
+                raise ValueError(f"Shard manifests disagree on {key!r}")
+
+    ordered: List[Tuple[Tuple[int, ...], Dict[str, object], Optional[str]]] = []
+    for partial in partials:
+        shard = partial["shard"]
+        entries = list(partial.get("entries") or [])
+        order = [tuple(item) for item in shard.get("order") or []]
+        log_lines = list(shard.get("logLines") or [])
+        if len(order) != len(entries):
+            raise ValueError(
+                f"Shard {shard['index']}/{count} manifest is missing discovery order data"
+            )
+        for position, (key, entry) in enumerate(zip(order, entries)):
+            log_line = log_lines[position] if position < len(log_lines) else None
+            ordered.append((key, entry, log_line))
+    ordered.sort(key=lambda item: item[0])
+
+    manifest: Dict[str, object] = {
+        "generatorVersion": reference.get("generatorVersion"),
+        "templateVersion": reference.get("templateVersion"),
+        "templateFingerprints": reference.get("templateFingerprints"),
+        "elapsedSeconds": max(float(partial.get("elapsedSeconds") or 0.0) for partial in partials),
+        "flags": reference.get("flags"),
+        "entries": [entry for _, entry, _ in ordered],
+    }
+    validation_summaries = [partial["validation"] for partial in partials if partial.get("validation")]
+    if validation_summaries:
+        manifest["validation"] = _merge_validation(validation_summaries)
+    index_summaries = [partial["index"] for partial in partials if partial.get("index")]
+    if index_summaries:
+        manifest["index"] = {"path": index_summaries[0].get("path")}
+        for key in ("inserted", "updated", "unchanged", "removed"):
+            manifest["index"][key] = sum(int(summary.get(key) or 0) for summary in index_summaries)
+    cache_summaries = [partial["cache"] for partial in partials if partial.get("cache")]
+    if cache_summaries:
+        manifest["cache"] = _merge_cache_summaries(cache_summaries)
+    return manifest, [line for _, _, line in ordered if line]
+
+
+def _merge_shard_catalogs(
+    manifest_path: Path, partials: Sequence[Dict[str, object]]
+) -> Optional[Dict[str, object]]:
+    catalog_summaries = [partial.get("catalog") for partial in partials]
+    if not all(catalog_summaries):
+        return None
+    parts = [
+        read_catalog(manifest_path.parent / str(summary["path"])) for summary in catalog_summaries
+    ]
+    orders = [
+        [tuple(key) for key in partial["shard"].get("order") or []] for partial in partials
+    ]
+    columns = merge_columns(parts, orders)
+    write_catalog(manifest_path.parent / CATALOG_FILENAME, columns)
+    return {"path": CATALOG_FILENAME, "sets": len(columns.set_names), "attributes": len(columns)}
+
+
+def _merge_shard_metrics(manifest_path: Path, partials: Sequence[Dict[str, object]]) -> None:
+    parts = []
+    for partial in partials:
+        shard = partial["shard"]
+        path = shard_output_path(
+            manifest_path.parent / METRICS_JSON_FILENAME, int(shard["index"]), int(shard["count"])
+        )
+        if not path.exists():
+            return
+        parts.append(RunMetrics.from_json(path.read_text()))
+    merged = RunMetrics.merged(parts)
+    atomic_write_text(manifest_path.parent / METRICS_TEXT_FILENAME, merged.to_openmetrics())
+    atomic_write_text(manifest_path.parent / METRICS_JSON_FILENAME, merged.to_json())
+
+
+def _previous_manifest(manifest_path: Path) -> Optional[Dict[str, object]]:
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except (OSError, ValueError):
+        return None
+    return manifest if isinstance(manifest, dict) else None
+
+
+def merge_manifests_main(args: Optional[Sequence[str]], default_manifest: str, default_log: str) -> None:
+    parser = argparse.ArgumentParser(
+        prog="attribute_gen merge-manifests",
+        description="Merge per-shard partial manifests into a single manifest and log.",
+    )
+    parser.add_argument(
+        "partials",
+        nargs="*",
+        help="Partial shard manifests (defaults to <manifest>.shard-*-of-*.json).",
+    )
+    parser.add_argument("--manifest", dest="manifest", default=default_manifest)
+    parser.add_argument("--log", dest="log_path", default=default_log)
+    parser.add_argument(
+        "--keep-partials",
+        action="store_true",
+        help="Leave the partial shard manifests and logs in place after merging.",
+    )
+    parser.add_argument(
+        "--prune",
+        action="store_true",
+        help="Delete outputs and hash sidecars whose input was removed or renamed.",
+    )
+    parser.add_argument(
+        "--lock-timeout",
+        dest="lock_timeout",
+        type=float,
+        default=None,
+        help="Seconds to wait for a concurrent run to finish before giving up (default: wait).",
+    )
+    parsed = parser.parse_args(args=args)
+
+    # Same lock as a single-node run on this manifest, so a merge never
+    # interleaves its writes with a run's.
+    manifest_path = Path(parsed.manifest)
+    try:
+        with FileLock(manifest_path.with_name(f".{manifest_path.stem}.lock"), parsed.lock_timeout):
+            _merge_manifests(parser, parsed)
+    except LockTimeoutError as error:
+        parser.error(str(error))
+
+
+def _merge_manifests(parser: argparse.ArgumentParser, parsed: argparse.Namespace) -> None:
+    manifest_path = Path(parsed.manifest)
+    log_path = Path(parsed.log_path)
+    partial_paths = (
+        [Path(path) for path in parsed.partials]
+        if parsed.partials
+        else discover_shard_manifests(manifest_path)
+    )
+    try:
+        partials = [json.loads(path.read_text()) for path in partial_paths]
+        manifest, log_lines = merge_shard_manifests(partials)
+        catalog_summary = _merge_shard_catalogs(manifest_path, partials)
+        _merge_shard_metrics(manifest_path, partials)
+    except (OSError, ValueError, KeyError, TypeError) as error:
+        parser.error(str(error))
+
+    orphaned: List[Path] = []
+    if dict(manifest.get("validation") or {}).get("errors"):
+        # The shards skipped generation; keep the last good entries, log and
+        # journal so the next merge stays incremental.
+        validation = manifest["validation"]
+        manifest = _previous_manifest(manifest_path) or manifest
+        manifest["validation"] = validation
+        atomic_write_text(manifest_path, json.dumps(manifest, indent=2) + "\n")
+    else:
+        if catalog_summary is not None:
+            manifest["catalog"] = catalog_summary
+        orphaned = reconcile_outputs(DiskStorage(), manifest_path, manifest["entries"], parsed.prune)
+        manifest["orphans"] = {
+            "path": OUTPUT_INDEX_FILENAME,
+            "files": [str(path) for path in orphaned],
+            "pruned": parsed.prune,
+        }
+        if parsed.prune:
+            log_lines.extend(f"PRUNED {path}" for path in orphaned)
+        if manifest.get("index"):
+            # Shards cannot tell which sets lost their input; drop them here.
+            with AttributeIndex(manifest_path.parent / str(manifest["index"]["path"])) as index:
+                manifest["index"]["removed"] += index.retain(
+                    entry_key(entry) for entry in manifest["entries"]
+                )
+        journal = ManifestJournal.for_manifest(manifest_path)
+        manifest["journal"] = {"path": journal.path.name, "run": journal.next_run}
+        atomic_write_text(manifest_path, json.dumps(manifest, indent=2) + "\n")
+        journal.append(manifest)
+        atomic_write_text(log_path, "".join(f"{line}\n" for line in log_lines))
+
+    if not parsed.keep_partials:
+        for path, partial in zip(partial_paths, partials):
+            shard = partial["shard"]
+            path.unlink(missing_ok=True)
+            if partial.get("catalog"):
+                (manifest_path.parent / str(partial["catalog"]["path"])).unlink(missing_ok=True)
+            shard_output_path(log_path, int(shard["index"]), int(shard["count"])).unlink(
+                missing_ok=True
+            )
+            for filename in (METRICS_TEXT_FILENAME, METRICS_JSON_FILENAME):
+                shard_output_path(
+                    manifest_path.parent / filename, int(shard["index"]), int(shard["count"])
+                ).unlink(missing_ok=True)
+
+    for path in orphaned:
+        if parsed.prune:
+            print(f"[PRUNED] {path}")
+        else:
+            print(f"[ORPHAN] {path} (no input left; run with --prune to delete)")
+    print(
+        f"Merged {len(partials)} shard manifests ({len(manifest['entries'])} entries) into {manifest_path}."
+    )
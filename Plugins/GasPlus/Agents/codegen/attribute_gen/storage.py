@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import io
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, Set
+
+from .hashing import DEFAULT_ALGORITHM, hash_file, new_digest
+from .locking import atomic_write_bytes, atomic_write_text
+
+
+class Storage(ABC):
+    """File operations the generator performs on inputs, outputs and hash state.
+
+    ``persistent`` is false for backends whose writes vanish with the
+    process; disk-only side artifacts (SQLite index, checkpoints, run lock)
+    are skipped for those.
+    """
+
+    persistent = True
+
+    @abstractmethod
+    def read_bytes(self, path: Path) -> bytes:
+        """The contents of ``path``; raises ``FileNotFoundError`` if it is missing."""
+
+    def read_text(self, path: Path) -> str:
+        return self.read_bytes(path).decode("utf-8")
+
+    @abstractmethod
+    def write_bytes(self, path: Path, data: bytes) -> None:
+        """Create or overwrite ``path``, creating missing parent directories."""
+
+    def write_text(self, path: Path, text: str) -> None:
+        self.write_bytes(path, text.encode("utf-8"))
+
+    def replace_text(self, path: Path, text: str) -> None:
+        """Write ``text`` so concurrent readers see either the old or new file."""
+        self.write_text(path, text)
+
+    @abstractmethod
+    def exists(self, path: Path) -> bool:
+        """Whether ``path`` is a file or directory."""
+
+    def size(self, path: Path) -> int:
+        return len(self.read_bytes(path))
+
+    @abstractmethod
+    def iter_files(self, root: Path) -> Iterator[Path]:
+        """Every file below ``root``, recursively."""
+
+    @abstractmethod
+    def mkdir(self, path: Path) -> None:
+        """Create ``path`` and its parents; existing directories are fine."""
+
+    @abstractmethod
+    def unlink(self, path: Path) -> None:
+        """Delete ``path``; a missing file is not an error."""
+
+    def open_binary(self, path: Path) -> BinaryIO:
+        return io.BytesIO(self.read_bytes(path))
+
+    def hash_file(self, path: Path, algorithm: str = DEFAULT_ALGORITHM) -> str:
+        digest = new_digest(algorithm)
+        digest.update(self.read_bytes(path))
+        return digest.hexdigest()
+
+
+class DiskStorage(Storage):
+    def read_bytes(self, path: Path) -> bytes:
+        return Path(path).read_bytes()
+
+    def read_text(self, path: Path) -> str:
+        return Path(path).read_text()
+
+    def write_bytes(self, path: Path, data: bytes) -> None:
+        atomic_write_bytes(Path(path), data)
+
+    def write_text(self, path: Path, text: str) -> None:
+        atomic_write_text(Path(path), text)
+
+    def exists(self, path: Path) -> bool:
+        return Path(path).exists()
+
+    def size(self, path: Path) -> int:
+        return Path(path).stat().st_size
+
+    def iter_files(self, root: Path) -> Iterator[Path]:
+        root = Path(root)
+        if not root.exists():
+            return iter(())
+        return (path for path in root.rglob("*") if path.is_file())
+
+    def mkdir(self, path: Path) -> None:
+        Path(path).mkdir(parents=True, exist_ok=True)
+
+    def unlink(self, path: Path) -> None:
+        Path(path).unlink(missing_ok=True)
+
+    def open_binary(self, path: Path) -> BinaryIO:
+        return Path(path).open("rb")
+
+    def hash_file(self, path: Path, algorithm: str = DEFAULT_ALGORITHM) -> str:
+        return hash_file(Path(path), algorithm)
+
+
+def _key(path: Path) -> Path:
+    return Path(path).resolve()
+
+
+class MemoryStorage(Storage):
+    """Keeps every file in a dict; nothing touches the disk."""
+
+    persistent = False
+
+    def __init__(self, files: Optional[Dict[Path, str]] = None):
+        self._files: Dict[Path, bytes] = {}
+        self._directories: Set[Path] = set()
+        self._lock = threading.Lock()
+        for path, text in (files or {}).items():
+            self.write_text(path, text)
+
+    @property
+    def files(self) -> Dict[Path, bytes]:
+        with self._lock:
+            return dict(sorted(self._files.items()))
+
+    def read_bytes(self, path: Path) -> bytes:
+        try:
+            with self._lock:
+                return self._files[_key(path)]
+        except KeyError:
+            raise FileNotFoundError(str(path)) from None
+
+    def write_bytes(self, path: Path, data: bytes) -> None:
+        key = _key(path)
+        with self._lock:
+            self._directories.update(key.parents)
+            self._files[key] = bytes(data)
+
+    def exists(self, path: Path) -> bool:
+        key = _key(path)
+        with self._lock:
+            return key in self._files or key in self._directories
+
+    def iter_files(self, root: Path) -> Iterator[Path]:
+        root = _key(root)
+        with self._lock:
+            matches = [path for path in self._files if path.is_relative_to(root)]
+        return iter(sorted(matches))
+
+    def mkdir(self, path: Path) -> None:
+        key = _key(path)
+        with self._lock:
+            self._directories.add(key)
+            self._directories.update(key.parents)
+
+    def unlink(self, path: Path) -> None:
+        with self._lock:
+            self._files.pop(_key(path), None)
+
+
+class OverlayStorage(Storage):
+    """Reads fall through to ``base``; writes and deletions stay in memory.
+
+    Dry runs use this so every code path runs unchanged while the disk is
+    left untouched; ``changes`` lists what a real run would have written.
+    """
+
+    persistent = False
+
+    def __init__(self, base: Storage):
+        self.base = base
+        self.upper = MemoryStorage()
+        self._deleted: Set[Path] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def changes(self) -> Dict[Path, bytes]:
+        return self.upper.files
+
+    def _visible_in_base(self, path: Path) -> bool:
+        with self._lock:
+            return _key(path) not in self._deleted
+
+    def read_bytes(self, path: Path) -> bytes:
+        if self.upper.exists(path) or not self._visible_in_base(path):
+            return self.upper.read_bytes(path)
+        return self.base.read_bytes(path)
+
+    def read_text(self, path: Path) -> str:
+        if self.upper.exists(path) or not self._visible_in_base(path):
+            return self.upper.read_text(path)
+        return self.base.read_text(path)
+
+    def write_bytes(self, path: Path, data: bytes) -> None:
+        with self._lock:
+            self._deleted.discard(_key(path))
+        self.upper.write_bytes(path, data)
+
+    def exists(self, path: Path) -> bool:
+        if self.upper.exists(path):
+            return True
+        return self._visible_in_base(path) and self.base.exists(path)
+
+    def iter_files(self, root: Path) -> Iterator[Path]:
+        seen: List[Path] = [path for path in self.base.iter_files(root) if self._visible_in_base(path)]
+        known = {_key(path) for path in seen}
+        seen.extend(path for path in self.upper.iter_files(root) if path not in known)
+        return iter(seen)
+
+    def mkdir(self, path: Path) -> None:
+        self.upper.mkdir(path)
+
+    def unlink(self, path: Path) -> None:
+        self.upper.unlink(path)
+        with self._lock:
+            self._deleted.add(_key(path))
+
+    def open_binary(self, path: Path) -> BinaryIO:
+        if self.upper.exists(path) or not self._visible_in_base(path):
+            return self.upper.open_binary(path)
+        return self.base.open_binary(path)
+
+    def size(self, path: Path) -> int:
+        if self.upper.exists(path) or not self._visible_in_base(path):
+            return self.upper.size(path)
+        return self.base.size(path)
+
+    def hash_file(self, path: Path, algorithm: str = DEFAULT_ALGORITHM) -> str:
+        if self.upper.exists(path) or not self._visible_in_base(path):
+            return self.upper.hash_file(path, algorithm)
+        return self.base.hash_file(path, algorithm)
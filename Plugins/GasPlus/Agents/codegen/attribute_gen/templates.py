@@ -0,0 +1,759 @@
+from __future__ import annotations
+
+import keyword
+import re
+from typing import Callable, Dict, FrozenSet, List, Sequence, Tuple, Union
+
+_SLOT_PATTERN = re.compile(r"\{\{([A-Za-z_][A-Za-z0-9_]*)\}\}")
+
+
+class Template:
+    """Template text compiled once into static chunks and named ``{{Slot}}`` holes.
+
+    At construction the chunk/slot sequence is turned into a function whose
+    body is a single f-string concatenation, so a render is one string build
+    with no parsing, dedenting or per-slot lookups. Every slot must be
+    passed by keyword.
+    """
+
+    __slots__ = ("name", "source", "chunks", "slots", "render")
+
+    def __init__(self, source: str, name: str = "<template>"):
+        self.name = name
+        self.source = source
+        # Alternating static text and slot names; slots are wrapped in a
+        # one-element tuple so empty static chunks stay unambiguous.
+        chunks: List[Union[str, Tuple[str]]] = []
+        position = 0
+        for match in _SLOT_PATTERN.finditer(source):
+            if match.start() > position:
+                chunks.append(source[position : match.start()])
+            chunks.append((match.group(1),))
+            position = match.end()
+        if position < len(source):
+            chunks.append(source[position:])
+        self.chunks: Tuple[Union[str, Tuple[str]], ...] = tuple(chunks)
+        self.slots: FrozenSet[str] = frozenset(
+            chunk[0] for chunk in chunks if isinstance(chunk, tuple)
+        )
+        self.render: Callable[..., str] = _compile(self.chunks, self.slots, name)
+
+    def __repr__(self) -> str:
+        return f"Template({self.name!r})"
+
+
+def _compile(
+    chunks: Sequence[Union[str, Tuple[str]]], slots: FrozenSet[str], name: str
+) -> Callable[..., str]:
+    pieces = []
+    for chunk in chunks:
+        if isinstance(chunk, tuple):
+            pieces.append("f'{%s}'" % chunk[0])
+        else:
+            pieces.append("f" + repr(chunk.replace("{", "{{").replace("}", "}}")))
+    reserved = sorted(slot for slot in slots if keyword.iskeyword(slot))
+    if reserved:
+        raise ValueError(f"Template {name} uses Python keywords as slot names: {reserved}")
+    parameters = f"*, {', '.join(sorted(slots))}" if slots else ""
+    code = f"def render({parameters}):\n    return {' '.join(pieces) or repr('')}\n"
+    namespace: Dict[str, object] = {}
+    exec(compile(code, f"<template {name}>", "exec"), namespace)
+    return namespace["render"]  # type: ignore[return-value]
+
+
+# Attribute set header -------------------------------------------------------
+
+ATTRIBUTE_SET_HEADER = Template(
+    """\
+#pragma once
+
+{{Includes}}
+// <Codex::Preserve Begin: HeaderIncludes>
+// <Codex::Preserve End: HeaderIncludes>
+
+#include "{{Name}}AttributeSet.generated.h"
+
+{{ForwardDeclarations}}// Base and current values of every {{ClassName}} attribute, indexed
+// like {{ClassName}}::SnapshotFields.
+struct F{{FileBasename}}Snapshot
+{
+    static constexpr int32 NumAttributes = {{NumAttributes}};
+
+    float BaseValues[NumAttributes];
+    float CurrentValues[NumAttributes];
+};
+
+// Static description of one {{ClassName}} attribute; see
+// {{ClassName}}::AttributeInfos.
+struct F{{FileBasename}}AttributeInfo
+{
+    const TCHAR* Name;
+    int32 Index;
+    float ClampMin;
+    float ClampMax;
+    bool bHasClampMin;
+    bool bHasClampMax;
+    bool bReplicated;
+    bool bRepNotify;
+};
+
+UCLASS()
+class {{ModuleApi}} {{ClassName}} : public UAttributeSet
+{
+    GENERATED_BODY()
+
+public:
+    {{ClassName}}();
+
+    virtual void GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const override;
+    virtual void PreAttributeChange(const FGameplayAttribute& Attribute, float& NewValue) override;
+    virtual void PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue) override;
+
+    using FSnapshot = F{{FileBasename}}Snapshot;
+    static constexpr int32 SnapshotFieldCount = FSnapshot::NumAttributes;
+    static const TCHAR* const SnapshotFieldNames[SnapshotFieldCount];
+    static FGameplayAttributeData {{ClassName}}::* const SnapshotFields[SnapshotFieldCount];
+
+    void CaptureSnapshot(FSnapshot& OutSnapshot) const;
+    void RestoreSnapshot(const FSnapshot& Snapshot);
+
+    using FAttributeInfo = F{{FileBasename}}AttributeInfo;
+    static constexpr int32 AttributeCount = {{NumAttributes}};
+    static const FAttributeInfo AttributeInfos[AttributeCount];
+
+    // Reflection-free lookups by name, case-insensitive like FName. Unknown
+    // names return INDEX_NONE or an invalid FGameplayAttribute.
+    static int32 FindAttributeIndex(const TCHAR* Name);
+    static FGameplayAttribute FindAttribute(const TCHAR* Name);
+    static const FGameplayAttribute& GetAttributeByIndex(int32 Index);
+
+private:
+    static const uint32 AttributeNameMask;
+    static const uint32 AttributeNameSeeds[];
+    static const int32 AttributeNameSlots[];
+
+    static uint32 HashAttributeName(const TCHAR* Name);
+    static uint32 AttributeNameSlot(uint32 Hash, uint32 Seed);
+
+public:
+    // GASPLUS-PRESERVE BEGIN {{ClassName}}.PublicMembers
+    // Add additional member declarations here.
+    // GASPLUS-PRESERVE END {{ClassName}}.PublicMembers{{Members}}
+};
+""",
+    "AttributeSet.h",
+)
+
+ATTRIBUTE_PROPERTY = Template(
+    """\
+    // Attribute: {{Name}}
+    // Metadata: {{Metadata}}{{Comment}}
+    UPROPERTY({{Specifiers}})
+    FGameplayAttributeData {{Name}};
+    ATTRIBUTE_ACCESSORS({{ClassName}}, {{Name}});""",
+    "AttributeSet.h:property",
+)
+
+ONREP_DECLARATION = Template(
+    """\
+    UFUNCTION()
+    void OnRep_{{Name}}(const FGameplayAttributeData& OldValue);""",
+    "AttributeSet.h:onrep",
+)
+
+# Attribute set source -------------------------------------------------------
+
+ATTRIBUTE_SET_SOURCE = Template(
+    """\
+{{Includes}}
+{{Instrumentation}}
+{{ClassName}}::{{ClassName}}() = default;
+// GASPLUS-PRESERVE BEGIN {{ClassName}}.Constructor
+// Customize constructor defaults here.
+// GASPLUS-PRESERVE END {{ClassName}}.Constructor
+
+void {{ClassName}}::GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const
+{
+    Super::GetLifetimeReplicatedProps(OutLifetimeProps);{{Replication}}
+}
+
+void {{ClassName}}::PreAttributeChange(const FGameplayAttribute& Attribute, float& NewValue)
+{
+{{PreScope}}    Super::PreAttributeChange(Attribute, NewValue);
+    // GASPLUS-PRESERVE BEGIN {{ClassName}}.PreAttributeChange
+    // Customize pre-attribute change logic here.
+    // GASPLUS-PRESERVE END {{ClassName}}.PreAttributeChange{{PreBlocks}}
+    // <Codex::Preserve Begin: PreAttributeChange_Custom>
+    // <Codex::Preserve End: PreAttributeChange_Custom>
+}
+
+void {{ClassName}}::PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue)
+{
+{{PostScope}}    Super::PostAttributeChange(Attribute, OldValue, NewValue);
+    UE_UNUSED(OldValue);
+    UE_UNUSED(NewValue);
+    // GASPLUS-PRESERVE BEGIN {{ClassName}}.PostAttributeChange
+    // Customize post-attribute change logic here.
+    // GASPLUS-PRESERVE END {{ClassName}}.PostAttributeChange{{PostBlocks}}
+    // <Codex::Preserve Begin: PostAttributeChange_Custom>
+    // <Codex::Preserve End: PostAttributeChange_Custom>
+}
+
+{{Snapshot}}
+
+{{Lookup}}
+
+{{OnRep}}// GASPLUS-PRESERVE BEGIN {{ClassName}}.AdditionalMethods
+// Add additional method definitions here.
+// GASPLUS-PRESERVE END {{ClassName}}.AdditionalMethods
+""",
+    "AttributeSet.cpp",
+)
+
+PRE_ATTRIBUTE_CHANGE_BLOCK = Template(
+    """\
+    if (Attribute == Get{{Name}}Attribute())
+    {
+{{Scope}}        // Metadata: {{Metadata}}
+{{Clamp}}        // TODO: Add pre-clamp logic for {{Name}} if additional validation is required.
+    }""",
+    "AttributeSet.cpp:pre",
+)
+
+CLAMP_LINES = Template(
+    """\
+        const float ClampedValue = FMath::Clamp(NewValue, {{Min}}, {{Max}});
+        NewValue = ClampedValue;
+""",
+    "AttributeSet.cpp:clamp",
+)
+
+POST_ATTRIBUTE_CHANGE_BLOCK = Template(
+    """\
+    if (Attribute == Get{{Name}}Attribute())
+    {
+{{Scope}}        // Metadata: {{Metadata}}
+        // TODO: Add post-clamp logic for {{Name}} (OldValue={OldValue}, NewValue={NewValue}).
+    }""",
+    "AttributeSet.cpp:post",
+)
+
+ONREP_DEFINITION = Template(
+    """\
+void {{ClassName}}::OnRep_{{Name}}(const FGameplayAttributeData& OldValue)
+{
+{{Scope}}    GAMEPLAYATTRIBUTE_REPNOTIFY({{ClassName}}, {{Name}}, OldValue);
+    // <Codex::Preserve Begin: OnRep_{{Name}}>
+    // <Codex::Preserve End: OnRep_{{Name}}>
+}""",
+    "AttributeSet.cpp:onrep",
+)
+
+SNAPSHOT_DEFINITIONS = Template(
+    """\
+const TCHAR* const {{ClassName}}::SnapshotFieldNames[{{ClassName}}::SnapshotFieldCount] = {
+{{FieldNames}}};
+
+FGameplayAttributeData {{ClassName}}::* const {{ClassName}}::SnapshotFields[{{ClassName}}::SnapshotFieldCount] = {
+{{FieldPointers}}};
+
+void {{ClassName}}::CaptureSnapshot(FSnapshot& OutSnapshot) const
+{
+{{Capture}}}
+
+void {{ClassName}}::RestoreSnapshot(const FSnapshot& Snapshot)
+{
+{{Restore}}}""",
+    "AttributeSet.cpp:snapshot",
+)
+
+SNAPSHOT_FIELD_NAME = Template('    TEXT("{{Name}}"),\n', "AttributeSet.cpp:snapshot-name")
+SNAPSHOT_FIELD_POINTER = Template("    &{{ClassName}}::{{Name}},\n", "AttributeSet.cpp:snapshot-field")
+SNAPSHOT_CAPTURE = Template(
+    """\
+    OutSnapshot.BaseValues[{{Index}}] = {{Name}}.GetBaseValue();
+    OutSnapshot.CurrentValues[{{Index}}] = {{Name}}.GetCurrentValue();
+""",
+    "AttributeSet.cpp:snapshot-capture",
+)
+SNAPSHOT_RESTORE = Template(
+    """\
+    {{Name}}.SetBaseValue(Snapshot.BaseValues[{{Index}}]);
+    {{Name}}.SetCurrentValue(Snapshot.CurrentValues[{{Index}}]);
+""",
+    "AttributeSet.cpp:snapshot-restore",
+)
+
+LOOKUP_DEFINITIONS = Template(
+    """\
+const {{ClassName}}::FAttributeInfo {{ClassName}}::AttributeInfos[{{ClassName}}::AttributeCount] = {
+{{Infos}}};
+
+// Perfect hash of the lowercased names: a name's hash selects its seed, and
+// the hash mixed with that seed selects the slot holding its index.
+const uint32 {{ClassName}}::AttributeNameMask = {{Mask}}u;
+
+const uint32 {{ClassName}}::AttributeNameSeeds[] = {
+{{Seeds}}};
+
+const int32 {{ClassName}}::AttributeNameSlots[] = {
+{{Slots}}};
+
+uint32 {{ClassName}}::HashAttributeName(const TCHAR* Name)
+{
+    uint32 Hash = 0x811C9DC5u;
+    for (; *Name; ++Name)
+    {
+        const uint32 Char = static_cast<uint32>(*Name);
+        Hash = (Hash ^ (Char >= 'A' && Char <= 'Z' ? Char + 32u : Char)) * 0x01000193u;
+    }
+    return Hash;
+}
+
+uint32 {{ClassName}}::AttributeNameSlot(uint32 Hash, uint32 Seed)
+{
+    uint32 Value = Hash ^ Seed;
+    Value = (Value ^ (Value >> 16)) * 0x85EBCA6Bu;
+    Value = (Value ^ (Value >> 13)) * 0xC2B2AE35u;
+    return (Value ^ (Value >> 16)) & AttributeNameMask;
+}
+
+int32 {{ClassName}}::FindAttributeIndex(const TCHAR* Name)
+{
+    if (Name == nullptr)
+    {
+        return INDEX_NONE;
+    }
+    const uint32 Hash = HashAttributeName(Name);
+    const int32 Index = AttributeNameSlots[AttributeNameSlot(Hash, AttributeNameSeeds[Hash & AttributeNameMask])];
+    if (Index == INDEX_NONE || FCString::Stricmp(Name, AttributeInfos[Index].Name) != 0)
+    {
+        return INDEX_NONE;
+    }
+    return Index;
+}
+
+FGameplayAttribute {{ClassName}}::FindAttribute(const TCHAR* Name)
+{
+    const int32 Index = FindAttributeIndex(Name);
+    return Index == INDEX_NONE ? FGameplayAttribute() : GetAttributeByIndex(Index);
+}
+
+const FGameplayAttribute& {{ClassName}}::GetAttributeByIndex(int32 Index)
+{
+    // Resolved through reflection once, on first use.
+    struct FAttributeCache
+    {
+        FGameplayAttribute Attributes[AttributeCount];
+
+        FAttributeCache()
+        {
+            for (int32 Each = 0; Each < AttributeCount; ++Each)
+            {
+                Attributes[Each] = FGameplayAttribute(
+                    FindFieldChecked<FProperty>({{ClassName}}::StaticClass(), FName(AttributeInfos[Each].Name)));
+            }
+        }
+    };
+    static const FAttributeCache Cache;
+    check(Index >= 0 && Index < AttributeCount);
+    return Cache.Attributes[Index];
+}""",
+    "AttributeSet.cpp:lookup",
+)
+
+LOOKUP_INFO = Template(
+    '    {TEXT("{{Name}}"), {{Index}}, {{ClampMin}}, {{ClampMax}}, {{HasClampMin}}, {{HasClampMax}}, {{Replicated}}, {{RepNotify}}},\n',
+    "AttributeSet.cpp:lookup-info",
+)
+
+INSTRUMENTATION_SCOPE = Template(
+    """\
+{{Indent}}GASPLUS_ATTRIBUTE_SCOPE({{Scope}});
+{{Indent}}GASPLUS_ATTRIBUTE_COUNT(STAT_GasPlus_{{Scope}});
+""",
+    "AttributeSet.cpp:scope",
+)
+
+INSTRUMENTATION = Template(
+    """\
+// Unreal Insights trace scopes and stat counters. Define
+// GASPLUS_ATTRIBUTE_INSTRUMENTATION=0 to compile them out.
+#ifndef GASPLUS_ATTRIBUTE_INSTRUMENTATION
+#define GASPLUS_ATTRIBUTE_INSTRUMENTATION !UE_BUILD_SHIPPING
+#endif
+
+#if GASPLUS_ATTRIBUTE_INSTRUMENTATION
+#include "ProfilingDebugging/CpuProfilerTrace.h"
+#include "Stats/Stats.h"
+
+DECLARE_STATS_GROUP(TEXT("GasPlus {{ClassName}}"), {{Group}}, STATCAT_Advanced);
+{{Declarations}}
+#define GASPLUS_ATTRIBUTE_SCOPE(Name) TRACE_CPUPROFILER_EVENT_SCOPE(Name)
+#define GASPLUS_ATTRIBUTE_COUNT(Stat) INC_DWORD_STAT(Stat)
+#else
+#define GASPLUS_ATTRIBUTE_SCOPE(Name)
+#define GASPLUS_ATTRIBUTE_COUNT(Stat)
+#endif
+""",
+    "AttributeSet.cpp:instrumentation",
+)
+
+COUNTER_STAT = Template(
+    'DECLARE_DWORD_COUNTER_STAT(TEXT("{{Label}}"), STAT_GasPlus_{{Scope}}, {{Group}});\n',
+    "AttributeSet.cpp:stat",
+)
+
+# Generated header stub ------------------------------------------------------
+
+GENERATED_HEADER = Template(
+    """\
+#pragma once
+
+// Stub generated header for {{ClassName}}. In Unreal builds this file will be replaced by UHT.
+""",
+    "AttributeSet.generated.h",
+)
+
+# Meta attribute registry ----------------------------------------------------
+
+META_REGISTRY_HEADER = Template(
+    """\
+#pragma once
+
+#include "CoreMinimal.h"
+
+#if __has_include("UObject/NameTypes.h")
+#include "UObject/NameTypes.h"
+#include "Containers/UnrealString.h"
+#endif
+
+#if __has_include("Containers/Map.h")
+#include "Containers/Map.h"
+#endif
+
+#if !__has_include("UObject/NameTypes.h")
+#include <string>
+#endif
+
+#if !__has_include("Containers/Map.h")
+#include <map>
+#include <stdexcept>
+#endif
+
+#ifndef TEXT
+#define TEXT(x) x
+#endif
+
+namespace GasPlusSample::Attributes::Meta
+{
+#if __has_include("UObject/NameTypes.h")
+    using FMetaRegistryName = FName;
+    using FMetaRegistryString = FString;
+#else
+    struct FMetaRegistryName
+    {
+        FMetaRegistryName() = default;
+
+        explicit FMetaRegistryName(const char* InName)
+            : Value(InName ? InName : "")
+        {
+        }
+
+        bool IsNone() const
+        {
+            return Value.empty();
+        }
+
+        bool operator==(const FMetaRegistryName& Other) const
+        {
+            return Value == Other.Value;
+        }
+
+        bool operator!=(const FMetaRegistryName& Other) const
+        {
+            return !(*this == Other);
+        }
+
+        std::string Value;
+    };
+
+    inline bool operator<(const FMetaRegistryName& Lhs, const FMetaRegistryName& Rhs)
+    {
+        return Lhs.Value < Rhs.Value;
+    }
+
+    using FMetaRegistryString = std::string;
+#endif
+
+#if __has_include("Containers/Map.h")
+    template <typename KeyType, typename ValueType>
+    using TMetaRegistryMap = TMap<KeyType, ValueType>;
+#else
+    template <typename KeyType, typename ValueType>
+    class TMetaRegistryMap
+    {
+    public:
+        bool Contains(const KeyType& Key) const
+        {
+            return Storage.find(Key) != Storage.end();
+        }
+
+        void Add(const KeyType& Key, const ValueType& Value)
+        {
+            Storage[Key] = Value;
+        }
+
+        const ValueType* Find(const KeyType& Key) const
+        {
+            auto It = Storage.find(Key);
+            if (It == Storage.end())
+            {
+                return nullptr;
+            }
+            return &It->second;
+        }
+
+        ValueType* Find(const KeyType& Key)
+        {
+            auto It = Storage.find(Key);
+            if (It == Storage.end())
+            {
+                return nullptr;
+            }
+            return &It->second;
+        }
+
+        const ValueType& FindChecked(const KeyType& Key) const
+        {
+            auto It = Storage.find(Key);
+            if (It == Storage.end())
+            {
+                throw std::out_of_range("Key not found in TMetaRegistryMap");
+            }
+            return It->second;
+        }
+
+    private:
+        std::map<KeyType, ValueType> Storage;
+    };
+#endif
+
+    struct GASPLUSSAMPLE_API FMetaAttributeDefinition
+    {
+        FMetaAttributeDefinition() = default;
+
+        FMetaAttributeDefinition(
+            const FMetaRegistryName& InRegistryName,
+            const FMetaRegistryName& InBackingAttributeName,
+            const FMetaRegistryString& InDescription);
+
+        FMetaRegistryName RegistryName;
+        FMetaRegistryName BackingAttributeName;
+        FMetaRegistryString Description;
+    };
+
+    class GASPLUSSAMPLE_API FMetaAttributesRegistry
+    {
+    public:
+        static const FMetaAttributesRegistry& Get();
+        static void RegisterEditorExtension(const FMetaAttributeDefinition& Definition);
+
+        const FMetaAttributeDefinition& GetDamage() const;
+        const FMetaAttributeDefinition& GetHeal() const;
+        const FMetaAttributeDefinition& GetShieldDelta() const;
+
+        const TMetaRegistryMap<FMetaRegistryName, FMetaAttributeDefinition>& GetDefinitions() const;
+        const FMetaAttributeDefinition* FindDefinition(const FMetaRegistryName& RegistryName) const;
+
+    private:
+        FMetaAttributesRegistry();
+        void Register(const FMetaAttributeDefinition& Definition);
+
+        static const FMetaRegistryName DamageKey;
+        static const FMetaRegistryName HealKey;
+        static const FMetaRegistryName ShieldDeltaKey;
+
+        TMetaRegistryMap<FMetaRegistryName, FMetaAttributeDefinition> Definitions;
+    };
+}
+""",
+    "Meta/MetaAttributes.h",
+)
+
+META_REGISTRY_SOURCE = Template(
+    """\
+#include "Meta/MetaAttributes.h"
+
+#if __has_include("HAL/CriticalSection.h")
+#include "HAL/CriticalSection.h"
+#include "Misc/ScopeLock.h"
+#else
+#include <mutex>
+#endif
+
+namespace GasPlusSample::Attributes::Meta
+{
+#if !__has_include("HAL/CriticalSection.h")
+    class FCriticalSection
+    {
+    public:
+        void Lock()
+        {
+            Mutex.lock();
+        }
+
+        void Unlock()
+        {
+            Mutex.unlock();
+        }
+
+    private:
+        std::mutex Mutex;
+    };
+
+    class FScopeLock
+    {
+    public:
+        explicit FScopeLock(FCriticalSection* InCriticalSection)
+            : CriticalSection(InCriticalSection)
+        {
+            if (CriticalSection)
+            {
+                CriticalSection->Lock();
+            }
+        }
+
+        ~FScopeLock()
+        {
+            if (CriticalSection)
+            {
+                CriticalSection->Unlock();
+            }
+        }
+
+    private:
+        FCriticalSection* CriticalSection;
+    };
+#endif
+
+    namespace
+    {
+        FCriticalSection GMetaAttributesRegistryMutex;
+    }
+
+    const FMetaRegistryName FMetaAttributesRegistry::DamageKey(TEXT("Damage"));
+    const FMetaRegistryName FMetaAttributesRegistry::HealKey(TEXT("Heal"));
+    const FMetaRegistryName FMetaAttributesRegistry::ShieldDeltaKey(TEXT("ShieldDelta"));
+
+    FMetaAttributeDefinition::FMetaAttributeDefinition(
+        const FMetaRegistryName& InRegistryName,
+        const FMetaRegistryName& InBackingAttributeName,
+        const FMetaRegistryString& InDescription)
+        : RegistryName(InRegistryName)
+        , BackingAttributeName(InBackingAttributeName)
+        , Description(InDescription)
+    {
+    }
+
+    const FMetaAttributesRegistry& FMetaAttributesRegistry::Get()
+    {
+        static FMetaAttributesRegistry Instance;
+        return Instance;
+    }
+
+    void FMetaAttributesRegistry::RegisterEditorExtension(const FMetaAttributeDefinition& Definition)
+    {
+        FScopeLock Lock(&GMetaAttributesRegistryMutex);
+        FMetaAttributesRegistry& Registry = const_cast<FMetaAttributesRegistry&>(Get());
+        Registry.Register(Definition);
+    }
+
+    FMetaAttributesRegistry::FMetaAttributesRegistry()
+    {
+        Register(FMetaAttributeDefinition(DamageKey, DamageKey, TEXT("Aggregates outgoing damage modifications before final application.")));
+        Register(FMetaAttributeDefinition(HealKey, HealKey, TEXT("Aggregates incoming healing before it is applied to core attributes.")));
+        Register(FMetaAttributeDefinition(ShieldDeltaKey, ShieldDeltaKey, TEXT("Captures shield-specific adjustments that may bypass health values.")));
+    }
+
+    void FMetaAttributesRegistry::Register(const FMetaAttributeDefinition& Definition)
+    {
+        if (Definition.RegistryName.IsNone() || Definitions.Contains(Definition.RegistryName))
+        {
+            return;
+        }
+
+        Definitions.Add(Definition.RegistryName, Definition);
+    }
+
+    const TMetaRegistryMap<FMetaRegistryName, FMetaAttributeDefinition>& FMetaAttributesRegistry::GetDefinitions() const
+    {
+        return Definitions;
+    }
+
+    const FMetaAttributeDefinition* FMetaAttributesRegistry::FindDefinition(const FMetaRegistryName& RegistryName) const
+    {
+        return Definitions.Find(RegistryName);
+    }
+
+    const FMetaAttributeDefinition& FMetaAttributesRegistry::GetDamage() const
+    {
+        return Definitions.FindChecked(DamageKey);
+    }
+
+    const FMetaAttributeDefinition& FMetaAttributesRegistry::GetHeal() const
+    {
+        return Definitions.FindChecked(HealKey);
+    }
+
+    const FMetaAttributeDefinition& FMetaAttributesRegistry::GetShieldDelta() const
+    {
+        return Definitions.FindChecked(ShieldDeltaKey);
+    }
+}
+""",
+    "Meta/MetaAttributes.cpp",
+)
+
+# Native gameplay tags (gameplayTags plugin) ---------------------------------
+
+GAMEPLAY_TAGS_HEADER = Template(
+    """\
+#pragma once
+
+#include "NativeGameplayTags.h"
+
+// Native gameplay tags declared by {{Source}}.
+namespace {{Name}}Tags
+{
+{{Declarations}}
+    // GASPLUS-PRESERVE BEGIN {{Name}}Tags.Declarations
+    // GASPLUS-PRESERVE END {{Name}}Tags.Declarations
+}
+""",
+    "GameplayTags.h",
+)
+
+GAMEPLAY_TAG_DECLARATION = Template(
+    "    {{ModuleApi}} UE_DECLARE_GAMEPLAY_TAG_EXTERN({{Identifier}});\n",
+    "GameplayTags.h:declaration",
+)
+
+GAMEPLAY_TAGS_SOURCE = Template(
+    """\
+#include "{{Name}}GameplayTags.h"
+
+namespace {{Name}}Tags
+{
+{{Definitions}}
+    // GASPLUS-PRESERVE BEGIN {{Name}}Tags.Definitions
+    // GASPLUS-PRESERVE END {{Name}}Tags.Definitions
+}
+""",
+    "GameplayTags.cpp",
+)
+
+GAMEPLAY_TAG_DEFINITION = Template(
+    '    UE_DEFINE_GAMEPLAY_TAG_COMMENT({{Identifier}}, "{{Tag}}", "{{Comment}}");\n',
+    "GameplayTags.cpp:definition",
+)
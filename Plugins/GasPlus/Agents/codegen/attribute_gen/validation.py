@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set
+
+if TYPE_CHECKING:
+    from .generator import AttributeSetAsset
+
+# Keys registered by the generated FMetaAttributesRegistry.
+META_REGISTRY_KEYS = frozenset({"Damage", "Heal", "ShieldDelta"})
+
+_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_CPP_KEYWORDS = frozenset(
+    {
+        "alignas", "alignof", "and", "asm", "auto", "bool", "break", "case", "catch",
+        "char", "class", "const", "constexpr", "continue", "decltype", "default",
+        "delete", "do", "double", "else", "enum", "explicit", "export", "extern",
+        "false", "float", "for", "friend", "goto", "if", "inline", "int", "long",
+        "mutable", "namespace", "new", "noexcept", "not", "nullptr", "operator", "or",
+        "private", "protected", "public", "register", "return", "short", "signed",
+        "sizeof", "static", "struct", "switch", "template", "this", "throw", "true",
+        "try", "typedef", "typename", "union", "unsigned", "using", "virtual", "void",
+        "volatile", "while",
+    }
+)
+
+SEVERITY_ERROR = "error"
+SEVERITY_WARNING = "warning"
+
+
+@dataclass
+class ValidationIssue:
+    severity: str
+    code: str
+    message: str
+    sources: List[str] = field(default_factory=list)
+
+    def to_summary(self) -> Dict[str, object]:
+        return {
+            "severity": self.severity,
+            "code": self.code,
+            "message": self.message,
+            "sources": list(self.sources),
+        }
+
+    def format(self) -> str:
+        return f"[{self.severity.upper()}] {self.code}: {self.message}"
+
+
+@dataclass
+class ValidationIndex:
+    """Lookups built once over every discovered asset."""
+
+    attribute_sets: Dict[str, List[str]] = field(default_factory=dict)
+    class_sources: Dict[str, List[str]] = field(default_factory=dict)
+    name_sources: Dict[str, List[str]] = field(default_factory=dict)
+    meta_backing: Dict[str, List[str]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, assets: Iterable["AttributeSetAsset"]) -> "ValidationIndex":
+        index = cls()
+        for asset in assets:
+            label = asset.source_label
+            index.class_sources.setdefault(asset.class_name, []).append(label)
+            index.name_sources.setdefault(asset.name, []).append(label)
+            for attribute in asset.attributes:
+                index.attribute_sets.setdefault(attribute.name, []).append(asset.name)
+                meta_attribute = attribute.metadata.meta_attribute
+                if meta_attribute is not None:
+                    index.meta_backing.setdefault(meta_attribute, []).append(
+                        f"{asset.name}.{attribute.name}"
+                    )
+        return index
+
+
+def is_cpp_identifier(name: str) -> bool:
+    return bool(_IDENTIFIER_PATTERN.match(name)) and name not in _CPP_KEYWORDS
+
+
+def validate_assets(
+    assets: List["AttributeSetAsset"], index: Optional[ValidationIndex] = None
+) -> List[ValidationIssue]:
+    """Run every cross-asset check in a single pass over the attributes."""
+    index = index or ValidationIndex.build(assets)
+    issues: List[ValidationIssue] = []
+
+    for class_name, sources in index.class_sources.items():
+        if len(sources) > 1:
+            issues.append(
+                ValidationIssue(
+                    SEVERITY_ERROR,
+                    "duplicate-class",
+                    f"Class {class_name} is defined by {', '.join(sources)}",
+                    sources,
+                )
+            )
+    for name, sources in index.name_sources.items():
+        if len(sources) > 1:
+            issues.append(
+                ValidationIssue(
+                    SEVERITY_ERROR,
+                    "duplicate-file",
+                    f"Output files {name}AttributeSet.* are produced by {', '.join(sources)}",
+                    sources,
+                )
+            )
+
+    for asset in assets:
+        label = asset.source_label
+        for identifier in (asset.name, asset.class_name):
+            if not is_cpp_identifier(identifier):
+                issues.append(
+                    ValidationIssue(
+                        SEVERITY_ERROR,
+                        "invalid-identifier",
+                        f"{identifier!r} in {label} is not a valid C++ identifier",
+                        [label],
+                    )
+                )
+        # FName compares case-insensitively, so Health and health are the
+        # same attribute to the engine and to the generated name lookup.
+        seen: Dict[str, str] = {}
+        duplicates: Set[str] = set()
+        for attribute in asset.attributes:
+            key = attribute.name.lower()
+            first = seen.get(key)
+            if first is None:
+                seen[key] = attribute.name
+            elif key not in duplicates:
+                duplicates.add(key)
+                message = f"{asset.class_name} declares {attribute.name} more than once"
+                if first != attribute.name:
+                    message = (
+                        f"{asset.class_name} declares {first} and {attribute.name},"
+                        " which differ only in case"
+                    )
+                issues.append(
+                    ValidationIssue(SEVERITY_ERROR, "duplicate-attribute", message, [label])
+                )
+            if not is_cpp_identifier(attribute.name):
+                issues.append(
+                    ValidationIssue(
+                        SEVERITY_ERROR,
+                        "invalid-identifier",
+                        f"Attribute {attribute.name!r} in {label} is not a valid C++ identifier",
+                        [label],
+                    )
+                )
+            metadata = attribute.metadata
+            if (
+                metadata.clamp_min is not None
+                and metadata.clamp_max is not None
+                and metadata.clamp_min > metadata.clamp_max
+            ):
+                issues.append(
+                    ValidationIssue(
+                        SEVERITY_ERROR,
+                        "clamp-range",
+                        f"{asset.class_name}.{attribute.name} has ClampMin {metadata.clamp_min}"
+                        f" greater than ClampMax {metadata.clamp_max}",
+                        [label],
+                    )
+                )
+            meta_attribute = metadata.meta_attribute
+            if (
+                meta_attribute is not None
+                and meta_attribute not in META_REGISTRY_KEYS
+                and meta_attribute not in index.attribute_sets
+            ):
+                issues.append(
+                    ValidationIssue(
+                        SEVERITY_WARNING,
+                        "dangling-meta-attribute",
+                        f"{asset.class_name}.{attribute.name} references MetaAttribute"
+                        f" {meta_attribute}, which is neither a registry key nor an attribute",
+                        [label],
+                    )
+                )
+    return issues
+
+
+def summarize(issues: List[ValidationIssue]) -> Dict[str, object]:
+    return {
+        "errors": sum(1 for issue in issues if issue.severity == SEVERITY_ERROR),
+        "warnings": sum(1 for issue in issues if issue.severity == SEVERITY_WARNING),
+        "issues": [issue.to_summary() for issue in issues],
+    }
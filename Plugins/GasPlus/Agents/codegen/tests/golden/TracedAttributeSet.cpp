@@ -0,0 +1,227 @@
+#include "TracedAttributeSet.h"
+
+#include "AbilitySystemComponent.h"
+#include "Net/UnrealNetwork.h"
+
+// <Codex::Preserve Begin: SourceIncludes>
+// <Codex::Preserve End: SourceIncludes>
+
+
+// Unreal Insights trace scopes and stat counters. Define
+// GASPLUS_ATTRIBUTE_INSTRUMENTATION=0 to compile them out.
+#ifndef GASPLUS_ATTRIBUTE_INSTRUMENTATION
+#define GASPLUS_ATTRIBUTE_INSTRUMENTATION !UE_BUILD_SHIPPING
+#endif
+
+#if GASPLUS_ATTRIBUTE_INSTRUMENTATION
+#include "ProfilingDebugging/CpuProfilerTrace.h"
+#include "Stats/Stats.h"
+
+DECLARE_STATS_GROUP(TEXT("GasPlus UTracedAttributeSet"), STATGROUP_GasPlus_UTracedAttributeSet, STATCAT_Advanced);
+DECLARE_DWORD_COUNTER_STAT(TEXT("UTracedAttributeSet.PreAttributeChange"), STAT_GasPlus_UTracedAttributeSet_PreAttributeChange, STATGROUP_GasPlus_UTracedAttributeSet);
+DECLARE_DWORD_COUNTER_STAT(TEXT("UTracedAttributeSet.PostAttributeChange"), STAT_GasPlus_UTracedAttributeSet_PostAttributeChange, STATGROUP_GasPlus_UTracedAttributeSet);
+DECLARE_DWORD_COUNTER_STAT(TEXT("UTracedAttributeSet.Health.PreAttributeChange"), STAT_GasPlus_UTracedAttributeSet_Health_PreAttributeChange, STATGROUP_GasPlus_UTracedAttributeSet);
+DECLARE_DWORD_COUNTER_STAT(TEXT("UTracedAttributeSet.Health.PostAttributeChange"), STAT_GasPlus_UTracedAttributeSet_Health_PostAttributeChange, STATGROUP_GasPlus_UTracedAttributeSet);
+DECLARE_DWORD_COUNTER_STAT(TEXT("UTracedAttributeSet.Health.OnRep"), STAT_GasPlus_UTracedAttributeSet_Health_OnRep, STATGROUP_GasPlus_UTracedAttributeSet);
+DECLARE_DWORD_COUNTER_STAT(TEXT("UTracedAttributeSet.Shield.PreAttributeChange"), STAT_GasPlus_UTracedAttributeSet_Shield_PreAttributeChange, STATGROUP_GasPlus_UTracedAttributeSet);
+DECLARE_DWORD_COUNTER_STAT(TEXT("UTracedAttributeSet.Shield.PostAttributeChange"), STAT_GasPlus_UTracedAttributeSet_Shield_PostAttributeChange, STATGROUP_GasPlus_UTracedAttributeSet);
+
+#define GASPLUS_ATTRIBUTE_SCOPE(Name) TRACE_CPUPROFILER_EVENT_SCOPE(Name)
+#define GASPLUS_ATTRIBUTE_COUNT(Stat) INC_DWORD_STAT(Stat)
+#else
+#define GASPLUS_ATTRIBUTE_SCOPE(Name)
+#define GASPLUS_ATTRIBUTE_COUNT(Stat)
+#endif
+
+
+UTracedAttributeSet::UTracedAttributeSet() = default;
+// GASPLUS-PRESERVE BEGIN UTracedAttributeSet.Constructor
+// Customize constructor defaults here.
+// GASPLUS-PRESERVE END UTracedAttributeSet.Constructor
+
+void UTracedAttributeSet::GetLifetimeReplicatedProps(TArray<FLifetimeProperty>& OutLifetimeProps) const
+{
+    Super::GetLifetimeReplicatedProps(OutLifetimeProps);
+    DOREPLIFETIME_CONDITION_NOTIFY(UTracedAttributeSet, Health, COND_None, REPNOTIFY_Always);
+    DOREPLIFETIME(UTracedAttributeSet, Shield);
+}
+
+void UTracedAttributeSet::PreAttributeChange(const FGameplayAttribute& Attribute, float& NewValue)
+{
+    GASPLUS_ATTRIBUTE_SCOPE(UTracedAttributeSet_PreAttributeChange);
+    GASPLUS_ATTRIBUTE_COUNT(STAT_GasPlus_UTracedAttributeSet_PreAttributeChange);
+    Super::PreAttributeChange(Attribute, NewValue);
+    // GASPLUS-PRESERVE BEGIN UTracedAttributeSet.PreAttributeChange
+    // Customize pre-attribute change logic here.
+    // GASPLUS-PRESERVE END UTracedAttributeSet.PreAttributeChange
+    if (Attribute == GetHealthAttribute())
+    {
+        GASPLUS_ATTRIBUTE_SCOPE(UTracedAttributeSet_Health_PreAttributeChange);
+        GASPLUS_ATTRIBUTE_COUNT(STAT_GasPlus_UTracedAttributeSet_Health_PreAttributeChange);
+        // Metadata: Replicate=true, GenerateHooks=true, SkipOnRep=false, ClampMin=0.0, ClampMax=100.0
+        const float ClampedValue = FMath::Clamp(NewValue, 0.0, 100.0);
+        NewValue = ClampedValue;
+        // TODO: Add pre-clamp logic for Health if additional validation is required.
+    }
+    if (Attribute == GetShieldAttribute())
+    {
+        GASPLUS_ATTRIBUTE_SCOPE(UTracedAttributeSet_Shield_PreAttributeChange);
+        GASPLUS_ATTRIBUTE_COUNT(STAT_GasPlus_UTracedAttributeSet_Shield_PreAttributeChange);
+        // Metadata: Replicate=true, GenerateHooks=true, SkipOnRep=true
+        // TODO: Add pre-clamp logic for Shield if additional validation is required.
+    }
+    // <Codex::Preserve Begin: PreAttributeChange_Custom>
+    // <Codex::Preserve End: PreAttributeChange_Custom>
+}
+
+void UTracedAttributeSet::PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue)
+{
+    GASPLUS_ATTRIBUTE_SCOPE(UTracedAttributeSet_PostAttributeChange);
+    GASPLUS_ATTRIBUTE_COUNT(STAT_GasPlus_UTracedAttributeSet_PostAttributeChange);
+    Super::PostAttributeChange(Attribute, OldValue, NewValue);
+    UE_UNUSED(OldValue);
+    UE_UNUSED(NewValue);
+    // GASPLUS-PRESERVE BEGIN UTracedAttributeSet.PostAttributeChange
+    // Customize post-attribute change logic here.
+    // GASPLUS-PRESERVE END UTracedAttributeSet.PostAttributeChange
+    if (Attribute == GetHealthAttribute())
+    {
+        GASPLUS_ATTRIBUTE_SCOPE(UTracedAttributeSet_Health_PostAttributeChange);
+        GASPLUS_ATTRIBUTE_COUNT(STAT_GasPlus_UTracedAttributeSet_Health_PostAttributeChange);
+        // Metadata: Replicate=true, GenerateHooks=true, SkipOnRep=false, ClampMin=0.0, ClampMax=100.0
+        // TODO: Add post-clamp logic for Health (OldValue={OldValue}, NewValue={NewValue}).
+    }
+    if (Attribute == GetShieldAttribute())
+    {
+        GASPLUS_ATTRIBUTE_SCOPE(UTracedAttributeSet_Shield_PostAttributeChange);
+        GASPLUS_ATTRIBUTE_COUNT(STAT_GasPlus_UTracedAttributeSet_Shield_PostAttributeChange);
+        // Metadata: Replicate=true, GenerateHooks=true, SkipOnRep=true
+        // TODO: Add post-clamp logic for Shield (OldValue={OldValue}, NewValue={NewValue}).
+    }
+    // <Codex::Preserve Begin: PostAttributeChange_Custom>
+    // <Codex::Preserve End: PostAttributeChange_Custom>
+}
+
+const TCHAR* const UTracedAttributeSet::SnapshotFieldNames[UTracedAttributeSet::SnapshotFieldCount] = {
+    TEXT("Health"),
+    TEXT("Shield"),
+    TEXT("Armor"),
+};
+
+FGameplayAttributeData UTracedAttributeSet::* const UTracedAttributeSet::SnapshotFields[UTracedAttributeSet::SnapshotFieldCount] = {
+    &UTracedAttributeSet::Health,
+    &UTracedAttributeSet::Shield,
+    &UTracedAttributeSet::Armor,
+};
+
+void UTracedAttributeSet::CaptureSnapshot(FSnapshot& OutSnapshot) const
+{
+    OutSnapshot.BaseValues[0] = Health.GetBaseValue();
+    OutSnapshot.CurrentValues[0] = Health.GetCurrentValue();
+    OutSnapshot.BaseValues[1] = Shield.GetBaseValue();
+    OutSnapshot.CurrentValues[1] = Shield.GetCurrentValue();
+    OutSnapshot.BaseValues[2] = Armor.GetBaseValue();
+    OutSnapshot.CurrentValues[2] = Armor.GetCurrentValue();
+}
+
+void UTracedAttributeSet::RestoreSnapshot(const FSnapshot& Snapshot)
+{
+    Health.SetBaseValue(Snapshot.BaseValues[0]);
+    Health.SetCurrentValue(Snapshot.CurrentValues[0]);
+    Shield.SetBaseValue(Snapshot.BaseValues[1]);
+    Shield.SetCurrentValue(Snapshot.CurrentValues[1]);
+    Armor.SetBaseValue(Snapshot.BaseValues[2]);
+    Armor.SetCurrentValue(Snapshot.CurrentValues[2]);
+}
+
+const UTracedAttributeSet::FAttributeInfo UTracedAttributeSet::AttributeInfos[UTracedAttributeSet::AttributeCount] = {
+    {TEXT("Health"), 0, 0.0f, 100.0f, true, true, true, true},
+    {TEXT("Shield"), 1, -FLT_MAX, FLT_MAX, false, false, true, false},
+    {TEXT("Armor"), 2, -FLT_MAX, FLT_MAX, false, false, false, false},
+};
+
+// Perfect hash of the lowercased names: a name's hash selects its seed, and
+// the hash mixed with that seed selects the slot holding its index.
+const uint32 UTracedAttributeSet::AttributeNameMask = 7u;
+
+const uint32 UTracedAttributeSet::AttributeNameSeeds[] = {
+    0u, 0u, 0u, 0u, 2u, 0u, 0u, 0u,
+};
+
+const int32 UTracedAttributeSet::AttributeNameSlots[] = {
+    1, INDEX_NONE, 0, INDEX_NONE, INDEX_NONE, INDEX_NONE, INDEX_NONE, 2,
+};
+
+uint32 UTracedAttributeSet::HashAttributeName(const TCHAR* Name)
+{
+    uint32 Hash = 0x811C9DC5u;
+    for (; *Name; ++Name)
+    {
+        const uint32 Char = static_cast<uint32>(*Name);
+        Hash = (Hash ^ (Char >= 'A' && Char <= 'Z' ? Char + 32u : Char)) * 0x01000193u;
+    }
+    return Hash;
+}
+
+uint32 UTracedAttributeSet::AttributeNameSlot(uint32 Hash, uint32 Seed)
+{
+    uint32 Value = Hash ^ Seed;
+    Value = (Value ^ (Value >> 16)) * 0x85EBCA6Bu;
+    Value = (Value ^ (Value >> 13)) * 0xC2B2AE35u;
+    return (Value ^ (Value >> 16)) & AttributeNameMask;
+}
+
+int32 UTracedAttributeSet::FindAttributeIndex(const TCHAR* Name)
+{
+    if (Name == nullptr)
+    {
+        return INDEX_NONE;
+    }
+    const uint32 Hash = HashAttributeName(Name);
+    const int32 Index = AttributeNameSlots[AttributeNameSlot(Hash, AttributeNameSeeds[Hash & AttributeNameMask])];
+    if (Index == INDEX_NONE || FCString::Stricmp(Name, AttributeInfos[Index].Name) != 0)
+    {
+        return INDEX_NONE;
+    }
+    return Index;
+}
+
+FGameplayAttribute UTracedAttributeSet::FindAttribute(const TCHAR* Name)
+{
+    const int32 Index = FindAttributeIndex(Name);
+    return Index == INDEX_NONE ? FGameplayAttribute() : GetAttributeByIndex(Index);
+}
+
+const FGameplayAttribute& UTracedAttributeSet::GetAttributeByIndex(int32 Index)
+{
+    // Resolved through reflection once, on first use.
+    struct FAttributeCache
+    {
+        FGameplayAttribute Attributes[AttributeCount];
+
+        FAttributeCache()
+        {
+            for (int32 Each = 0; Each < AttributeCount; ++Each)
+            {
+                Attributes[Each] = FGameplayAttribute(
+                    FindFieldChecked<FProperty>(UTracedAttributeSet::StaticClass(), FName(AttributeInfos[Each].Name)));
+            }
+        }
+    };
+    static const FAttributeCache Cache;
+    check(Index >= 0 && Index < AttributeCount);
+    return Cache.Attributes[Index];
+}
+
+void UTracedAttributeSet::OnRep_Health(const FGameplayAttributeData& OldValue)
+{
+    GASPLUS_ATTRIBUTE_SCOPE(UTracedAttributeSet_Health_OnRep);
+    GASPLUS_ATTRIBUTE_COUNT(STAT_GasPlus_UTracedAttributeSet_Health_OnRep);
+    GAMEPLAYATTRIBUTE_REPNOTIFY(UTracedAttributeSet, Health, OldValue);
+    // <Codex::Preserve Begin: OnRep_Health>
+    // <Codex::Preserve End: OnRep_Health>
+}
+
+// GASPLUS-PRESERVE BEGIN UTracedAttributeSet.AdditionalMethods
+// Add additional method definitions here.
+// GASPLUS-PRESERVE END UTracedAttributeSet.AdditionalMethods
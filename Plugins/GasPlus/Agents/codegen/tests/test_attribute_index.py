@@ -0,0 +1,123 @@
+import dataclasses
+import json
+import sqlite3
+
+import pytest
+
+from Plugins.GasPlus.Agents.codegen.attribute_gen import generator
+from Plugins.GasPlus.Agents.codegen.attribute_gen.index import INDEX_FILENAME, AttributeIndex
+from Plugins.GasPlus.Agents.codegen.attribute_gen.sharding import merge_manifests_main
+
+from . import utils
+
+
+def _index_path(tmp_path):
+    return utils.manifest_path(tmp_path).parent / INDEX_FILENAME
+
+
+def _write_sets(tmp_path):
+    utils.write_asset(
+        tmp_path,
+        "Vitals",
+        [
+            {"name": "Health", "metadata": {"MetaAttribute": "Heal"}},
+            {"name": "Shield", "metadata": {"MetaAttribute": "Damage"}},
+        ],
+    )
+    utils.write_asset(tmp_path, "Combat", [{"name": "Health"}, {"name": "Power"}])
+
+
+def test_index_answers_lookups(tmp_path):
+    _write_sets(tmp_path)
+    output_root = utils.run_generator(tmp_path)
+
+    with AttributeIndex(_index_path(tmp_path)) as index:
+        defining = index.sets_defining("Health")
+        assert [row["class_name"] for row in defining] == [
+            "UCombatAttributeSet",
+            "UVitalsAttributeSet",
+        ]
+        assert defining[1]["header_path"] == str(output_root.resolve() / "VitalsAttributeSet.h")
+        damage = index.attributes_with_meta("Damage")
+        assert [(row["set_name"], row["name"]) for row in damage] == [("Vitals", "Shield")]
+        assert [row["name"] for row in index.set_attributes("UCombatAttributeSet")] == [
+            "Health",
+            "Power",
+        ]
+
+
+def test_index_only_updates_changed_sets(tmp_path):
+    _write_sets(tmp_path)
+    utils.run_generator(tmp_path)
+    assert utils.load_manifest(tmp_path)["index"]["inserted"] == 2
+
+    utils.write_asset(tmp_path, "Combat", [{"name": "Power"}])
+    (tmp_path / "Content" / "Attributes" / "Vitals.json").unlink()
+    utils.write_asset(tmp_path, "Loot", [{"name": "Luck"}])
+    utils.run_generator(tmp_path, force=False)
+
+    summary = utils.load_manifest(tmp_path)["index"]
+    assert summary == {
+        "path": INDEX_FILENAME,
+        "inserted": 1,
+        "updated": 1,
+        "unchanged": 0,
+        "removed": 1,
+    }
+    with AttributeIndex(_index_path(tmp_path)) as index:
+        assert index.sets_defining("Health") == []
+
+
+def test_merge_manifests_prunes_sets_of_removed_inputs(tmp_path):
+    _write_sets(tmp_path)
+    config = utils.make_config(tmp_path, force=False, project_root=tmp_path, shard_count=2)
+    merge_args = ["--manifest", str(config.manifest_path), "--log", str(config.log_path)]
+
+    def run_shards():
+        for index in (1, 2):
+            generator.AttributeSetGenerator(dataclasses.replace(config, shard_index=index)).run()
+        merge_manifests_main(merge_args, "", "")
+
+    run_shards()
+    (tmp_path / "Content" / "Attributes" / "Vitals.json").unlink()
+    run_shards()
+
+    assert utils.load_manifest(tmp_path)["index"]["removed"] == 1
+    with AttributeIndex(_index_path(tmp_path)) as index:
+        assert [row["class_name"] for row in index.sets_defining("Health")] == [
+            "UCombatAttributeSet"
+        ]
+
+
+def test_query_cli_prints_json(tmp_path, capsys):
+    _write_sets(tmp_path)
+    utils.run_generator(tmp_path)
+    capsys.readouterr()
+
+    generator.main(["query", "--index", str(_index_path(tmp_path)), "--json", "meta", "Heal"])
+
+    rows = json.loads(capsys.readouterr().out)
+    assert [(row["class_name"], row["name"]) for row in rows] == [("UVitalsAttributeSet", "Health")]
+
+
+def test_query_cli_opens_the_index_read_only(tmp_path, capsys):
+    _write_sets(tmp_path)
+    utils.run_generator(tmp_path)
+    index_path = _index_path(tmp_path)
+    before = index_path.read_bytes()
+
+    generator.main(["query", "--index", str(index_path), "set", "Combat"])
+    assert index_path.read_bytes() == before
+
+    with sqlite3.connect(str(index_path)) as connection:
+        connection.execute("UPDATE info SET value = '99' WHERE key = 'schemaVersion'")
+    connection.close()
+    capsys.readouterr()
+    with pytest.raises(SystemExit):
+        generator.main(["query", "--index", str(index_path), "set", "Combat"])
+
+    assert "index schema 99" in capsys.readouterr().err
+    with sqlite3.connect(str(index_path)) as connection:
+        assert connection.execute("SELECT value FROM info").fetchall() == [("99",)]
+        assert connection.execute("SELECT COUNT(*) FROM sets").fetchone() == (2,)
+    connection.close()
@@ -0,0 +1,74 @@
+import json
+
+from Plugins.GasPlus.Agents.codegen.attribute_gen import catalog
+
+from . import utils
+
+
+def _set_payload(name, clamp_max):
+    return {
+        "name": name,
+        "className": f"U{name}AttributeSet",
+        "attributes": [
+            {
+                "name": f"{name}Value",
+                "metadata": {
+                    "Replicate": True,
+                    "ClampMax": clamp_max,
+                },
+            }
+        ],
+    }
+
+
+def _content_dir(tmp_path):
+    content_dir = tmp_path / "Content" / "Attributes"
+    content_dir.mkdir(parents=True, exist_ok=True)
+    return content_dir
+
+
+def test_json_lines_catalog_generates_every_set(tmp_path):
+    lines = [json.dumps(_set_payload(name, 10)) for name in ("Alpha", "Bravo", "Charlie")]
+    (_content_dir(tmp_path) / "Stats.jsonl").write_text("\n".join(lines) + "\n\n")
+
+    output_root = utils.run_generator(tmp_path)
+
+    entries = utils.load_manifest(tmp_path)["entries"]
+    assert [entry["className"] for entry in entries] == [
+        "UAlphaAttributeSet",
+        "UBravoAttributeSet",
+        "UCharlieAttributeSet",
+    ]
+    assert [entry["record"] for entry in entries] == [0, 1, 2]
+    assert len({entry["inputHash"] for entry in entries}) == 3
+    assert (output_root / "BravoAttributeSet.h").exists()
+
+
+def test_json_array_catalog_is_streamed(tmp_path, monkeypatch):
+    monkeypatch.setattr(catalog, "_CHUNK_SIZE", 7)
+    path = _content_dir(tmp_path) / "Bulk.json"
+    payloads = [_set_payload(f"Set{index}", index) for index in range(5)]
+    path.write_text(json.dumps(payloads, indent=2))
+
+    records = list(catalog.iter_catalog(path))
+
+    assert catalog.is_catalog(path)
+    assert [record.data for record in records] == payloads
+    assert [record.index for record in records] == list(range(5))
+
+
+def test_editing_one_record_only_regenerates_that_set(tmp_path):
+    path = _content_dir(tmp_path) / "Bulk.json"
+    payloads = [_set_payload("Alpha", 10), _set_payload("Bravo", 20)]
+    path.write_text(json.dumps(payloads, indent=2))
+    utils.run_generator(tmp_path, force=False)
+
+    payloads[1]["attributes"][0]["metadata"]["ClampMax"] = 25
+    path.write_text(json.dumps(payloads))
+    utils.run_generator(tmp_path, force=False)
+
+    entries = utils.load_manifest(tmp_path)["entries"]
+    assert entries[0]["status"]["write"] == "skip"
+    assert entries[0]["status"]["hashChanged"] is False
+    assert entries[1]["status"]["write"] == "update"
+    assert entries[1]["status"]["hashChanged"] is True
@@ -0,0 +1,114 @@
+from pathlib import Path
+
+import pytest
+
+from Plugins.GasPlus.Agents.codegen.attribute_gen import AttributeSetGenerator, GeneratorConfig
+from Plugins.GasPlus.Agents.codegen.attribute_gen.generator import EXIT_STALE, main
+
+from . import utils
+
+REPO_ROOT = Path(__file__).resolve().parents[5]
+
+
+def _set(tree, name, clamp_max):
+    return utils.write_asset(
+        tree,
+        name,
+        [
+            {
+                "name": "Health",
+                "metadata": {
+                    "Replicate": True,
+                    "ClampMax": clamp_max,
+                },
+            }
+        ],
+    )
+
+
+def _fail_render(asset):
+    raise AssertionError("check mode must not render")
+
+
+def test_check_passes_on_clean_tree_without_rendering(tmp_path, capsys):
+    _set(tmp_path, "Alpha", 10)
+    output_root = utils.run_generator(tmp_path, force=False)
+    header_mtime = (output_root / "AlphaAttributeSet.h").stat().st_mtime_ns
+    manifest_text = utils.manifest_path(tmp_path).read_text()
+    capsys.readouterr()
+
+    checker = AttributeSetGenerator(utils.make_config(tmp_path, force=False, check="first"))
+    checker._render_header = _fail_render
+    checker._render_source = _fail_render
+    assert checker.check() == 0
+
+    assert "Check passed: 1 attribute set(s)" in capsys.readouterr().out
+    assert (output_root / "AlphaAttributeSet.h").stat().st_mtime_ns == header_mtime
+    assert utils.manifest_path(tmp_path).read_text() == manifest_text
+
+
+def test_check_stops_at_first_stale_output_unless_all(tmp_path, capsys):
+    _set(tmp_path, "Alpha", 10)
+    _set(tmp_path, "Bravo", 20)
+    utils.run_generator(tmp_path, force=False)
+    _set(tmp_path, "Alpha", 11)
+    _set(tmp_path, "Bravo", 21)
+    capsys.readouterr()
+
+    first = AttributeSetGenerator(utils.make_config(tmp_path, check="first"))
+    assert first.check() == EXIT_STALE
+    first_lines = [line for line in capsys.readouterr().out.splitlines() if "[STALE]" in line]
+    assert all("UAlphaAttributeSet" in line for line in first_lines)
+
+    every = AttributeSetGenerator(utils.make_config(tmp_path, check="all"))
+    assert every.check() == EXIT_STALE
+    all_lines = [line for line in capsys.readouterr().out.splitlines() if "[STALE]" in line]
+    assert any("UBravoAttributeSet" in line for line in all_lines)
+    assert len(all_lines) > len(first_lines)
+
+
+def test_check_falls_back_to_committed_manifest(tmp_path):
+    _set(tmp_path, "Alpha", 10)
+    utils.run_generator(tmp_path, force=False)
+    for sidecar in utils.manifest_path(tmp_path).parent.glob("*.generated.hash"):
+        sidecar.unlink()
+
+    checker = AttributeSetGenerator(utils.make_config(tmp_path, check="first"))
+    assert checker.check() == 0
+
+
+def test_check_cli_exits_with_stale_code(tmp_path):
+    _set(tmp_path, "Alpha", 10)
+    output_root = utils.run_generator(tmp_path, force=False)
+    (output_root / "AlphaAttributeSet.cpp").unlink()
+
+    with pytest.raises(SystemExit) as excinfo:
+        main(
+            [
+                "--input",
+                str(tmp_path / "Content" / "Attributes"),
+                "--output",
+                str(output_root),
+                "--manifest",
+                str(utils.manifest_path(tmp_path)),
+                "--log",
+                str(utils.log_path(tmp_path)),
+                "--check=all",
+            ]
+        )
+    assert excinfo.value.code == EXIT_STALE
+
+
+def test_committed_outputs_are_up_to_date():
+    # The CI gate runs --check=all on the shipped tree; template changes must
+    # regenerate and commit the sample outputs alongside.
+    codegen_root = REPO_ROOT / "Plugins" / "GasPlus" / "Agents" / "codegen"
+    config = GeneratorConfig(
+        input_roots=[REPO_ROOT / "Content" / "Attributes"],
+        output_root=REPO_ROOT / "Source" / "GasPlusSample" / "Attributes",
+        manifest_path=codegen_root / "manifest.json",
+        log_path=codegen_root / "logs" / "attribute_gen.log",
+        project_root=REPO_ROOT,
+        check="all",
+    )
+    assert AttributeSetGenerator(config).check() == 0
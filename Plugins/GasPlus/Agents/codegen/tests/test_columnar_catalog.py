@@ -0,0 +1,85 @@
+import math
+import time
+
+from Plugins.GasPlus.Agents.codegen.attribute_gen import columnar, reports
+from Plugins.GasPlus.Agents.codegen.attribute_gen.generator import (
+    AttributeDefinition,
+    AttributeMetadata,
+    AttributeSetAsset,
+)
+
+from . import utils
+
+
+def _asset(name, count, **metadata):
+    return AttributeSetAsset(
+        name=name,
+        class_name=f"U{name}AttributeSet",
+        attributes=[
+            AttributeDefinition(name=f"{name}{index}", metadata=AttributeMetadata(**metadata))
+            for index in range(count)
+        ],
+    )
+
+
+def test_generator_writes_catalog_that_round_trips(tmp_path):
+    utils.write_asset(
+        tmp_path,
+        "Vitals",
+        [
+            {"name": "Health", "metadata": {"ClampMin": 0, "ClampMax": 100}},
+            {"name": "Shield", "metadata": {"Replicate": False, "MetaAttribute": "Damage"}},
+        ],
+    )
+
+    utils.run_generator(tmp_path)
+
+    manifest = utils.load_manifest(tmp_path)
+    assert manifest["catalog"] == {"path": columnar.CATALOG_FILENAME, "sets": 1, "attributes": 2}
+    catalog_path = (tmp_path / utils.MANIFEST_RELATIVE).parent / columnar.CATALOG_FILENAME
+    columns = columnar.read_catalog(catalog_path)
+    assert columns.set_names == ["Vitals"]
+    assert columns.class_names == ["UVitalsAttributeSet"]
+    assert columns.names == ["Health", "Shield"]
+    assert columns.meta_names == ["Damage"]
+    assert list(columns.meta_ids) == [-1, 0]
+    assert columns.clamp_max[0] == 100.0
+    assert math.isnan(columns.clamp_max[1])
+    assert not columns.flags[1] & columnar.FLAG_REPLICATE
+
+
+def test_reports_answer_aggregate_questions():
+    columns = columnar.AttributeColumns.from_assets(
+        [
+            _asset("Alpha", 3, clamp_min=0.0, clamp_max=10.0),
+            _asset("Bravo", 2, replicate=False, generate_hooks=False, meta_attribute="Heal"),
+        ]
+    )
+
+    assert reports.replicated_per_set(columns) == {"Alpha": 3, "Bravo": 0}
+    assert reports.attributes_without_hooks(columns) == [("Bravo", "Bravo0"), ("Bravo", "Bravo1")]
+    assert reports.meta_attribute_counts(columns) == {"Heal": 2}
+    distribution = reports.clamp_range_distribution(columns, bins=4)
+    assert distribution["count"] == 3
+    assert distribution["mean"] == 10.0
+    assert sum(distribution["counts"]) == 3
+
+
+def test_reports_scale_to_large_catalogs(tmp_path):
+    assets = [
+        _asset(f"Set{index}", 1000, clamp_min=0.0, clamp_max=float(index + 1))
+        for index in range(100)
+    ]
+    path = tmp_path / columnar.CATALOG_FILENAME
+    columnar.write_catalog(path, columnar.AttributeColumns.from_assets(assets))
+    columns = columnar.read_catalog(path)
+
+    started = time.perf_counter()
+    per_set = reports.replicated_per_set(columns)
+    distribution = reports.clamp_range_distribution(columns)
+    elapsed = time.perf_counter() - started
+
+    assert len(columns) == 100_000
+    assert per_set["Set99"] == 1000
+    assert distribution["max"] == 100.0
+    assert elapsed < 1.0
@@ -0,0 +1,126 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from Plugins.GasPlus.Agents.codegen.attribute_gen import datatable, generator
+
+from . import utils
+
+
+HEADER = "---,Set,Attribute,Category,Replicate,ClampMin,ClampMax,MetaAttribute,Comment\n"
+
+
+def _write_sheet(tmp_path, rows, name="Stats.csv"):
+    content_dir = tmp_path / "Content" / "Attributes"
+    content_dir.mkdir(parents=True, exist_ok=True)
+    path = content_dir / name
+    path.write_text(HEADER + "".join(f"{row}\n" for row in rows))
+    return path
+
+
+def test_datatable_rows_are_grouped_into_sets(tmp_path):
+    _write_sheet(
+        tmp_path,
+        [
+            "Row1,Vitals,Health,Vital,true,0,100,,Current health",
+            "Row2,Combat,Power,Offense,false,,,,",
+            "Row3,Vitals,Mana,Vital,,0,,,",
+        ],
+    )
+
+    output_root = utils.run_generator(tmp_path)
+
+    entries = utils.load_manifest(tmp_path)["entries"]
+    assert [entry["className"] for entry in entries] == [
+        "UVitalsAttributeSet",
+        "UCombatAttributeSet",
+    ]
+    assert [entry["record"] for entry in entries] == [0, 1]
+    vitals = (output_root / "VitalsAttributeSet.h").read_text()
+    assert "FGameplayAttributeData Health;" in vitals
+    assert "FGameplayAttributeData Mana;" in vitals
+    assert "Current health" in vitals
+    assert "ClampMax=\"100" in vitals
+    combat = (output_root / "CombatAttributeSet.h").read_text()
+    assert "Replicated" not in utils.extract_property_spec(combat, "Power")
+
+
+def test_invalid_cells_report_their_row(tmp_path):
+    path = _write_sheet(
+        tmp_path,
+        [
+            "Row1,Vitals,Health,Vital,true,0,100,,",
+            "Row2,Vitals,Mana,Vital,maybe,0,100,,",
+        ],
+    )
+
+    with pytest.raises(ValueError, match="row 3 column Replicate"):
+        list(datatable.iter_datatable_sets(path))
+
+
+def test_csv_without_set_and_attribute_columns_is_rejected(tmp_path):
+    content_dir = tmp_path / "Content" / "Attributes"
+    content_dir.mkdir(parents=True, exist_ok=True)
+    loot = content_dir / "Loot.csv"
+    loot.write_text("---,Item,Weight\nRow1,Sword,3\n")
+    utils.write_asset(tmp_path, "Solo", [{"name": "Value"}])
+
+    with pytest.raises(ValueError, match="Loot.csv: header has no Set column"):
+        list(datatable.iter_datatable_sets(loot))
+
+    config = utils.make_config(tmp_path, keep_going=True)
+    assert generator.AttributeSetGenerator(config).run() == generator.EXIT_FAILED
+
+    entries = utils.load_manifest(tmp_path)["entries"]
+    assert [entry["status"]["write"] for entry in entries] == ["error", "force"]
+    assert entries[0]["error"]["stage"] == "parse"
+    assert "Loot.csv" in entries[0]["error"]["message"]
+
+
+def test_errors_name_the_original_line_past_blank_rows(tmp_path):
+    path = _write_sheet(
+        tmp_path,
+        [
+            "Row1,Vitals,Health,Vital,true,0,100,,",
+            ",,,,,,,,",
+            "",
+            "Row2,Vitals,Mana,Vital,maybe,0,100,,",
+        ],
+    )
+
+    with pytest.raises(ValueError, match="row 5 column Replicate"):
+        list(datatable.iter_datatable_sets(path))
+
+
+def test_large_sheet_parses_quickly(tmp_path):
+    rows = [
+        f"Row{index},Set{index % 50},Attr{index},Stats,true,0,{index},,"
+        for index in range(20000)
+    ]
+    path = _write_sheet(tmp_path, rows)
+
+    started = time.perf_counter()
+    sets = list(datatable.iter_datatable_sets(path))
+    elapsed = time.perf_counter() - started
+
+    assert len(sets) == 50
+    assert sum(len(table_set.names) for table_set in sets) == 20000
+    assert sets[1].clamp_max[:2] == [1.0, 51.0]
+    assert elapsed < 1.0
+
+
+@pytest.mark.parametrize("use_numpy", [False, True], ids=["python", "numpy"])
+def test_float_columns_parse_with_and_without_numpy(monkeypatch, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(datatable, "np", None)
+    path = Path("Stats.csv")
+
+    parsed = datatable._float_column([" 1.5", "", "-2", "1e3 "], "ClampMin", path, [2, 3, 4, 5])
+
+    assert parsed == [1.5, None, -2.0, 1000.0]
+    assert all(value is None or type(value) is float for value in parsed)
+    with pytest.raises(ValueError, match="row 3 column ClampMin is not a number: 'ten'"):
+        datatable._float_column(["1", "ten"], "ClampMin", path, [2, 3])
@@ -0,0 +1,114 @@
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from Plugins.GasPlus.Agents.codegen.attribute_gen import generator
+
+from . import utils
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is required")
+
+
+def _git(tree, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=codegen", "-c", "user.email=codegen@example.com", *args],
+        cwd=tree,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _set(tree, name, clamp_max):
+    return utils.write_asset(
+        tree,
+        name,
+        [
+            {
+                "name": "Health",
+                "metadata": {
+                    "Replicate": True,
+                    "ClampMin": 0,
+                    "ClampMax": clamp_max,
+                },
+            }
+        ],
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _git(tmp_path, "init", "-q")
+    _set(tmp_path, "Alpha", 10)
+    _set(tmp_path, "Bravo", 20)
+    _git(tmp_path, "add", "Content")
+    _git(tmp_path, "commit", "-q", "-m", "inputs")
+    utils.run_generator(tmp_path, force=False, project_root=tmp_path)
+    return tmp_path
+
+
+def test_changed_since_only_processes_changed_inputs(repo, capsys):
+    _set(repo, "Bravo", 99)
+    capsys.readouterr()
+
+    utils.run_generator(repo, force=False, project_root=repo, changed_since="HEAD")
+
+    out = capsys.readouterr().out
+    assert "UBravoAttributeSet" in out
+    assert "UAlphaAttributeSet" not in out
+    manifest = utils.load_manifest(repo)
+    assert [entry["className"] for entry in manifest["entries"]] == [
+        "UAlphaAttributeSet",
+        "UBravoAttributeSet",
+    ]
+    assert manifest["entries"][1]["status"]["write"] == "update"
+    assert manifest["flags"]["changedSince"] == "HEAD"
+    assert utils.log_path(repo).read_text().count("\n") == 1
+
+
+def test_changed_inputs_are_validated_against_unchanged_sets(repo):
+    payload = json.loads((repo / "Content" / "Attributes" / "Alpha.json").read_text())
+    (repo / "Content" / "Attributes" / "Charlie.json").write_text(json.dumps(payload))
+    _git(repo, "add", "Content")
+
+    exit_code = generator.AttributeSetGenerator(
+        utils.make_config(repo, force=False, project_root=repo, staged=True)
+    ).run()
+
+    assert exit_code == generator.EXIT_INVALID
+    validation = utils.load_manifest(repo)["validation"]
+    assert [issue["code"] for issue in validation["issues"]] == ["duplicate-class", "duplicate-file"]
+    assert sorted(validation["issues"][0]["sources"]) == ["Alpha.json", "Charlie.json"]
+
+
+def test_staged_mode_reuses_git_blob_fingerprint(repo):
+    charlie = _set(repo, "Charlie", 30)
+    _git(repo, "add", str(charlie))
+
+    utils.run_generator(repo, force=False, project_root=repo, staged=True)
+    sidecar = utils.manifest_path(repo).parent / "CharlieAttributeSet.generated.hash"
+    payload = json.loads(sidecar.read_text())
+    assert payload["inputBlob"]
+
+    payload["inputHash"] = "0" * 64
+    sidecar.write_text(json.dumps(payload))
+    utils.run_generator(repo, force=False, project_root=repo, staged=True)
+
+    entries = utils.load_manifest(repo)["entries"]
+    assert [entry["className"] for entry in entries] == [
+        "UAlphaAttributeSet",
+        "UBravoAttributeSet",
+        "UCharlieAttributeSet",
+    ]
+    # The matching blob id means the file was not re-hashed.
+    assert entries[2]["inputHash"] == "0" * 64
+
+
+def test_deleted_input_is_dropped_from_manifest(repo):
+    _git(repo, "rm", "-q", "Content/Attributes/Alpha.json")
+
+    utils.run_generator(repo, force=False, project_root=repo, staged=True)
+
+    entries = utils.load_manifest(repo)["entries"]
+    assert [entry["className"] for entry in entries] == ["UBravoAttributeSet"]
@@ -0,0 +1,61 @@
+import hashlib
+import json
+
+import pytest
+
+from Plugins.GasPlus.Agents.codegen.attribute_gen import hashing
+
+from . import utils
+
+
+def test_mmap_and_chunked_reads_agree(tmp_path, monkeypatch):
+    path = tmp_path / "payload.bin"
+    payload = bytes(range(256)) * 4096
+    path.write_bytes(payload)
+    expected = hashlib.sha256(payload).hexdigest()
+
+    assert hashing.hash_file(path) == expected
+    monkeypatch.setattr(hashing, "MMAP_THRESHOLD", 1)
+    assert hashing.hash_file(path) == expected
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    assert hashing.hash_file(empty) == hashlib.sha256(b"").hexdigest()
+
+
+def test_hash_parts_matches_digest_of_joined_parts():
+    parts = ["1.0", "fingerprint", "UVitalsAttributeSet", ""]
+    joined = "|".join(parts).encode("utf-8")
+
+    assert hashing.hash_parts(parts) == hashlib.sha256(joined).hexdigest()
+    assert hashing.hash_parts(parts, "blake2b") == hashlib.blake2b(joined, digest_size=32).hexdigest()
+    assert hashing.hash_parts([]) == hashlib.sha256(b"").hexdigest()
+
+
+def test_pooled_hashing_matches_serial(tmp_path):
+    paths = []
+    for index in range(12):
+        path = tmp_path / f"input{index}.json"
+        path.write_text(json.dumps({"index": index}))
+        paths.append(path)
+
+    pooled = hashing.hash_files(paths + paths[:3], "blake2b", max_workers=4)
+
+    assert list(pooled) == paths
+    assert pooled == {path: hashing.hash_file(path, "blake2b") for path in paths}
+    with pytest.raises(ValueError):
+        hashing.new_digest("md5")
+
+
+def test_faster_digest_keeps_sha256_input_hash(tmp_path):
+    asset_path = utils.write_asset(tmp_path, "Digest", [{"name": "Value"}])
+    utils.run_generator(tmp_path, hash_algorithm="blake2b")
+
+    manifest = utils.load_manifest(tmp_path)
+    entry = manifest["entries"][0]
+    assert entry["inputHash"] == hashlib.sha256(asset_path.read_bytes()).hexdigest()
+    assert manifest["flags"]["hashAlgorithm"] == "blake2b"
+
+    utils.run_generator(tmp_path, force=False, hash_algorithm="blake2b")
+    assert utils.load_manifest(tmp_path)["entries"][0]["status"]["write"] == "skip"
+    utils.run_generator(tmp_path, force=False)
+    assert utils.load_manifest(tmp_path)["entries"][0]["status"]["write"] == "update"
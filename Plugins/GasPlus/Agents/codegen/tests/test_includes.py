@@ -0,0 +1,76 @@
+from . import utils
+
+
+def test_header_only_includes_attribute_set_dependencies(tmp_path):
+    utils.write_asset(
+        tmp_path,
+        "Lean",
+        [
+            {
+                "name": "Health",
+                "metadata": {
+                    "Replicate": True,
+                },
+            }
+        ],
+    )
+    output_root = utils.run_generator(tmp_path)
+    header = (output_root / "LeanAttributeSet.h").read_text()
+    source = (output_root / "LeanAttributeSet.cpp").read_text()
+
+    assert '#include "AbilitySystemComponent.h"' not in header
+    assert '#include "Meta/MetaAttributes.h"' not in header
+    assert "UAbilitySystemComponent" not in header
+    assert '#include "AbilitySystemComponent.h"' in source
+    assert '#include "Net/UnrealNetwork.h"' in source
+    assert '#include "Meta/MetaAttributes.h"' not in source
+
+
+def test_meta_attributes_add_no_includes(tmp_path):
+    utils.write_asset(
+        tmp_path,
+        "MetaLean",
+        [
+            {
+                "name": "Damage",
+                "metadata": {
+                    "Replicate": False,
+                    "MetaAttribute": "Damage",
+                },
+            }
+        ],
+    )
+    output_root = utils.run_generator(tmp_path)
+    header = (output_root / "MetaLeanAttributeSet.h").read_text()
+    source = (output_root / "MetaLeanAttributeSet.cpp").read_text()
+
+    assert "MetaAttribute=Damage" in header
+    assert '#include "GasPlusMetaAttributeRegistry.h"' not in header
+    assert '#include "Meta/MetaAttributes.h"' not in header
+    assert '#include "Meta/MetaAttributes.h"' not in source
+    assert '#include "Net/UnrealNetwork.h"' not in source
+    assert '#include "AbilitySystemComponent.h"' not in source
+
+
+def test_manifest_reports_include_counts(tmp_path):
+    utils.write_asset(
+        tmp_path,
+        "Counted",
+        [
+            {
+                "name": "Stamina",
+                "metadata": {
+                    "Replicate": True,
+                    "MetaAttribute": "Heal",
+                },
+            }
+        ],
+    )
+    utils.run_generator(tmp_path)
+
+    includes = utils.load_manifest(tmp_path)["entries"][0]["includes"]
+    assert includes["header"]["count"] == 2
+    assert includes["header"]["paths"] == ["CoreMinimal.h", "AttributeSet.h"]
+    assert includes["header"]["forwardDeclarations"] == []
+    assert includes["source"]["count"] == 3
+    assert includes["generatedHeader"]["count"] == 0
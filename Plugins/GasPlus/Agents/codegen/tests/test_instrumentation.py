@@ -0,0 +1,95 @@
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from . import utils
+
+GOLDEN_ROOT = Path(__file__).resolve().parent / "golden"
+_ATTRIBUTES = [
+    {"name": "Health", "metadata": {"ClampMin": 0, "ClampMax": 100}},
+    {"name": "Shield", "metadata": {"SkipOnRep": True}},
+    {"name": "Armor", "metadata": {"Replicate": False, "GenerateHooks": False}},
+]
+
+
+def _write_instrumented_asset(tmp_path, instrument=True):
+    asset_path = utils.write_asset(tmp_path, "Traced", _ATTRIBUTES)
+    if instrument:
+        payload = json.loads(asset_path.read_text())
+        payload["Instrument"] = True
+        asset_path.write_text(json.dumps(payload, indent=2))
+    return asset_path
+
+
+def test_instrumented_source_matches_golden(tmp_path):
+    _write_instrumented_asset(tmp_path)
+    output_root = utils.run_generator(tmp_path)
+
+    source = (output_root / "TracedAttributeSet.cpp").read_text()
+    assert source == (GOLDEN_ROOT / "TracedAttributeSet.cpp").read_text()
+
+
+def test_instrumentation_is_opt_in_and_only_touches_the_source(tmp_path):
+    _write_instrumented_asset(tmp_path, instrument=False)
+    output_root = utils.run_generator(tmp_path)
+    plain_header = (output_root / "TracedAttributeSet.h").read_text()
+    assert "GASPLUS_ATTRIBUTE" not in (output_root / "TracedAttributeSet.cpp").read_text()
+    plain_hashes = utils.load_manifest(tmp_path)["entries"][0]["hashes"]["outputs"]
+
+    # The config switch instruments sets whose DataAsset does not ask for it.
+    utils.run_generator(tmp_path, instrument=True)
+    source = (output_root / "TracedAttributeSet.cpp").read_text()
+    assert source == (GOLDEN_ROOT / "TracedAttributeSet.cpp").read_text()
+    assert (output_root / "TracedAttributeSet.h").read_text() == plain_header
+    hashes = utils.load_manifest(tmp_path)["entries"][0]["hashes"]["outputs"]
+    assert hashes["header"] == plain_hashes["header"]
+    assert hashes["source"] != plain_hashes["source"]
+
+
+@pytest.mark.skipif(shutil.which("g++") is None, reason="g++ compiler is required")
+@pytest.mark.parametrize("enabled", ["1", "0"])
+def test_instrumented_source_compiles_with_and_without_tracing(tmp_path, enabled):
+    _write_instrumented_asset(tmp_path)
+    output_root = utils.run_generator(tmp_path)
+    stub_root = utils.write_compile_stubs(tmp_path / "stubs", ["Traced"])
+    (stub_root / "ProfilingDebugging").mkdir()
+    (stub_root / "Stats").mkdir()
+    (stub_root / "ProfilingDebugging" / "CpuProfilerTrace.h").write_text(
+        "#pragma once\n\n"
+        "struct FTraceScope { explicit FTraceScope(const char*) {} };\n"
+        "#define TRACE_CPUPROFILER_EVENT_SCOPE(Name) FTraceScope Name##_Scope(#Name)\n"
+    )
+    (stub_root / "Stats" / "Stats.h").write_text(
+        "#pragma once\n\n"
+        "#define TEXT(Value) Value\n"
+        "#define DECLARE_STATS_GROUP(Description, GroupId, Category)\n"
+        "#define DECLARE_DWORD_COUNTER_STAT(Description, StatId, GroupId) static int StatId = 0;\n"
+        "#define INC_DWORD_STAT(StatId) (++StatId)\n"
+    )
+    test_cpp = tmp_path / "test.cpp"
+    test_cpp.write_text(
+        '#include "TracedAttributeSet.h"\n#include "TracedAttributeSet.cpp"\nint main() { return 0; }\n'
+    )
+
+    result = subprocess.run(
+        [
+            "g++",
+            "-std=c++17",
+            "-Wall",
+            "-Werror",
+            f"-DGASPLUS_ATTRIBUTE_INSTRUMENTATION={enabled}",
+            "-c",
+            str(test_cpp),
+            "-o",
+            str(tmp_path / "test.o"),
+            f"-I{stub_root}",
+            f"-I{output_root}",
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
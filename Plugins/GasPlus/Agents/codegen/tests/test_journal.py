@@ -0,0 +1,69 @@
+import json
+
+from Plugins.GasPlus.Agents.codegen.attribute_gen import ManifestJournal, generator
+from Plugins.GasPlus.Agents.codegen.attribute_gen.journal import journal_main
+
+from . import utils
+
+
+def _manifest(run, names):
+    return {
+        "elapsedSeconds": run / 10,
+        "entries": [{"input": f"{name}.json", "status": {"write": "skip"}} for name in names],
+    }
+
+
+def test_runs_append_deltas_that_rebuild_the_manifest(tmp_path, capsys):
+    vitals = utils.write_asset(tmp_path, "Vitals", [{"name": "Health"}])
+    mana = utils.write_asset(tmp_path, "Mana", [{"name": "Mana"}])
+    config = utils.make_config(tmp_path, force=False)
+    generator.AttributeSetGenerator(config).run()
+    generator.AttributeSetGenerator(config).run()
+    generator.AttributeSetGenerator(config).run()
+    utils.write_asset(tmp_path, "Vitals", [{"name": "Health"}, {"name": "Stamina"}])
+    mana.unlink()
+    generator.AttributeSetGenerator(config).run()
+
+    manifest = utils.load_manifest(tmp_path)
+    assert manifest["journal"]["run"] == 4
+    journal = ManifestJournal.for_manifest(config.manifest_path)
+    records = [json.loads(line) for line in journal.path.read_text().splitlines()]
+    assert [len(record["changed"]) for record in records] == [2, 2, 0, 1]
+    assert journal.manifest_at() == manifest
+    assert len(journal.manifest_at(1)["entries"]) == 2
+
+    changes = journal.changes_since(3)
+    assert [entry["input"] for entry in changes.changed.values()] == [str(vitals)]
+    assert changes.removed == [str(mana)]
+    assert journal.changes_since(4).changed == {}
+
+    capsys.readouterr()
+    journal_main(["--manifest", str(config.manifest_path), "--since", "3"], "")
+    assert json.loads(capsys.readouterr().out)["removed"] == [str(mana)]
+
+
+def test_snapshots_bound_replay_and_torn_appends_are_discarded(tmp_path):
+    journal = ManifestJournal(tmp_path / "manifest.journal.jsonl", snapshot_interval=2)
+    history = [
+        _manifest(1, ["A", "B"]),
+        _manifest(2, ["B", "A"]),
+        _manifest(3, ["A"]),
+        _manifest(4, ["A", "C"]),
+        _manifest(5, ["C"]),
+    ]
+    for manifest in history:
+        journal.append(manifest)
+    records = [json.loads(line) for line in journal.path.read_text().splitlines()]
+    assert [run for run, record in enumerate(records, 1) if "snapshot" in record] == [1, 3, 5]
+    assert [journal.manifest_at(run) for run in range(1, 6)] == history
+
+    with journal.path.open("ab") as stream:
+        stream.write(b'{"run": 6, "chan')
+    with journal.index_path.open("ab") as stream:
+        stream.write(b"\x00" * 5)
+    assert journal.latest_run == 5
+    assert journal.append(_manifest(6, ["C", "D"])) == 6
+    assert journal.manifest_at(6) == _manifest(6, ["C", "D"])
+    changes = journal.changes_since(2)
+    assert sorted(changes.changed) == ["C.json", "D.json"]
+    assert changes.removed == ["B.json", "A.json"]
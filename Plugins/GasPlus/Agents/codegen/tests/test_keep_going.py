@@ -0,0 +1,114 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from Plugins.GasPlus.Agents.codegen.attribute_gen import generator
+from Plugins.GasPlus.Agents.codegen.attribute_gen.checkpoint import checkpoint_path_for
+
+from . import utils
+
+
+def _content_dir(tmp_path):
+    content_dir = tmp_path / "Content" / "Attributes"
+    content_dir.mkdir(parents=True, exist_ok=True)
+    return content_dir
+
+
+def test_malformed_input_aborts_without_keep_going(tmp_path):
+    utils.write_asset(tmp_path, "Good", [{"name": "Value"}])
+    (_content_dir(tmp_path) / "Broken.json").write_text("{not json")
+
+    with pytest.raises(ValueError):
+        utils.run_generator(tmp_path)
+
+
+def test_keep_going_records_failures_in_discovery_order(tmp_path):
+    content_dir = _content_dir(tmp_path)
+    (content_dir / "A_Broken.json").write_text("{not json")
+    utils.write_asset(tmp_path, "B_Good", [{"name": "Value"}])
+    (content_dir / "C_Catalog.jsonl").write_text(
+        json.dumps({"name": "Ok", "attributes": [{"name": "Value"}]})
+        + "\n"
+        + json.dumps({"name": "Empty", "attributes": []})
+        + "\n"
+    )
+
+    config = utils.make_config(tmp_path, keep_going=True)
+    assert generator.AttributeSetGenerator(config).run() == generator.EXIT_FAILED
+
+    entries = utils.load_manifest(tmp_path)["entries"]
+    assert [(entry["status"]["write"], entry.get("record")) for entry in entries] == [
+        ("error", None),
+        ("force", None),
+        ("force", 0),
+        ("error", 1),
+    ]
+    assert entries[0]["error"]["stage"] == "parse"
+    assert "no attributes" in entries[3]["error"]["message"]
+    assert (config.output_root / "B_GoodAttributeSet.h").exists()
+    assert (config.output_root / "OkAttributeSet.h").exists()
+    log = utils.log_path(tmp_path).read_text()
+    assert "FAILED A_Broken.json (parse)" in log
+
+
+def test_resume_skips_sets_completed_before_a_crash(tmp_path, capsys):
+    for name in ("Alpha", "Bravo", "Charlie", "Delta"):
+        utils.write_asset(tmp_path, name, [{"name": "Value"}])
+    config = utils.make_config(tmp_path, io_concurrency=1, checkpoint_interval=1)
+
+    crashing = generator.AttributeSetGenerator(config)
+    original = crashing._process_asset
+
+    def crash_on_charlie(asset):
+        if asset.name == "Charlie":
+            raise RuntimeError("simulated crash")
+        return original(asset)
+
+    crashing._process_asset = crash_on_charlie
+    with pytest.raises(RuntimeError):
+        crashing.run()
+    checkpoint_path = checkpoint_path_for(config.manifest_path)
+    assert sorted(json.loads(checkpoint_path.read_text())["results"]) == [
+        str((tmp_path / "Content" / "Attributes" / f"{name}.json").resolve())
+        for name in ("Alpha", "Bravo")
+    ]
+    capsys.readouterr()
+
+    resumed = generator.AttributeSetGenerator(
+        utils.make_config(tmp_path, io_concurrency=1, resume=True)
+    )
+    processed = []
+    original_resumed = resumed._process_asset
+    resumed._process_asset = lambda asset: processed.append(asset.name) or original_resumed(asset)
+    assert resumed.run() == 0
+
+    assert processed == ["Charlie", "Delta"]
+    assert "Resuming from 2 checkpointed attribute set(s)." in capsys.readouterr().out
+    entries = utils.load_manifest(tmp_path)["entries"]
+    assert [entry["className"] for entry in entries] == [
+        "UAlphaAttributeSet",
+        "UBravoAttributeSet",
+        "UCharlieAttributeSet",
+        "UDeltaAttributeSet",
+    ]
+    assert not checkpoint_path.exists()
+
+
+def test_keep_going_renders_valid_sets_past_validation_errors(tmp_path):
+    utils.write_asset(
+        tmp_path, "Broken", [{"name": "Health", "metadata": {"ClampMin": 10, "ClampMax": 1}}]
+    )
+    utils.write_asset(tmp_path, "Good", [{"name": "Value"}])
+
+    config = utils.make_config(tmp_path, keep_going=True)
+    assert generator.AttributeSetGenerator(config).run() == generator.EXIT_FAILED
+
+    manifest = utils.load_manifest(tmp_path)
+    entries = {Path(entry["input"]).stem: entry for entry in manifest["entries"]}
+    assert entries["Broken"]["error"]["stage"] == "validate"
+    assert "ClampMin 10.0 greater than ClampMax 1.0" in entries["Broken"]["error"]["message"]
+    assert entries["Good"]["status"]["write"] == "force"
+    assert manifest["validation"]["errors"] == 1
+    assert not (config.output_root / "BrokenAttributeSet.h").exists()
+    assert (config.output_root / "GoodAttributeSet.h").exists()
@@ -0,0 +1,113 @@
+import os
+import stat
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from Plugins.GasPlus.Agents.codegen.attribute_gen import generator
+from Plugins.GasPlus.Agents.codegen.attribute_gen.locking import (
+    FileLock,
+    LockTimeoutError,
+    atomic_write_text,
+)
+
+from . import utils
+
+
+def test_lock_excludes_other_processes(tmp_path):
+    pytest.importorskip("fcntl")
+    lock_path = tmp_path / "codegen.lock"
+    holder = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import fcntl, sys, time\n"
+            f"handle = open({str(lock_path)!r}, 'w')\n"
+            "fcntl.flock(handle, fcntl.LOCK_EX)\n"
+            "print('locked', flush=True)\n"
+            "sys.stdin.readline()\n",
+        ],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert holder.stdout.readline().strip() == "locked"
+        with pytest.raises(LockTimeoutError):
+            FileLock(lock_path, timeout=0.2).acquire()
+    finally:
+        holder.communicate("done\n")
+
+    with FileLock(lock_path, timeout=1.0):
+        pass
+
+
+def _tracked_generator(tmp_path, calls, delay=0.0):
+    instance = generator.AttributeSetGenerator(utils.make_config(tmp_path, force=False))
+    original = instance._generate
+
+    def generate():
+        calls.append(threading.get_ident())
+        time.sleep(delay)
+        return original()
+
+    instance._generate = generate
+    return instance
+
+
+def test_waiting_runs_coalesce_into_one_follow_up(tmp_path):
+    utils.write_asset(tmp_path, "Shared", [{"name": "Value"}])
+    calls = []
+    results = {}
+
+    def launch(name, delay=0.0):
+        thread = threading.Thread(
+            target=lambda: results.__setitem__(name, _tracked_generator(tmp_path, calls, delay).run())
+        )
+        thread.start()
+        return thread
+
+    first = launch("first", delay=0.5)
+    while not calls:
+        time.sleep(0.01)
+    waiters = [launch("second"), launch("third")]
+    for thread in [first, *waiters]:
+        thread.join(timeout=30)
+
+    # The in-flight run started before the waiters arrived, so exactly one
+    # follow-up runs and the other waiter reuses its result.
+    assert len(calls) == 2
+    assert results == {"first": 0, "second": 0, "third": 0}
+
+
+def test_sequential_runs_are_not_coalesced(tmp_path):
+    utils.write_asset(tmp_path, "Solo", [{"name": "Value"}])
+    calls = []
+
+    _tracked_generator(tmp_path, calls).run()
+    _tracked_generator(tmp_path, calls).run()
+
+    assert len(calls) == 2
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_atomic_writes_follow_umask_and_keep_existing_mode(tmp_path):
+    previous_umask = os.umask(0o022)
+    try:
+        utils.write_asset(tmp_path, "Vitals", [{"name": "Health"}])
+        utils.run_generator(tmp_path)
+        manifest = utils.manifest_path(tmp_path)
+        header = tmp_path / "Source" / "GasPlusSample" / "Attributes" / "VitalsAttributeSet.h"
+        assert stat.S_IMODE(manifest.stat().st_mode) == 0o644
+        assert stat.S_IMODE(manifest.stat().st_mode) == stat.S_IMODE(header.stat().st_mode)
+
+        manifest.chmod(0o640)
+        atomic_write_text(manifest, "{}\n")
+        assert stat.S_IMODE(manifest.stat().st_mode) == 0o640
+        assert manifest.read_text() == "{}\n"
+        assert not list(manifest.parent.glob(".tmp-*"))
+    finally:
+        os.umask(previous_umask)
@@ -0,0 +1,80 @@
+import shutil
+import subprocess
+
+import pytest
+
+from Plugins.GasPlus.Agents.codegen.attribute_gen import AttributeSetGenerator
+
+from . import utils
+
+_ATTRIBUTES = [
+    {"name": "Health", "metadata": {"ClampMin": 0, "ClampMax": 100}},
+    {"name": "Mana", "metadata": {"SkipOnRep": True}},
+    {"name": "Stamina", "metadata": {"Replicate": False, "GenerateHooks": False}},
+] + [{"name": f"Resist{index}"} for index in range(37)]
+
+
+def test_name_lookup_is_a_perfect_hash():
+    names = [f"Attribute{index}" for index in range(300)] + ["attribute7"]
+    seeds, slots = AttributeSetGenerator._build_name_lookup(names)
+    mask = len(slots) - 1
+
+    assert len(slots) & mask == 0 and len(slots) >= 300
+    for index, name in enumerate(names):
+        name_hash = AttributeSetGenerator._attribute_name_hash(name)
+        slot = AttributeSetGenerator._attribute_name_slot(name_hash, seeds[name_hash & mask], mask)
+        # Names equal up to case resolve to the first definition.
+        assert slots[slot] == (7 if index == 300 else index)
+    assert sorted(slot for slot in slots if slot >= 0) == list(range(300))
+    assert AttributeSetGenerator._build_name_lookup([]) == ([0], [-1])
+
+
+@pytest.mark.skipif(shutil.which("g++") is None, reason="g++ compiler is required")
+def test_generated_lookups_resolve_names_and_indices(tmp_path):
+    utils.write_asset(tmp_path, "Vitals", _ATTRIBUTES)
+    output_root = utils.run_generator(tmp_path)
+    stub_root = utils.write_compile_stubs(tmp_path / "stubs", ["Vitals"])
+    test_cpp = tmp_path / "test.cpp"
+    test_cpp.write_text(
+        '#include "VitalsAttributeSet.h"\n'
+        '#include "VitalsAttributeSet.cpp"\n\n'
+        "int main()\n"
+        "{\n"
+        "    using USet = UVitalsAttributeSet;\n"
+        "    for (int32 Index = 0; Index < USet::AttributeCount; ++Index)\n"
+        "    {\n"
+        "        if (USet::AttributeInfos[Index].Index != Index) return 1;\n"
+        "        if (USet::FindAttributeIndex(USet::AttributeInfos[Index].Name) != Index) return 2;\n"
+        "    }\n"
+        '    if (USet::FindAttributeIndex("mANA") != 1) return 3;\n'
+        '    if (USet::FindAttributeIndex("Mana2") != INDEX_NONE) return 4;\n'
+        '    if (USet::FindAttributeIndex("") != INDEX_NONE) return 5;\n'
+        '    if (USet::FindAttribute("Unknown").IsValid()) return 6;\n'
+        '    if (!(USet::FindAttribute("health") == USet::GetHealthAttribute())) return 7;\n'
+        "    if (!(USet::GetAttributeByIndex(2) == USet::GetStaminaAttribute())) return 8;\n"
+        "    const USet::FAttributeInfo& Health = USet::AttributeInfos[0];\n"
+        "    if (!Health.bHasClampMax || Health.ClampMax != 100.0f || !Health.bRepNotify) return 9;\n"
+        "    if (!USet::AttributeInfos[1].bReplicated || USet::AttributeInfos[1].bRepNotify) return 10;\n"
+        "    return USet::AttributeInfos[2].bReplicated || USet::AttributeInfos[2].bHasClampMin ? 11 : 0;\n"
+        "}\n"
+    )
+    binary = tmp_path / "lookup"
+
+    build = subprocess.run(
+        [
+            "g++",
+            "-std=c++17",
+            "-Wall",
+            "-Werror",
+            str(test_cpp),
+            "-o",
+            str(binary),
+            f"-I{stub_root}",
+            f"-I{output_root}",
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert build.returncode == 0, build.stderr
+    assert subprocess.run([str(binary)], check=False).returncode == 0
@@ -144,58 +144,7 @@ def test_generated_code_compiles(tmp_path):
     source_path = output_root / "CompileCheckAttributeSet.cpp"
     generated_header_path = output_root / "CompileCheckAttributeSet.generated.h"
 
-    stub_include_root = tmp_path / "stubs"
-    (stub_include_root / "Net").mkdir(parents=True, exist_ok=True)
-
-    (stub_include_root / "CoreMinimal.h").write_text(
-        """#pragma once\n\n#include <cfloat>\n#include <algorithm>\n\n#define GASPLUSSAMPLE_API\n#define UCLASS(...)\n#define UFUNCTION(...)\n#define UPROPERTY(...)\n#define GENERATED_BODY() using Super = UAttributeSet;\n#define UE_UNUSED(Expr) (void)(Expr)\n"""
-    )
-    attribute_stub = (
-        "#pragma once\n\n"
-        "#include <vector>\n\n"
-        "using FLifetimeProperty = int;\n"
-        "template <typename T>\n"
-        "class TArray : public std::vector<T> {\n"
-        "public:\n"
-        "    using std::vector<T>::vector;\n"
-        "};\n\n"
-        "struct FGameplayAttributeData {\n"
-        "    float CurrentValue = 0.0f;\n"
-        "    float GetCurrentValue() const { return CurrentValue; }\n"
-        "    void SetCurrentValue(float Value) { CurrentValue = Value; }\n"
-        "};\n\n"
-        "struct FGameplayAttribute {};\n\n"
-        "inline bool operator==(const FGameplayAttribute&, const FGameplayAttribute&) {\n"
-        "    return true;\n"
-        "}\n\n"
-        "struct FMath {\n"
-        "    static float Clamp(float Value, float Min, float Max) {\n"
-        "        return std::max(Min, std::min(Value, Max));\n"
-        "    }\n"
-        "};\n\n"
-        "class UAttributeSet {\n"
-        "public:\n"
-        "    virtual ~UAttributeSet() = default;\n"
-        "    virtual void GetLifetimeReplicatedProps(TArray<FLifetimeProperty>&) const {}\n"
-        "    virtual void PreAttributeChange(const FGameplayAttribute&, float&) {}\n"
-        "    virtual void PostAttributeChange(const FGameplayAttribute&, float, float) {}\n"
-        "};\n\n"
-        "#define ATTRIBUTE_ACCESSORS(ClassName, PropertyName) \\\n"
-        "    static FGameplayAttribute Get##PropertyName##Attribute() { return FGameplayAttribute(); } \\\n"
-        "    float Get##PropertyName() const { return PropertyName.GetCurrentValue(); } \\\n"
-        "    void Set##PropertyName(float NewValue) { PropertyName.SetCurrentValue(NewValue); } \\\n"
-        "    void Init##PropertyName(float NewValue) { PropertyName.SetCurrentValue(NewValue); }\n"
-        "#define GAMEPLAYATTRIBUTE_PROPERTY_GETTER(ClassName, PropertyName)\n"
-        "#define GAMEPLAYATTRIBUTE_VALUE_GETTER(PropertyName)\n"
-        "#define GAMEPLAYATTRIBUTE_VALUE_SETTER(PropertyName)\n"
-        "#define GAMEPLAYATTRIBUTE_VALUE_INITTER(PropertyName)\n"
-    )
-    (stub_include_root / "AttributeSet.h").write_text(attribute_stub)
-    (stub_include_root / "AbilitySystemComponent.h").write_text("#pragma once\n")
-    (stub_include_root / "Net/UnrealNetwork.h").write_text(
-        """#pragma once\n\n#define COND_None 0\n#define REPNOTIFY_Always 0\n#define DOREPLIFETIME(ClassName, PropertyName) do {} while (0)\n#define DOREPLIFETIME_CONDITION_NOTIFY(ClassName, PropertyName, Condition, NotifyPolicy) do {} while (0)\n#define GAMEPLAYATTRIBUTE_REPNOTIFY(ClassName, PropertyName, OldValue) do {} while (0)\n"""
-    )
-    (stub_include_root / "CompileCheckAttributeSet.generated.h").write_text("#pragma once\n")
+    stub_include_root = utils.write_compile_stubs(tmp_path / "stubs", ["CompileCheck"])
 
     compile_dir = tmp_path / "compile"
     compile_dir.mkdir(parents=True, exist_ok=True)
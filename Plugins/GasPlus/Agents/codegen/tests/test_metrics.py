@@ -0,0 +1,58 @@
+import json
+
+from Plugins.GasPlus.Agents.codegen.attribute_gen import generator
+from Plugins.GasPlus.Agents.codegen.attribute_gen.metrics import COUNTERS, RunMetrics
+
+from . import utils
+
+
+def _counters(tmp_path):
+    payload = json.loads((utils.manifest_path(tmp_path).parent / "metrics.json").read_text())
+    return payload["counters"]
+
+
+def test_counters_track_cold_and_warm_runs(tmp_path):
+    utils.write_asset(tmp_path, "Alpha", [{"name": "Value"}])
+    utils.write_asset(tmp_path, "Bravo", [{"name": "Value"}])
+    config = utils.make_config(tmp_path, force=False)
+
+    generator.AttributeSetGenerator(config).run()
+    cold = _counters(tmp_path)
+    assert cold["assets_discovered"] == 2
+    assert cold["hash_misses"] == 2
+    assert cold["renders_performed"] == 6
+    # Three outputs per set plus the two meta registry files.
+    assert cold["files_rewritten"] == 8
+    assert cold["read_bytes"] > 0
+    assert cold["written_bytes"] > 0
+
+    generator.AttributeSetGenerator(config).run()
+    warm = _counters(tmp_path)
+    assert warm["hash_hits"] == 2
+    assert warm["renders_performed"] == 0
+    assert warm["renders_avoided"] == 6
+    assert warm["files_rewritten"] == 0
+    assert warm["files_unchanged"] == 8
+
+
+def test_forced_rerun_counts_merged_preserve_regions(tmp_path):
+    utils.write_asset(tmp_path, "Alpha", [{"name": "Value"}])
+    generator.AttributeSetGenerator(utils.make_config(tmp_path)).run()
+    assert _counters(tmp_path)["preserve_regions_merged"] == 0
+
+    generator.AttributeSetGenerator(utils.make_config(tmp_path)).run()
+    assert _counters(tmp_path)["preserve_regions_merged"] > 0
+
+
+def test_openmetrics_export_is_well_formed(tmp_path):
+    utils.write_asset(tmp_path, "Alpha", [{"name": "Value"}])
+    generator.AttributeSetGenerator(utils.make_config(tmp_path)).run()
+    text = (utils.manifest_path(tmp_path).parent / "metrics.prom").read_text()
+
+    lines = text.splitlines()
+    assert lines[-1] == "# EOF"
+    assert "# UNIT attribute_gen_read_bytes bytes" in lines
+    samples = dict(line.split(" ") for line in lines if not line.startswith("#"))
+    assert set(samples) == {f"attribute_gen_{name}_total" for name in COUNTERS}
+    assert samples["attribute_gen_assets_discovered_total"] == "1"
+    assert RunMetrics.from_json(RunMetrics({"hash_hits": 3}).to_json())["hash_hits"] == 3
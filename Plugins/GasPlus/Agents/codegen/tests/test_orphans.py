@@ -0,0 +1,59 @@
+from Plugins.GasPlus.Agents.codegen.attribute_gen import generator
+
+from . import utils
+
+_OUTPUT_SUFFIXES = ("AttributeSet.h", "AttributeSet.cpp", "AttributeSet.generated.h")
+
+
+def _outputs(config, name):
+    return [config.output_root / f"{name}{suffix}" for suffix in _OUTPUT_SUFFIXES] + [
+        config.manifest_path.parent / f"{name}AttributeSet.generated.hash"
+    ]
+
+
+def test_deleted_input_is_reported_until_pruned(tmp_path, capsys):
+    utils.write_asset(tmp_path, "Keep", [{"name": "Value"}])
+    removed = utils.write_asset(tmp_path, "Gone", [{"name": "Value"}])
+    config = utils.make_config(tmp_path, force=False)
+    generator.AttributeSetGenerator(config).run()
+    removed.unlink()
+    capsys.readouterr()
+
+    for _ in range(2):
+        generator.AttributeSetGenerator(config).run()
+        assert capsys.readouterr().out.count("[ORPHAN]") == 4
+        orphans = utils.load_manifest(tmp_path)["orphans"]
+        assert sorted(orphans["files"]) == sorted(str(path) for path in _outputs(config, "Gone"))
+        assert all(path.exists() for path in _outputs(config, "Gone"))
+
+    generator.AttributeSetGenerator(utils.make_config(tmp_path, force=False, prune=True)).run()
+    assert not any(path.exists() for path in _outputs(config, "Gone"))
+    assert all(path.exists() for path in _outputs(config, "Keep"))
+    assert "PRUNED" in utils.log_path(tmp_path).read_text()
+
+    generator.AttributeSetGenerator(config).run()
+    assert utils.load_manifest(tmp_path)["orphans"]["files"] == []
+
+
+def test_renamed_set_orphans_its_previous_outputs(tmp_path):
+    source = utils.write_asset(tmp_path, "Vitals", [{"name": "Health"}])
+    config = utils.make_config(tmp_path, force=False, prune=True)
+    generator.AttributeSetGenerator(config).run()
+
+    source.write_text(source.read_text().replace("Vitals", "Survival"))
+    generator.AttributeSetGenerator(config).run()
+
+    assert not any(path.exists() for path in _outputs(config, "Vitals"))
+    assert all(path.exists() for path in _outputs(config, "Survival"))
+
+
+def test_failed_input_keeps_its_outputs(tmp_path):
+    source = utils.write_asset(tmp_path, "Fragile", [{"name": "Value"}])
+    generator.AttributeSetGenerator(utils.make_config(tmp_path)).run()
+
+    source.write_text("{not json")
+    config = utils.make_config(tmp_path, keep_going=True, prune=True)
+    assert generator.AttributeSetGenerator(config).run() == generator.EXIT_FAILED
+
+    assert all(path.exists() for path in _outputs(config, "Fragile"))
+    assert utils.load_manifest(tmp_path)["orphans"]["files"] == []
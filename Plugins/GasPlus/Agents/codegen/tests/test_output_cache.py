@@ -0,0 +1,103 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from Plugins.GasPlus.Agents.codegen.attribute_gen import OutputCache
+
+from . import utils
+
+
+def _write_combat(worktree):
+    utils.write_asset(
+        worktree,
+        "Combat",
+        [
+            {
+                "name": "AttackPower",
+                "metadata": {
+                    "Replicate": True,
+                    "ClampMin": 0,
+                },
+            }
+        ],
+    )
+
+
+def test_second_worktree_reuses_cached_outputs(tmp_path):
+    cache_dir = tmp_path / "cache"
+    first_tree = tmp_path / "first"
+    second_tree = tmp_path / "second"
+    _write_combat(first_tree)
+    _write_combat(second_tree)
+
+    utils.run_generator(first_tree, force=False, cache_dir=cache_dir, project_root=first_tree)
+    first_cache = utils.load_manifest(first_tree)["cache"]
+    assert first_cache["run"]["misses"] == 3
+    assert first_cache["run"]["stores"] == 3
+
+    output_root = utils.run_generator(
+        second_tree, force=False, cache_dir=cache_dir, project_root=second_tree
+    )
+
+    second_cache = utils.load_manifest(second_tree)["cache"]
+    assert second_cache["run"]["hits"] == 3
+    assert second_cache["run"]["misses"] == 0
+    assert second_cache["lifetime"]["hits"] == 3
+    assert second_cache["lifetime"]["misses"] == 3
+    first_header = (
+        first_tree / "Source" / "GasPlusSample" / "Attributes" / "CombatAttributeSet.h"
+    ).read_text()
+    assert (output_root / "CombatAttributeSet.h").read_text() == first_header
+
+
+def test_cache_keys_use_project_relative_paths():
+    key = OutputCache.make_key("header", "abc", "Source/GasPlusSample/Attributes/A.h")
+    assert key == OutputCache.make_key(
+        "header", "abc", "Source\\GasPlusSample\\Attributes\\A.h".replace("\\", "/")
+    )
+    assert key != OutputCache.make_key("source", "abc", "Source/GasPlusSample/Attributes/A.h")
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path):
+    cache = OutputCache(tmp_path / "cache", max_bytes=10)
+    cache.put("aa01", "12345678")
+    cache.put("bb02", "abcdefgh")
+    old_entry = tmp_path / "cache" / "objects" / "aa" / "aa01"
+    os.utime(old_entry, (1, 1))
+
+    assert cache.evict() == 1
+    assert cache.get("aa01") is None
+    assert cache.get("bb02") == "abcdefgh"
+    assert cache.stats.evictions == 1
+
+
+def test_dry_run_hits_leave_cache_entries_untouched(tmp_path, capsys):
+    cache_dir = tmp_path / "cache"
+    _write_combat(tmp_path)
+    utils.run_generator(tmp_path, force=False, cache_dir=cache_dir, project_root=tmp_path)
+    for entry in (cache_dir / "objects").rglob("*"):
+        if entry.is_file():
+            os.utime(entry, (1, 1))
+    # Make the sidecar stale so the dry run renders through the cache.
+    for sidecar in tmp_path.rglob("*.generated.hash"):
+        sidecar.unlink()
+
+    capsys.readouterr()
+
+    utils.run_generator(
+        tmp_path, force=False, dry_run=True, cache_dir=cache_dir, project_root=tmp_path
+    )
+
+    assert "Output cache: 3 hits, 0 misses" in capsys.readouterr().out
+    entries = [entry for entry in (cache_dir / "objects").rglob("*") if entry.is_file()]
+    assert entries and all(entry.stat().st_mtime == 1 for entry in entries)
+
+
+def test_concurrent_finalize_keeps_every_runs_totals(tmp_path):
+    caches = [OutputCache(tmp_path / "cache") for _ in range(8)]
+    for cache in caches:
+        cache.stats.hits = 1
+
+    with ThreadPoolExecutor(max_workers=len(caches)) as pool:
+        list(pool.map(OutputCache.finalize, caches))
+
+    assert caches[0].load_totals()["hits"] == len(caches)
@@ -0,0 +1,85 @@
+import json
+
+from . import utils
+
+
+def _write_primary(tmp_path, **attribute_overrides):
+    attribute = {
+        "name": "Health",
+        "category": "Vitals",
+        "metadata": {
+            "Replicate": True,
+            "ClampMin": 0,
+            "ClampMax": 100,
+        },
+    }
+    attribute.update(attribute_overrides)
+    return utils.write_asset(tmp_path, "Primary", [attribute])
+
+
+def _mtimes(output_root):
+    return {
+        label: (output_root / f"PrimaryAttributeSet{suffix}").stat().st_mtime_ns
+        for label, suffix in (
+            ("header", ".h"),
+            ("source", ".cpp"),
+            ("generatedHeader", ".generated.h"),
+        )
+    }
+
+
+def test_category_edit_only_rewrites_header(tmp_path):
+    _write_primary(tmp_path)
+    output_root = utils.run_generator(tmp_path, force=False)
+    before = _mtimes(output_root)
+
+    _write_primary(tmp_path, category="Survival")
+    utils.run_generator(tmp_path, force=False)
+    after = _mtimes(output_root)
+
+    entry = utils.load_manifest(tmp_path)["entries"][0]
+    assert entry["status"]["outputs"] == {
+        "header": "update",
+        "source": "skip",
+        "generatedHeader": "skip",
+    }
+    assert after["source"] == before["source"]
+    assert after["generatedHeader"] == before["generatedHeader"]
+    assert 'Category="Survival"' in (output_root / "PrimaryAttributeSet.h").read_text()
+
+
+def test_clamp_edit_leaves_generated_header_untouched(tmp_path):
+    _write_primary(tmp_path)
+    output_root = utils.run_generator(tmp_path, force=False)
+    before = _mtimes(output_root)
+    first_hashes = utils.load_manifest(tmp_path)["entries"][0]["hashes"]["outputs"]
+
+    _write_primary(
+        tmp_path,
+        metadata={"Replicate": True, "ClampMin": 0, "ClampMax": 500},
+    )
+    utils.run_generator(tmp_path, force=False)
+    after = _mtimes(output_root)
+
+    entry = utils.load_manifest(tmp_path)["entries"][0]
+    assert entry["hashes"]["outputs"]["generatedHeader"] == first_hashes["generatedHeader"]
+    assert entry["hashes"]["outputs"]["source"] != first_hashes["source"]
+    assert entry["status"]["outputs"]["generatedHeader"] == "skip"
+    assert after["generatedHeader"] == before["generatedHeader"]
+    assert "FMath::Clamp(NewValue, 0.0, 500.0)" in (
+        output_root / "PrimaryAttributeSet.cpp"
+    ).read_text()
+
+
+def test_formatting_only_edit_skips_all_outputs(tmp_path):
+    asset_path = _write_primary(tmp_path)
+    output_root = utils.run_generator(tmp_path, force=False)
+    before = _mtimes(output_root)
+
+    asset_path.write_text(json.dumps(json.loads(asset_path.read_text())))
+    utils.run_generator(tmp_path, force=False)
+
+    entry = utils.load_manifest(tmp_path)["entries"][0]
+    assert entry["status"]["hashChanged"] is True
+    assert entry["status"]["write"] == "skip"
+    assert _mtimes(output_root) == before
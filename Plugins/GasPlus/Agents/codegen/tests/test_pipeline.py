@@ -0,0 +1,69 @@
+import asyncio
+import json
+import threading
+import time
+
+from Plugins.GasPlus.Agents.codegen.attribute_gen import pipeline
+
+from . import utils
+
+
+def test_map_ordered_bounds_concurrency_and_keeps_order():
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def work(item):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.002 * (10 - item))
+        with lock:
+            in_flight -= 1
+        return item * item
+
+    results = pipeline.map_ordered(work, range(10), limit=3)
+
+    assert results == [item * item for item in range(10)]
+    assert 1 < peak <= 3
+
+
+def test_map_ordered_runs_serially_inside_an_event_loop():
+    threads = set()
+
+    async def caller():
+        return pipeline.map_ordered(
+            lambda item: threads.add(threading.get_ident()) or item, range(4), limit=4
+        )
+
+    assert asyncio.run(caller()) == [0, 1, 2, 3]
+    assert threads == {threading.get_ident()}
+
+
+def _normalized(tree):
+    text = utils.manifest_path(tree).read_text().replace(str(tree), "<tree>")
+    manifest = json.loads(text)
+    manifest.pop("elapsedSeconds")
+    return manifest
+
+
+def test_concurrent_generation_matches_serial(tmp_path):
+    serial_tree = tmp_path / "serial"
+    concurrent_tree = tmp_path / "concurrent"
+    for tree in (serial_tree, concurrent_tree):
+        for index in range(12):
+            utils.write_asset(tree, f"Set{index:02d}", [{"name": f"Stat{index}"}])
+
+    utils.run_generator(serial_tree, io_concurrency=1)
+    utils.run_generator(concurrent_tree, io_concurrency=6)
+
+    assert _normalized(concurrent_tree) == _normalized(serial_tree)
+    assert [entry["className"] for entry in _normalized(serial_tree)["entries"]] == [
+        f"USet{index:02d}AttributeSet" for index in range(12)
+    ]
+    serial_log = utils.log_path(serial_tree).read_text().replace(str(serial_tree), "<tree>")
+    concurrent_log = utils.log_path(concurrent_tree).read_text().replace(
+        str(concurrent_tree), "<tree>"
+    )
+    assert concurrent_log == serial_log
@@ -0,0 +1,151 @@
+import json
+
+import pytest
+
+from Plugins.GasPlus.Agents.codegen.attribute_gen import GeneratorPlugin, generator
+from Plugins.GasPlus.Agents.codegen.attribute_gen.plugins import resolve_plugins
+
+from . import utils
+
+
+class CuePlugin(GeneratorPlugin):
+    name = "cue"
+    templates = {"header": ("render",)}
+
+    def __init__(self):
+        self.claimed = []
+
+    def claims(self, data):
+        self.claimed.append(data.get("name"))
+        return "cueTag" in data
+
+    def output_paths(self, asset, output_root):
+        return {"header": output_root / "Cues" / f"{asset.name}Cue.h"}
+
+    def render(self, label, asset):
+        return (
+            "#pragma once\n\n"
+            f"// Cue: {asset.data['cueTag']}\n"
+            f"// GASPLUS-PRESERVE BEGIN {asset.name}Cue.Members\n"
+            f"// GASPLUS-PRESERVE END {asset.name}Cue.Members\n"
+        )
+
+
+def _write_cue(tmp_path, name, tag):
+    path = tmp_path / "Content" / "Attributes" / f"{name}.json"
+    path.write_text(json.dumps({"name": name, "cueTag": tag}))
+    return path
+
+
+def test_plugins_share_the_discovery_walk_and_hash_store(tmp_path):
+    utils.write_asset(tmp_path, "Vitals", [{"name": "Health"}])
+    _write_cue(tmp_path, "Burn", "GameplayCue.Burn")
+    plugin = CuePlugin()
+    config = utils.make_config(tmp_path, force=False, plugins=[plugin])
+
+    assert generator.AttributeSetGenerator(config).run() == 0
+    cue_path = config.output_root / "Cues" / "BurnCue.h"
+    assert "GameplayCue.Burn" in cue_path.read_text()
+    assert sorted(plugin.claimed) == ["Burn", "Vitals"]
+    manifest = utils.load_manifest(tmp_path)
+    cue_entry = next(entry for entry in manifest["entries"] if entry.get("generator") == "cue")
+    assert cue_entry["name"] == "Burn"
+    assert (config.manifest_path.parent / "Burn.cue.generated.hash").exists()
+    assert "cue.header" in manifest["templateFingerprints"]
+
+    edited = cue_path.read_text().replace("// GASPLUS-PRESERVE END", "int32 Stacks;\n// GASPLUS-PRESERVE END")
+    cue_path.write_text(edited)
+    generator.AttributeSetGenerator(config).run()
+    metrics = json.loads((config.manifest_path.parent / "metrics.json").read_text())
+    assert metrics["counters"]["hash_hits"] == 2
+    assert metrics["counters"]["renders_performed"] == 0
+
+    _write_cue(tmp_path, "Burn", "GameplayCue.Burn.Strong")
+    generator.AttributeSetGenerator(config).run()
+    text = cue_path.read_text()
+    assert "GameplayCue.Burn.Strong" in text
+    assert "int32 Stacks;" in text
+
+
+def test_check_and_orphans_cover_plugin_outputs(tmp_path):
+    utils.write_asset(tmp_path, "Vitals", [{"name": "Health"}])
+    cue_source = _write_cue(tmp_path, "Burn", "GameplayCue.Burn")
+    config = utils.make_config(tmp_path, force=False, plugins=[CuePlugin()])
+    generator.AttributeSetGenerator(config).run()
+    check_config = utils.make_config(tmp_path, check="all", plugins=[CuePlugin()])
+    assert generator.AttributeSetGenerator(check_config).check() == 0
+
+    _write_cue(tmp_path, "Burn", "GameplayCue.Frost")
+    assert generator.AttributeSetGenerator(check_config).check() == generator.EXIT_STALE
+
+    cue_source.unlink()
+    prune_config = utils.make_config(tmp_path, force=False, prune=True, plugins=[CuePlugin()])
+    generator.AttributeSetGenerator(prune_config).run()
+    assert not (config.output_root / "Cues" / "BurnCue.h").exists()
+    assert (config.output_root / "VitalsAttributeSet.h").exists()
+
+
+def test_plugin_selection_errors():
+    with pytest.raises(ValueError, match="reserved"):
+        resolve_plugins([type("Shadow", (CuePlugin,), {"name": "attributeSet"})()])
+    with pytest.raises(ValueError, match="selected twice"):
+        resolve_plugins([CuePlugin(), CuePlugin()])
+    with pytest.raises(ValueError, match="Unknown generator plugin"):
+        resolve_plugins(["effects"])
+    spec = f"{__name__}:CuePlugin"
+    assert list(resolve_plugins([spec])) == ["cue"]
+
+
+def _write_tags(tmp_path, name, tags):
+    path = tmp_path / "Content" / "Attributes" / f"{name}.json"
+    path.write_text(json.dumps({"name": name, "gameplayTags": tags}))
+    return path
+
+
+def test_builtin_gameplay_tags_plugin(tmp_path):
+    utils.write_asset(tmp_path, "Vitals", [{"name": "Health"}])
+    _write_tags(
+        tmp_path,
+        "Combat",
+        ["Ability.Attack", {"tag": "State.Stunned", "comment": 'Cannot act "at all"'}],
+    )
+    config = utils.make_config(tmp_path, force=False, plugins=["gameplayTags"])
+
+    assert generator.AttributeSetGenerator(config).run() == 0
+    tags_root = config.output_root / "Tags"
+    header = (tags_root / "CombatGameplayTags.h").read_text()
+    source = (tags_root / "CombatGameplayTags.cpp").read_text()
+    assert "namespace CombatTags" in header
+    assert "GASPLUSSAMPLE_API UE_DECLARE_GAMEPLAY_TAG_EXTERN(Ability_Attack);" in header
+    assert "UE_DEFINE_GAMEPLAY_TAG_COMMENT(State_Stunned, \"State.Stunned\", " in source
+    assert 'Cannot act \\"at all\\"' in source
+    manifest = utils.load_manifest(tmp_path)
+    assert {"gameplayTags.header", "gameplayTags.source"} <= set(manifest["templateFingerprints"])
+    assert (config.output_root / "VitalsAttributeSet.h").exists()
+
+    check_config = utils.make_config(tmp_path, check="all", plugins=["gameplayTags"])
+    assert generator.AttributeSetGenerator(check_config).check() == 0
+
+
+def test_gameplay_tags_reject_invalid_and_colliding_tags(tmp_path):
+    plugin = resolve_plugins(["gameplayTags"])["gameplayTags"]
+    source = tmp_path / "Combat.json"
+
+    with pytest.raises(ValueError, match="not a valid gameplay tag"):
+        plugin.parse({"name": "Combat", "gameplayTags": ["Ability..Attack"]}, source)
+    with pytest.raises(ValueError, match="both map to Ability_Attack"):
+        plugin.parse(
+            {"name": "Combat", "gameplayTags": ["Ability.Attack", "Ability_Attack"]}, source
+        )
+
+
+def test_plugin_contract_is_abstract():
+    class Incomplete(GeneratorPlugin):
+        name = "incomplete"
+        templates = {"header": ("render",)}
+
+        def claims(self, data):
+            return False
+
+    with pytest.raises(TypeError, match="abstract"):
+        Incomplete()
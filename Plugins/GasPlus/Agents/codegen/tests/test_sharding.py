@@ -0,0 +1,161 @@
+import dataclasses
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from Plugins.GasPlus.Agents.codegen.attribute_gen import generator
+from Plugins.GasPlus.Agents.codegen.attribute_gen.locking import FileLock
+from Plugins.GasPlus.Agents.codegen.attribute_gen.sharding import (
+    merge_manifests_main,
+    parse_shard_spec,
+    shard_for,
+)
+
+from . import utils
+
+REPO_ROOT = Path(__file__).resolve().parents[5]
+SET_NAMES = ["Alpha", "Bravo", "Charlie", "Delta", "Echo", "Foxtrot"]
+
+
+def _write_sets(tree):
+    for index, name in enumerate(SET_NAMES):
+        utils.write_asset(
+            tree,
+            name,
+            [
+                {
+                    "name": f"Stat{index}",
+                    "metadata": {
+                        "Replicate": index % 2 == 0,
+                        "ClampMin": 0,
+                        "ClampMax": 10 * (index + 1),
+                    },
+                }
+            ],
+        )
+
+
+def _cli(tree, *extra):
+    command = [
+        sys.executable,
+        "-m",
+        "Plugins.GasPlus.Agents.codegen.attribute_gen",
+        *extra,
+    ]
+    if not extra or extra[0] != "merge-manifests":
+        command += [
+            "--input",
+            str(tree / "Content" / "Attributes"),
+            "--output",
+            str(tree / "Source" / "GasPlusSample" / "Attributes"),
+            "--project-root",
+            str(tree),
+        ]
+    command += [
+        "--manifest",
+        str(utils.manifest_path(tree)),
+        "--log",
+        str(utils.log_path(tree)),
+    ]
+    return subprocess.run(
+        command, cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+
+
+def _normalized_manifest(tree):
+    manifest = json.loads(utils.manifest_path(tree).read_text().replace(str(tree), "<tree>"))
+    manifest.pop("elapsedSeconds")
+    return manifest
+
+
+def test_parse_shard_spec_is_one_based():
+    assert parse_shard_spec("2/4") == (2, 4)
+    for spec in ("0/4", "5/4", "1-4"):
+        try:
+            parse_shard_spec(spec)
+        except ValueError:
+            continue
+        raise AssertionError(f"{spec} should be rejected")
+
+
+def test_shard_assignment_is_stable_and_total():
+    keys = [f"Content/Attributes/{name}.json" for name in SET_NAMES]
+    owners = [shard_for(key, 3) for key in keys]
+    assert owners == [shard_for(key, 3) for key in keys]
+    assert all(1 <= owner <= 3 for owner in owners)
+
+
+def test_merged_shards_match_single_node_run(tmp_path):
+    single_tree = tmp_path / "single"
+    sharded_tree = tmp_path / "sharded"
+    _write_sets(single_tree)
+    _write_sets(sharded_tree)
+
+    _cli(single_tree)
+    for index in (1, 2, 3):
+        _cli(sharded_tree, "--shard", f"{index}/3")
+    assert not utils.manifest_path(sharded_tree).exists()
+    _cli(sharded_tree, "merge-manifests")
+
+    assert _normalized_manifest(sharded_tree) == _normalized_manifest(single_tree)
+    single_log = utils.log_path(single_tree).read_text().replace(str(single_tree), "<tree>")
+    sharded_log = utils.log_path(sharded_tree).read_text().replace(str(sharded_tree), "<tree>")
+    assert sharded_log == single_log
+    assert not list(utils.manifest_path(sharded_tree).parent.glob("manifest.shard-*"))
+    catalog_name = "attributes.catalog"
+    sharded_catalog = utils.manifest_path(sharded_tree).parent / catalog_name
+    single_catalog = utils.manifest_path(single_tree).parent / catalog_name
+    assert sharded_catalog.read_bytes() == single_catalog.read_bytes()
+    assert not list(sharded_catalog.parent.glob("attributes.shard-*"))
+    single_metrics = json.loads((single_catalog.parent / "metrics.json").read_text())["counters"]
+    sharded_metrics = json.loads((sharded_catalog.parent / "metrics.json").read_text())["counters"]
+    for name in ("assets_discovered", "hash_misses", "renders_performed", "files_rewritten"):
+        assert sharded_metrics[name] == single_metrics[name]
+    assert not list(sharded_catalog.parent.glob("metrics.shard-*"))
+
+
+def test_duplicates_split_across_shards_are_rejected(tmp_path):
+    _write_sets(tmp_path)
+    config = utils.make_config(tmp_path, force=False, project_root=tmp_path, shard_count=2)
+    merge_args = ["--manifest", str(config.manifest_path), "--log", str(config.log_path)]
+    for index in (1, 2):
+        generator.AttributeSetGenerator(dataclasses.replace(config, shard_index=index)).run()
+    merge_manifests_main(merge_args, "", "")
+    previous = utils.load_manifest(tmp_path)
+
+    # A second input that reuses a set's name and class, owned by the other shard.
+    owners = {
+        name: shard_for(f"Content/Attributes/{name}.json", 2) for name in SET_NAMES + ["Zulu"]
+    }
+    twin = next(name for name in SET_NAMES if owners[name] != owners["Zulu"])
+    payload = json.loads((tmp_path / "Content" / "Attributes" / f"{twin}.json").read_text())
+    (tmp_path / "Content" / "Attributes" / "Zulu.json").write_text(json.dumps(payload))
+    for index in (1, 2):
+        shard = dataclasses.replace(config, shard_index=index)
+        assert generator.AttributeSetGenerator(shard).run() == generator.EXIT_INVALID
+    merge_manifests_main(merge_args, "", "")
+
+    manifest = utils.load_manifest(tmp_path)
+    codes = [issue["code"] for issue in manifest["validation"]["issues"]]
+    assert codes == ["duplicate-class", "duplicate-file"]
+    assert manifest["validation"]["errors"] == 2
+    assert manifest["entries"] == previous["entries"]
+
+
+def test_merge_takes_the_run_lock(tmp_path):
+    _write_sets(tmp_path)
+    config = utils.make_config(tmp_path, project_root=tmp_path, shard_count=2)
+    for index in (1, 2):
+        generator.AttributeSetGenerator(dataclasses.replace(config, shard_index=index)).run()
+    merge_args = ["--manifest", str(config.manifest_path), "--log", str(config.log_path)]
+
+    with FileLock(config.manifest_path.with_name(".manifest.lock")):
+        with pytest.raises(SystemExit):
+            merge_manifests_main(merge_args + ["--lock-timeout", "0.1"], "", "")
+    assert not config.manifest_path.exists()
+
+    merge_manifests_main(merge_args, "", "")
+    assert len(utils.load_manifest(tmp_path)["entries"]) == len(SET_NAMES)
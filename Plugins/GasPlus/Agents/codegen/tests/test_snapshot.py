@@ -0,0 +1,85 @@
+import shutil
+import subprocess
+
+import pytest
+
+from . import utils
+
+_ATTRIBUTES = [
+    {"name": "Health", "metadata": {"ClampMin": 0, "ClampMax": 100}},
+    {"name": "Mana", "metadata": {"Replicate": False}},
+    {"name": "Stamina", "metadata": {"GenerateHooks": False}},
+]
+
+
+def test_snapshot_layout_follows_attribute_order(tmp_path):
+    utils.write_asset(tmp_path, "Vitals", _ATTRIBUTES)
+    output_root = utils.run_generator(tmp_path)
+    header = (output_root / "VitalsAttributeSet.h").read_text()
+    source = (output_root / "VitalsAttributeSet.cpp").read_text()
+
+    assert "struct FVitalsAttributeSetSnapshot\n" in header
+    assert "static constexpr int32 NumAttributes = 3;" in header
+    assert header.index("struct FVitalsAttributeSetSnapshot") < header.index("UCLASS()")
+    assert "void CaptureSnapshot(FSnapshot& OutSnapshot) const;" in header
+    for index, attribute in enumerate(_ATTRIBUTES):
+        name = attribute["name"]
+        assert f"OutSnapshot.BaseValues[{index}] = {name}.GetBaseValue();" in source
+        assert f"{name}.SetCurrentValue(Snapshot.CurrentValues[{index}]);" in source
+    field_table = source[source.index("SnapshotFields[") :]
+    assert field_table.index("&UVitalsAttributeSet::Health") < field_table.index(
+        "&UVitalsAttributeSet::Mana"
+    ) < field_table.index("&UVitalsAttributeSet::Stamina")
+
+
+@pytest.mark.skipif(shutil.which("g++") is None, reason="g++ compiler is required")
+def test_snapshot_round_trips_values(tmp_path):
+    utils.write_asset(tmp_path, "Vitals", _ATTRIBUTES)
+    output_root = utils.run_generator(tmp_path)
+    stub_root = utils.write_compile_stubs(tmp_path / "stubs", ["Vitals"])
+    test_cpp = tmp_path / "test.cpp"
+    test_cpp.write_text(
+        '#include "VitalsAttributeSet.h"\n'
+        '#include "VitalsAttributeSet.cpp"\n'
+        "#include <cstring>\n\n"
+        "int main()\n"
+        "{\n"
+        "    UVitalsAttributeSet Set;\n"
+        "    for (int32 Index = 0; Index < UVitalsAttributeSet::SnapshotFieldCount; ++Index)\n"
+        "    {\n"
+        "        (Set.*UVitalsAttributeSet::SnapshotFields[Index]).SetBaseValue(10.0f * Index);\n"
+        "        (Set.*UVitalsAttributeSet::SnapshotFields[Index]).SetCurrentValue(10.0f * Index + 1.0f);\n"
+        "    }\n"
+        "    UVitalsAttributeSet::FSnapshot Before;\n"
+        "    Set.CaptureSnapshot(Before);\n"
+        "    if (Before.BaseValues[2] != 20.0f || Before.CurrentValues[1] != 11.0f) return 1;\n"
+        '    if (std::strcmp(UVitalsAttributeSet::SnapshotFieldNames[1], "Mana") != 0) return 2;\n\n'
+        "    Set.Mana.SetCurrentValue(-5.0f);\n"
+        "    UVitalsAttributeSet::FSnapshot After;\n"
+        "    Set.CaptureSnapshot(After);\n"
+        "    if (std::memcmp(&Before, &After, sizeof(Before)) == 0) return 3;\n\n"
+        "    Set.RestoreSnapshot(Before);\n"
+        "    Set.CaptureSnapshot(After);\n"
+        "    return std::memcmp(&Before, &After, sizeof(Before)) == 0 ? 0 : 4;\n"
+        "}\n"
+    )
+    binary = tmp_path / "snapshot"
+
+    build = subprocess.run(
+        [
+            "g++",
+            "-std=c++17",
+            "-Wall",
+            "-Werror",
+            str(test_cpp),
+            "-o",
+            str(binary),
+            f"-I{stub_root}",
+            f"-I{output_root}",
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert build.returncode == 0, build.stderr
+    assert subprocess.run([str(binary)], check=False).returncode == 0
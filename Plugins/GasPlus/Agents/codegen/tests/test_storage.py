@@ -0,0 +1,96 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from Plugins.GasPlus.Agents.codegen.attribute_gen import generator
+from Plugins.GasPlus.Agents.codegen.attribute_gen.storage import (
+    DiskStorage,
+    MemoryStorage,
+    OverlayStorage,
+    Storage,
+)
+
+from . import utils
+
+
+def test_memory_storage_runs_without_touching_disk(tmp_path, capsys):
+    config = utils.make_config(tmp_path, force=False)
+    input_path = config.input_roots[0] / "Vitals.json"
+    storage = MemoryStorage(
+        {input_path: json.dumps({"name": "Vitals", "attributes": [{"name": "Health"}]})}
+    )
+
+    assert generator.AttributeSetGenerator(config, storage=storage).run() == 0
+    assert list(tmp_path.iterdir()) == []
+    header = storage.read_text(config.output_root / "VitalsAttributeSet.h")
+    assert "FGameplayAttributeData Health;" in header
+    manifest = json.loads(storage.read_text(config.manifest_path))
+    assert manifest["entries"][0]["className"] == "UVitalsAttributeSet"
+    assert "index" not in manifest
+    capsys.readouterr()
+
+    # The hash state lives in memory too, so a second pass is a no-op.
+    assert generator.AttributeSetGenerator(config, storage=storage).run() == 0
+    assert "[CACHED] UVitalsAttributeSet" in capsys.readouterr().out
+
+
+def test_dry_run_previews_changes_in_overlay(tmp_path):
+    utils.write_asset(tmp_path, "Vitals", [{"name": "Health"}])
+    config = utils.make_config(tmp_path, force=False)
+    generator.AttributeSetGenerator(config).run()
+    header_path = config.output_root / "VitalsAttributeSet.h"
+    header_before = header_path.read_text()
+    manifest_before = config.manifest_path.read_text()
+
+    utils.write_asset(tmp_path, "Vitals", [{"name": "Health"}, {"name": "Mana"}])
+    preview = generator.AttributeSetGenerator(utils.make_config(tmp_path, force=False, dry_run=True))
+    preview.run()
+
+    assert header_path.read_text() == header_before
+    assert config.manifest_path.read_text() == manifest_before
+    changes = preview.storage.changes
+    assert b"FGameplayAttributeData Mana;" in changes[header_path.resolve()]
+    assert config.manifest_path.resolve() in changes
+
+
+def test_overlay_reads_through_and_hides_deletions(tmp_path):
+    existing = tmp_path / "Existing.txt"
+    existing.write_text("on disk")
+    overlay = OverlayStorage(DiskStorage())
+
+    overlay.write_text(tmp_path / "New.txt", "in memory")
+    assert overlay.read_text(existing) == "on disk"
+    assert sorted(path.name for path in overlay.iter_files(tmp_path)) == ["Existing.txt", "New.txt"]
+
+    overlay.unlink(existing)
+    assert not overlay.exists(existing)
+    assert existing.read_text() == "on disk"
+    assert not (tmp_path / "New.txt").exists()
+
+
+def test_incomplete_backend_fails_when_created():
+    class ReadOnlyStorage(Storage):
+        def read_bytes(self, path):
+            return b""
+
+    with pytest.raises(TypeError, match="write_bytes"):
+        ReadOnlyStorage()
+
+
+def test_disk_write_text_replaces_atomically(tmp_path, monkeypatch):
+    target = tmp_path / "Nested" / "Out.h"
+    replaced = []
+    original_replace = os.replace
+
+    def record_replace(source, destination):
+        replaced.append(Path(destination))
+        original_replace(source, destination)
+
+    monkeypatch.setattr(os, "replace", record_replace)
+    DiskStorage().write_text(target, "// generated\n")
+
+    assert replaced == [target]
+    assert target.read_text() == "// generated\n"
+    assert [path.name for path in target.parent.iterdir()] == ["Out.h"]
@@ -125,7 +125,7 @@ def test_preserve_regions_retained_after_regeneration(tmp_path):
     assert "UE_LOG(LogTemp, Verbose, TEXT(\"Preserved Hook\"));" in source_after
 
 
-def test_meta_attribute_registry_include_emitted(tmp_path):
+def test_meta_attribute_recorded_without_registry_include(tmp_path):
     utils.write_asset(
         tmp_path,
         "MetaAttr",
@@ -142,7 +142,7 @@ def test_meta_attribute_registry_include_emitted(tmp_path):
     output_root = utils.run_generator(tmp_path)
 
     header = (output_root / "MetaAttrAttributeSet.h").read_text()
-    assert "#include \"GasPlusMetaAttributeRegistry.h\"" in header
+    assert "#include \"GasPlusMetaAttributeRegistry.h\"" not in header
     assert "MetaAttribute=OutgoingDamage" in header
 
     manifest = utils.load_manifest(tmp_path)
@@ -0,0 +1,107 @@
+from Plugins.GasPlus.Agents.codegen.attribute_gen import (
+    AttributeSetGenerator,
+    GameplayTagsPlugin,
+    generator,
+)
+
+from . import utils
+
+
+class _RestyledGenerator(AttributeSetGenerator):
+    def _render_generated_header(self, asset):
+        return f"#pragma once\n\n// Restyled stub for {asset.class_name}.\n"
+
+
+def test_renderer_edit_invalidates_only_its_output(tmp_path, monkeypatch):
+    utils.write_asset(
+        tmp_path,
+        "Styled",
+        [
+            {
+                "name": "Health",
+                "metadata": {
+                    "Replicate": True,
+                },
+            }
+        ],
+    )
+    output_root = utils.run_generator(tmp_path, force=False)
+    first = utils.load_manifest(tmp_path)
+
+    monkeypatch.setattr(utils, "AttributeSetGenerator", _RestyledGenerator)
+    utils.run_generator(tmp_path, force=False)
+    second = utils.load_manifest(tmp_path)
+
+    fingerprints_before = first["templateFingerprints"]
+    fingerprints_after = second["templateFingerprints"]
+    assert fingerprints_after["generatedHeader"] != fingerprints_before["generatedHeader"]
+    assert fingerprints_after["header"] == fingerprints_before["header"]
+    assert fingerprints_after["source"] == fingerprints_before["source"]
+
+    assert second["entries"][0]["status"]["outputs"] == {
+        "header": "skip",
+        "source": "skip",
+        "generatedHeader": "update",
+    }
+    assert "Restyled stub" in (output_root / "StyledAttributeSet.generated.h").read_text()
+
+
+def test_template_fingerprints_are_stable_between_runs(tmp_path):
+    utils.write_asset(
+        tmp_path,
+        "Stable",
+        [
+            {
+                "name": "Mana",
+                "metadata": {
+                    "Replicate": False,
+                },
+            }
+        ],
+    )
+    utils.run_generator(tmp_path, force=False)
+    utils.run_generator(tmp_path, force=False)
+
+    manifest = utils.load_manifest(tmp_path)
+    assert set(manifest["templateFingerprints"]) == {
+        "header",
+        "source",
+        "generatedHeader",
+        "metaRegistry",
+    }
+    assert manifest["entries"][0]["status"]["write"] == "skip"
+
+
+class _RecommentedGenerator(AttributeSetGenerator):
+    @staticmethod
+    def _metadata_comment(metadata):
+        return "restyled"
+
+
+def test_fingerprints_follow_renderer_helpers():
+    header = generator._renderer_closure(AttributeSetGenerator, ("_render_header",))
+    assert "generator.AttributeSetAsset.file_basename" in header
+    assert "generator.AttributeSetGenerator._metadata_comment" in header
+    assert "template:AttributeSet.h:property" in header
+
+    tags = generator._renderer_closure(GameplayTagsPlugin, ("render",))
+    assert "gameplay_tags.GameplayTagsPlugin.tags" in tags
+    assert "gameplay_tags._string_literal" in tags
+    assert "plugins.PluginAsset.source_label" in tags
+    assert "template:GameplayTags.h:declaration" in tags
+
+
+def test_helper_edit_invalidates_the_outputs_that_call_it():
+    def fingerprints(owner):
+        return {
+            kind: generator._template_fingerprint(owner, kind)
+            for kind in generator.TEMPLATE_RENDERERS
+        }
+
+    before = fingerprints(AttributeSetGenerator)
+    after = fingerprints(_RecommentedGenerator)
+
+    assert after["header"] != before["header"]
+    assert after["source"] != before["source"]
+    assert after["generatedHeader"] == before["generatedHeader"]
+    assert after["metaRegistry"] == before["metaRegistry"]
@@ -0,0 +1,67 @@
+import pytest
+
+from Plugins.GasPlus.Agents.codegen.attribute_gen import AttributeSetGenerator, generator
+from Plugins.GasPlus.Agents.codegen.attribute_gen.benchmark import (
+    BaselineGenerator,
+    measure_render_throughput,
+    synthetic_assets,
+    without_lookup_tables,
+)
+from Plugins.GasPlus.Agents.codegen.attribute_gen.templates import Template
+
+
+def test_template_compiles_static_chunks_and_slots():
+    template = Template('{{Name}} {\n    TEXT("{x}\\n"); // \'{{Name}}\'\n}{{Tail}}', "sample")
+
+    assert template.slots == {"Name", "Tail"}
+    assert template.chunks[0] == ("Name",)
+    assert template.render(Name="Foo", Tail="") == 'Foo {\n    TEXT("{x}\\n"); // \'Foo\'\n}'
+    assert Template("static only").render() == "static only"
+    with pytest.raises(TypeError):
+        template.render(Name="Foo")
+    with pytest.raises(ValueError, match="keywords"):
+        Template("{{class}}")
+
+
+def test_template_text_is_part_of_the_fingerprint():
+    def fingerprint(text):
+        return generator._template_fingerprint(AttributeSetGenerator, "probe", (Template(text, "t"),))
+
+    assert fingerprint("// v1\n") == fingerprint("// v1\n")
+    assert fingerprint("// v1\n") != fingerprint("// v2\n")
+    source = generator.ATTRIBUTE_SET_SOURCE.source
+    closure = generator._renderer_closure(AttributeSetGenerator, ("_render_source",))
+    assert closure["template:AttributeSet.cpp"] == source.encode("utf-8")
+
+
+def test_benchmark_reports_throughput():
+    result = measure_render_throughput(synthetic_assets(2, 5), repeat=1)
+
+    assert result["attributes"] == 10
+    assert result["attributesPerSecond"] > 0
+    assert result["metaRegistrySeconds"] >= 0
+    assert result["baselineSeconds"] > 0
+    assert result["speedup"] == result["baselineSeconds"] / result["lookupFreeSeconds"]
+
+
+def test_baseline_matches_compiled_output_without_lookup_tables():
+    config = generator.GeneratorConfig(dry_run=True)
+    compiled = AttributeSetGenerator(config)
+    baseline = BaselineGenerator(config)
+    asset = synthetic_assets(2, 9)[1]
+
+    with without_lookup_tables():
+        assert compiled._render_header(asset) == baseline._render_header(asset)
+        assert compiled._render_source(asset) == baseline._render_source(asset)
+    assert "FindAttributeIndex" not in baseline._render_source(asset)
+    assert "FindAttributeIndex" in compiled._render_source(asset)
+    assert compiled._render_meta_registry_source() == baseline._render_meta_registry_source()
+
+
+def test_without_lookup_tables_is_restored():
+    header = generator.ATTRIBUTE_SET_HEADER
+    lookup = AttributeSetGenerator._render_lookup_source
+    with without_lookup_tables():
+        assert generator.ATTRIBUTE_SET_HEADER is not header
+    assert generator.ATTRIBUTE_SET_HEADER is header
+    assert AttributeSetGenerator._render_lookup_source is lookup
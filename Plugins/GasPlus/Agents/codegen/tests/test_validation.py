@@ -0,0 +1,135 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from Plugins.GasPlus.Agents.codegen.attribute_gen import ManifestJournal, generator
+
+from . import utils
+
+
+def _issue_codes(tmp_path):
+    validation = utils.load_manifest(tmp_path)["validation"]
+    return sorted(issue["code"] for issue in validation["issues"])
+
+
+def test_clean_assets_report_no_issues(tmp_path):
+    utils.write_asset(tmp_path, "Clean", [{"name": "Health", "metadata": {"MetaAttribute": "Damage"}}])
+
+    output_root = utils.run_generator(tmp_path)
+
+    validation = utils.load_manifest(tmp_path)["validation"]
+    assert validation == {"errors": 0, "warnings": 0, "issues": []}
+    assert (output_root / "CleanAttributeSet.h").exists()
+
+
+def test_errors_are_recorded_and_block_generation(tmp_path):
+    utils.write_asset(
+        tmp_path,
+        "Broken",
+        [
+            {"name": "Health", "metadata": {"ClampMin": 10, "ClampMax": 1}},
+            {"name": "Health"},
+            {"name": "class"},
+        ],
+    )
+    other_root = tmp_path / "Content" / "Extra"
+    other_root.mkdir(parents=True)
+    (other_root / "Broken.json").write_text(
+        json.dumps({"name": "Broken", "attributes": [{"name": "Mana"}]})
+    )
+
+    config = utils.make_config(
+        tmp_path, input_roots=[tmp_path / "Content" / "Attributes", other_root]
+    )
+    assert generator.AttributeSetGenerator(config).run() == generator.EXIT_INVALID
+
+    assert _issue_codes(tmp_path) == [
+        "clamp-range",
+        "duplicate-attribute",
+        "duplicate-class",
+        "duplicate-file",
+        "invalid-identifier",
+    ]
+    assert utils.load_manifest(tmp_path)["entries"] == []
+    assert not (config.output_root / "BrokenAttributeSet.h").exists()
+
+
+def test_attribute_names_differing_only_in_case_are_duplicates(tmp_path):
+    utils.write_asset(tmp_path, "Vitals", [{"name": "Health"}, {"name": "health"}])
+
+    config = utils.make_config(tmp_path)
+    assert generator.AttributeSetGenerator(config).run() == generator.EXIT_INVALID
+
+    issues = utils.load_manifest(tmp_path)["validation"]["issues"]
+    assert [issue["code"] for issue in issues] == ["duplicate-attribute"]
+    assert "Health and health" in issues[0]["message"]
+    assert not (config.output_root / "VitalsAttributeSet.h").exists()
+
+
+def test_invalid_run_keeps_previous_entries_log_and_journal(tmp_path):
+    utils.write_asset(tmp_path, "Vitals", [{"name": "Health"}])
+    utils.write_asset(tmp_path, "Combat", [{"name": "Power"}])
+    config = utils.make_config(tmp_path, force=False)
+    assert generator.AttributeSetGenerator(config).run() == 0
+    previous = utils.load_manifest(tmp_path)
+    log_text = (tmp_path / utils.LOG_RELATIVE).read_text()
+
+    utils.write_asset(tmp_path, "Vitals", [{"name": "Health"}, {"name": "Health"}])
+    assert generator.AttributeSetGenerator(config).run() == generator.EXIT_INVALID
+
+    manifest = utils.load_manifest(tmp_path)
+    assert manifest["entries"] == previous["entries"]
+    assert manifest["journal"] == previous["journal"]
+    assert _issue_codes(tmp_path) == ["duplicate-attribute"]
+    assert (tmp_path / utils.LOG_RELATIVE).read_text() == log_text
+    assert ManifestJournal.for_manifest(config.manifest_path).latest_run == 1
+
+    utils.write_asset(tmp_path, "Vitals", [{"name": "Health"}, {"name": "Mana"}])
+    assert generator.AttributeSetGenerator(config).run() == 0
+    statuses = {
+        Path(entry["input"]).stem: entry["status"]["write"]
+        for entry in utils.load_manifest(tmp_path)["entries"]
+    }
+    assert statuses["Combat"] == "skip"
+    assert statuses["Vitals"] != "skip"
+
+
+def test_dangling_meta_attribute_is_a_warning(tmp_path):
+    utils.write_asset(
+        tmp_path,
+        "Combat",
+        [
+            {"name": "Power", "metadata": {"MetaAttribute": "Missing"}},
+            {"name": "Armor", "metadata": {"MetaAttribute": "Power"}},
+        ],
+    )
+
+    output_root = utils.run_generator(tmp_path)
+
+    validation = utils.load_manifest(tmp_path)["validation"]
+    assert validation["errors"] == 0
+    assert validation["warnings"] == 1
+    assert "Missing" in validation["issues"][0]["message"]
+    assert (output_root / "CombatAttributeSet.h").exists()
+
+
+def test_cli_exits_non_zero_on_errors(tmp_path):
+    utils.write_asset(tmp_path, "Bad", [{"name": "1Health"}])
+    content_root = tmp_path / "Content" / "Attributes"
+
+    with pytest.raises(SystemExit) as excinfo:
+        generator.main(
+            [
+                "--input",
+                str(content_root),
+                "--output",
+                str(tmp_path / "Source"),
+                "--manifest",
+                str(tmp_path / utils.MANIFEST_RELATIVE),
+                "--log",
+                str(tmp_path / utils.LOG_RELATIVE),
+            ]
+        )
+
+    assert excinfo.value.code == generator.EXIT_INVALID
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import dataclasses
 import json
 import re
 from pathlib import Path
@@ -31,20 +32,22 @@ def write_asset(tmp_path: Path, name: str, attributes: Sequence[Mapping[str, obj
     return asset_path
 
 
-def run_generator(tmp_path: Path):
-    output_root = tmp_path / "Source" / "GasPlusSample" / "Attributes"
-    manifest_path = tmp_path / MANIFEST_RELATIVE
-    log_path = tmp_path / LOG_RELATIVE
+def make_config(tmp_path: Path, **overrides) -> GeneratorConfig:
     config = GeneratorConfig(
         input_roots=[tmp_path / "Content" / "Attributes"],
-        output_root=output_root,
-        manifest_path=manifest_path,
-        log_path=log_path,
+        output_root=tmp_path / "Source" / "GasPlusSample" / "Attributes",
+        manifest_path=tmp_path / MANIFEST_RELATIVE,
+        log_path=tmp_path / LOG_RELATIVE,
         force=True,
     )
+    return dataclasses.replace(config, **overrides)
+
+
+def run_generator(tmp_path: Path, **overrides):
+    config = make_config(tmp_path, **overrides)
     generator = AttributeSetGenerator(config)
     generator.run()
-    return output_root
+    return config.output_root
 
 
 def extract_property_spec(header: str, attribute_name: str) -> str:
@@ -65,3 +68,80 @@ def log_path(tmp_path: Path) -> Path:
 
 def load_manifest(tmp_path: Path) -> Mapping[str, object]:
     return json.loads(manifest_path(tmp_path).read_text())
+
+
+def write_compile_stubs(stub_include_root: Path, set_names: Sequence[str]) -> Path:
+    """Minimal Unreal headers that let g++ syntax-check generated sets."""
+    (stub_include_root / "Net").mkdir(parents=True, exist_ok=True)
+
+    (stub_include_root / "CoreMinimal.h").write_text(
+        """#pragma once\n\n#include <cfloat>\n#include <cctype>\n#include <algorithm>\n\n#define GASPLUSSAMPLE_API\n#define UCLASS(...)\n#define UFUNCTION(...)\n#define UPROPERTY(...)\n#define GENERATED_BODY() using Super = UAttributeSet; public: static UClass* StaticClass() { return nullptr; }\n#define UE_UNUSED(Expr) (void)(Expr)\n#define TEXT(Value) Value\n#define check(Expr) ((void)0)\n\nusing int32 = int;\nusing uint32 = unsigned int;\nusing TCHAR = char;\n\nenum { INDEX_NONE = -1 };\n\nclass UClass;\n\nstruct FName {\n    FName(const TCHAR* InValue = \"\") : Value(InValue) {}\n    const TCHAR* Value;\n};\n\nstruct FCString {\n    static int32 Stricmp(const TCHAR* Lhs, const TCHAR* Rhs) {\n        for (; *Lhs && std::tolower(*Lhs) == std::tolower(*Rhs); ++Lhs, ++Rhs) {}\n        return std::tolower(*Lhs) - std::tolower(*Rhs);\n    }\n};\n"""
+    )
+    attribute_stub = (
+        "#pragma once\n\n"
+        "#include <map>\n"
+        "#include <string>\n"
+        "#include <vector>\n\n"
+        "using FLifetimeProperty = int;\n"
+        "template <typename T>\n"
+        "class TArray : public std::vector<T> {\n"
+        "public:\n"
+        "    using std::vector<T>::vector;\n"
+        "};\n\n"
+        "struct FGameplayAttributeData {\n"
+        "    float BaseValue = 0.0f;\n"
+        "    float CurrentValue = 0.0f;\n"
+        "    float GetBaseValue() const { return BaseValue; }\n"
+        "    void SetBaseValue(float Value) { BaseValue = Value; }\n"
+        "    float GetCurrentValue() const { return CurrentValue; }\n"
+        "    void SetCurrentValue(float Value) { CurrentValue = Value; }\n"
+        "};\n\n"
+        "struct FProperty {\n"
+        "    std::string Name;\n"
+        "};\n\n"
+        "template <typename T>\n"
+        "T* FindFieldChecked(const UClass*, FName Name) {\n"
+        "    static std::map<std::string, T> Fields;\n"
+        "    T& Field = Fields[Name.Value];\n"
+        "    Field.Name = Name.Value;\n"
+        "    return &Field;\n"
+        "}\n\n"
+        "struct FGameplayAttribute {\n"
+        "    FGameplayAttribute() = default;\n"
+        "    explicit FGameplayAttribute(FProperty* InProperty) : Property(InProperty) {}\n"
+        "    bool IsValid() const { return Property != nullptr; }\n"
+        "    FProperty* Property = nullptr;\n"
+        "};\n\n"
+        "inline bool operator==(const FGameplayAttribute& Lhs, const FGameplayAttribute& Rhs) {\n"
+        "    return Lhs.Property == Rhs.Property;\n"
+        "}\n\n"
+        "struct FMath {\n"
+        "    static float Clamp(float Value, float Min, float Max) {\n"
+        "        return std::max(Min, std::min(Value, Max));\n"
+        "    }\n"
+        "};\n\n"
+        "class UAttributeSet {\n"
+        "public:\n"
+        "    virtual ~UAttributeSet() = default;\n"
+        "    virtual void GetLifetimeReplicatedProps(TArray<FLifetimeProperty>&) const {}\n"
+        "    virtual void PreAttributeChange(const FGameplayAttribute&, float&) {}\n"
+        "    virtual void PostAttributeChange(const FGameplayAttribute&, float, float) {}\n"
+        "};\n\n"
+        "#define ATTRIBUTE_ACCESSORS(ClassName, PropertyName) \\\n"
+        "    static FGameplayAttribute Get##PropertyName##Attribute() { return FGameplayAttribute(FindFieldChecked<FProperty>(nullptr, FName(#PropertyName))); } \\\n"
+        "    float Get##PropertyName() const { return PropertyName.GetCurrentValue(); } \\\n"
+        "    void Set##PropertyName(float NewValue) { PropertyName.SetCurrentValue(NewValue); } \\\n"
+        "    void Init##PropertyName(float NewValue) { PropertyName.SetCurrentValue(NewValue); }\n"
+        "#define GAMEPLAYATTRIBUTE_PROPERTY_GETTER(ClassName, PropertyName)\n"
+        "#define GAMEPLAYATTRIBUTE_VALUE_GETTER(PropertyName)\n"
+        "#define GAMEPLAYATTRIBUTE_VALUE_SETTER(PropertyName)\n"
+        "#define GAMEPLAYATTRIBUTE_VALUE_INITTER(PropertyName)\n"
+    )
+    (stub_include_root / "AttributeSet.h").write_text(attribute_stub)
+    (stub_include_root / "AbilitySystemComponent.h").write_text("#pragma once\n")
+    (stub_include_root / "Net/UnrealNetwork.h").write_text(
+        """#pragma once\n\n#define COND_None 0\n#define REPNOTIFY_Always 0\n#define DOREPLIFETIME(ClassName, PropertyName) do {} while (0)\n#define DOREPLIFETIME_CONDITION_NOTIFY(ClassName, PropertyName, Condition, NotifyPolicy) do {} while (0)\n#define GAMEPLAYATTRIBUTE_REPNOTIFY(ClassName, PropertyName, OldValue) do {} while (0)\n"""
+    )
+    for name in set_names:
+        (stub_include_root / f"{name}AttributeSet.generated.h").write_text("#pragma once\n")
+    return stub_include_root
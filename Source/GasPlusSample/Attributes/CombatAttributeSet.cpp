@@ -1,10 +1,12 @@
 #include "CombatAttributeSet.h"
 
+#include "AbilitySystemComponent.h"
 #include "Net/UnrealNetwork.h"
 
 // <Codex::Preserve Begin: SourceIncludes>
 // <Codex::Preserve End: SourceIncludes>
 
+
 UCombatAttributeSet::UCombatAttributeSet() = default;
 // GASPLUS-PRESERVE BEGIN UCombatAttributeSet.Constructor
 // Customize constructor defaults here.
@@ -61,6 +63,117 @@ void UCombatAttributeSet::PostAttributeChange(const FGameplayAttribute& Attribut
     // <Codex::Preserve End: PostAttributeChange_Custom>
 }
 
+const TCHAR* const UCombatAttributeSet::SnapshotFieldNames[UCombatAttributeSet::SnapshotFieldCount] = {
+    TEXT("AttackPower"),
+    TEXT("DefensePower"),
+    TEXT("CriticalRate"),
+};
+
+FGameplayAttributeData UCombatAttributeSet::* const UCombatAttributeSet::SnapshotFields[UCombatAttributeSet::SnapshotFieldCount] = {
+    &UCombatAttributeSet::AttackPower,
+    &UCombatAttributeSet::DefensePower,
+    &UCombatAttributeSet::CriticalRate,
+};
+
+void UCombatAttributeSet::CaptureSnapshot(FSnapshot& OutSnapshot) const
+{
+    OutSnapshot.BaseValues[0] = AttackPower.GetBaseValue();
+    OutSnapshot.CurrentValues[0] = AttackPower.GetCurrentValue();
+    OutSnapshot.BaseValues[1] = DefensePower.GetBaseValue();
+    OutSnapshot.CurrentValues[1] = DefensePower.GetCurrentValue();
+    OutSnapshot.BaseValues[2] = CriticalRate.GetBaseValue();
+    OutSnapshot.CurrentValues[2] = CriticalRate.GetCurrentValue();
+}
+
+void UCombatAttributeSet::RestoreSnapshot(const FSnapshot& Snapshot)
+{
+    AttackPower.SetBaseValue(Snapshot.BaseValues[0]);
+    AttackPower.SetCurrentValue(Snapshot.CurrentValues[0]);
+    DefensePower.SetBaseValue(Snapshot.BaseValues[1]);
+    DefensePower.SetCurrentValue(Snapshot.CurrentValues[1]);
+    CriticalRate.SetBaseValue(Snapshot.BaseValues[2]);
+    CriticalRate.SetCurrentValue(Snapshot.CurrentValues[2]);
+}
+
+const UCombatAttributeSet::FAttributeInfo UCombatAttributeSet::AttributeInfos[UCombatAttributeSet::AttributeCount] = {
+    {TEXT("AttackPower"), 0, 0.0f, FLT_MAX, true, false, true, true},
+    {TEXT("DefensePower"), 1, -FLT_MAX, FLT_MAX, false, false, false, false},
+    {TEXT("CriticalRate"), 2, 0.0f, 1.0f, true, true, true, true},
+};
+
+// Perfect hash of the lowercased names: a name's hash selects its seed, and
+// the hash mixed with that seed selects the slot holding its index.
+const uint32 UCombatAttributeSet::AttributeNameMask = 7u;
+
+const uint32 UCombatAttributeSet::AttributeNameSeeds[] = {
+    0u, 0u, 0u, 0u, 0u, 0u, 0u, 0u,
+};
+
+const int32 UCombatAttributeSet::AttributeNameSlots[] = {
+    INDEX_NONE, INDEX_NONE, 2, 0, 1, INDEX_NONE, INDEX_NONE, INDEX_NONE,
+};
+
+uint32 UCombatAttributeSet::HashAttributeName(const TCHAR* Name)
+{
+    uint32 Hash = 0x811C9DC5u;
+    for (; *Name; ++Name)
+    {
+        const uint32 Char = static_cast<uint32>(*Name);
+        Hash = (Hash ^ (Char >= 'A' && Char <= 'Z' ? Char + 32u : Char)) * 0x01000193u;
+    }
+    return Hash;
+}
+
+uint32 UCombatAttributeSet::AttributeNameSlot(uint32 Hash, uint32 Seed)
+{
+    uint32 Value = Hash ^ Seed;
+    Value = (Value ^ (Value >> 16)) * 0x85EBCA6Bu;
+    Value = (Value ^ (Value >> 13)) * 0xC2B2AE35u;
+    return (Value ^ (Value >> 16)) & AttributeNameMask;
+}
+
+int32 UCombatAttributeSet::FindAttributeIndex(const TCHAR* Name)
+{
+    if (Name == nullptr)
+    {
+        return INDEX_NONE;
+    }
+    const uint32 Hash = HashAttributeName(Name);
+    const int32 Index = AttributeNameSlots[AttributeNameSlot(Hash, AttributeNameSeeds[Hash & AttributeNameMask])];
+    if (Index == INDEX_NONE || FCString::Stricmp(Name, AttributeInfos[Index].Name) != 0)
+    {
+        return INDEX_NONE;
+    }
+    return Index;
+}
+
+FGameplayAttribute UCombatAttributeSet::FindAttribute(const TCHAR* Name)
+{
+    const int32 Index = FindAttributeIndex(Name);
+    return Index == INDEX_NONE ? FGameplayAttribute() : GetAttributeByIndex(Index);
+}
+
+const FGameplayAttribute& UCombatAttributeSet::GetAttributeByIndex(int32 Index)
+{
+    // Resolved through reflection once, on first use.
+    struct FAttributeCache
+    {
+        FGameplayAttribute Attributes[AttributeCount];
+
+        FAttributeCache()
+        {
+            for (int32 Each = 0; Each < AttributeCount; ++Each)
+            {
+                Attributes[Each] = FGameplayAttribute(
+                    FindFieldChecked<FProperty>(UCombatAttributeSet::StaticClass(), FName(AttributeInfos[Each].Name)));
+            }
+        }
+    };
+    static const FAttributeCache Cache;
+    check(Index >= 0 && Index < AttributeCount);
+    return Cache.Attributes[Index];
+}
+
 void UCombatAttributeSet::OnRep_AttackPower(const FGameplayAttributeData& OldValue)
 {
     GAMEPLAYATTRIBUTE_REPNOTIFY(UCombatAttributeSet, AttackPower, OldValue);
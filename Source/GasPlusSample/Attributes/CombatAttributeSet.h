@@ -2,11 +2,35 @@
 
 #include "CoreMinimal.h"
 #include "AttributeSet.h"
-#include "AbilitySystemComponent.h"
-#include "Meta/MetaAttributes.h"
+// <Codex::Preserve Begin: HeaderIncludes>
+// <Codex::Preserve End: HeaderIncludes>
 
 #include "CombatAttributeSet.generated.h"
 
+// Base and current values of every UCombatAttributeSet attribute, indexed
+// like UCombatAttributeSet::SnapshotFields.
+struct FCombatAttributeSetSnapshot
+{
+    static constexpr int32 NumAttributes = 3;
+
+    float BaseValues[NumAttributes];
+    float CurrentValues[NumAttributes];
+};
+
+// Static description of one UCombatAttributeSet attribute; see
+// UCombatAttributeSet::AttributeInfos.
+struct FCombatAttributeSetAttributeInfo
+{
+    const TCHAR* Name;
+    int32 Index;
+    float ClampMin;
+    float ClampMax;
+    bool bHasClampMin;
+    bool bHasClampMax;
+    bool bReplicated;
+    bool bRepNotify;
+};
+
 UCLASS()
 class GASPLUSSAMPLE_API UCombatAttributeSet : public UAttributeSet
 {
@@ -19,6 +43,33 @@ public:
     virtual void PreAttributeChange(const FGameplayAttribute& Attribute, float& NewValue) override;
     virtual void PostAttributeChange(const FGameplayAttribute& Attribute, float OldValue, float NewValue) override;
 
+    using FSnapshot = FCombatAttributeSetSnapshot;
+    static constexpr int32 SnapshotFieldCount = FSnapshot::NumAttributes;
+    static const TCHAR* const SnapshotFieldNames[SnapshotFieldCount];
+    static FGameplayAttributeData UCombatAttributeSet::* const SnapshotFields[SnapshotFieldCount];
+
+    void CaptureSnapshot(FSnapshot& OutSnapshot) const;
+    void RestoreSnapshot(const FSnapshot& Snapshot);
+
+    using FAttributeInfo = FCombatAttributeSetAttributeInfo;
+    static constexpr int32 AttributeCount = 3;
+    static const FAttributeInfo AttributeInfos[AttributeCount];
+
+    // Reflection-free lookups by name, case-insensitive like FName. Unknown
+    // names return INDEX_NONE or an invalid FGameplayAttribute.
+    static int32 FindAttributeIndex(const TCHAR* Name);
+    static FGameplayAttribute FindAttribute(const TCHAR* Name);
+    static const FGameplayAttribute& GetAttributeByIndex(int32 Index);
+
+private:
+    static const uint32 AttributeNameMask;
+    static const uint32 AttributeNameSeeds[];
+    static const int32 AttributeNameSlots[];
+
+    static uint32 HashAttributeName(const TCHAR* Name);
+    static uint32 AttributeNameSlot(uint32 Hash, uint32 Seed);
+
+public:
     // GASPLUS-PRESERVE BEGIN UCombatAttributeSet.PublicMembers
     // Add additional member declarations here.
     // GASPLUS-PRESERVE END UCombatAttributeSet.PublicMembers
@@ -26,10 +26,10 @@
 
 namespace GasPlusSample::Attributes::Meta
 {
-    #if __has_include("UObject/NameTypes.h")
+#if __has_include("UObject/NameTypes.h")
     using FMetaRegistryName = FName;
     using FMetaRegistryString = FString;
-    #else
+#else
     struct FMetaRegistryName
     {
         FMetaRegistryName() = default;
@@ -63,12 +63,12 @@ namespace GasPlusSample::Attributes::Meta
     }
 
     using FMetaRegistryString = std::string;
-    #endif
+#endif
 
-    #if __has_include("Containers/Map.h")
+#if __has_include("Containers/Map.h")
     template <typename KeyType, typename ValueType>
     using TMetaRegistryMap = TMap<KeyType, ValueType>;
-    #else
+#else
     template <typename KeyType, typename ValueType>
     class TMetaRegistryMap
     {
@@ -116,7 +116,7 @@ namespace GasPlusSample::Attributes::Meta
     private:
         std::map<KeyType, ValueType> Storage;
     };
-    #endif
+#endif
 
     struct GASPLUSSAMPLE_API FMetaAttributeDefinition
     {
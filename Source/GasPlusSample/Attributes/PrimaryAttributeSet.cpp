@@ -1,10 +1,12 @@
 #include "PrimaryAttributeSet.h"
 
+#include "AbilitySystemComponent.h"
 #include "Net/UnrealNetwork.h"
 
 // <Codex::Preserve Begin: SourceIncludes>
 // <Codex::Preserve End: SourceIncludes>
 
+
 UPrimaryAttributeSet::UPrimaryAttributeSet() = default;
 // GASPLUS-PRESERVE BEGIN UPrimaryAttributeSet.Constructor
 // Customize constructor defaults here.
@@ -76,6 +78,117 @@ void UPrimaryAttributeSet::PostAttributeChange(const FGameplayAttribute& Attribu
     // <Codex::Preserve End: PostAttributeChange_Custom>
 }
 
+const TCHAR* const UPrimaryAttributeSet::SnapshotFieldNames[UPrimaryAttributeSet::SnapshotFieldCount] = {
+    TEXT("Health"),
+    TEXT("Mana"),
+    TEXT("Stamina"),
+};
+
+FGameplayAttributeData UPrimaryAttributeSet::* const UPrimaryAttributeSet::SnapshotFields[UPrimaryAttributeSet::SnapshotFieldCount] = {
+    &UPrimaryAttributeSet::Health,
+    &UPrimaryAttributeSet::Mana,
+    &UPrimaryAttributeSet::Stamina,
+};
+
+void UPrimaryAttributeSet::CaptureSnapshot(FSnapshot& OutSnapshot) const
+{
+    OutSnapshot.BaseValues[0] = Health.GetBaseValue();
+    OutSnapshot.CurrentValues[0] = Health.GetCurrentValue();
+    OutSnapshot.BaseValues[1] = Mana.GetBaseValue();
+    OutSnapshot.CurrentValues[1] = Mana.GetCurrentValue();
+    OutSnapshot.BaseValues[2] = Stamina.GetBaseValue();
+    OutSnapshot.CurrentValues[2] = Stamina.GetCurrentValue();
+}
+
+void UPrimaryAttributeSet::RestoreSnapshot(const FSnapshot& Snapshot)
+{
+    Health.SetBaseValue(Snapshot.BaseValues[0]);
+    Health.SetCurrentValue(Snapshot.CurrentValues[0]);
+    Mana.SetBaseValue(Snapshot.BaseValues[1]);
+    Mana.SetCurrentValue(Snapshot.CurrentValues[1]);
+    Stamina.SetBaseValue(Snapshot.BaseValues[2]);
+    Stamina.SetCurrentValue(Snapshot.CurrentValues[2]);
+}
+
+const UPrimaryAttributeSet::FAttributeInfo UPrimaryAttributeSet::AttributeInfos[UPrimaryAttributeSet::AttributeCount] = {
+    {TEXT("Health"), 0, 0.0f, 100.0f, true, true, true, true},
+    {TEXT("Mana"), 1, 0.0f, 250.0f, true, true, true, true},
+    {TEXT("Stamina"), 2, 0.0f, 150.0f, true, true, true, false},
+};
+
+// Perfect hash of the lowercased names: a name's hash selects its seed, and
+// the hash mixed with that seed selects the slot holding its index.
+const uint32 UPrimaryAttributeSet::AttributeNameMask = 7u;
+
+const uint32 UPrimaryAttributeSet::AttributeNameSeeds[] = {
+    0u, 0u, 0u, 0u, 0u, 0u, 0u, 0u,
+};
+
+const int32 UPrimaryAttributeSet::AttributeNameSlots[] = {
+    INDEX_NONE, INDEX_NONE, 0, 2, INDEX_NONE, 1, INDEX_NONE, INDEX_NONE,
+};
+
+uint32 UPrimaryAttributeSet::HashAttributeName(const TCHAR* Name)
+{
+    uint32 Hash = 0x811C9DC5u;
+    for (; *Name; ++Name)
+    {
+        const uint32 Char = static_cast<uint32>(*Name);
+        Hash = (Hash ^ (Char >= 'A' && Char <= 'Z' ? Char + 32u : Char)) * 0x01000193u;
+    }
+    return Hash;
+}
+
+uint32 UPrimaryAttributeSet::AttributeNameSlot(uint32 Hash, uint32 Seed)
+{
+    uint32 Value = Hash ^ Seed;
+    Value = (Value ^ (Value >> 16)) * 0x85EBCA6Bu;
+    Value = (Value ^ (Value >> 13)) * 0xC2B2AE35u;
+    return (Value ^ (Value >> 16)) & AttributeNameMask;
+}
+
+int32 UPrimaryAttributeSet::FindAttributeIndex(const TCHAR* Name)
+{
+    if (Name == nullptr)
+    {
+        return INDEX_NONE;
+    }
+    const uint32 Hash = HashAttributeName(Name);
+    const int32 Index = AttributeNameSlots[AttributeNameSlot(Hash, AttributeNameSeeds[Hash & AttributeNameMask])];
+    if (Index == INDEX_NONE || FCString::Stricmp(Name, AttributeInfos[Index].Name) != 0)
+    {
+        return INDEX_NONE;
+    }
+    return Index;
+}
+
+FGameplayAttribute UPrimaryAttributeSet::FindAttribute(const TCHAR* Name)
+{
+    const int32 Index = FindAttributeIndex(Name);
+    return Index == INDEX_NONE ? FGameplayAttribute() : GetAttributeByIndex(Index);
+}
+
+const FGameplayAttribute& UPrimaryAttributeSet::GetAttributeByIndex(int32 Index)
+{
+    // Resolved through reflection once, on first use.
+    struct FAttributeCache
+    {
+        FGameplayAttribute Attributes[AttributeCount];
+
+        FAttributeCache()
+        {
+            for (int32 Each = 0; Each < AttributeCount; ++Each)
+            {
+                Attributes[Each] = FGameplayAttribute(
+                    FindFieldChecked<FProperty>(UPrimaryAttributeSet::StaticClass(), FName(AttributeInfos[Each].Name)));
+            }
+        }
+    };
+    static const FAttributeCache Cache;
+    check(Index >= 0 && Index < AttributeCount);
+    return Cache.Attributes[Index];
+}
+
 void UPrimaryAttributeSet::OnRep_Health(const FGameplayAttributeData& OldValue)
 {
     GAMEPLAYATTRIBUTE_REPNOTIFY(UPrimaryAttributeSet, Health, OldValue);